@@ -0,0 +1,132 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Benchmark the Parquet options of the pandas materializer.
+
+A dataframe is saved to and loaded from the artifact store of the active
+stack with different compression codecs and as a multi-file dataset. The
+script reports the save and load throughput and the size of the artifacts.
+"""
+
+import os
+import time
+from typing import Optional, Type
+from uuid import uuid4
+
+import click
+import numpy as np
+import pandas as pd
+
+from zenml.client import Client
+from zenml.io import fileio
+from zenml.materializers.pandas_materializer import PandasMaterializer
+
+CODECS = ["gzip", "snappy", "zstd", "lz4", "none"]
+
+
+def _create_dataframe(rows: int) -> pd.DataFrame:
+    """Creates a dataframe with numeric, categorical and text columns.
+
+    Args:
+        rows: The number of rows.
+
+    Returns:
+        The dataframe.
+    """
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "int": rng.integers(0, 1_000_000, size=rows),
+            "float": rng.normal(size=rows),
+            "category": rng.choice(["a", "b", "c", "d"], size=rows),
+            "text": [f"row-{i}" for i in range(rows)],
+        }
+    )
+
+
+def _create_materializer_class(
+    codec: str, rows_per_file: Optional[int]
+) -> Type[PandasMaterializer]:
+    """Creates a pandas materializer class with custom Parquet options.
+
+    Args:
+        codec: The compression codec.
+        rows_per_file: The maximum number of rows per file.
+
+    Returns:
+        The materializer class.
+    """
+    return type(
+        "BenchmarkPandasMaterializer",
+        (PandasMaterializer,),
+        {
+            "SKIP_REGISTRATION": True,
+            "PARQUET_COMPRESSION": codec,
+            "PARQUET_ROWS_PER_FILE": rows_per_file,
+        },
+    )
+
+
+@click.command()
+@click.option("--rows", default=2_000_000, help="Number of dataframe rows.")
+@click.option(
+    "--rows-per-file",
+    default=250_000,
+    help="Number of rows per file for the multi-file dataset.",
+)
+def main(rows: int, rows_per_file: int) -> None:
+    """Benchmark the Parquet options of the pandas materializer.
+
+    Args:
+        rows: The number of dataframe rows.
+        rows_per_file: The number of rows per file for the multi-file
+            dataset.
+    """
+    artifact_store = Client().active_stack.artifact_store
+    df = _create_dataframe(rows)
+    megabytes = df.memory_usage(deep=True).sum() / 1e6
+
+    configurations = [(codec, None) for codec in CODECS]
+    configurations += [("zstd", rows_per_file), ("snappy", rows_per_file)]
+
+    click.echo(f"Dataframe: {rows} rows, {megabytes:.1f}MB in memory")
+    click.echo(
+        f"{'codec':<8}{'files':>8}{'save MB/s':>12}{'load MB/s':>12}"
+        f"{'size MB':>10}"
+    )
+    for codec, rows_per_file_ in configurations:
+        materializer_class = _create_materializer_class(codec, rows_per_file_)
+        uri = os.path.join(artifact_store.path, "benchmark", str(uuid4()))
+        artifact_store.makedirs(uri)
+        materializer = materializer_class(uri=uri)
+
+        start = time.perf_counter()
+        materializer.save(df)
+        save_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        loaded = materializer.load(pd.DataFrame)
+        load_duration = time.perf_counter() - start
+        assert len(loaded) == rows
+
+        size = fileio.size(uri) or 0
+        files = "multi" if rows_per_file_ else "single"
+        click.echo(
+            f"{codec:<8}{files:>8}{megabytes / save_duration:>12.1f}"
+            f"{megabytes / load_duration:>12.1f}{size / 1e6:>10.1f}"
+        )
+        artifact_store.rmtree(uri)
+
+
+if __name__ == "__main__":
+    main()
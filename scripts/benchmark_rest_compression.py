@@ -0,0 +1,169 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Benchmark the compression of REST payloads.
+
+A JSON payload that resembles a pipeline deployment with many steps is
+compressed with all content encodings supported by the ZenML server and
+client. The script reports the size on the wire and the compression and
+decompression throughput per encoding as well as the throughput of the JSON
+decoders.
+"""
+
+import json
+import time
+from typing import Any, Callable, Dict
+from uuid import uuid4
+
+import click
+
+from zenml.utils import http_utils
+
+
+def _create_payload(steps: int) -> Dict[str, Any]:
+    """Creates a payload that resembles a pipeline deployment.
+
+    Args:
+        steps: The number of steps of the deployment.
+
+    Returns:
+        The payload.
+    """
+    step_configurations = {}
+    for i in range(steps):
+        step_configurations[f"step_{i}"] = {
+            "spec": {
+                "source": f"my_project.steps.step_{i}",
+                "upstream_steps": [f"step_{i - 1}"] if i else [],
+                "inputs": {
+                    "data": {
+                        "step_name": f"step_{i - 1}",
+                        "output_name": "output",
+                    }
+                }
+                if i
+                else {},
+            },
+            "config": {
+                "name": f"step_{i}",
+                "enable_cache": True,
+                "enable_artifact_metadata": None,
+                "parameters": {"learning_rate": 0.001, "epochs": 10},
+                "settings": {
+                    "docker": {
+                        "parent_image": None,
+                        "requirements": ["scikit-learn", "pandas"],
+                        "environment": {"ZENML_LOGGING_VERBOSITY": "INFO"},
+                    },
+                    "resources": {"cpu_count": 2, "memory": "4GB"},
+                },
+                "outputs": {
+                    "output": {
+                        "materializer_source": [
+                            "zenml.materializers.pandas_materializer."
+                            "PandasMaterializer"
+                        ],
+                        "default_materializer_source": None,
+                    }
+                },
+                "caching_parameters": {},
+                "external_input_artifacts": {},
+                "model_artifacts_or_metadata": {},
+                "client_lazy_loaders": {},
+            },
+        }
+    return {
+        "id": str(uuid4()),
+        "run_name_template": "training-{date}-{time}",
+        "pipeline_configuration": {"name": "training", "enable_cache": True},
+        "step_configurations": step_configurations,
+        "client_environment": {"python_version": "3.11.7", "os": "linux"},
+    }
+
+
+def _throughput(
+    function: Callable[[], Any], megabytes: float, repetitions: int
+) -> float:
+    """Measures the throughput of a function.
+
+    Args:
+        function: The function to measure.
+        megabytes: The amount of data that the function processes.
+        repetitions: How often to call the function.
+
+    Returns:
+        The throughput in MB/s.
+    """
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        function()
+    return megabytes * repetitions / (time.perf_counter() - start)
+
+
+@click.command()
+@click.option("--steps", default=500, help="Number of deployment steps.")
+@click.option(
+    "--repetitions", default=10, help="Number of repetitions per measurement."
+)
+def main(steps: int, repetitions: int) -> None:
+    """Benchmark the compression of REST payloads.
+
+    Args:
+        steps: The number of deployment steps.
+        repetitions: The number of repetitions per measurement.
+    """
+    data = json.dumps(_create_payload(steps)).encode()
+    megabytes = len(data) / 1e6
+
+    click.echo(f"Payload: {steps} steps, {megabytes:.2f}MB of JSON")
+    click.echo(
+        f"{'encoding':<10}{'size KB':>10}{'ratio':>8}{'compress MB/s':>16}"
+        f"{'decompress MB/s':>18}"
+    )
+    click.echo(f"{'identity':<10}{len(data) / 1e3:>10.1f}{1:>8.1f}")
+    for encoding in http_utils.supported_encodings():
+        compressed = http_utils.compress(data, encoding)
+        assert http_utils.decompress(compressed, encoding) == data
+        compress_throughput = _throughput(
+            lambda: http_utils.compress(data, encoding),
+            megabytes,
+            repetitions,
+        )
+        decompress_throughput = _throughput(
+            lambda: http_utils.decompress(compressed, encoding),
+            megabytes,
+            repetitions,
+        )
+        click.echo(
+            f"{encoding:<10}{len(compressed) / 1e3:>10.1f}"
+            f"{len(data) / len(compressed):>8.1f}"
+            f"{compress_throughput:>16.1f}{decompress_throughput:>18.1f}"
+        )
+
+    decoders: Dict[str, Callable[[], Any]] = {"json": lambda: json.loads(data)}
+    try:
+        import orjson
+
+        decoders["orjson"] = lambda: orjson.loads(data)
+    except ImportError:
+        click.echo("orjson is not installed, skipping its measurement.")
+
+    click.echo(f"{'decoder':<10}{'decode MB/s':>12}")
+    for name, decode in decoders.items():
+        click.echo(
+            f"{name:<10}{_throughput(decode, megabytes, repetitions):>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Benchmark versioned entity creation with concurrent writers.
+
+Concurrent writers create auto-numbered versions of the same artifact and
+model in the store of the active client. The script reports the throughput
+and verifies that each version number was assigned exactly once.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+from uuid import uuid4
+
+import click
+
+from zenml.client import Client
+from zenml.config.source import Source, SourceType
+from zenml.enums import ArtifactType
+from zenml.models import (
+    ArtifactVersionRegistrationRequest,
+    ModelRequest,
+    ModelVersionRequest,
+)
+
+SOURCE = Source(module="builtins", attribute="int", type=SourceType.BUILTIN)
+
+
+def _run(
+    name: str, create: Callable[[], int], writers: int, count: int
+) -> None:
+    """Runs a benchmark and prints its results.
+
+    Args:
+        name: The name of the benchmark.
+        create: Function that creates a version and returns its number.
+        writers: The number of concurrent writers.
+        count: The number of versions to create.
+
+    Raises:
+        RuntimeError: If a version number was assigned more than once.
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=writers) as executor:
+        futures = [executor.submit(create) for _ in range(count)]
+        numbers: List[int] = [future.result() for future in futures]
+    duration = time.perf_counter() - start
+
+    if sorted(numbers) != list(range(1, count + 1)):
+        raise RuntimeError(f"{name}: Duplicate or missing version numbers.")
+
+    click.echo(
+        f"{name}: {count} versions with {writers} writers in "
+        f"{duration:.2f}s ({count / duration:.1f} versions/s)"
+    )
+
+
+@click.command()
+@click.option("--writers", default=10, help="Number of concurrent writers.")
+@click.option("--count", default=200, help="Number of versions to create.")
+def main(writers: int, count: int) -> None:
+    """Benchmark versioned entity creation with concurrent writers.
+
+    Args:
+        writers: The number of concurrent writers.
+        count: The number of versions to create per entity.
+    """
+    client = Client()
+    store = client.zen_store
+    user_id = client.active_user.id
+    workspace_id = client.active_workspace.id
+    suffix = uuid4().hex[:8]
+
+    artifact_name = f"benchmark_artifact_{suffix}"
+
+    def _create_artifact_version() -> int:
+        request = ArtifactVersionRegistrationRequest(
+            user=user_id,
+            workspace=workspace_id,
+            artifact_name=artifact_name,
+            type=ArtifactType.DATA,
+            uri=f"benchmark/{uuid4()}",
+            materializer=SOURCE,
+            data_type=SOURCE,
+        )
+        return int(store.register_artifact_versions([request])[0].version)
+
+    model = store.create_model(
+        ModelRequest(
+            user=user_id,
+            workspace=workspace_id,
+            name=f"benchmark_model_{suffix}",
+        )
+    )
+
+    def _create_model_version() -> int:
+        request = ModelVersionRequest(
+            user=user_id, workspace=workspace_id, model=model.id
+        )
+        number = store.create_model_version(request).number
+        assert number is not None
+        return number
+
+    _run("Artifact versions", _create_artifact_version, writers, count)
+    _run("Model versions", _create_model_version, writers, count)
+
+
+if __name__ == "__main__":
+    main()
@@ -48,6 +48,7 @@ from zenml.model.utils import (
     log_model_version_metadata,
 )
 from zenml.artifacts.artifact_config import ArtifactConfig
+from zenml.artifacts.artifact_load_config import ArtifactLoadConfig
 from zenml.artifacts.external_artifact import ExternalArtifact
 from zenml.model.model import Model
 from zenml.model.model_version import ModelVersion # TODO: deprecate me
@@ -59,6 +60,7 @@ from zenml.steps.utils import log_step_metadata
 
 __all__ = [
     "ArtifactConfig",
+    "ArtifactLoadConfig",
     "ExternalArtifact",
     "get_pipeline_context",
     "get_step_context",
@@ -13,31 +13,70 @@
 #  permissions and limitations under the License.
 """The analytics client of ZenML."""
 
+import atexit
 import json
 import logging
+import os
+import threading
+from queue import Full, Queue
 from typing import Any, Dict, Optional, Tuple
 from uuid import UUID
 
+from zenml.analytics.consumer import Consumer, QueueItem
 from zenml.analytics.enums import AnalyticsEvent
 from zenml.analytics.request import post
 from zenml.analytics.utils import AnalyticsEncoder
-from zenml.constants import IS_DEBUG_ENV
+from zenml.constants import ANALYTICS_SERVER_URL, IS_DEBUG_ENV
 
 logger = logging.getLogger(__name__)
 
 
 class Client(object):
-    """The client class for ZenML analytics."""
+    """The client class for ZenML analytics.
 
-    def __init__(self, send: bool = True, timeout: int = 15) -> None:
+    By default, messages are put in a bounded queue and sent in batches by a
+    background thread, so tracking an event never blocks the calling thread.
+    If the queue is full, new messages are dropped. Messages that are still
+    queued when the interpreter exits are flushed before exiting.
+    """
+
+    def __init__(
+        self,
+        send: bool = True,
+        timeout: int = 15,
+        host: str = ANALYTICS_SERVER_URL,
+        sync_mode: bool = False,
+        max_queue_size: int = 10000,
+        upload_size: int = 100,
+        upload_interval: float = 0.5,
+    ) -> None:
         """Initialization of the client.
 
         Args:
             send: Flag to determine whether to send the message.
             timeout: Timeout in seconds.
+            host: The URL of the analytics server.
+            sync_mode: If `True`, messages are sent immediately in the calling
+                thread instead of being queued.
+            max_queue_size: The maximum number of messages to queue.
+            upload_size: The maximum number of messages to send in a single
+                batch.
+            upload_interval: The maximum number of seconds to wait for a batch
+                to fill up before sending it.
         """
         self.send = send
         self.timeout = timeout
+        self.host = host
+        self.sync_mode = sync_mode
+        self.max_queue_size = max_queue_size
+        self.upload_size = upload_size
+        self.upload_interval = upload_interval
+
+        self.queue: "Queue[QueueItem]" = Queue(max_queue_size)
+        self.consumer: Optional[Consumer] = None
+        self._consumer_pid: Optional[int] = None
+        self._consumer_lock = threading.Lock()
+        self._registered_atexit = False
 
     def identify(
         self, user_id: UUID, traits: Optional[Dict[Any, Any]]
@@ -133,12 +172,75 @@ class Client(object):
         Returns:
             Tuple (success flag, the original message).
         """
+        from zenml.analytics import source_context
+
         # if send is False, return msg as if it was successfully queued
         if not self.send:
             return True, msg
 
-        post(timeout=self.timeout, batch=[msg])
+        if self.sync_mode:
+            post(timeout=self.timeout, batch=[msg], host=self.host)
+            return True, msg
+
+        self._start_consumer()
+        try:
+            # The source context is stored with the message because it is not
+            # available in the thread of the consumer.
+            self.queue.put((source_context.get(), msg), block=False)
+        except Full:
+            logger.debug("Analytics queue is full, dropping message.")
+            return False, msg
+
         return True, msg
 
+    def _start_consumer(self) -> None:
+        """Starts the consumer thread if it is not running in this process."""
+        with self._consumer_lock:
+            pid = os.getpid()
+            if (
+                self.consumer is not None
+                and self._consumer_pid == pid
+                and self.consumer.is_alive()
+            ):
+                return
+
+            if self._consumer_pid is not None and self._consumer_pid != pid:
+                # We're in a forked process. The queue might be in an
+                # inconsistent state as its lock could have been held by a
+                # thread of the parent process, so we start with a new one.
+                self.queue = Queue(self.max_queue_size)
+
+            self.consumer = Consumer(
+                queue=self.queue,
+                host=self.host,
+                upload_size=self.upload_size,
+                upload_interval=self.upload_interval,
+                timeout=self.timeout,
+            )
+            self.consumer.start()
+            self._consumer_pid = pid
+
+            if not self._registered_atexit:
+                atexit.register(self.join)
+                self._registered_atexit = True
+
+    def flush(self) -> None:
+        """Blocks until all queued messages were processed."""
+        if self.consumer is not None and self.consumer.is_alive():
+            self.queue.join()
+
+    def join(self) -> None:
+        """Stops the consumer after sending all queued messages.
+
+        Waits at most `timeout` seconds for the queued messages to be sent, so
+        an unreachable analytics server never blocks the interpreter exit.
+        """
+        consumer = self.consumer
+        if consumer is None or self._consumer_pid != os.getpid():
+            return
+
+        consumer.pause()
+        consumer.join(timeout=self.timeout)
+
 
 default_client = Client()
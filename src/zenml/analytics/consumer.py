@@ -0,0 +1,138 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""The background consumer of the ZenML analytics client.
+
+This module is based on the 'analytics-python' package created by Segment.
+The base functionalities are adapted to work with the ZenML analytics server.
+"""
+
+import logging
+import time
+from collections import defaultdict
+from queue import Empty, Queue
+from threading import Thread
+from typing import Dict, List, Tuple
+
+from zenml.analytics.request import post
+from zenml.enums import SourceContextTypes
+
+logger = logging.getLogger(__name__)
+
+QueueItem = Tuple[SourceContextTypes, str]
+
+
+class Consumer(Thread):
+    """Daemon thread that sends queued analytics messages in batches."""
+
+    def __init__(
+        self,
+        queue: "Queue[QueueItem]",
+        host: str,
+        upload_size: int = 100,
+        upload_interval: float = 0.5,
+        timeout: int = 15,
+    ) -> None:
+        """Initialization of the consumer.
+
+        Args:
+            queue: The queue to consume messages from.
+            host: The URL of the analytics server.
+            upload_size: The maximum number of messages to send in a single
+                batch.
+            upload_interval: The maximum number of seconds to wait for a batch
+                to fill up before sending it.
+            timeout: Timeout in seconds for each request.
+        """
+        super().__init__(daemon=True, name="zenml-analytics-consumer")
+        self.queue = queue
+        self.host = host
+        self.upload_size = upload_size
+        self.upload_interval = upload_interval
+        self.timeout = timeout
+        self.running = True
+
+    def run(self) -> None:
+        """Sends batches of messages until the consumer gets paused.
+
+        Once paused, the messages that are still in the queue are sent before
+        the thread stops.
+        """
+        while self.running:
+            self.upload()
+
+        while not self.queue.empty():
+            self.upload()
+
+    def pause(self) -> None:
+        """Stops the consumer after the messages in the queue are sent."""
+        self.running = False
+
+    def upload(self) -> bool:
+        """Sends the next batch of messages from the queue.
+
+        Messages are grouped by their source context, as the source context is
+        sent as a header of the request.
+
+        Returns:
+            True if a batch was sent successfully, False otherwise.
+        """
+        items = self.next()
+        if not items:
+            return False
+
+        batches: Dict[SourceContextTypes, List[str]] = defaultdict(list)
+        for source, msg in items:
+            batches[source].append(msg)
+
+        success = True
+        try:
+            for source, batch in batches.items():
+                try:
+                    post(
+                        batch=batch,
+                        timeout=self.timeout,
+                        host=self.host,
+                        source=source,
+                    )
+                except Exception as e:
+                    logger.debug(f"Sending analytics batch failed: {e}")
+                    success = False
+        finally:
+            # Mark the items as processed even if sending failed, otherwise
+            # flushing the queue would never finish.
+            for _ in items:
+                self.queue.task_done()
+
+        return success
+
+    def next(self) -> List[QueueItem]:
+        """Collects the next batch of messages from the queue.
+
+        Returns:
+            Up to `upload_size` messages that were queued within
+            `upload_interval` seconds.
+        """
+        items: List[QueueItem] = []
+        start_time = time.monotonic()
+
+        while len(items) < self.upload_size:
+            remaining = self.upload_interval - (time.monotonic() - start_time)
+            if remaining <= 0:
+                break
+            try:
+                items.append(self.queue.get(block=True, timeout=remaining))
+            except Empty:
+                break
+
+        return items
@@ -18,22 +18,31 @@ The base functionalities are adapted to work with the ZenML analytics server.
 """
 
 import logging
-from typing import List
+from typing import List, Optional
 
 import requests
 
 from zenml.analytics.utils import AnalyticsAPIError
 from zenml.constants import ANALYTICS_SERVER_URL
+from zenml.enums import SourceContextTypes
 
 logger = logging.getLogger(__name__)
 
 
-def post(batch: List[str], timeout: int = 15) -> requests.Response:
+def post(
+    batch: List[str],
+    timeout: int = 15,
+    host: str = ANALYTICS_SERVER_URL,
+    source: Optional[SourceContextTypes] = None,
+) -> requests.Response:
     """Post a batch of messages to the ZenML analytics server.
 
     Args:
         batch: The messages to send.
         timeout: Timeout in seconds.
+        host: The URL of the analytics server.
+        source: The source context of the messages. Defaults to the source
+            context of the current execution context.
 
     Returns:
         The response.
@@ -43,13 +52,16 @@ def post(batch: List[str], timeout: int = 15) -> requests.Response:
     """
     from zenml.analytics import source_context
 
+    if source is None:
+        source = source_context.get()
+
     headers = {
         "accept": "application/json",
         "content-type": "application/json",
-        source_context.name: source_context.get().value,
+        source_context.name: source.value,
     }
     response = requests.post(
-        url=ANALYTICS_SERVER_URL + "/batch",
+        url=host + "/batch",
         headers=headers,
         data=f"[{','.join(batch)}]",
         timeout=timeout,
@@ -418,6 +418,36 @@ class BaseArtifactStore(StackComponent):
             The iterator that walks the contents of the given directory.
         """
 
+    def put_dir(
+        self, src: str, dst: PathType, overwrite: bool = False
+    ) -> None:
+        """Uploads a local directory to the artifact store.
+
+        Files are uploaded concurrently. Artifact stores can override this
+        method to use a native bulk upload instead.
+
+        Args:
+            src: The local directory to upload.
+            dst: The destination path in the artifact store.
+            overwrite: Whether to overwrite existing destination files.
+        """
+        io_utils.copy_dir(src, fileio.convert_to_str(dst), overwrite=overwrite)
+
+    def get_dir(
+        self, src: PathType, dst: str, overwrite: bool = False
+    ) -> None:
+        """Downloads a directory of the artifact store to a local directory.
+
+        Files are downloaded concurrently. Artifact stores can override this
+        method to use a native bulk download instead.
+
+        Args:
+            src: The directory in the artifact store to download.
+            dst: The local destination directory.
+            overwrite: Whether to overwrite existing destination files.
+        """
+        io_utils.copy_dir(fileio.convert_to_str(src), dst, overwrite=overwrite)
+
     # --- Internal interface ---
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initiate the Pydantic object and register the corresponding filesystem.
@@ -453,6 +483,15 @@ class BaseArtifactStore(StackComponent):
                     sanitized_method,
                 )
 
+        # Directory transfers are not part of the filesystem interface, but
+        # their artifact store paths need to be sanitized as well.
+        for method_name in ("put_dir", "get_dir"):
+            setattr(
+                self,
+                method_name,
+                _sanitize_paths(getattr(self, method_name), self.path),
+            )
+
         # Local filesystem is always registered, no point in doing it again.
         if isinstance(self, LocalFilesystem):
             return
@@ -0,0 +1,92 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Artifact load configuration."""
+
+from typing import Any, List, Literal, Optional, Tuple
+
+from pydantic import BaseModel, validator
+
+SUPPORTED_FILTER_OPERATORS = (
+    "==",
+    "=",
+    "!=",
+    "<",
+    "<=",
+    ">",
+    ">=",
+    "in",
+    "not in",
+)
+
+
+class ArtifactLoadConfig(BaseModel):
+    """Configuration to load only parts of a tabular artifact.
+
+    Materializers that support it push the column selection and row filters
+    down to the storage format, so that data which is not needed is never
+    read. Numpy arrays can be memory-mapped instead of being read into memory.
+
+    Example:
+    ```python
+    @step
+    def my_step(
+        df: Annotated[
+            pd.DataFrame,
+            ArtifactLoadConfig(
+                columns=["age", "income"],
+                filters=[("age", ">=", 18)],
+            ),
+        ],
+    ) -> None:
+        ...
+    ```
+
+    Attributes:
+        columns: The names of the columns to load. If not given, all columns
+            are loaded.
+        filters: Row filters of the form `(column, operator, value)`. Only
+            rows which match all filters are loaded. Supported operators are
+            `==`, `=`, `!=`, `<`, `<=`, `>`, `>=`, `in` and `not in`.
+        mmap_mode: The mode in which numpy arrays are memory-mapped instead
+            of being read into memory, `r` (read-only) or `c`
+            (copy-on-write). If not given, the `ZENML_NUMPY_MMAP_MODE`
+            environment variable is used.
+    """
+
+    columns: Optional[List[str]] = None
+    filters: Optional[List[Tuple[str, str, Any]]] = None
+    mmap_mode: Optional[Literal["r", "c"]] = None
+
+    @validator("filters")
+    def _validate_filters(
+        cls, filters: Optional[List[Tuple[str, str, Any]]]
+    ) -> Optional[List[Tuple[str, str, Any]]]:
+        """Validates the filter operators.
+
+        Args:
+            filters: The row filters.
+
+        Returns:
+            The validated row filters.
+
+        Raises:
+            ValueError: If a filter uses an unsupported operator.
+        """
+        for _, operator, _ in filters or []:
+            if operator not in SUPPORTED_FILTER_OPERATORS:
+                raise ValueError(
+                    f"Unsupported filter operator `{operator}`. Supported "
+                    f"operators are {SUPPORTED_FILTER_OPERATORS}."
+                )
+        return filters
@@ -59,6 +59,8 @@ class ExternalArtifact(ExternalArtifactConfiguration):
             be stored. Only used when `value` is provided.
         store_artifact_visualizations: Whether visualizations for the
             artifact should be stored. Only used when `value` is provided.
+        load_config: The columns and rows of the artifact to load in the
+            step. Only supported by materializers of tabular data.
 
     Example:
     ```
@@ -170,4 +172,5 @@ class ExternalArtifact(ExternalArtifactConfiguration):
             name=self.name,
             version=self.version,
             model=self.model,
+            load_config=self.load_config,
         )
@@ -18,6 +18,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, root_validator
 
+from zenml.artifacts.artifact_load_config import ArtifactLoadConfig
 from zenml.logger import get_logger
 from zenml.model.model import Model
 from zenml.models.v2.core.artifact_version import ArtifactVersionResponse
@@ -35,6 +36,7 @@ class ExternalArtifactConfiguration(BaseModel):
     name: Optional[str] = None
     version: Optional[str] = None
     model: Optional[Model] = None
+    load_config: Optional[ArtifactLoadConfig] = None
 
     @root_validator
     def _validate_all_eac(cls, values: Dict[str, Any]) -> Dict[str, Any]:
@@ -16,17 +16,13 @@
 import base64
 import os
 import tempfile
-import time
 import zipfile
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union, cast
 from uuid import UUID, uuid4
 
 from zenml.client import Client
-from zenml.constants import (
-    MAX_RETRIES_FOR_VERSIONED_ENTITY_CREATION,
-    MODEL_METADATA_YAML_FILE_NAME,
-)
+from zenml.constants import MODEL_METADATA_YAML_FILE_NAME
 from zenml.enums import (
     ExecutionStatus,
     MetadataResourceTypes,
@@ -35,14 +31,12 @@ from zenml.enums import (
 )
 from zenml.exceptions import (
     DoesNotExistException,
-    EntityExistsError,
     StepContextError,
 )
 from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.models import (
-    ArtifactRequest,
-    ArtifactVersionRequest,
+    ArtifactVersionRegistrationRequest,
     ArtifactVersionResponse,
     ArtifactVisualizationRequest,
     LoadedVisualization,
@@ -111,37 +105,116 @@ def save_artifact(
 
     Returns:
         The saved artifact response.
+    """
+    client = Client()
+
+    artifact_version_request = _store_artifact_data_and_prepare_request(
+        data=data,
+        name=name,
+        version=version,
+        tags=tags,
+        extract_metadata=extract_metadata,
+        include_visualizations=include_visualizations,
+        has_custom_name=has_custom_name,
+        user_metadata=user_metadata,
+        materializer=materializer,
+        uri=uri,
+        manual_save=manual_save,
+    )
+
+    step_context = None
+    if manual_save:
+        try:
+            step_context = get_step_context()
+            artifact_version_request.step_run_id = step_context.step_run.id
+        except (RuntimeError, StepContextError):
+            logger.debug("Unable to link saved artifact to step run.")
+
+    # Create the artifact, the artifact version and its metadata, and link
+    # it to the step run in a single request
+    try:
+        response = client.zen_store.register_artifact_versions(
+            [artifact_version_request]
+        )[0]
+    except KeyError:
+        if not artifact_version_request.step_run_id:
+            raise
+        # The step context refers to a step run that doesn't exist (anymore),
+        # which shouldn't prevent the artifact from being saved.
+        logger.debug("Unable to link saved artifact to step run.")
+        artifact_version_request.step_run_id = None
+        step_context = None
+        response = client.zen_store.register_artifact_versions(
+            [artifact_version_request]
+        )[0]
+
+    if step_context:
+        try:
+            model = step_context.model
+        except (RuntimeError, StepContextError):
+            logger.debug("Unable to link saved artifact to model.")
+        else:
+            if model:
+                from zenml.model.utils import link_artifact_to_model
+
+                link_artifact_to_model(
+                    artifact_version_id=response.id,
+                    model=model,
+                    is_model_artifact=is_model_artifact,
+                    is_deployment_artifact=is_deployment_artifact,
+                )
+
+    return response
+
+
+def _store_artifact_data_and_prepare_request(
+    data: Any,
+    name: str,
+    version: Optional[Union[int, str]] = None,
+    tags: Optional[List[str]] = None,
+    extract_metadata: bool = True,
+    include_visualizations: bool = True,
+    has_custom_name: bool = True,
+    user_metadata: Optional[Dict[str, "MetadataType"]] = None,
+    materializer: Optional["MaterializerClassOrSource"] = None,
+    uri: Optional[str] = None,
+    manual_save: bool = True,
+) -> ArtifactVersionRegistrationRequest:
+    """Store the artifact data and prepare the request to register it.
+
+    Args:
+        name: The name of the artifact.
+        data: The artifact data.
+        version: The version of the artifact. If not provided, a new
+            auto-incremented version will be used.
+        tags: Tags to associate with the artifact.
+        extract_metadata: If artifact metadata should be extracted and returned.
+        include_visualizations: If artifact visualizations should be generated.
+        has_custom_name: If the artifact name is custom and should be listed in
+            the dashboard "Artifacts" tab.
+        user_metadata: User-provided metadata to store with the artifact.
+        materializer: The materializer to use for saving the artifact to the
+            artifact store.
+        uri: The URI within the artifact store to upload the artifact
+            to. If not provided, the artifact will be uploaded to
+            `custom_artifacts/{name}/{version}`.
+        manual_save: If this function is called manually and the URI should
+            therefore be checked for existing artifacts.
+
+    Returns:
+        The request to register the artifact version.
 
     Raises:
         RuntimeError: If artifact URI already exists.
-        EntityExistsError: If artifact version already exists.
     """
     from zenml.materializers.materializer_registry import (
         materializer_registry,
     )
+    from zenml.metadata.metadata_types import validate_metadata
     from zenml.utils import source_utils
 
     client = Client()
 
-    # Get or create the artifact
-    try:
-        artifact = client.list_artifacts(name=name)[0]
-        if artifact.has_custom_name != has_custom_name:
-            client.update_artifact(
-                name_id_or_prefix=artifact.id, has_custom_name=has_custom_name
-            )
-    except IndexError:
-        try:
-            artifact = client.zen_store.create_artifact(
-                ArtifactRequest(
-                    name=name,
-                    has_custom_name=has_custom_name,
-                    tags=tags,
-                )
-            )
-        except EntityExistsError:
-            artifact = client.list_artifacts(name=name)[0]
-
     # Get the current artifact store
     artifact_store = client.active_stack.artifact_store
 
@@ -209,94 +282,24 @@ def save_artifact(
             logger.warning(
                 f"Failed to extract metadata for output artifact '{name}': {e}"
             )
-
-    # Create the artifact version
-    def _create_version() -> Optional[ArtifactVersionResponse]:
-        artifact_version = ArtifactVersionRequest(
-            artifact_id=artifact.id,
-            version=version,
-            tags=tags,
-            type=materializer_object.ASSOCIATED_ARTIFACT_TYPE,
-            uri=materializer_object.uri,
-            materializer=source_utils.resolve(materializer_object.__class__),
-            data_type=source_utils.resolve(data_type),
-            user=Client().active_user.id,
-            workspace=Client().active_workspace.id,
-            artifact_store_id=artifact_store.id,
-            visualizations=visualizations,
-            has_custom_name=has_custom_name,
-        )
-        try:
-            return client.zen_store.create_artifact_version(
-                artifact_version=artifact_version
-            )
-        except EntityExistsError:
-            return None
-
-    response = None
-    if not version:
-        retries_made = 0
-        for i in range(MAX_RETRIES_FOR_VERSIONED_ENTITY_CREATION):
-            # Get new artifact version
-            version = _get_new_artifact_version(name)
-            if response := _create_version():
-                break
-            # smoothed exponential back-off, it will go as 0.2, 0.3,
-            # 0.45, 0.68, 1.01, 1.52, 2.28, 3.42, 5.13, 7.69, ...
-            sleep = 0.2 * 1.5**i
-            logger.debug(
-                f"Failed to create artifact version `{version}` for "
-                f"artifact `{name}`. Retrying in {sleep}..."
-            )
-            time.sleep(sleep)
-            retries_made += 1
-        if not response:
-            raise EntityExistsError(
-                f"Failed to create new artifact version for artifact "
-                f"`{name}`. Retried {retries_made} times. "
-                "This could be driven by exceptionally high concurrency of "
-                "pipeline runs. Please, reach out to us on ZenML Slack for support."
-            )
-    else:
-        response = _create_version()
-        if not response:
-            raise EntityExistsError(
-                f"Failed to create artifact version `{version}` for artifact "
-                f"`{name}`. Given version already exists."
-            )
-    if artifact_metadata:
-        client.create_run_metadata(
-            metadata=artifact_metadata,
-            resource_id=response.id,
-            resource_type=MetadataResourceTypes.ARTIFACT_VERSION,
-        )
-
-    if manual_save:
-        try:
-            error_message = "step run"
-            step_context = get_step_context()
-            step_run = step_context.step_run
-            client.zen_store.update_run_step(
-                step_run_id=step_run.id,
-                step_run_update=StepRunUpdate(
-                    saved_artifact_versions={name: response.id}
-                ),
-            )
-            error_message = "model"
-            model = step_context.model
-            if model:
-                from zenml.model.utils import link_artifact_to_model
-
-                link_artifact_to_model(
-                    artifact_version_id=response.id,
-                    model=model,
-                    is_model_artifact=is_model_artifact,
-                    is_deployment_artifact=is_deployment_artifact,
-                )
-        except (RuntimeError, StepContextError):
-            logger.debug(f"Unable to link saved artifact to {error_message}.")
-
-    return response
+    metadata_values, metadata_types = validate_metadata(artifact_metadata)
+
+    return ArtifactVersionRegistrationRequest(
+        artifact_name=name,
+        version=version,
+        has_custom_name=has_custom_name,
+        tags=tags,
+        type=materializer_object.ASSOCIATED_ARTIFACT_TYPE,
+        uri=materializer_object.uri,
+        materializer=source_utils.resolve(materializer_object.__class__),
+        data_type=source_utils.resolve(data_type),
+        user=client.active_user.id,
+        workspace=client.active_workspace.id,
+        artifact_store_id=artifact_store.id,
+        visualizations=visualizations,
+        metadata_values=metadata_values,
+        metadata_types=metadata_types,
+    )
 
 
 def load_artifact(
@@ -717,30 +720,6 @@ def _get_artifact_store_from_response_or_from_active_stack(
     return Client().active_stack.artifact_store
 
 
-def _get_new_artifact_version(artifact_name: str) -> int:
-    """Get the next auto-incremented version for an artifact name.
-
-    Args:
-        artifact_name: The name of the artifact.
-
-    Returns:
-        The next auto-incremented version.
-    """
-    artifact_versions = Client().list_artifact_versions(
-        name=artifact_name,
-        sort_by="desc:version_number",
-        size=1,
-    )
-
-    # If a numbered version exists, increment it
-    try:
-        return int(artifact_versions[0].version) + 1
-
-    # If no numbered versions exist yet, start at 1
-    except (IndexError, ValueError):
-        return 1
-
-
 def _load_file_from_artifact_store(
     uri: str,
     artifact_store: "BaseArtifactStore",
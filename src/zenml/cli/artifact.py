@@ -21,6 +21,7 @@ import click
 from zenml.cli import utils as cli_utils
 from zenml.cli.cli import TagGroup, cli
 from zenml.client import Client
+from zenml.constants import DEPAGINATION_MAX_WORKERS
 from zenml.enums import CliCategories
 from zenml.logger import get_logger
 from zenml.models import ArtifactFilter, ArtifactVersionFilter
@@ -247,7 +248,8 @@ def prune_artifacts(
     """
     client = Client()
     unused_artifact_versions = depaginate(
-        partial(client.list_artifact_versions, only_unused=True)
+        partial(client.list_artifact_versions, only_unused=True),
+        max_workers=DEPAGINATION_MAX_WORKERS,
     )
 
     if not unused_artifact_versions:
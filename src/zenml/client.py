@@ -14,7 +14,6 @@
 """Client implementation."""
 
 import functools
-import json
 import os
 from abc import ABCMeta
 from datetime import datetime
@@ -187,11 +186,11 @@ from zenml.services.service_type import ServiceType
 from zenml.utils import io_utils, source_utils
 from zenml.utils.dict_utils import dict_to_bytes
 from zenml.utils.filesync_model import FileSyncModel
-from zenml.utils.pagination_utils import depaginate
+from zenml.utils.pagination_utils import lazy_depaginate
 from zenml.utils.uuid_utils import is_valid_uuid
 
 if TYPE_CHECKING:
-    from zenml.metadata.metadata_types import MetadataType, MetadataTypeEnum
+    from zenml.metadata.metadata_types import MetadataType
     from zenml.service_connectors.service_connector import ServiceConnector
     from zenml.stack import Stack
     from zenml.zen_stores.base_zen_store import BaseZenStore
@@ -814,6 +813,8 @@ class Client(metaclass=ClientMetaClass):
         active: Optional[bool] = None,
         email_opted_in: Optional[bool] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[UserResponse]:
         """List all users.
 
@@ -833,6 +834,8 @@ class Client(metaclass=ClientMetaClass):
             email_opted_in: Use the user opt in status for filtering
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             The User
@@ -843,6 +846,8 @@ class Client(metaclass=ClientMetaClass):
                 page=page,
                 size=size,
                 logical_operator=logical_operator,
+                cursor=cursor,
+                skip_count=skip_count,
                 id=id,
                 external_user_id=external_user_id,
                 created=created,
@@ -1019,6 +1024,8 @@ class Client(metaclass=ClientMetaClass):
         updated: Optional[Union[datetime, str]] = None,
         name: Optional[str] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[WorkspaceResponse]:
         """List all workspaces.
 
@@ -1033,6 +1040,8 @@ class Client(metaclass=ClientMetaClass):
             name: Use the workspace name for filtering
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             Page of workspaces
@@ -1043,6 +1052,8 @@ class Client(metaclass=ClientMetaClass):
                 page=page,
                 size=size,
                 logical_operator=logical_operator,
+                cursor=cursor,
+                skip_count=skip_count,
                 id=id,
                 created=created,
                 updated=updated,
@@ -1233,6 +1244,8 @@ class Client(metaclass=ClientMetaClass):
         user_id: Optional[Union[str, UUID]] = None,
         component_id: Optional[Union[str, UUID]] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[StackResponse]:
         """Lists all stacks.
 
@@ -1251,6 +1264,8 @@ class Client(metaclass=ClientMetaClass):
             name: The name of the stack to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A page of stacks.
@@ -1260,6 +1275,8 @@ class Client(metaclass=ClientMetaClass):
             size=size,
             sort_by=sort_by,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             workspace_id=workspace_id,
             user_id=user_id,
             component_id=component_id,
@@ -1676,6 +1693,8 @@ class Client(metaclass=ClientMetaClass):
         pipeline_step_name: Optional[str] = None,
         model_version_id: Optional[Union[str, UUID]] = None,
         config: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[ServiceResponse]:
         """List all services.
 
@@ -1701,6 +1720,8 @@ class Client(metaclass=ClientMetaClass):
             model_version_id: Use the model version id for filtering
             config: Use the config for filtering
             pipeline_run_id: Use the pipeline run id for filtering
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             The Service response page.
@@ -1710,6 +1731,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             id=id,
             created=created,
             updated=updated,
@@ -1888,6 +1911,8 @@ class Client(metaclass=ClientMetaClass):
         connector_id: Optional[Union[str, UUID]] = None,
         stack_id: Optional[Union[str, UUID]] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[ComponentResponse]:
         """Lists all registered stack components.
 
@@ -1908,6 +1933,8 @@ class Client(metaclass=ClientMetaClass):
             name: The name of the component to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A page of stack components.
@@ -1917,6 +1944,8 @@ class Client(metaclass=ClientMetaClass):
             size=size,
             sort_by=sort_by,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             workspace_id=workspace_id or self.active_workspace.id,
             user_id=user_id,
             connector_id=connector_id,
@@ -2217,6 +2246,8 @@ class Client(metaclass=ClientMetaClass):
         integration: Optional[str] = None,
         user_id: Optional[Union[str, UUID]] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[FlavorResponse]:
         """Fetches all the flavor models.
 
@@ -2234,6 +2265,8 @@ class Client(metaclass=ClientMetaClass):
             integration: The integration of the flavor to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A list of all the flavor models.
@@ -2243,6 +2276,8 @@ class Client(metaclass=ClientMetaClass):
             size=size,
             sort_by=sort_by,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             user_id=user_id,
             name=name,
             type=type,
@@ -2341,6 +2376,8 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[PipelineResponse]:
         """List all pipelines.
 
@@ -2360,6 +2397,8 @@ class Client(metaclass=ClientMetaClass):
             user_id: The id of the user to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A page with Pipeline fitting the filter description
@@ -2369,6 +2408,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             id=id,
             created=created,
             updated=updated,
@@ -2505,6 +2546,8 @@ class Client(metaclass=ClientMetaClass):
         python_version: Optional[str] = None,
         checksum: Optional[str] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[PipelineBuildResponse]:
         """List all builds.
 
@@ -2527,6 +2570,8 @@ class Client(metaclass=ClientMetaClass):
             checksum: The build checksum to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A page with builds fitting the filter description
@@ -2536,6 +2581,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             id=id,
             created=created,
             updated=updated,
@@ -2641,6 +2688,8 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[EventSourceResponse]:
         """Lists all event_sources.
 
@@ -2659,6 +2708,8 @@ class Client(metaclass=ClientMetaClass):
             event_source_type: The subtype of the event_source to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A page of event_sources.
@@ -2668,6 +2719,8 @@ class Client(metaclass=ClientMetaClass):
             size=size,
             sort_by=sort_by,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             workspace_id=workspace_id,
             user_id=user_id,
             name=name,
@@ -2845,6 +2898,8 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[TriggerResponse]:
         """Lists all triggers.
 
@@ -2862,6 +2917,8 @@ class Client(metaclass=ClientMetaClass):
             event_source_id: The event source associated with the Trigger
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A page of triggers.
@@ -2871,6 +2928,8 @@ class Client(metaclass=ClientMetaClass):
             size=size,
             sort_by=sort_by,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             workspace_id=workspace_id,
             user_id=user_id,
             name=name,
@@ -3036,6 +3095,8 @@ class Client(metaclass=ClientMetaClass):
         stack_id: Optional[Union[str, UUID]] = None,
         build_id: Optional[Union[str, UUID]] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[PipelineDeploymentResponse]:
         """List all deployments.
 
@@ -3054,6 +3115,8 @@ class Client(metaclass=ClientMetaClass):
             build_id: The id of the build to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A page with deployments fitting the filter description
@@ -3063,6 +3126,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             id=id,
             created=created,
             updated=updated,
@@ -3136,6 +3201,8 @@ class Client(metaclass=ClientMetaClass):
         catchup: Optional[Union[str, bool]] = None,
         hydrate: bool = False,
         run_once_start_time: Optional[Union[datetime, str]] = None,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[ScheduleResponse]:
         """List schedules.
 
@@ -3161,6 +3228,8 @@ class Client(metaclass=ClientMetaClass):
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
             run_once_start_time: Use to filter by run once start time.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A list of schedules.
@@ -3170,6 +3239,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             id=id,
             created=created,
             updated=updated,
@@ -3262,6 +3333,8 @@ class Client(metaclass=ClientMetaClass):
         num_steps: Optional[Union[int, str]] = None,
         unlisted: Optional[bool] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[PipelineRunResponse]:
         """List all pipeline runs.
 
@@ -3291,6 +3364,8 @@ class Client(metaclass=ClientMetaClass):
             unlisted: If the runs should be unlisted or not.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A page with Pipeline Runs fitting the filter description
@@ -3300,6 +3375,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             id=id,
             created=created,
             updated=updated,
@@ -3399,6 +3476,8 @@ class Client(metaclass=ClientMetaClass):
         user_id: Optional[Union[str, UUID]] = None,
         num_outputs: Optional[Union[int, str]] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[StepRunResponse]:
         """List all pipelines.
 
@@ -3424,6 +3503,8 @@ class Client(metaclass=ClientMetaClass):
             num_outputs: The number of outputs for the step run
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A page with Pipeline fitting the filter description
@@ -3433,6 +3514,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             id=id,
             entrypoint_name=entrypoint_name,
             code_hash=code_hash,
@@ -3492,6 +3575,8 @@ class Client(metaclass=ClientMetaClass):
         has_custom_name: Optional[bool] = None,
         hydrate: bool = False,
         tag: Optional[str] = None,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[ArtifactResponse]:
         """Get a list of artifacts.
 
@@ -3508,6 +3593,8 @@ class Client(metaclass=ClientMetaClass):
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
             tag: Filter artifacts by tag.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A list of artifacts.
@@ -3517,6 +3604,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             id=id,
             created=created,
             updated=updated,
@@ -3585,7 +3674,7 @@ class Client(metaclass=ClientMetaClass):
             delete_from_artifact_store: Delete data from artifact metadata
         """
         if delete_from_artifact_store:
-            unused_artifact_versions = depaginate(
+            unused_artifact_versions = lazy_depaginate(
                 partial(self.list_artifact_versions, only_unused=True)
             )
             for unused_artifact_version in unused_artifact_versions:
@@ -3657,6 +3746,8 @@ class Client(metaclass=ClientMetaClass):
         has_custom_name: Optional[bool] = None,
         hydrate: bool = False,
         tag: Optional[str] = None,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[ArtifactVersionResponse]:
         """Get a list of artifact versions.
 
@@ -3685,6 +3776,8 @@ class Client(metaclass=ClientMetaClass):
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
             tag: A tag to filter by.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A list of artifact versions.
@@ -3694,6 +3787,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             id=id,
             created=created,
             updated=updated,
@@ -3794,7 +3889,7 @@ class Client(metaclass=ClientMetaClass):
         Raises:
             ValueError: If the artifact version is still used in any runs.
         """
-        if artifact_version not in depaginate(
+        if artifact_version not in lazy_depaginate(
             partial(self.list_artifact_versions, only_unused=True)
         ):
             raise ValueError(
@@ -3875,29 +3970,9 @@ class Client(metaclass=ClientMetaClass):
         Returns:
             The created metadata, as string to model dictionary.
         """
-        from zenml.metadata.metadata_types import get_metadata_type
+        from zenml.metadata.metadata_types import validate_metadata
 
-        values: Dict[str, "MetadataType"] = {}
-        types: Dict[str, "MetadataTypeEnum"] = {}
-        for key, value in metadata.items():
-            # Skip metadata that is too large to be stored in the database.
-            if len(json.dumps(value)) > TEXT_FIELD_MAX_LENGTH:
-                logger.warning(
-                    f"Metadata value for key '{key}' is too large to be "
-                    "stored in the database. Skipping."
-                )
-                continue
-            # Skip metadata that is not of a supported type.
-            try:
-                metadata_type = get_metadata_type(value)
-            except ValueError as e:
-                logger.warning(
-                    f"Metadata value for key '{key}' is not of a supported "
-                    f"type. Skipping. Full error: {e}"
-                )
-                continue
-            values[key] = value
-            types[key] = metadata_type
+        values, types = validate_metadata(metadata)
 
         run_metadata = RunMetadataRequest(
             workspace=self.active_workspace.id,
@@ -3928,6 +4003,8 @@ class Client(metaclass=ClientMetaClass):
         value: Optional["MetadataType"] = None,
         type: Optional[str] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[RunMetadataResponse]:
         """List run metadata.
 
@@ -3950,6 +4027,8 @@ class Client(metaclass=ClientMetaClass):
             type: The type of the metadata.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             The run metadata.
@@ -3959,6 +4038,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             id=id,
             created=created,
             updated=updated,
@@ -4160,6 +4241,8 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[SecretResponse]:
         """Fetches all the secret models.
 
@@ -4180,6 +4263,8 @@ class Client(metaclass=ClientMetaClass):
             user_id: The  id of the user to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A list of all the secret models without the secret values.
@@ -4193,6 +4278,8 @@ class Client(metaclass=ClientMetaClass):
             size=size,
             sort_by=sort_by,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             user_id=user_id,
             workspace_id=workspace_id,
             name=name,
@@ -4509,6 +4596,8 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[CodeRepositoryResponse]:
         """List all code repositories.
 
@@ -4525,6 +4614,8 @@ class Client(metaclass=ClientMetaClass):
             user_id: The id of the user to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A page of code repositories matching the filter description.
@@ -4534,6 +4625,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             id=id,
             created=created,
             updated=updated,
@@ -4903,6 +4996,8 @@ class Client(metaclass=ClientMetaClass):
         labels: Optional[Dict[str, Optional[str]]] = None,
         secret_id: Optional[Union[str, UUID]] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[ServiceConnectorResponse]:
         """Lists all registered service connectors.
 
@@ -4928,6 +5023,8 @@ class Client(metaclass=ClientMetaClass):
                 service connector.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A page of service connectors.
@@ -4937,6 +5034,8 @@ class Client(metaclass=ClientMetaClass):
             size=size,
             sort_by=sort_by,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             workspace_id=workspace_id or self.active_workspace.id,
             user_id=user_id,
             name=name,
@@ -5591,6 +5690,8 @@ class Client(metaclass=ClientMetaClass):
         name: Optional[str] = None,
         hydrate: bool = False,
         tag: Optional[str] = None,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[ModelResponse]:
         """Get models by filter from Model Control Plane.
 
@@ -5605,6 +5706,8 @@ class Client(metaclass=ClientMetaClass):
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
             tag: The tag of the model to filter by.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A page object with all models.
@@ -5615,6 +5718,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             created=created,
             updated=updated,
             tag=tag,
@@ -5789,6 +5894,8 @@ class Client(metaclass=ClientMetaClass):
         stage: Optional[Union[str, ModelStages]] = None,
         hydrate: bool = False,
         tag: Optional[str] = None,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[ModelVersionResponse]:
         """Get model versions by filter from Model Control Plane.
 
@@ -5807,6 +5914,8 @@ class Client(metaclass=ClientMetaClass):
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
             tag: The tag to filter by.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A page object with all model versions.
@@ -5816,6 +5925,8 @@ class Client(metaclass=ClientMetaClass):
             size=size,
             sort_by=sort_by,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             created=created,
             updated=updated,
             name=name,
@@ -5900,6 +6011,8 @@ class Client(metaclass=ClientMetaClass):
         only_deployment_artifacts: Optional[bool] = None,
         has_custom_name: Optional[bool] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[ModelVersionArtifactResponse]:
         """Get model version to artifact links by filter in Model Control Plane.
 
@@ -5922,6 +6035,8 @@ class Client(metaclass=ClientMetaClass):
             has_custom_name: Filter artifacts with/without custom names.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A page of all model version to artifact links.
@@ -5930,6 +6045,8 @@ class Client(metaclass=ClientMetaClass):
             ModelVersionArtifactFilter(
                 sort_by=sort_by,
                 logical_operator=logical_operator,
+                cursor=cursor,
+                skip_count=skip_count,
                 page=page,
                 size=size,
                 created=created,
@@ -6014,6 +6131,8 @@ class Client(metaclass=ClientMetaClass):
         pipeline_run_id: Optional[Union[UUID, str]] = None,
         pipeline_run_name: Optional[str] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[ModelVersionPipelineRunResponse]:
         """Get all model version to pipeline run links by filter.
 
@@ -6032,6 +6151,8 @@ class Client(metaclass=ClientMetaClass):
             pipeline_run_name: Use the pipeline run name for filtering
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A page of all model version to pipeline run links.
@@ -6040,6 +6161,8 @@ class Client(metaclass=ClientMetaClass):
             ModelVersionPipelineRunFilter(
                 sort_by=sort_by,
                 logical_operator=logical_operator,
+                cursor=cursor,
+                skip_count=skip_count,
                 page=page,
                 size=size,
                 created=created,
@@ -6072,6 +6195,8 @@ class Client(metaclass=ClientMetaClass):
         failed_auth_attempts: Union[int, str, None] = None,
         last_login: Optional[Union[datetime, str, None]] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[OAuthDeviceResponse]:
         """List all authorized devices.
 
@@ -6091,6 +6216,8 @@ class Client(metaclass=ClientMetaClass):
             last_login: Use the last login date for filtering.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A page of authorized devices matching the filter.
@@ -6100,6 +6227,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             id=id,
             created=created,
             updated=updated,
@@ -6225,6 +6354,8 @@ class Client(metaclass=ClientMetaClass):
         logical_operator: LogicalOperators = LogicalOperators.AND,
         trigger_id: Optional[UUID] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[TriggerExecutionResponse]:
         """List all trigger executions matching the given filter criteria.
 
@@ -6236,6 +6367,8 @@ class Client(metaclass=ClientMetaClass):
             trigger_id: ID of the trigger to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A list of all trigger executions matching the filter criteria.
@@ -6246,6 +6379,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
         )
         filter_model.set_scope_workspace(self.active_workspace.id)
         return self.zen_store.list_trigger_executions(
@@ -6537,6 +6672,8 @@ class Client(metaclass=ClientMetaClass):
         description: Optional[str] = None,
         active: Optional[bool] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[ServiceAccountResponse]:
         """List all service accounts.
 
@@ -6553,6 +6690,8 @@ class Client(metaclass=ClientMetaClass):
             active: Use the service account active status for filtering
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             The list of service accounts matching the filter description.
@@ -6563,6 +6702,8 @@ class Client(metaclass=ClientMetaClass):
                 page=page,
                 size=size,
                 logical_operator=logical_operator,
+                cursor=cursor,
+                skip_count=skip_count,
                 id=id,
                 created=created,
                 updated=updated,
@@ -6697,6 +6838,8 @@ class Client(metaclass=ClientMetaClass):
         last_login: Optional[Union[datetime, str]] = None,
         last_rotated: Optional[Union[datetime, str]] = None,
         hydrate: bool = False,
+        cursor: Optional[str] = None,
+        skip_count: bool = False,
     ) -> Page[APIKeyResponse]:
         """List all API keys.
 
@@ -6717,6 +6860,8 @@ class Client(metaclass=ClientMetaClass):
             last_rotated: The last time the API key was rotated.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            cursor: The cursor of the previous page to continue after.
+            skip_count: Whether to skip counting the total number of items.
 
         Returns:
             A page of API keys matching the filter description.
@@ -6730,6 +6875,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            cursor=cursor,
+            skip_count=skip_count,
             id=id,
             created=created,
             updated=updated,
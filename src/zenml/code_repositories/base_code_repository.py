@@ -131,6 +131,61 @@ class BaseCodeRepository(ABC):
         """
         pass
 
+    def download_archive(
+        self, commit: str, directory: str, repo_sub_directory: Optional[str]
+    ) -> bool:
+        """Downloads files from the code repository as a single archive.
+
+        Subclasses should implement this if the code repository can serve
+        its content as an archive, which requires far fewer API calls than
+        downloading each file individually.
+
+        Args:
+            commit: The commit hash to download files from.
+            directory: The directory to download files to.
+            repo_sub_directory: The subdirectory in the repository to
+                download files from.
+
+        Returns:
+            Whether the files were downloaded. If this returns False, the
+            files will be downloaded using `download_files(...)` instead.
+        """
+        return False
+
+    def download_code(
+        self, commit: str, directory: str, repo_sub_directory: Optional[str]
+    ) -> None:
+        """Downloads code from the code repository to a local directory.
+
+        The code is downloaded as an archive if the code repository supports
+        it, and file by file otherwise.
+
+        Args:
+            commit: The commit hash to download files from.
+            directory: The directory to download files to.
+            repo_sub_directory: The subdirectory in the repository to
+                download files from.
+        """
+        try:
+            if self.download_archive(
+                commit=commit,
+                directory=directory,
+                repo_sub_directory=repo_sub_directory,
+            ):
+                return
+        except Exception as e:
+            logger.warning(
+                "Failed to download code archive, downloading individual "
+                "files instead: %s",
+                e,
+            )
+
+        self.download_files(
+            commit=commit,
+            directory=directory,
+            repo_sub_directory=repo_sub_directory,
+        )
+
     @abstractmethod
     def get_local_context(
         self, path: str
@@ -24,13 +24,19 @@ from pydantic import BaseModel, Field, SecretStr, root_validator
 from zenml.constants import (
     DEFAULT_ZENML_JWT_TOKEN_ALGORITHM,
     DEFAULT_ZENML_JWT_TOKEN_LEEWAY,
+    DEFAULT_ZENML_SERVER_AUTH_CACHE_SIZE,
+    DEFAULT_ZENML_SERVER_AUTH_CACHE_TTL,
+    DEFAULT_ZENML_SERVER_CACHE_STATS_LOG_INTERVAL,
     DEFAULT_ZENML_SERVER_DEVICE_AUTH_POLLING,
     DEFAULT_ZENML_SERVER_DEVICE_AUTH_TIMEOUT,
     DEFAULT_ZENML_SERVER_LOGIN_RATE_LIMIT_DAY,
     DEFAULT_ZENML_SERVER_LOGIN_RATE_LIMIT_MINUTE,
+    DEFAULT_ZENML_SERVER_MAX_DECOMPRESSED_REQUEST_SIZE,
     DEFAULT_ZENML_SERVER_MAX_DEVICE_AUTH_ATTEMPTS,
     DEFAULT_ZENML_SERVER_NAME,
     DEFAULT_ZENML_SERVER_PIPELINE_RUN_AUTH_WINDOW,
+    DEFAULT_ZENML_SERVER_RBAC_CACHE_SIZE,
+    DEFAULT_ZENML_SERVER_RBAC_CACHE_TTL,
     DEFAULT_ZENML_SERVER_SECURE_HEADERS_CACHE,
     DEFAULT_ZENML_SERVER_SECURE_HEADERS_CONTENT,
     DEFAULT_ZENML_SERVER_SECURE_HEADERS_CSP,
@@ -138,6 +144,22 @@ class ServerConfiguration(BaseModel):
             server.
         login_rate_limit_minute: The number of login attempts allowed per minute.
         login_rate_limit_day: The number of login attempts allowed per day.
+        auth_cache_ttl_seconds: The time in seconds for which the
+            authentication context of an access token is cached by the
+            server. Set to 0 to disable caching.
+        auth_cache_size: The maximum number of authentication contexts
+            cached by the server.
+        rbac_cache_ttl_seconds: The time in seconds for which RBAC
+            permission decisions are cached by the server. Set to 0 to
+            disable caching.
+        rbac_cache_size: The maximum number of RBAC permission decisions
+            cached by the server.
+        cache_stats_log_interval_seconds: The interval in seconds in which
+            the hit, miss and eviction counts of the server caches are logged
+            at debug level. Set to 0 to disable logging the cache statistics.
+        max_decompressed_request_size: The maximum size in bytes to which a
+            compressed request body may decompress. Larger request bodies are
+            rejected.
         secure_headers_server: Custom value to be set in the `Server` HTTP
             header to identify the server. If not specified, or if set to one of
             the reserved values `enabled`, `yes`, `true`, `on`, the `Server`
@@ -265,6 +287,20 @@ class ServerConfiguration(BaseModel):
     login_rate_limit_minute: int = DEFAULT_ZENML_SERVER_LOGIN_RATE_LIMIT_MINUTE
     login_rate_limit_day: int = DEFAULT_ZENML_SERVER_LOGIN_RATE_LIMIT_DAY
 
+    auth_cache_ttl_seconds: int = DEFAULT_ZENML_SERVER_AUTH_CACHE_TTL
+    auth_cache_size: int = DEFAULT_ZENML_SERVER_AUTH_CACHE_SIZE
+
+    rbac_cache_ttl_seconds: int = DEFAULT_ZENML_SERVER_RBAC_CACHE_TTL
+    rbac_cache_size: int = DEFAULT_ZENML_SERVER_RBAC_CACHE_SIZE
+
+    cache_stats_log_interval_seconds: int = (
+        DEFAULT_ZENML_SERVER_CACHE_STATS_LOG_INTERVAL
+    )
+
+    max_decompressed_request_size: int = (
+        DEFAULT_ZENML_SERVER_MAX_DECOMPRESSED_REQUEST_SIZE
+    )
+
     secure_headers_server: Union[bool, str] = True
     secure_headers_hsts: Union[bool, str] = (
         DEFAULT_ZENML_SERVER_SECURE_HEADERS_HSTS
@@ -145,6 +145,15 @@ ENV_ZENML_HUB_URL = "ZENML_HUB_URL"
 ENV_ZENML_ENFORCE_TYPE_ANNOTATIONS = "ZENML_ENFORCE_TYPE_ANNOTATIONS"
 ENV_ZENML_ENABLE_IMPLICIT_AUTH_METHODS = "ZENML_ENABLE_IMPLICIT_AUTH_METHODS"
 ENV_ZENML_DISABLE_STEP_LOGS_STORAGE = "ZENML_DISABLE_STEP_LOGS_STORAGE"
+ENV_ZENML_OUTPUT_ARTIFACT_SAVE_PARALLELISM = (
+    "ZENML_OUTPUT_ARTIFACT_SAVE_PARALLELISM"
+)
+ENV_ZENML_INPUT_ARTIFACT_PREFETCH_PARALLELISM = (
+    "ZENML_INPUT_ARTIFACT_PREFETCH_PARALLELISM"
+)
+ENV_ZENML_NUMPY_MMAP_MODE = "ZENML_NUMPY_MMAP_MODE"
+ENV_ZENML_ARTIFACT_CACHE_PATH = "ZENML_ARTIFACT_CACHE_PATH"
+ENV_ZENML_ARTIFACT_CACHE_SIZE_MB = "ZENML_ARTIFACT_CACHE_SIZE_MB"
 ENV_ZENML_PIPELINE_API_TOKEN_EXPIRES_MINUTES = (
     "ZENML_PIPELINE_API_TOKEN_EXPIRES_MINUTES"
 )
@@ -241,6 +250,12 @@ ZENML_API_KEY_PREFIX = "ZENKEY_"
 DEFAULT_ZENML_SERVER_PIPELINE_RUN_AUTH_WINDOW = 60 * 48  # 48 hours
 DEFAULT_ZENML_SERVER_LOGIN_RATE_LIMIT_MINUTE = 5
 DEFAULT_ZENML_SERVER_LOGIN_RATE_LIMIT_DAY = 1000
+DEFAULT_ZENML_SERVER_AUTH_CACHE_TTL = 30  # seconds
+DEFAULT_ZENML_SERVER_AUTH_CACHE_SIZE = 1000
+DEFAULT_ZENML_SERVER_RBAC_CACHE_TTL = 30  # seconds
+DEFAULT_ZENML_SERVER_RBAC_CACHE_SIZE = 10000
+DEFAULT_ZENML_SERVER_CACHE_STATS_LOG_INTERVAL = 300  # seconds
+DEFAULT_ZENML_SERVER_MAX_DECOMPRESSED_REQUEST_SIZE = 32 * 1024 * 1024
 
 DEFAULT_ZENML_SERVER_SECURE_HEADERS_HSTS = (
     "max-age=63072000; includeSubdomains"
@@ -308,6 +323,7 @@ API_TOKEN = "/api_token"
 ARTIFACTS = "/artifacts"
 ARTIFACT_VERSIONS = "/artifact_versions"
 ARTIFACT_VISUALIZATIONS = "/artifact_visualizations"
+CACHED_STEP_RUN = "/cached"
 CODE_REFERENCES = "/code_references"
 CODE_REPOSITORIES = "/code_repositories"
 COMPONENT_TYPES = "/component-types"
@@ -333,6 +349,7 @@ PIPELINE_DEPLOYMENTS = "/pipeline_deployments"
 PIPELINES = "/pipelines"
 PIPELINE_SPEC = "/pipeline-spec"
 PLUGIN_FLAVORS = "/plugin-flavors"
+REGISTER = "/register"
 RUNS = "/runs"
 RUN_METADATA = "/run-metadata"
 SCHEDULES = "/schedules"
@@ -358,6 +375,7 @@ STACK_COMPONENTS = "/components"
 STATISTICS = "/statistics"
 STATUS = "/status"
 STEP_CONFIGURATION = "/step-configuration"
+STEP_INPUTS = "/step-inputs"
 STEPS = "/steps"
 TAGS = "/tags"
 TRIGGERS = "/triggers"
@@ -390,6 +408,7 @@ PAGE_SIZE_MAXIMUM: int = handle_int_env_var(
     ENV_ZENML_PAGINATION_DEFAULT_LIMIT, default=10000
 )
 FILTERING_DATETIME_FORMAT: str = "%Y-%m-%d %H:%M:%S"
+DEPAGINATION_MAX_WORKERS: int = 8
 
 # Metadata constants
 METADATA_ORCHESTRATOR_URL = "orchestrator_url"
@@ -444,11 +463,6 @@ LATEST_MODEL_VERSION_PLACEHOLDER = "__latest__"
 # Service connector constants
 SERVICE_CONNECTOR_SKEW_TOLERANCE_SECONDS = 60 * 5  # 5 minutes
 
-# Versioned entities
-MAX_RETRIES_FOR_VERSIONED_ENTITY_CREATION = (
-    10  # empirical value to pass heavy parallelized tests
-)
-
 
 FINISHED_ONBOARDING_SURVEY_KEY = "awareness_channels"
 
@@ -27,7 +27,12 @@ from zenml.constants import (
     handle_bool_env_var,
 )
 from zenml.logger import get_logger
-from zenml.utils import code_repository_utils, source_utils, uuid_utils
+from zenml.utils import (
+    code_repository_utils,
+    code_utils,
+    source_utils,
+    uuid_utils,
+)
 
 if TYPE_CHECKING:
     from zenml.models import PipelineDeploymentResponse
@@ -225,10 +230,11 @@ class BaseEntrypointConfiguration(ABC):
             code_repo_root, code_reference.subdirectory
         )
         os.makedirs(download_dir)
-        repo.download_files(
+        code_utils.download_code(
+            code_repository=repo,
             commit=code_reference.commit,
+            sub_directory=code_reference.subdirectory,
             directory=download_dir,
-            repo_sub_directory=code_reference.subdirectory,
         )
         source_utils.set_custom_source_root(download_dir)
         code_repository_utils.set_custom_local_repository(
@@ -14,7 +14,7 @@
 """Base class for all the Event Hub."""
 
 from functools import partial
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Iterator, List
 
 from zenml import EventSourceResponse
 from zenml.enums import PluginType
@@ -30,7 +30,7 @@ from zenml.models import (
     TriggerFilter,
     TriggerResponse,
 )
-from zenml.utils.pagination_utils import depaginate
+from zenml.utils.pagination_utils import lazy_depaginate
 from zenml.zen_server.utils import plugin_flavor_registry
 
 logger = get_logger(__name__)
@@ -125,7 +125,7 @@ class InternalEventHub(BaseEventHub):
             The list of matching triggers.
         """
         # get all event sources configured for this flavor
-        triggers: List[TriggerResponse] = depaginate(
+        triggers: Iterator[TriggerResponse] = lazy_depaginate(
             partial(
                 self.zen_store.list_triggers,
                 trigger_filter_model=TriggerFilter(
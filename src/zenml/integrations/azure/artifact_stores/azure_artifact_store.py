@@ -34,6 +34,7 @@ from zenml.integrations.azure.flavors.azure_artifact_store_flavor import (
 from zenml.io.fileio import convert_to_str
 from zenml.secret.schemas import AzureSecretSchema
 from zenml.stack.authentication_mixin import AuthenticationMixin
+from zenml.utils import io_utils
 
 PathType = Union[bytes, str]
 
@@ -357,3 +358,31 @@ class AzureArtifactStore(BaseArtifactStore, AuthenticationMixin):
             files,
         ) in self.filesystem.walk(path=top):
             yield f"{prefix}{directory}", subdirectories, files
+
+    def put_dir(
+        self, src: str, dst: PathType, overwrite: bool = False
+    ) -> None:
+        """Uploads a local directory to the artifact store in batches.
+
+        Args:
+            src: The local directory to upload.
+            dst: The destination path in the artifact store.
+            overwrite: Whether to overwrite existing destination files.
+        """
+        io_utils.fsspec_put_dir(
+            self.filesystem, src, convert_to_str(dst), overwrite=overwrite
+        )
+
+    def get_dir(
+        self, src: PathType, dst: str, overwrite: bool = False
+    ) -> None:
+        """Downloads a directory of the artifact store in batches.
+
+        Args:
+            src: The directory in the artifact store to download.
+            dst: The local destination directory.
+            overwrite: Whether to overwrite existing destination files.
+        """
+        io_utils.fsspec_get_dir(
+            self.filesystem, convert_to_str(src), dst, overwrite=overwrite
+        )
@@ -26,7 +26,6 @@ from zenml.integrations.bentoml.constants import DEFAULT_BENTO_FILENAME
 from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
-from zenml.utils import io_utils
 
 if TYPE_CHECKING:
     from zenml.metadata.metadata_types import MetadataType
@@ -53,7 +52,7 @@ class BentoMaterializer(BaseMaterializer):
         temp_dir = tempfile.TemporaryDirectory()
 
         # Copy from artifact store to temporary directory
-        io_utils.copy_dir(self.uri, temp_dir.name)
+        self.artifact_store.get_dir(self.uri, temp_dir.name)
 
         # Load the Bento from the temporary directory
         imported_bento = Bento.import_from(
@@ -81,7 +80,7 @@ class BentoMaterializer(BaseMaterializer):
         bentoml.export_bento(bento.tag, temp_bento_path)
 
         # copy the saved image to the artifact store
-        io_utils.copy_dir(temp_dir.name, self.uri)
+        self.artifact_store.put_dir(temp_dir.name, self.uri)
 
         # Remove the temporary directory
         fileio.rmtree(temp_dir.name)
@@ -15,6 +15,7 @@
 
 import os
 import re
+import tempfile
 from typing import List, Optional
 
 import requests
@@ -30,6 +31,7 @@ from zenml.code_repositories.base_code_repository import (
 )
 from zenml.code_repositories.git import LocalGitRepositoryContext
 from zenml.logger import get_logger
+from zenml.utils import code_utils
 from zenml.utils.secret_utils import SecretField
 
 logger = get_logger(__name__)
@@ -131,6 +133,41 @@ class GitHubCodeRepository(BaseCodeRepository):
         except Exception as e:
             raise RuntimeError(f"An error occurred while logging in: {str(e)}")
 
+    def download_archive(
+        self, commit: str, directory: str, repo_sub_directory: Optional[str]
+    ) -> bool:
+        """Downloads the tarball of a commit and extracts it.
+
+        Args:
+            commit: The commit to download.
+            directory: The directory to download to.
+            repo_sub_directory: The sub directory to download from.
+
+        Returns:
+            True, as the files were downloaded.
+        """
+        archive_url = self.github_repo.get_archive_link("tarball", ref=commit)
+
+        with tempfile.TemporaryFile() as f:
+            with requests.get(
+                archive_url, stream=True, timeout=60
+            ) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    f.write(chunk)
+            f.seek(0)
+
+            # The tarball contains a single top-level directory named after
+            # the repository and commit
+            code_utils.extract_archive(
+                fileobj=f,
+                directory=directory,
+                strip_components=1,
+                sub_directory=repo_sub_directory,
+            )
+
+        return True
+
     def download_files(
         self, commit: str, directory: str, repo_sub_directory: Optional[str]
     ) -> None:
@@ -15,6 +15,7 @@
 
 import os
 import re
+import tempfile
 from typing import Optional
 
 from gitlab import Gitlab
@@ -31,6 +32,7 @@ from zenml.code_repositories.git.local_git_repository_context import (
     LocalGitRepositoryContext,
 )
 from zenml.logger import get_logger
+from zenml.utils import code_utils
 from zenml.utils.secret_utils import SecretField
 
 logger = get_logger(__name__)
@@ -94,6 +96,36 @@ class GitLabCodeRepository(BaseCodeRepository):
         except Exception as e:
             raise RuntimeError(f"An error occurred while logging in: {str(e)}")
 
+    def download_archive(
+        self, commit: str, directory: str, repo_sub_directory: Optional[str]
+    ) -> bool:
+        """Downloads the archive of a commit and extracts it.
+
+        Args:
+            commit: The commit to download.
+            directory: The directory to download to.
+            repo_sub_directory: The sub directory to download from.
+
+        Returns:
+            True, as the files were downloaded.
+        """
+        with tempfile.TemporaryFile() as f:
+            self.gitlab_project.repository_archive(
+                sha=commit, streamed=True, action=f.write
+            )
+            f.seek(0)
+
+            # The archive contains a single top-level directory named after
+            # the project and commit
+            code_utils.extract_archive(
+                fileobj=f,
+                directory=directory,
+                strip_components=1,
+                sub_directory=repo_sub_directory,
+            )
+
+        return True
+
     def download_files(
         self, commit: str, directory: str, repo_sub_directory: Optional[str]
     ) -> None:
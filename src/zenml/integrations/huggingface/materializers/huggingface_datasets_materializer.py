@@ -25,7 +25,6 @@ from zenml.enums import ArtifactType
 from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.materializers.pandas_materializer import PandasMaterializer
-from zenml.utils import io_utils
 
 if TYPE_CHECKING:
     from zenml.metadata.metadata_types import MetadataType
@@ -53,7 +52,7 @@ class HFDatasetMaterializer(BaseMaterializer):
             The dataset read from the specified dir.
         """
         temp_dir = mkdtemp()
-        io_utils.copy_dir(
+        self.artifact_store.get_dir(
             os.path.join(self.uri, DEFAULT_DATASET_DIR),
             temp_dir,
         )
@@ -69,7 +68,7 @@ class HFDatasetMaterializer(BaseMaterializer):
         path = os.path.join(temp_dir.name, DEFAULT_DATASET_DIR)
         try:
             ds.save_to_disk(path)
-            io_utils.copy_dir(
+            self.artifact_store.put_dir(
                 path,
                 os.path.join(self.uri, DEFAULT_DATASET_DIR),
             )
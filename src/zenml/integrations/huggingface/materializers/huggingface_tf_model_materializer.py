@@ -26,7 +26,6 @@ from transformers import (  # type: ignore [import-untyped]
 from zenml.enums import ArtifactType
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.metadata.metadata_types import MetadataType
-from zenml.utils import io_utils
 
 DEFAULT_TF_MODEL_DIR = "hf_tf_model"
 
@@ -47,7 +46,7 @@ class HFTFModelMaterializer(BaseMaterializer):
             The model read from the specified dir.
         """
         temp_dir = TemporaryDirectory()
-        io_utils.copy_dir(
+        self.artifact_store.get_dir(
             os.path.join(self.uri, DEFAULT_TF_MODEL_DIR), temp_dir.name
         )
 
@@ -66,7 +65,7 @@ class HFTFModelMaterializer(BaseMaterializer):
         """
         temp_dir = TemporaryDirectory()
         model.save_pretrained(temp_dir.name)
-        io_utils.copy_dir(
+        self.artifact_store.put_dir(
             temp_dir.name,
             os.path.join(self.uri, DEFAULT_TF_MODEL_DIR),
         )
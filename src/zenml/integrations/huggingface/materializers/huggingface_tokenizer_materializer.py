@@ -24,7 +24,6 @@ from transformers.tokenization_utils_base import (  # type: ignore [import-untyp
 
 from zenml.enums import ArtifactType
 from zenml.materializers.base_materializer import BaseMaterializer
-from zenml.utils import io_utils
 
 DEFAULT_TOKENIZER_DIR = "hf_tokenizer"
 
@@ -47,7 +46,7 @@ class HFTokenizerMaterializer(BaseMaterializer):
             The tokenizer read from the specified dir.
         """
         temp_dir = TemporaryDirectory()
-        io_utils.copy_dir(
+        self.artifact_store.get_dir(
             os.path.join(self.uri, DEFAULT_TOKENIZER_DIR), temp_dir.name
         )
 
@@ -61,7 +60,7 @@ class HFTokenizerMaterializer(BaseMaterializer):
         """
         temp_dir = TemporaryDirectory()
         tokenizer.save_pretrained(temp_dir.name)
-        io_utils.copy_dir(
+        self.artifact_store.put_dir(
             temp_dir.name,
             os.path.join(self.uri, DEFAULT_TOKENIZER_DIR),
         )
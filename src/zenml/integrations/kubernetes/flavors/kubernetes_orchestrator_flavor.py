@@ -15,6 +15,8 @@
 
 from typing import TYPE_CHECKING, Optional, Type
 
+from pydantic import PositiveInt
+
 from zenml.config.base_settings import BaseSettings
 from zenml.constants import KUBERNETES_CLUSTER_RESOURCE_TYPE
 from zenml.integrations.kubernetes import KUBERNETES_ORCHESTRATOR_FLAVOR
@@ -42,12 +44,24 @@ class KubernetesOrchestratorSettings(BaseSettings):
             orchestrator pod. If not provided, a new service account with "edit"
             permissions will be created.
         pod_settings: Pod settings to apply.
+        max_parallelism: Maximum number of step pods to run at the same time.
+            If not set, all steps whose upstream steps have finished are
+            started immediately.
+        fail_fast: If `True`, the orchestrator pod stops launching new step
+            pods as soon as one step failed. Steps downstream of a failed
+            step are never launched.
+        prioritize_critical_path: If `True` and more steps are ready than
+            allowed by `max_parallelism`, the steps with the longest chain of
+            downstream steps are launched first.
     """
 
     synchronous: bool = True
     timeout: int = 0
     service_account_name: Optional[str] = None
     pod_settings: Optional[KubernetesPodSettings] = None
+    max_parallelism: Optional[PositiveInt] = None
+    fail_fast: bool = False
+    prioritize_critical_path: bool = False
 
 
 class KubernetesOrchestratorConfig(  # type: ignore[misc] # https://github.com/pydantic/pydantic/issues/4173
@@ -33,9 +33,11 @@ Adjusted from https://github.com/tensorflow/tfx/blob/master/tfx/utils/kube_utils
 
 import datetime
 import enum
+import math
 import re
+import threading
 import time
-from typing import Any, Callable, Optional, TypeVar, cast
+from typing import Any, Callable, Optional, Tuple, TypeVar, cast
 
 from kubernetes import client as k8s_client
 from kubernetes import config as k8s_config
@@ -50,6 +52,13 @@ from zenml.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Time to wait for the remaining logs of a finished pod to be streamed.
+LOG_STREAM_JOIN_TIMEOUT_SECONDS = 30
+
+_LOG_TIMESTAMP_REGEX = re.compile(
+    r"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d+))?Z$"
+)
+
 
 class PodPhase(enum.Enum):
     """Phase of the Kubernetes pod.
@@ -168,6 +177,138 @@ def get_pod(
         raise RuntimeError from e
 
 
+def _parse_log_line(line: str) -> Tuple[Optional[datetime.datetime], str]:
+    """Split a pod log line that was requested with timestamps.
+
+    Args:
+        line: The log line, prefixed with an RFC3339 timestamp.
+
+    Returns:
+        The timestamp of the line (or `None` if the line doesn't start with a
+        valid timestamp) and the actual log message.
+    """
+    timestamp_str, _, message = line.partition(" ")
+    match = _LOG_TIMESTAMP_REGEX.match(timestamp_str)
+    if not match:
+        return None, line
+
+    seconds, fraction = match.groups()
+    timestamp = datetime.datetime.strptime(seconds, "%Y-%m-%dT%H:%M:%S")
+    if fraction:
+        # Kubernetes uses nanosecond precision, datetime only microseconds.
+        timestamp += datetime.timedelta(
+            microseconds=int(fraction[:6].ljust(6, "0"))
+        )
+    return timestamp, message
+
+
+def stream_pod_logs(
+    core_api_fn: Callable[[], k8s_client.CoreV1Api],
+    pod_name: str,
+    namespace: str,
+    stop_event: Optional[threading.Event] = None,
+) -> None:
+    """Stream the logs of a pod to `zenml.logger.info()`.
+
+    The logs are read using a single request that follows the log output of
+    the pod, so each log line is only transferred once. If the connection is
+    interrupted while the pod is still running, the stream is resumed starting
+    at the timestamp of the last received log line. As multiple lines can
+    share the same timestamp, only as many lines with that timestamp as were
+    logged before are skipped when resuming.
+
+    Args:
+        core_api_fn: Function to get a `CoreV1Api` client for the Kubernetes
+            API.
+        pod_name: The name of the pod.
+        namespace: The namespace of the pod.
+        stop_event: Optional event to stop streaming before the pod finished.
+    """
+    last_timestamp: Optional[datetime.datetime] = None
+    # Number of logged lines with the last timestamp
+    last_timestamp_count = 0
+
+    while not (stop_event and stop_event.is_set()):
+        core_api = core_api_fn()
+
+        since_seconds = None
+        if last_timestamp:
+            elapsed = datetime.datetime.utcnow() - last_timestamp
+            # Add some margin in case the clocks are not in sync, duplicate
+            # lines are skipped based on their timestamp.
+            since_seconds = max(math.ceil(elapsed.total_seconds()), 0) + 1
+
+        try:
+            response = core_api.read_namespaced_pod_log(
+                name=pod_name,
+                namespace=namespace,
+                follow=True,
+                timestamps=True,
+                since_seconds=since_seconds,
+                _preload_content=False,
+            )
+        except ApiException as e:
+            logger.debug(
+                "Failed to read logs of pod `%s:%s`: %s",
+                namespace,
+                pod_name,
+                e,
+            )
+        else:
+            # When resuming, skip the lines that were already logged before
+            # the connection was interrupted.
+            skip_until = last_timestamp
+            skip_count = last_timestamp_count
+            buffer = b""
+            try:
+                for chunk in response.stream(decode_content=True):
+                    buffer += chunk
+                    *lines, buffer = buffer.split(b"\n")
+                    for line in lines:
+                        timestamp, message = _parse_log_line(
+                            line.decode(errors="replace")
+                        )
+                        if skip_until and timestamp:
+                            if timestamp < skip_until:
+                                continue
+                            if timestamp == skip_until and skip_count > 0:
+                                skip_count -= 1
+                                continue
+                            skip_until = None
+
+                        if timestamp:
+                            if timestamp == last_timestamp:
+                                last_timestamp_count += 1
+                            else:
+                                last_timestamp = timestamp
+                                last_timestamp_count = 1
+                        logger.info(message)
+
+                    if stop_event and stop_event.is_set():
+                        return
+            except Exception as e:
+                logger.debug(
+                    "Log stream of pod `%s:%s` was interrupted: %s",
+                    namespace,
+                    pod_name,
+                    e,
+                )
+            finally:
+                response.release_conn()
+
+            if buffer:
+                _, message = _parse_log_line(buffer.decode(errors="replace"))
+                logger.info(message)
+
+        # The log stream ends when the pod terminates, otherwise the
+        # connection was interrupted and we need to resume streaming.
+        pod = get_pod(core_api_fn(), pod_name, namespace)
+        if pod is None or pod_is_done(pod) or pod_failed(pod):
+            return
+
+        time.sleep(1)
+
+
 def wait_pod(
     core_api_fn: Callable[[], k8s_client.CoreV1Api],
     pod_name: str,
@@ -195,7 +336,8 @@ def wait_pod(
         exponential_backoff: Whether to use exponential back off for polling.
             Defaults to False.
         stream_logs: Whether to stream the pod logs to
-            `zenml.logger.info()`. Defaults to False.
+            `zenml.logger.info()`. Defaults to False. The logs are streamed in
+            a separate thread once the pod is not pending anymore.
 
     Raises:
         RuntimeError: when the function times out.
@@ -210,45 +352,67 @@ def wait_pod(
     backoff_interval = 1
     maximum_backoff = 32
 
-    logged_lines = 0
+    log_thread: Optional[threading.Thread] = None
+    stop_log_stream = threading.Event()
 
-    while True:
-        core_api = core_api_fn()
-        resp = get_pod(core_api, pod_name, namespace)
+    def _stop_log_stream(pod: Optional[k8s_client.V1Pod]) -> None:
+        """Stops streaming the logs of the pod.
 
-        # Stream logs to `zenml.logger.info()`.
-        # TODO: can we do this without parsing all logs every time?
-        if stream_logs and pod_is_not_pending(resp):
-            response = core_api.read_namespaced_pod_log(
-                name=pod_name,
-                namespace=namespace,
-            )
-            logs = response.splitlines()
-            if len(logs) > logged_lines:
-                for line in logs[logged_lines:]:
-                    logger.info(line)
-                logged_lines = len(logs)
-
-        # Raise an error if the pod failed.
-        if pod_failed(resp):
-            raise RuntimeError(f"Pod `{namespace}:{pod_name}` failed.")
-
-        # Check if pod is in desired state (e.g. finished / running / ...).
-        if exit_condition_lambda(resp):
-            return resp
-
-        # Check if wait timed out.
-        elapse_time = datetime.datetime.utcnow() - start_time
-        if elapse_time.seconds >= timeout_sec and timeout_sec != 0:
-            raise RuntimeError(
-                f"Waiting for pod `{namespace}:{pod_name}` timed out after "
-                f"{timeout_sec} seconds."
-            )
+        Args:
+            pod: The current state of the pod.
+        """
+        if not log_thread:
+            return
 
-        # Wait (using exponential backoff).
-        time.sleep(backoff_interval)
-        if exponential_backoff and backoff_interval < maximum_backoff:
-            backoff_interval *= 2
+        if pod is not None and (pod_is_done(pod) or pod_failed(pod)):
+            # The log stream ends by itself once the pod terminated, wait
+            # for the remaining logs to be streamed.
+            log_thread.join(timeout=LOG_STREAM_JOIN_TIMEOUT_SECONDS)
+        stop_log_stream.set()
+
+    try:
+        while True:
+            core_api = core_api_fn()
+            resp = get_pod(core_api, pod_name, namespace)
+
+            # Stream logs to `zenml.logger.info()`.
+            if stream_logs and not log_thread and pod_is_not_pending(resp):
+                log_thread = threading.Thread(
+                    target=stream_pod_logs,
+                    kwargs=dict(
+                        core_api_fn=core_api_fn,
+                        pod_name=pod_name,
+                        namespace=namespace,
+                        stop_event=stop_log_stream,
+                    ),
+                    daemon=True,
+                )
+                log_thread.start()
+
+            # Raise an error if the pod failed.
+            if pod_failed(resp):
+                _stop_log_stream(resp)
+                raise RuntimeError(f"Pod `{namespace}:{pod_name}` failed.")
+
+            # Check if pod is in desired state (e.g. finished / running / ...).
+            if exit_condition_lambda(resp):
+                _stop_log_stream(resp)
+                return resp
+
+            # Check if wait timed out.
+            elapse_time = datetime.datetime.utcnow() - start_time
+            if elapse_time.seconds >= timeout_sec and timeout_sec != 0:
+                raise RuntimeError(
+                    f"Waiting for pod `{namespace}:{pod_name}` timed out "
+                    f"after {timeout_sec} seconds."
+                )
+
+            # Wait (using exponential backoff).
+            time.sleep(backoff_interval)
+            if exponential_backoff and backoff_interval < maximum_backoff:
+                backoff_interval *= 2
+    finally:
+        stop_log_stream.set()
 
 
 FuncT = TypeVar("FuncT", bound=Callable[..., Any])
@@ -15,6 +15,7 @@
 
 import argparse
 import socket
+from typing import cast
 
 from kubernetes import client as k8s_client
 
@@ -54,7 +55,11 @@ def parse_args() -> argparse.Namespace:
 
 
 def main() -> None:
-    """Entrypoint of the k8s master/orchestrator pod."""
+    """Entrypoint of the k8s master/orchestrator pod.
+
+    Raises:
+        RuntimeError: If any of the pipeline steps failed.
+    """
     # Log to the container's stdout so it can be streamed by the client.
     logger.info("Kubernetes orchestrator pod started.")
 
@@ -138,7 +143,24 @@ def main() -> None:
         )
         logger.info(f"Pod of step `{step_name}` completed.")
 
-    ThreadedDagRunner(dag=pipeline_dag, run_fn=run_step_on_kubernetes).run()
+    pipeline_settings = cast(
+        KubernetesOrchestratorSettings,
+        orchestrator.get_settings(deployment_config),
+    )
+    dag_runner = ThreadedDagRunner(
+        dag=pipeline_dag,
+        run_fn=run_step_on_kubernetes,
+        max_parallelism=pipeline_settings.max_parallelism,
+        fail_fast=pipeline_settings.fail_fast,
+        prioritize_critical_path=pipeline_settings.prioritize_critical_path,
+    )
+    dag_runner.run()
+
+    if dag_runner.failed_nodes:
+        raise RuntimeError(
+            "Pipeline run failed because the following steps failed: "
+            f"{', '.join(dag_runner.failed_nodes)}."
+        )
 
     logger.info("Orchestration pod completed.")
 
@@ -22,7 +22,7 @@ class PolarsIntegration(Integration):
 
     NAME = POLARS
     REQUIREMENTS = [
-        "polars>=0.19.5",
+        "polars>=0.19.13",
         "pyarrow>=12.0.0"
     ]
 
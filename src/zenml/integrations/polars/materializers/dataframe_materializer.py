@@ -15,16 +15,21 @@
 
 import os
 import tempfile
-from typing import Any, ClassVar, Tuple, Type, Union
+from typing import Any, ClassVar, Dict, Tuple, Type, Union
 
 import polars as pl
 import pyarrow as pa  # type: ignore
 import pyarrow.parquet as pq  # type: ignore
 
+from zenml.artifacts.artifact_load_config import ArtifactLoadConfig
 from zenml.enums import ArtifactType
 from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
-from zenml.utils import io_utils
+from zenml.metadata.metadata_types import DType, MetadataType
+from zenml.utils.statistics_utils import (
+    DEFAULT_CHUNK_SIZE,
+    RunningStatistics,
+)
 
 
 class PolarsMaterializer(BaseMaterializer):
@@ -36,6 +41,23 @@ class PolarsMaterializer(BaseMaterializer):
     )
     ASSOCIATED_ARTIFACT_TYPE = ArtifactType.DATA
 
+    @classmethod
+    def can_handle_type(cls, data_type: Type[Any]) -> bool:
+        """Whether the materializer can read/write a certain type.
+
+        In addition to the associated types, artifacts can be loaded lazily as
+        a `pl.LazyFrame`.
+
+        Args:
+            data_type: The type to check.
+
+        Returns:
+            Whether the materializer can read/write the given type.
+        """
+        return super().can_handle_type(data_type) or issubclass(
+            data_type, pl.LazyFrame
+        )
+
     def load(self, data_type: Type[Any]) -> Any:
         """Reads and returns Polars data after copying it to temporary path.
 
@@ -43,38 +65,72 @@ class PolarsMaterializer(BaseMaterializer):
             data_type: The type of the data to read.
 
         Returns:
-            A Polars data frame or series.
+            A Polars data frame or series, or a lazy frame if requested by the
+            data type.
         """
+        if issubclass(data_type, pl.LazyFrame):
+            # Files of remote artifact stores are downloaded to the local
+            # artifact cache first.
+            return pl.scan_parquet(self._get_local_path(self._parquet_path))
+
         # Create a temporary directory to store the model
         temp_dir = tempfile.TemporaryDirectory()
 
         # Copy from artifact store to temporary directory
-        io_utils.copy_dir(self.uri, temp_dir.name)
+        self.artifact_store.get_dir(self.uri, temp_dir.name)
 
         # Load the data from the temporary directory
         table = pq.read_table(
             os.path.join(temp_dir.name, "dataframe.parquet").replace("\\", "/")
         )
-
-        # If the data is of type pl.Series, convert it back to a pyarrow array
-        # instead of a table.
-        if (
-            table.schema.metadata
-            and b"zenml_is_pl_series" in table.schema.metadata
-        ):
-            isinstance_bytes = table.schema.metadata[b"zenml_is_pl_series"]
-            isinstance_series = bool.from_bytes(isinstance_bytes, "big")
-            if isinstance_series:
-                table = table.column(0)
-
-        # Convert the table to a Polars data frame or series
-        data = pl.from_arrow(table)
+        data = _table_to_polars(table)
 
         # Cleanup and return
         fileio.rmtree(temp_dir.name)
 
         return data
 
+    def load_with_config(
+        self, data_type: Type[Any], load_config: ArtifactLoadConfig
+    ) -> Union[pl.DataFrame, pl.Series]:
+        """Reads only the requested columns and rows of Polars data.
+
+        The column selection and row filters are pushed down to the Parquet
+        reader, which skips all other columns and all row groups that can't
+        contain matching rows.
+
+        Args:
+            data_type: The type of the data to read.
+            load_config: The columns and rows to load.
+
+        Raises:
+            ValueError: If a lazy frame should be loaded.
+
+        Returns:
+            A Polars data frame or series.
+        """
+        if issubclass(data_type, pl.LazyFrame):
+            raise ValueError(
+                "Lazy frames are loaded lazily, please select the columns "
+                "and rows on the lazy frame instead of using an "
+                "`ArtifactLoadConfig`."
+            )
+
+        with self.artifact_store.open(self._parquet_path, "rb") as f:
+            table = pq.read_table(
+                f, columns=load_config.columns, filters=load_config.filters
+            )
+        return _table_to_polars(table)
+
+    @property
+    def _parquet_path(self) -> str:
+        """The path of the Parquet file in the artifact store.
+
+        Returns:
+            The path of the Parquet file.
+        """
+        return os.path.join(self.uri, "dataframe.parquet").replace("\\", "/")
+
     def save(self, data: Union[pl.DataFrame, pl.Series]) -> None:
         """Writes Polars data to the artifact store.
 
@@ -115,7 +171,92 @@ class PolarsMaterializer(BaseMaterializer):
             "\\", "/"
         )
         pq.write_table(table, path)  # Uses lz4 compression by default
-        io_utils.copy_dir(temp_dir.name, self.uri)
+        self.artifact_store.put_dir(temp_dir.name, self.uri)
 
         # Remove the temporary directory
         fileio.rmtree(temp_dir.name)
+
+    def extract_metadata(
+        self, data: Union[pl.DataFrame, pl.Series]
+    ) -> Dict[str, "MetadataType"]:
+        """Extract metadata from the given Polars dataframe or series.
+
+        Args:
+            data: The Polars dataframe or series to extract metadata from.
+
+        Returns:
+            The extracted metadata as a dictionary.
+        """
+        polars_metadata: Dict[str, "MetadataType"] = {"shape": data.shape}
+
+        if isinstance(data, pl.Series):
+            polars_metadata["dtype"] = DType(data.dtype)
+            if data.dtype.is_numeric():
+                polars_metadata.update(_compute_series_statistics(data))
+        else:
+            polars_metadata["dtype"] = {
+                name: DType(dtype) for name, dtype in data.schema.items()
+            }
+            column_statistics = {
+                column.name: _compute_series_statistics(column)
+                for column in data.get_columns()
+                if column.dtype.is_numeric()
+            }
+            for stat_name in ["mean", "std", "min", "max"]:
+                polars_metadata[stat_name] = {
+                    name: statistics[stat_name]
+                    for name, statistics in column_statistics.items()
+                }
+
+        return polars_metadata
+
+
+def _table_to_polars(table: pa.Table) -> Union[pl.DataFrame, pl.Series]:
+    """Converts a PyArrow table to a Polars data frame or series.
+
+    Args:
+        table: The table to convert.
+
+    Returns:
+        A Polars series if the table was created from a series, otherwise a
+        Polars data frame.
+    """
+    # If the data is of type pl.Series, convert it back to a pyarrow array
+    # instead of a table.
+    if (
+        table.schema.metadata
+        and b"zenml_is_pl_series" in table.schema.metadata
+    ):
+        isinstance_bytes = table.schema.metadata[b"zenml_is_pl_series"]
+        isinstance_series = bool.from_bytes(isinstance_bytes, "big")
+        if isinstance_series:
+            table = table.column(0)
+
+    # Convert the table to a Polars data frame or series
+    return pl.from_arrow(table)
+
+
+def _compute_series_statistics(series: pl.Series) -> Dict[str, float]:
+    """Computes the mean, standard deviation, min and max of a series.
+
+    Null values are skipped and the standard deviation uses one delta degree
+    of freedom, like the Polars equivalents.
+
+    Args:
+        series: The numeric series for which to compute the statistics.
+
+    Returns:
+        The statistics of the series.
+    """
+    # Chunks are cast separately so that no float copy of the full column is
+    # allocated.
+    statistics = RunningStatistics(skipna=True)
+    for offset in range(0, len(series), DEFAULT_CHUNK_SIZE):
+        statistics.update(
+            series.slice(offset, DEFAULT_CHUNK_SIZE)
+            .cast(pl.Float64)
+            .to_numpy()
+        )
+    return {
+        key: float(value) for key, value in statistics.to_dict(ddof=1).items()
+    }
@@ -67,7 +67,6 @@ from xgboost import XGBClassifier, XGBRegressor
 from zenml.enums import ArtifactType
 from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
-from zenml.utils import io_utils
 
 
 class PyCaretMaterializer(BaseMaterializer):
@@ -137,7 +136,7 @@ class PyCaretMaterializer(BaseMaterializer):
         temp_dir = tempfile.TemporaryDirectory()
 
         # Copy from artifact store to temporary directory
-        io_utils.copy_dir(self.uri, temp_dir.name)
+        self.artifact_store.get_dir(self.uri, temp_dir.name)
 
         # Load the model from the temporary directory
         model = load_model(temp_dir.name)
@@ -156,7 +155,7 @@ class PyCaretMaterializer(BaseMaterializer):
         # Create a temporary directory to store the model
         temp_dir = tempfile.TemporaryDirectory()
         save_model(model, temp_dir.name)
-        io_utils.copy_dir(temp_dir.name, self.uri)
+        self.artifact_store.put_dir(temp_dir.name, self.uri)
 
         # Remove the temporary directory
         fileio.rmtree(temp_dir.name)
@@ -15,6 +15,8 @@
 
 from typing import Dict, List, Literal, Optional, Union
 
+from pydantic import PositiveInt
+
 from zenml.config.base_settings import BaseSettings
 from zenml.logger import get_logger
 from zenml.orchestrators import BaseOrchestratorConfig
@@ -86,6 +88,15 @@ class SkypilotBaseOrchestratorSettings(BaseSettings):
         stream_logs: if True, show the logs in the terminal.
         docker_run_args: Optional arguments to pass to the `docker run` command
             running inside the VM.
+        max_parallelism: Maximum number of steps to run on VMs at the same
+            time. If not set, all steps whose upstream steps have finished are
+            started immediately.
+        fail_fast: If `True`, the orchestrator VM stops launching new steps
+            as soon as one step failed. Steps downstream of a failed step are
+            never launched.
+        prioritize_critical_path: If `True` and more steps are ready than
+            allowed by `max_parallelism`, the steps with the longest chain of
+            downstream steps are launched first.
     """
 
     # Resources
@@ -111,6 +122,11 @@ class SkypilotBaseOrchestratorSettings(BaseSettings):
 
     docker_run_args: List[str] = []
 
+    # Orchestration settings
+    max_parallelism: Optional[PositiveInt] = None
+    fail_fast: bool = False
+    prioritize_critical_path: bool = False
+
 
 class SkypilotBaseOrchestratorConfig(  # type: ignore[misc] # https://github.com/pydantic/pydantic/issues/4173
     BaseOrchestratorConfig, SkypilotBaseOrchestratorSettings
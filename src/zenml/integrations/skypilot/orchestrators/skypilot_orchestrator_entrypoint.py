@@ -65,6 +65,7 @@ def main() -> None:
         TypeError: If the active stack's orchestrator is not an instance of
             SkypilotBaseOrchestrator.
         ValueError: If the active stack's container registry is None.
+        RuntimeError: If any of the pipeline steps failed.
     """
     # Log to the container's stdout so it can be streamed by the client.
     logger.info("Skypilot orchestrator VM started.")
@@ -165,6 +166,9 @@ def main() -> None:
 
         Args:
             step_name: Name of the step.
+
+        Raises:
+            RuntimeError: If the step failed.
         """
         cluster_name = unique_resource_configs[step_name]
 
@@ -234,41 +238,73 @@ def main() -> None:
         # Wait for pod to finish.
         logger.info(f"Waiting for pod of step `{step_name}` to start...")
 
-        current_run = Client().get_pipeline_run(run.id)
-
-        step_is_finished = False
-        while not step_is_finished:
-            time.sleep(10)
+        try:
             current_run = Client().get_pipeline_run(run.id)
-            try:
-                step_is_finished = current_run.steps[
-                    step_name
-                ].status.is_finished
-            except KeyError:
-                # Step is not yet in the run, so we wait for it to appear
-                continue
-
-        # Pop the resource configuration for this step
-        unique_resource_configs.pop(step_name)
-
-        if cluster_name in unique_resource_configs.values():
-            # If there are more steps using this configuration, skip deprovisioning the cluster
-            logger.info(
-                f"Resource configuration for cluster '{cluster_name}' "
-                "is used by subsequent steps. Skipping the deprovisioning of "
-                "the cluster."
-            )
-        else:
-            # If there are no more steps using this configuration, down the cluster
-            logger.info(
-                f"Resource configuration for cluster '{cluster_name}' "
-                "is not used by subsequent steps. deprovisioning the cluster."
-            )
-            sky.down(cluster_name)
+
+            step_is_finished = False
+            while not step_is_finished:
+                time.sleep(10)
+                current_run = Client().get_pipeline_run(run.id)
+                try:
+                    step_is_finished = current_run.steps[
+                        step_name
+                    ].status.is_finished
+                except KeyError:
+                    # Step is not yet in the run, so we wait for it to appear
+                    continue
+        finally:
+            # Pop the resource configuration for this step
+            unique_resource_configs.pop(step_name)
+
+            if cluster_name in unique_resource_configs.values():
+                # If there are more steps using this configuration, skip deprovisioning the cluster
+                logger.info(
+                    f"Resource configuration for cluster '{cluster_name}' "
+                    "is used by subsequent steps. Skipping the deprovisioning of "
+                    "the cluster."
+                )
+            else:
+                # If there are no more steps using this configuration, down the cluster
+                logger.info(
+                    f"Resource configuration for cluster '{cluster_name}' "
+                    "is not used by subsequent steps. deprovisioning the cluster."
+                )
+                sky.down(cluster_name)
+
+        if current_run.steps[step_name].status == ExecutionStatus.FAILED:
+            raise RuntimeError(f"Step `{step_name}` failed.")
 
         logger.info(f"Running step `{step_name}` on a VM is completed.")
 
-    ThreadedDagRunner(dag=pipeline_dag, run_fn=run_step_on_skypilot_vm).run()
+    pipeline_settings = cast(
+        SkypilotBaseOrchestratorSettings,
+        orchestrator.get_settings(deployment),
+    )
+    dag_runner = ThreadedDagRunner(
+        dag=pipeline_dag,
+        run_fn=run_step_on_skypilot_vm,
+        max_parallelism=pipeline_settings.max_parallelism,
+        fail_fast=pipeline_settings.fail_fast,
+        prioritize_critical_path=pipeline_settings.prioritize_critical_path,
+    )
+    dag_runner.run()
+
+    # Steps that were skipped after a failure still hold on to the clusters
+    # of their resource configurations, which might have been provisioned by
+    # steps that ran before.
+    for cluster_name in set(unique_resource_configs.values()):
+        try:
+            sky.down(cluster_name)
+        except Exception as e:
+            logger.debug(
+                f"Unable to deprovision cluster '{cluster_name}': {e}"
+            )
+
+    if dag_runner.failed_nodes:
+        raise RuntimeError(
+            "Pipeline run failed because the following steps failed: "
+            f"{', '.join(dag_runner.failed_nodes)}."
+        )
 
     logger.info("Orchestration VM provisioned.")
 
@@ -22,7 +22,6 @@ from tensorflow.python.keras.utils.layer_utils import count_params
 from zenml.enums import ArtifactType
 from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
-from zenml.utils import io_utils
 
 if TYPE_CHECKING:
     from zenml.metadata.metadata_types import MetadataType
@@ -47,7 +46,7 @@ class KerasMaterializer(BaseMaterializer):
         temp_dir = tempfile.TemporaryDirectory()
 
         # Copy from artifact store to temporary directory
-        io_utils.copy_dir(self.uri, temp_dir.name)
+        self.artifact_store.get_dir(self.uri, temp_dir.name)
 
         # Load the model from the temporary directory
         model = keras.models.load_model(temp_dir.name)
@@ -66,7 +65,7 @@ class KerasMaterializer(BaseMaterializer):
         # Create a temporary directory to store the model
         temp_dir = tempfile.TemporaryDirectory()
         model.save(temp_dir.name)
-        io_utils.copy_dir(temp_dir.name, self.uri)
+        self.artifact_store.put_dir(temp_dir.name, self.uri)
 
         # Remove the temporary directory
         fileio.rmtree(temp_dir.name)
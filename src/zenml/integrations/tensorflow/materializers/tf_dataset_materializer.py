@@ -22,7 +22,6 @@ import tensorflow as tf
 from zenml.enums import ArtifactType
 from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
-from zenml.utils import io_utils
 
 if TYPE_CHECKING:
     from zenml.metadata.metadata_types import MetadataType
@@ -46,7 +45,7 @@ class TensorflowDatasetMaterializer(BaseMaterializer):
             A tf.data.Dataset object.
         """
         temp_dir = tempfile.mkdtemp()
-        io_utils.copy_dir(self.uri, temp_dir)
+        self.artifact_store.get_dir(self.uri, temp_dir)
         path = os.path.join(temp_dir, DEFAULT_FILENAME)
         dataset = tf.data.experimental.load(path)
         # Don't delete the temporary directory here as the dataset is lazily
@@ -65,7 +64,7 @@ class TensorflowDatasetMaterializer(BaseMaterializer):
             tf.data.experimental.save(
                 dataset, path, compression=None, shard_func=None
             )
-            io_utils.copy_dir(temp_dir.name, self.uri)
+            self.artifact_store.put_dir(temp_dir.name, self.uri)
         finally:
             fileio.rmtree(temp_dir.name)
 
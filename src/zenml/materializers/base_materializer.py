@@ -13,19 +13,83 @@
 #  permissions and limitations under the License.
 """Metaclass implementation for registering ZenML BaseMaterializer subclasses."""
 
+import hashlib
 import inspect
-from typing import Any, ClassVar, Dict, Optional, Tuple, Type, cast
+import os
+import shutil
+import tempfile
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
 
 from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
+from zenml.constants import (
+    ENV_ZENML_ARTIFACT_CACHE_PATH,
+    ENV_ZENML_ARTIFACT_CACHE_SIZE_MB,
+    handle_int_env_var,
+)
 from zenml.enums import ArtifactType, VisualizationType
 from zenml.exceptions import MaterializerInterfaceError
 from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.materializers.materializer_registry import materializer_registry
 from zenml.metadata.metadata_types import MetadataType
+from zenml.utils import io_utils
+
+if TYPE_CHECKING:
+    from zenml.artifacts.artifact_load_config import ArtifactLoadConfig
 
 logger = get_logger(__name__)
 
+# Maximum size of the local cache of remote artifact files
+DEFAULT_ARTIFACT_CACHE_SIZE_MB = 10 * 1024
+
+
+def _evict_artifact_cache(
+    cache_root: str, max_size: int, keep: Optional[str] = None
+) -> None:
+    """Removes the least recently used files from the local artifact cache.
+
+    Args:
+        cache_root: The root directory of the artifact cache.
+        max_size: The maximum total size of the cached files in bytes.
+        keep: Cache entry directory which should never be evicted.
+    """
+    entries = []
+    total_size = 0
+    for entry in os.scandir(cache_root):
+        if not entry.is_dir():
+            continue
+        size = 0
+        last_used = 0.0
+        for file in os.scandir(entry.path):
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                continue
+            size += stat.st_size
+            last_used = max(last_used, stat.st_atime, stat.st_mtime)
+        entries.append((last_used, size, entry.path))
+        total_size += size
+
+    for _, size, entry_path in sorted(entries):
+        if total_size <= max_size:
+            break
+        if entry_path == keep:
+            continue
+        logger.debug("Evicting `%s` from the artifact cache.", entry_path)
+        # Files that are still opened or memory-mapped by other processes
+        # stay readable until they're closed on POSIX systems.
+        shutil.rmtree(entry_path, ignore_errors=True)
+        total_size -= size
+
 
 class BaseMaterializerMeta(type):
     """Metaclass responsible for registering different BaseMaterializer subclasses.
@@ -160,6 +224,28 @@ class BaseMaterializer(metaclass=BaseMaterializerMeta):
         # read from a location inside self.uri
         return None
 
+    def load_with_config(
+        self, data_type: Type[Any], load_config: "ArtifactLoadConfig"
+    ) -> Any:
+        """Write logic here to load only parts of the data of an artifact.
+
+        Override this method if the materializer can load a subset of the
+        columns or rows of an artifact, e.g. by pushing them down to the file
+        format, without reading the full data.
+
+        Args:
+            data_type: What type the artifact data should be loaded as.
+            load_config: The columns and rows to load.
+
+        Raises:
+            NotImplementedError: If the materializer does not support loading
+                with a load config.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support loading artifacts "
+            "with an `ArtifactLoadConfig`."
+        )
+
     def save(self, data: Any) -> None:
         """Write logic here to save the data of an artifact.
 
@@ -257,6 +343,65 @@ class BaseMaterializer(metaclass=BaseMaterializerMeta):
             for associated_type in cls.ASSOCIATED_TYPES
         )
 
+    def _get_local_path(self, path: str) -> str:
+        """Gets a local path from which a file in the artifact store can be read.
+
+        Files of local or mounted artifact stores are read in place. Files of
+        remote artifact stores are downloaded to the local artifact cache,
+        unless they are cached already. As artifacts never change once they
+        are stored, the cached copies never get stale. The size of the cache
+        is limited by the `ZENML_ARTIFACT_CACHE_SIZE_MB` environment variable
+        and the least recently used files are evicted once it is exceeded.
+
+        Args:
+            path: The path of the file in the artifact store.
+
+        Returns:
+            The local path of the file.
+        """
+        if not io_utils.is_remote(path) and os.path.isfile(path):
+            return path
+
+        cache_root = os.getenv(ENV_ZENML_ARTIFACT_CACHE_PATH) or os.path.join(
+            io_utils.get_global_config_directory(), "artifact_cache"
+        )
+        cache_dir = os.path.join(
+            cache_root, hashlib.sha256(path.encode()).hexdigest()
+        )
+        local_path = os.path.join(cache_dir, os.path.basename(path))
+        if os.path.exists(local_path):
+            # Mark the file as recently used, independent of whether the
+            # file system records access times.
+            os.utime(local_path)
+            return local_path
+
+        os.makedirs(cache_dir, exist_ok=True)
+        # Download to a temporary file first so that concurrent loads of the
+        # same artifact never see a partially written file.
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as local, self.artifact_store.open(
+                path, "rb"
+            ) as remote:
+                shutil.copyfileobj(remote, local)
+            os.replace(temp_path, local_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        max_size_mb = handle_int_env_var(
+            ENV_ZENML_ARTIFACT_CACHE_SIZE_MB,
+            default=DEFAULT_ARTIFACT_CACHE_SIZE_MB,
+        )
+        if max_size_mb > 0:
+            _evict_artifact_cache(
+                cache_root=cache_root,
+                max_size=max_size_mb * 1024 * 1024,
+                keep=cache_dir,
+            )
+
+        return local_path
+
     def extract_full_metadata(self, data: Any) -> Dict[str, "MetadataType"]:
         """Extract both base and custom metadata from the given data.
 
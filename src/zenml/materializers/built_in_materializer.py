@@ -13,13 +13,19 @@
 #  permissions and limitations under the License.
 """Implementation of ZenML's builtin materializer."""
 
+import functools
+import math
 import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -27,8 +33,12 @@ from typing import (
     Union,
 )
 
+import cloudpickle
+import numpy as np
+
 from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
 from zenml.enums import ArtifactType
+from zenml.environment import Environment
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.materializers.materializer_registry import materializer_registry
@@ -41,6 +51,17 @@ logger = get_logger(__name__)
 DEFAULT_FILENAME = "data.json"
 DEFAULT_BYTES_FILENAME = "data.txt"
 DEFAULT_METADATA_FILENAME = "metadata.json"
+PACKED_NUMPY_FORMAT = "numpy"
+PACKED_CLOUDPICKLE_FORMAT = "cloudpickle"
+PACKED_FILENAMES = {
+    PACKED_NUMPY_FORMAT: "elements.npy",
+    PACKED_CLOUDPICKLE_FORMAT: "elements.pkl",
+}
+# Maximum number of threads to load packed container elements.
+PACKED_LOAD_PARALLELISM = 8
+# Number of elements that lazily loaded containers load at once when
+# iterating over them.
+LAZY_LOAD_BATCH_SIZE = 64
 BASIC_TYPES = (
     bool,
     float,
@@ -249,6 +270,190 @@ def find_materializer_registry_type(type_: Type[Any]) -> Type[Any]:
     )
 
 
+def _save_packed_numpy_element(f: Any, element: Any) -> None:
+    """Writes a numpy array to a packed file.
+
+    Args:
+        f: The file to write to.
+        element: The numpy array.
+    """
+    np.save(f, element, allow_pickle=True)
+
+
+def _load_packed_numpy_element(f: Any) -> Any:
+    """Reads a numpy array from the current position of a packed file.
+
+    Args:
+        f: The file to read from.
+
+    Returns:
+        The numpy array.
+    """
+    return np.load(f, allow_pickle=True)
+
+
+def _save_packed_cloudpickle_element(f: Any, element: Any) -> None:
+    """Writes a pickled object to a packed file.
+
+    Args:
+        f: The file to write to.
+        element: The object.
+    """
+    cloudpickle.dump(element, f)
+
+
+def _load_packed_cloudpickle_element(f: Any) -> Any:
+    """Reads a pickled object from the current position of a packed file.
+
+    Args:
+        f: The file to read from.
+
+    Returns:
+        The object.
+    """
+    return cloudpickle.load(f)
+
+
+_PACKED_WRITERS: Dict[str, Callable[[Any, Any], None]] = {
+    PACKED_NUMPY_FORMAT: _save_packed_numpy_element,
+    PACKED_CLOUDPICKLE_FORMAT: _save_packed_cloudpickle_element,
+}
+_PACKED_READERS: Dict[str, Callable[[Any], Any]] = {
+    PACKED_NUMPY_FORMAT: _load_packed_numpy_element,
+    PACKED_CLOUDPICKLE_FORMAT: _load_packed_cloudpickle_element,
+}
+
+
+def _warn_on_python_version_mismatch(
+    entries: List[Tuple[int, Dict[str, Any]]],
+) -> None:
+    """Warns if pickled elements were saved with a different Python version.
+
+    Args:
+        entries: The metadata entries of the pickled elements.
+    """
+    current_python_version = Environment().python_version()
+    source_python_versions = {
+        entry.get("python_version") for _, entry in entries
+    } - {current_python_version}
+    if source_python_versions:
+        logger.warning(
+            f"Your artifact was materialized under Python version "
+            f"'{source_python_versions.pop()}' but you are currently using "
+            f"'{current_python_version}'. This might cause unexpected "
+            "behavior since pickle is not reproducible across Python "
+            "versions. Attempting to load anyway..."
+        )
+
+
+class LazyElementSequence(Sequence):  # type: ignore[type-arg]
+    """Read-only sequence of container elements which are loaded on access.
+
+    Each element is loaded from the artifact store the first time it is
+    accessed and cached afterwards. Accessing a slice or iterating over the
+    sequence loads multiple elements at once, which reads packed elements in
+    parallel.
+    """
+
+    def __init__(
+        self,
+        length: int,
+        load_elements: Callable[[Iterable[int]], Dict[int, Any]],
+    ) -> None:
+        """Initializes the sequence.
+
+        Args:
+            length: The number of elements.
+            load_elements: Function that loads the elements with the given
+                indices and returns them by index.
+        """
+        self._length = length
+        self._load_elements = load_elements
+        self._elements: Dict[int, Any] = {}
+
+    def __len__(self) -> int:
+        """Gets the number of elements.
+
+        Returns:
+            The number of elements.
+        """
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """Gets an element or a slice of elements, loading them if necessary.
+
+        Args:
+            index: The index or slice.
+
+        Returns:
+            The element, or a list of the elements if a slice was given.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(index, slice):
+            indices = range(self._length)[index]
+            self._load(indices)
+            return [self._elements[i] for i in indices]
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Sequence index out of range.")
+        self._load([index])
+        return self._elements[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over the elements, loading them in batches.
+
+        Yields:
+            The elements.
+        """
+        for start in range(0, self._length, LAZY_LOAD_BATCH_SIZE):
+            yield from self[start : start + LAZY_LOAD_BATCH_SIZE]
+
+    def __eq__(self, other: Any) -> bool:
+        """Compares the elements with another sequence.
+
+        Args:
+            other: The other sequence.
+
+        Returns:
+            Whether the other sequence contains the same elements.
+        """
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        try:
+            return list(self) == list(other)
+        except ValueError:
+            # Elements like numpy arrays or pandas objects don't compare to a
+            # single truth value.
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        """Gets a representation that doesn't load any elements.
+
+        Returns:
+            The representation.
+        """
+        return (
+            f"{self.__class__.__name__}(length={self._length}, "
+            f"loaded={len(self._elements)})"
+        )
+
+    def _load(self, indices: Iterable[int]) -> None:
+        """Loads all elements which are not loaded yet.
+
+        Args:
+            indices: The indices of the elements to load.
+        """
+        missing = [i for i in indices if i not in self._elements]
+        if missing:
+            self._elements.update(self._load_elements(missing))
+
+
 class BuiltInContainerMaterializer(BaseMaterializer):
     """Handle built-in container types (dict, list, set, tuple)."""
 
@@ -259,6 +464,16 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         tuple,
     )
 
+    # Whether to pack numpy arrays and pickled elements of non-serializable
+    # containers into a single file per format instead of storing each
+    # element in a separate directory. Packed artifacts can't be loaded by
+    # ZenML versions that don't support this format yet.
+    PACK_ELEMENTS: ClassVar[bool] = False
+
+    # Whether to load non-serializable lists and tuples as a read-only
+    # sequence which only loads elements once they are accessed.
+    LAZY_LOAD: ClassVar[bool] = False
+
     def __init__(
         self, uri: str, artifact_store: Optional[BaseArtifactStore] = None
     ):
@@ -271,6 +486,7 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         super().__init__(uri, artifact_store)
         self.data_path = os.path.join(self.uri, DEFAULT_FILENAME)
         self.metadata_path = os.path.join(self.uri, DEFAULT_METADATA_FILENAME)
+        self._sources: Dict[str, Any] = {}
 
     def load(self, data_type: Type[Any]) -> Any:
         """Reads a materialized built-in container object.
@@ -283,6 +499,10 @@ class BuiltInContainerMaterializer(BaseMaterializer):
             3. Initialize the materializer with the desired path,
             4. Use `load()` of that materializer to load the element.
 
+        If `LAZY_LOAD` is set, lists and tuples are instead returned as a
+        `LazyElementSequence` which only loads elements once they are
+        accessed.
+
         Args:
             data_type: The type of the data to read.
 
@@ -323,15 +543,15 @@ class BuiltInContainerMaterializer(BaseMaterializer):
 
             # New format for zenml > 0.37.0
             elif isinstance(metadata, list):
-                for entry in metadata:
-                    path_ = entry["path"]
-                    type_ = source_utils.load(entry["type"])
-                    materializer_class = source_utils.load(
-                        entry["materializer"]
+                if self.LAZY_LOAD and issubclass(data_type, (list, tuple)):
+                    return LazyElementSequence(
+                        length=len(metadata),
+                        load_elements=functools.partial(
+                            self._load_elements, metadata
+                        ),
                     )
-                    materializer = materializer_class(uri=path_)
-                    element = materializer.load(type_)
-                    outputs.append(element)
+                elements = self._load_elements(metadata, range(len(metadata)))
+                outputs = [elements[i] for i in range(len(metadata))]
 
             else:
                 raise RuntimeError(f"Unknown metadata format: {metadata}.")
@@ -378,31 +598,43 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         if isinstance(data, dict):
             data = [list(data.keys()), list(data.values())]
 
-        # non-serializable list: Materialize each element into a subfolder.
+        # non-serializable list: Materialize each element into a subfolder,
+        # or pack it into a single file together with all other elements of
+        # the same format.
         # Get path, type, and corresponding materializer for each element.
-        metadata: List[Dict[str, str]] = []
+        metadata: List[Dict[str, Any]] = []
         materializers: List[BaseMaterializer] = []
+        packed_elements: Dict[str, List[Tuple[Any, Dict[str, Any]]]] = {}
         try:
             for i, element in enumerate(data):
-                element_path = os.path.join(self.uri, str(i))
-                self.artifact_store.mkdir(element_path)
                 type_ = type(element)
                 materializer_class = materializer_registry[type_]
-                materializer = materializer_class(uri=element_path)
-                materializers.append(materializer)
-                metadata.append(
-                    {
-                        "path": element_path,
-                        "type": source_utils.resolve(type_).import_path,
-                        "materializer": source_utils.resolve(
-                            materializer_class
-                        ).import_path,
-                    }
-                )
+                entry: Dict[str, Any] = {
+                    "type": source_utils.resolve(type_).import_path,
+                    "materializer": source_utils.resolve(
+                        materializer_class
+                    ).import_path,
+                }
+                packed_format = self._get_packed_format(materializer_class)
+                if packed_format:
+                    entry["packed_format"] = packed_format
+                    packed_elements.setdefault(packed_format, []).append(
+                        (element, entry)
+                    )
+                else:
+                    element_path = os.path.join(self.uri, str(i))
+                    self.artifact_store.mkdir(element_path)
+                    entry["path"] = element_path
+                    materializers.append(materializer_class(uri=element_path))
+                metadata.append(entry)
+            # Pack elements into a single file per format.
+            for packed_format, elements in packed_elements.items():
+                self._save_packed_elements(packed_format, elements)
             # Write metadata as JSON.
             yaml_utils.write_json(self.metadata_path, metadata)
-            # Materialize each element.
-            for element, materializer in zip(data, materializers):
+            # Materialize each element that was not packed.
+            for materializer in materializers:
+                element = data[int(os.path.basename(materializer.uri))]
                 materializer.validate_type_compatibility(type(element))
                 materializer.save(element)
         # If an error occurs, delete all created files.
@@ -410,11 +642,146 @@ class BuiltInContainerMaterializer(BaseMaterializer):
             # Delete metadata
             if self.artifact_store.exists(self.metadata_path):
                 self.artifact_store.remove(self.metadata_path)
-            # Delete all elements that were already saved.
+            # Delete all packed files and elements that were already saved.
+            for filename in PACKED_FILENAMES.values():
+                packed_path = os.path.join(self.uri, filename)
+                if self.artifact_store.exists(packed_path):
+                    self.artifact_store.remove(packed_path)
             for entry in metadata:
-                self.artifact_store.rmtree(entry["path"])
+                if "path" in entry:
+                    self.artifact_store.rmtree(entry["path"])
             raise e
 
+    def _get_packed_format(
+        self, materializer_class: Type[BaseMaterializer]
+    ) -> Optional[str]:
+        """Gets the format in which elements of a materializer are packed.
+
+        Only elements which would be stored as a single `.npy` or cloudpickle
+        file by their materializer are packed, as they can be written to and
+        read from a shared file stream.
+
+        Args:
+            materializer_class: The materializer class of an element.
+
+        Returns:
+            The packed format or None if elements of this materializer
+            can't be packed.
+        """
+        from zenml.materializers.cloudpickle_materializer import (
+            CloudpickleMaterializer,
+        )
+        from zenml.materializers.numpy_materializer import NumpyMaterializer
+
+        if not self.PACK_ELEMENTS:
+            return None
+        if materializer_class is NumpyMaterializer:
+            return PACKED_NUMPY_FORMAT
+        if materializer_class is CloudpickleMaterializer:
+            return PACKED_CLOUDPICKLE_FORMAT
+        return None
+
+    def _save_packed_elements(
+        self,
+        packed_format: str,
+        elements: List[Tuple[Any, Dict[str, Any]]],
+    ) -> None:
+        """Writes elements into a single packed file.
+
+        The offset of each element in the file is stored in its metadata
+        entry, which allows loading each element independently.
+
+        Args:
+            packed_format: The format in which to pack the elements.
+            elements: The elements and their metadata entries.
+        """
+        if packed_format == PACKED_CLOUDPICKLE_FORMAT:
+            logger.warning(
+                "No materializer is registered for types %s, so they were "
+                "pickled. Pickle is not production ready and should only be "
+                "used for prototyping as the artifacts cannot be loaded when "
+                "running with a different Python version.",
+                sorted({entry["type"] for _, entry in elements}),
+            )
+            python_version = Environment().python_version()
+            for _, entry in elements:
+                entry["python_version"] = python_version
+
+        write = _PACKED_WRITERS[packed_format]
+        path = os.path.join(self.uri, PACKED_FILENAMES[packed_format])
+        with self.artifact_store.open(path, "wb") as f:
+            for element, entry in elements:
+                entry["offset"] = f.tell()
+                write(f, element)
+
+    def _load_elements(
+        self, metadata: List[Dict[str, Any]], indices: Iterable[int]
+    ) -> Dict[int, Any]:
+        """Loads elements of a non-serializable container.
+
+        Packed elements are loaded in parallel, only reading the byte ranges
+        of the packed files in which they are stored.
+
+        Args:
+            metadata: The metadata entries of all elements.
+            indices: The indices of the elements to load.
+
+        Returns:
+            The loaded elements by index.
+        """
+        outputs: Dict[int, Any] = {}
+        packed_entries: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        for index in indices:
+            entry = metadata[index]
+            if "packed_format" in entry:
+                packed_entries.setdefault(entry["packed_format"], []).append(
+                    (index, entry)
+                )
+            else:
+                type_ = self._load_source(entry["type"])
+                materializer_class = self._load_source(entry["materializer"])
+                materializer = materializer_class(uri=entry["path"])
+                outputs[index] = materializer.load(type_)
+
+        for packed_format, entries in packed_entries.items():
+            if packed_format == PACKED_CLOUDPICKLE_FORMAT:
+                _warn_on_python_version_mismatch(entries)
+            read = _PACKED_READERS[packed_format]
+            path = os.path.join(self.uri, PACKED_FILENAMES[packed_format])
+
+            def _load_chunk(chunk: List[Tuple[int, Dict[str, Any]]]) -> None:
+                with self.artifact_store.open(path, "rb") as f:
+                    for index, entry in chunk:
+                        f.seek(entry["offset"])
+                        outputs[index] = read(f)
+
+            chunk_size = math.ceil(len(entries) / PACKED_LOAD_PARALLELISM)
+            chunks = [
+                entries[start : start + chunk_size]
+                for start in range(0, len(entries), chunk_size)
+            ]
+            if len(chunks) == 1:
+                _load_chunk(chunks[0])
+                continue
+            with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+                # Consume the results to raise any errors
+                list(executor.map(_load_chunk, chunks))
+
+        return outputs
+
+    def _load_source(self, source: str) -> Any:
+        """Loads a type or materializer source, caching the result.
+
+        Args:
+            source: The source to load.
+
+        Returns:
+            The loaded source.
+        """
+        if source not in self._sources:
+            self._sources[source] = source_utils.load(source)
+        return self._sources[source]
+
     def extract_metadata(self, data: Any) -> Dict[str, "MetadataType"]:
         """Extract metadata from the given built-in container object.
 
@@ -15,18 +15,22 @@
 
 import os
 from collections import Counter
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, Tuple, Type
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional, Tuple, Type
 
 import numpy as np
 
+from zenml.constants import ENV_ZENML_NUMPY_MMAP_MODE
 from zenml.enums import ArtifactType, VisualizationType
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.metadata.metadata_types import DType, MetadataType
+from zenml.utils.statistics_utils import compute_statistics
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
+    from zenml.artifacts.artifact_load_config import ArtifactLoadConfig
+
 logger = get_logger(__name__)
 
 
@@ -36,6 +40,31 @@ DATA_FILENAME = "data.parquet"
 SHAPE_FILENAME = "shape.json"
 DATA_VAR = "data_var"
 
+# Memory-map modes that don't modify the stored artifact.
+SUPPORTED_MMAP_MODES = ("r", "c")
+
+
+def _get_mmap_mode() -> Optional[str]:
+    """Gets the mode in which numpy arrays should be memory-mapped.
+
+    Returns:
+        The memory-map mode, or None if arrays should be loaded into memory.
+    """
+    mmap_mode = os.getenv(ENV_ZENML_NUMPY_MMAP_MODE)
+    if not mmap_mode:
+        return None
+
+    if mmap_mode not in SUPPORTED_MMAP_MODES:
+        logger.warning(
+            "Ignoring unsupported numpy memory-map mode `%s`, supported modes "
+            "are %s.",
+            mmap_mode,
+            SUPPORTED_MMAP_MODES,
+        )
+        return None
+
+    return mmap_mode
+
 
 class NumpyMaterializer(BaseMaterializer):
     """Materializer to read data to and from pandas."""
@@ -46,9 +75,51 @@ class NumpyMaterializer(BaseMaterializer):
     def load(self, data_type: Type[Any]) -> "Any":
         """Reads a numpy array from a `.npy` file.
 
+        If the `ZENML_NUMPY_MMAP_MODE` environment variable is set, the array
+        is memory-mapped instead of being read into memory.
+
         Args:
             data_type: The type of the data to read.
 
+        Returns:
+            The numpy array.
+        """
+        return self._load_array(mmap_mode=_get_mmap_mode())
+
+    def load_with_config(
+        self, data_type: Type[Any], load_config: "ArtifactLoadConfig"
+    ) -> "Any":
+        """Reads a numpy array from a `.npy` file with a load config.
+
+        The memory-map mode of the load config takes precedence over the
+        `ZENML_NUMPY_MMAP_MODE` environment variable.
+
+        Args:
+            data_type: The type of the data to read.
+            load_config: The load config.
+
+        Raises:
+            ValueError: If columns or row filters are configured.
+
+        Returns:
+            The numpy array.
+        """
+        if load_config.columns or load_config.filters:
+            raise ValueError(
+                "Numpy arrays can't be loaded with column selections or row "
+                "filters."
+            )
+
+        return self._load_array(
+            mmap_mode=load_config.mmap_mode or _get_mmap_mode()
+        )
+
+    def _load_array(self, mmap_mode: Optional[str]) -> "Any":
+        """Reads a numpy array from a `.npy` file.
+
+        Args:
+            mmap_mode: The mode in which the array should be memory-mapped,
+                or None to read it into memory.
 
         Raises:
             ImportError: If pyarrow is not installed.
@@ -59,6 +130,9 @@ class NumpyMaterializer(BaseMaterializer):
         numpy_file = os.path.join(self.uri, NUMPY_FILENAME)
 
         if self.artifact_store.exists(numpy_file):
+            if mmap_mode:
+                return self._load_memory_mapped(numpy_file, mmap_mode)
+
             with self.artifact_store.open(numpy_file, "rb") as f:
                 return np.load(f, allow_pickle=True)
         elif self.artifact_store.exists(os.path.join(self.uri, DATA_FILENAME)):
@@ -95,6 +169,40 @@ class NumpyMaterializer(BaseMaterializer):
                     "You can install `pyarrow` by running `pip install pyarrow`.",
                 )
 
+    def _load_memory_mapped(
+        self, numpy_file: str, mmap_mode: str
+    ) -> "NDArray[Any]":
+        """Loads a memory-mapped numpy array from a `.npy` file.
+
+        Files in remote artifact stores are downloaded to the local artifact
+        cache first and mapped from there.
+
+        Args:
+            numpy_file: The path of the `.npy` file in the artifact store.
+            mmap_mode: The mode in which to memory-map the file.
+
+        Returns:
+            The numpy array.
+        """
+        local_file = self._get_local_path(numpy_file)
+
+        array: "NDArray[Any]"
+        try:
+            array = np.load(
+                local_file,
+                mmap_mode=mmap_mode,  # type: ignore[arg-type]
+                allow_pickle=True,
+            )
+        except ValueError:
+            # Arrays containing Python objects can't be memory-mapped.
+            logger.debug(
+                "Unable to memory-map numpy array `%s`, loading it into "
+                "memory instead.",
+                numpy_file,
+            )
+            array = np.load(local_file, allow_pickle=True)
+        return array
+
     def save(self, arr: "NDArray[Any]") -> None:
         """Writes a np.ndarray to the artifact store as a `.npy` file.
 
@@ -204,17 +312,17 @@ class NumpyMaterializer(BaseMaterializer):
         Returns:
             A dictionary of metadata.
         """
-        min_val = np.min(arr).item()
-        max_val = np.max(arr).item()
-
         numpy_metadata: Dict[str, "MetadataType"] = {
             "shape": tuple(arr.shape),
             "dtype": DType(arr.dtype.type),
-            "mean": np.mean(arr).item(),
-            "std": np.std(arr).item(),
-            "min": min_val,
-            "max": max_val,
         }
+        if arr.size == 0:
+            return numpy_metadata
+
+        # Computed chunk by chunk in a single pass so that large and
+        # memory-mapped arrays don't need to be copied.
+        statistics = compute_statistics(arr)
+        numpy_metadata.update(statistics.to_dict())
         return numpy_metadata
 
     def _extract_text_metadata(
@@ -13,9 +13,22 @@
 #  permissions and limitations under the License.
 """Materializer for Pandas."""
 
+import math
 import os
-from typing import Any, ClassVar, Dict, Optional, Tuple, Type, Union
-
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+import numpy as np
 import pandas as pd
 
 from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
@@ -23,17 +36,44 @@ from zenml.enums import ArtifactType, VisualizationType
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.metadata.metadata_types import DType, MetadataType
+from zenml.utils.statistics_utils import (
+    DEFAULT_CHUNK_SIZE,
+    RunningStatistics,
+)
+
+if TYPE_CHECKING:
+    from zenml.artifacts.artifact_load_config import ArtifactLoadConfig
 
 logger = get_logger(__name__)
 
 PARQUET_FILENAME = "df.parquet.gzip"
+PARQUET_DATASET_DIRNAME = "df.parquet"
 COMPRESSION_TYPE = "gzip"
 
 CSV_FILENAME = "df.csv"
 
+# Maximum number of files of a Parquet dataset artifact to read or write in
+# parallel.
+DATASET_PARALLELISM = 8
+
 
 class PandasMaterializer(BaseMaterializer):
-    """Materializer to read data to and from pandas."""
+    """Materializer to read data to and from pandas.
+
+    The way the data is written to Parquet can be configured by subclassing
+    this materializer and overriding the `PARQUET_*` class variables. The
+    subclass can then be used for individual step outputs:
+
+    ```python
+    class ZstdPandasMaterializer(PandasMaterializer):
+        PARQUET_COMPRESSION = "zstd"
+        PARQUET_ROW_GROUP_SIZE = 100_000
+
+    @step(output_materializers=ZstdPandasMaterializer)
+    def my_step() -> pd.DataFrame:
+        ...
+    ```
+    """
 
     ASSOCIATED_TYPES: ClassVar[Tuple[Type[Any], ...]] = (
         pd.DataFrame,
@@ -41,6 +81,18 @@ class PandasMaterializer(BaseMaterializer):
     )
     ASSOCIATED_ARTIFACT_TYPE: ClassVar[ArtifactType] = ArtifactType.DATA
 
+    # The compression codec, e.g. `gzip`, `snappy`, `zstd` or `lz4`.
+    PARQUET_COMPRESSION: ClassVar[Optional[str]] = COMPRESSION_TYPE
+    # The maximum number of rows per row group. Defaults to the pyarrow
+    # default if not set.
+    PARQUET_ROW_GROUP_SIZE: ClassVar[Optional[int]] = None
+    # Whether to use dictionary encoding for the columns.
+    PARQUET_USE_DICTIONARY: ClassVar[bool] = True
+    # If set, dataframes with more rows are written as a dataset of multiple
+    # Parquet files with at most this number of rows each, which are read in
+    # parallel when loading the artifact.
+    PARQUET_ROWS_PER_FILE: ClassVar[Optional[int]] = None
+
     def __init__(
         self, uri: str, artifact_store: Optional[BaseArtifactStore] = None
     ):
@@ -66,13 +118,91 @@ class PandasMaterializer(BaseMaterializer):
             )
         finally:
             self.parquet_path = os.path.join(self.uri, PARQUET_FILENAME)
+            self.parquet_dataset_path = os.path.join(
+                self.uri, PARQUET_DATASET_DIRNAME
+            )
             self.csv_path = os.path.join(self.uri, CSV_FILENAME)
 
-    def load(self, data_type: Type[Any]) -> Union[pd.DataFrame, pd.Series]:
+    @classmethod
+    def can_handle_type(cls, data_type: Type[Any]) -> bool:
+        """Whether the materializer can read/write a certain type.
+
+        In addition to the associated types, artifacts stored as `.parquet`
+        files can be loaded lazily as a `pyarrow.dataset.Dataset`.
+
+        Args:
+            data_type: The type to check.
+
+        Returns:
+            Whether the materializer can read/write the given type.
+        """
+        return super().can_handle_type(data_type) or _is_dataset_type(
+            data_type
+        )
+
+    def load(self, data_type: Type[Any]) -> Any:
+        """Reads `pd.DataFrame` or `pd.Series` from a `.parquet` or `.csv` file.
+
+        Args:
+            data_type: The type of the data to read.
+
+        Returns:
+            The pandas dataframe or series, or a `pyarrow.dataset.Dataset` if
+            requested by the data type.
+        """
+        if _is_dataset_type(data_type):
+            return self._load_dataset()
+
+        return self._load_dataframe(data_type)
+
+    def load_with_config(
+        self, data_type: Type[Any], load_config: "ArtifactLoadConfig"
+    ) -> Union[pd.DataFrame, pd.Series]:
+        """Reads only the requested columns and rows from a `.parquet` file.
+
+        The column selection and row filters are pushed down to the Parquet
+        reader, which skips all other columns and all row groups that can't
+        contain matching rows.
+
+        Args:
+            data_type: The type of the data to read.
+            load_config: The columns and rows to load.
+
+        Raises:
+            ValueError: If a lazy dataset should be loaded.
+
+        Returns:
+            The pandas dataframe or series.
+        """
+        if _is_dataset_type(data_type):
+            raise ValueError(
+                "Datasets are loaded lazily, please select the columns and "
+                "rows when reading from the dataset instead of using an "
+                "`ArtifactLoadConfig`."
+            )
+
+        self._validate_parquet_artifact(
+            "Loading only parts of a pandas artifact"
+        )
+
+        return self._load_dataframe(
+            data_type,
+            columns=load_config.columns,
+            filters=load_config.filters,
+        )
+
+    def _load_dataframe(
+        self,
+        data_type: Type[Any],
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Tuple[str, str, Any]]] = None,
+    ) -> Union[pd.DataFrame, pd.Series]:
         """Reads `pd.DataFrame` or `pd.Series` from a `.parquet` or `.csv` file.
 
         Args:
             data_type: The type of the data to read.
+            columns: The columns to read from a `.parquet` file.
+            filters: The row filters to apply when reading a `.parquet` file.
 
         Raises:
             ImportError: If pyarrow or fastparquet is not installed.
@@ -80,12 +210,14 @@ class PandasMaterializer(BaseMaterializer):
         Returns:
             The pandas dataframe or series.
         """
-        if self.artifact_store.exists(self.parquet_path):
+        if self.artifact_store.exists(self.parquet_dataset_path):
+            df = self._read_parquet_dataset(columns=columns, filters=filters)
+        elif self.artifact_store.exists(self.parquet_path):
             if self.pyarrow_exists:
                 with self.artifact_store.open(
                     self.parquet_path, mode="rb"
                 ) as f:
-                    df = pd.read_parquet(f)
+                    df = pd.read_parquet(f, columns=columns, filters=filters)
             else:
                 raise ImportError(
                     "You have an old version of a `PandasMaterializer` "
@@ -121,6 +253,103 @@ class PandasMaterializer(BaseMaterializer):
 
         return is_dataframe_or_series(df)
 
+    def _get_parquet_dataset_files(self) -> List[str]:
+        """Gets the paths of the files of a Parquet dataset artifact.
+
+        Returns:
+            The paths of the Parquet files in the dataset directory.
+        """
+        return [
+            os.path.join(self.parquet_dataset_path, str(file_name))
+            for file_name in sorted(
+                self.artifact_store.listdir(self.parquet_dataset_path)
+            )
+            if str(file_name).endswith(".parquet")
+        ]
+
+    def _read_parquet_dataset(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Tuple[str, str, Any]]] = None,
+    ) -> pd.DataFrame:
+        """Reads all files of a Parquet dataset artifact in parallel.
+
+        Args:
+            columns: The columns to read.
+            filters: The row filters to apply.
+
+        Returns:
+            The pandas dataframe.
+        """
+        import pyarrow as pa  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+
+        def _read_file(path: str) -> "pa.Table":
+            with self.artifact_store.open(path, mode="rb") as f:
+                return pq.read_table(
+                    f,
+                    columns=columns,
+                    filters=filters,
+                    use_pandas_metadata=True,
+                )
+
+        files = self._get_parquet_dataset_files()
+        with ThreadPoolExecutor(
+            max_workers=min(len(files), DATASET_PARALLELISM) or 1
+        ) as executor:
+            tables = list(executor.map(_read_file, files))
+
+        return pa.concat_tables(tables).to_pandas()
+
+    def _validate_parquet_artifact(self, operation: str) -> None:
+        """Validates that the artifact is stored as a `.parquet` file.
+
+        Args:
+            operation: Description of the operation that requires the
+                `.parquet` file, used in the error message.
+
+        Raises:
+            ImportError: If the artifact is not stored as a `.parquet` file.
+        """
+        if not (
+            self.pyarrow_exists
+            and (
+                self.artifact_store.exists(self.parquet_path)
+                or self.artifact_store.exists(self.parquet_dataset_path)
+            )
+        ):
+            raise ImportError(
+                f"{operation} is only supported for artifacts stored as "
+                "`.parquet` file, which requires `pyarrow`. You can install "
+                "`pyarrow` by running '`pip install pyarrow`'."
+            )
+
+    def _load_dataset(self) -> Any:
+        """Lazily loads the `.parquet` file as a `pyarrow.dataset.Dataset`.
+
+        Files of remote artifact stores are downloaded to the local artifact
+        cache first.
+
+        Returns:
+            The dataset.
+        """
+        self._validate_parquet_artifact(
+            "Loading a pandas artifact as a dataset"
+        )
+
+        import pyarrow.dataset as ds  # type: ignore
+
+        if self.artifact_store.exists(self.parquet_dataset_path):
+            local_paths = [
+                self._get_local_path(path)
+                for path in self._get_parquet_dataset_files()
+            ]
+            return ds.dataset(local_paths, format="parquet")
+
+        return ds.dataset(
+            self._get_local_path(self.parquet_path), format="parquet"
+        )
+
     def save(self, df: Union[pd.DataFrame, pd.Series]) -> None:
         """Writes a pandas dataframe or series to the specified filename.
 
@@ -131,12 +360,71 @@ class PandasMaterializer(BaseMaterializer):
             df = df.to_frame(name="series")
 
         if self.pyarrow_exists:
-            with self.artifact_store.open(self.parquet_path, mode="wb") as f:
-                df.to_parquet(f, compression=COMPRESSION_TYPE)
+            if (
+                self.PARQUET_ROWS_PER_FILE
+                and len(df) > self.PARQUET_ROWS_PER_FILE
+            ):
+                self._save_parquet_dataset(df, self.PARQUET_ROWS_PER_FILE)
+            else:
+                with self.artifact_store.open(
+                    self.parquet_path, mode="wb"
+                ) as f:
+                    df.to_parquet(f, **self._get_parquet_write_options())
         else:
             with self.artifact_store.open(self.csv_path, mode="wb") as f:
                 df.to_csv(f, index=True)
 
+    def _get_parquet_write_options(self) -> Dict[str, Any]:
+        """Gets the options for writing Parquet files.
+
+        Returns:
+            The keyword arguments to pass to the Parquet writer.
+        """
+        options: Dict[str, Any] = {
+            "compression": self.PARQUET_COMPRESSION,
+            "use_dictionary": self.PARQUET_USE_DICTIONARY,
+        }
+        if self.PARQUET_ROW_GROUP_SIZE:
+            options["row_group_size"] = self.PARQUET_ROW_GROUP_SIZE
+        return options
+
+    def _save_parquet_dataset(
+        self, df: pd.DataFrame, rows_per_file: int
+    ) -> None:
+        """Writes a dataframe as a dataset of multiple Parquet files.
+
+        Args:
+            df: The dataframe to write.
+            rows_per_file: The maximum number of rows per file.
+        """
+        import pyarrow as pa  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+
+        # All files share the schema, including the pandas metadata to
+        # restore the index when reading the dataset. The index is always
+        # stored as a column, as a range index stored only in the metadata
+        # can't be restored from a subset of the files or rows.
+        table = pa.Table.from_pandas(df, preserve_index=True)
+        self.artifact_store.makedirs(self.parquet_dataset_path)
+
+        def _write_file(index: int) -> None:
+            path = os.path.join(
+                self.parquet_dataset_path, f"part-{index:05d}.parquet"
+            )
+            with self.artifact_store.open(path, mode="wb") as f:
+                pq.write_table(
+                    table.slice(index * rows_per_file, rows_per_file),
+                    f,
+                    **self._get_parquet_write_options(),
+                )
+
+        file_count = math.ceil(len(table) / rows_per_file)
+        with ThreadPoolExecutor(
+            max_workers=min(file_count, DATASET_PARALLELISM)
+        ) as executor:
+            # Consume the results to raise any errors
+            list(executor.map(_write_file, range(file_count)))
+
     def save_visualizations(
         self, df: Union[pd.DataFrame, pd.Series]
     ) -> Dict[str, VisualizationType]:
@@ -169,24 +457,86 @@ class PandasMaterializer(BaseMaterializer):
 
         if isinstance(df, pd.Series):
             pandas_metadata["dtype"] = DType(df.dtype.type)
-            pandas_metadata["mean"] = float(df.mean().item())
-            pandas_metadata["std"] = float(df.std().item())
-            pandas_metadata["min"] = float(df.min().item())
-            pandas_metadata["max"] = float(df.max().item())
+            if _is_real_numeric(df):
+                pandas_metadata.update(_compute_series_statistics(df))
+            else:
+                pandas_metadata["mean"] = float(df.mean().item())
+                pandas_metadata["std"] = float(df.std().item())
+                pandas_metadata["min"] = float(df.min().item())
+                pandas_metadata["max"] = float(df.max().item())
 
         else:
             pandas_metadata["dtype"] = {
                 str(key): DType(value.type) for key, value in df.dtypes.items()
             }
-            for stat_name, stat in {
-                "mean": df.mean,
-                "std": df.std,
-                "min": df.min,
-                "max": df.max,
-            }.items():
+            column_statistics = {
+                str(key): _compute_series_statistics(column)
+                for key, column in df.items()
+                if _is_real_numeric(column)
+            }
+            for stat_name in ["mean", "std", "min", "max"]:
                 pandas_metadata[stat_name] = {
-                    str(key): float(value)
-                    for key, value in stat(numeric_only=True).to_dict().items()
+                    key: statistics[stat_name]
+                    for key, statistics in column_statistics.items()
                 }
 
         return pandas_metadata
+
+
+def _is_dataset_type(data_type: Type[Any]) -> bool:
+    """Checks whether a data type is a `pyarrow.dataset.Dataset`.
+
+    Args:
+        data_type: The data type to check.
+
+    Returns:
+        Whether the data type is a `pyarrow.dataset.Dataset`.
+    """
+    try:
+        import pyarrow.dataset as ds  # type: ignore
+    except ImportError:
+        return False
+
+    return isinstance(data_type, type) and issubclass(data_type, ds.Dataset)
+
+
+def _is_real_numeric(series: pd.Series) -> bool:
+    """Checks whether a series contains real numeric values.
+
+    Args:
+        series: The series to check.
+
+    Returns:
+        Whether the series contains real numeric values.
+    """
+    return pd.api.types.is_numeric_dtype(
+        series.dtype
+    ) and not pd.api.types.is_complex_dtype(series.dtype)
+
+
+def _compute_series_statistics(series: pd.Series) -> Dict[str, float]:
+    """Computes the mean, standard deviation, min and max of a series.
+
+    The statistics are computed in a single pass and, like the pandas
+    equivalents, skip missing values and use one delta degree of freedom for
+    the standard deviation.
+
+    Args:
+        series: The numeric series for which to compute the statistics.
+
+    Returns:
+        The statistics of the series.
+    """
+    # Chunks are cast separately so that no float copy of the full column is
+    # allocated.
+    values = series.array
+    statistics = RunningStatistics(skipna=True)
+    for start in range(0, len(values), DEFAULT_CHUNK_SIZE):
+        statistics.update(
+            values[start : start + DEFAULT_CHUNK_SIZE].to_numpy(
+                dtype=np.float64, na_value=np.nan
+            )
+        )
+    return {
+        key: float(value) for key, value in statistics.to_dict(ddof=1).items()
+    }
@@ -13,7 +13,6 @@
 #  permissions and limitations under the License.
 """Model user facing interface to pass into pipeline or step."""
 
-import time
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -26,7 +25,6 @@ from uuid import UUID
 
 from pydantic import BaseModel, PrivateAttr, root_validator
 
-from zenml.constants import MAX_RETRIES_FOR_VERSIONED_ENTITY_CREATION
 from zenml.enums import MetadataResourceTypes, ModelStages
 from zenml.exceptions import EntityExistsError
 from zenml.logger import get_logger
@@ -695,37 +693,21 @@ class Model(BaseModel):
                     " as an example. You can explore model versions using "
                     f"`zenml model version list -n {self.name}` CLI command."
                 )
-            retries_made = 0
-            for i in range(MAX_RETRIES_FOR_VERSIONED_ENTITY_CREATION):
-                try:
-                    model_version = (
-                        zenml_client.zen_store.create_model_version(
-                            model_version=mv_request
-                        )
-                    )
-                    break
-                except EntityExistsError as e:
-                    if i == MAX_RETRIES_FOR_VERSIONED_ENTITY_CREATION - 1:
-                        raise RuntimeError(
-                            f"Failed to create model version "
-                            f"`{self.version if self.version else 'new'}` "
-                            f"in model `{self.name}`. Retried {retries_made} times. "
-                            "This could be driven by exceptionally high concurrency of "
-                            "pipeline runs. Please, reach out to us on ZenML Slack for support."
-                        ) from e
-                    # smoothed exponential back-off, it will go as 0.2, 0.3,
-                    # 0.45, 0.68, 1.01, 1.52, 2.28, 3.42, 5.13, 7.69, ...
-                    sleep = 0.2 * 1.5**i
-                    logger.debug(
-                        f"Failed to create new model version for "
-                        f"model `{self.name}`. Retrying in {sleep}..."
-                    )
-                    time.sleep(sleep)
-                    retries_made += 1
-            self.version = model_version.name
-            self.was_created_in_this_run = True
+            try:
+                model_version = zenml_client.zen_store.create_model_version(
+                    model_version=mv_request
+                )
+            except EntityExistsError:
+                if not self.version:
+                    raise
+                # A concurrent run created the model version with the same
+                # name in the meantime, so we use that one instead
+                model_version = self._get_model_version()
+            else:
+                self.version = model_version.name
+                self.was_created_in_this_run = True
 
-            logger.info(f"New model version `{self.version}` was created.")
+                logger.info(f"New model version `{self.version}` was created.")
 
         self._id = model_version.id
         self._model_id = model_version.model.id
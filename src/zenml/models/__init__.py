@@ -78,6 +78,7 @@ from zenml.models.v2.core.artifact import (
 from zenml.models.v2.core.artifact_version import (
     ArtifactVersionRequest,
     ArtifactVersionFilter,
+    ArtifactVersionRegistrationRequest,
     ArtifactVersionResponse,
     ArtifactVersionResponseBody,
     ArtifactVersionResponseMetadata,
@@ -340,6 +341,11 @@ from zenml.models.v2.core.event_source import (
 )
 from zenml.models.v2.misc.user_auth import UserAuthModel
 from zenml.models.v2.misc.build_item import BuildItem
+from zenml.models.v2.misc.cached_step_run import CachedStepRun
+from zenml.models.v2.misc.step_inputs import (
+    ResolvedStepInputs,
+    StepInputsQuery,
+)
 from zenml.models.v2.misc.loaded_visualization import LoadedVisualization
 from zenml.models.v2.misc.hub_plugin_models import (
     HubPluginRequestModel,
@@ -381,6 +387,9 @@ APIKeyResponseBody.update_forward_refs(
 ArtifactVersionRequest.update_forward_refs(
     ArtifactVisualizationRequest=ArtifactVisualizationRequest,
 )
+ArtifactVersionRegistrationRequest.update_forward_refs(
+    ArtifactVisualizationRequest=ArtifactVisualizationRequest,
+)
 ArtifactVersionResponseBody.update_forward_refs(
     UserResponse=UserResponse,
 )
@@ -619,6 +628,7 @@ __all__ = [
     "ArtifactUpdate",
     "ArtifactVersionRequest",
     "ArtifactVersionFilter",
+    "ArtifactVersionRegistrationRequest",
     "ArtifactVersionResponse",
     "ArtifactVersionResponseBody",
     "ArtifactVersionResponseMetadata",
@@ -819,6 +829,9 @@ __all__ = [
     "UserAuthModel",
     "ExternalUserModel",
     "BuildItem",
+    "CachedStepRun",
+    "ResolvedStepInputs",
+    "StepInputsQuery",
     "LoadedVisualization",
     "HubPluginRequestModel",
     "HubPluginResponseModel",
@@ -13,6 +13,8 @@
 #  permissions and limitations under the License.
 """Base filter model definitions."""
 
+import base64
+import json
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import (
@@ -259,6 +261,8 @@ class BaseFilter(BaseModel):
         "page",
         "size",
         "logical_operator",
+        "cursor",
+        "skip_count",
     ]
 
     # List of fields that are not even mentioned as options in the CLI.
@@ -284,6 +288,17 @@ class BaseFilter(BaseModel):
         le=PAGE_SIZE_MAXIMUM,
         description="Page size",
     )
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor pointing after the last item of the previous "
+        "page. If set, the page starts after this item instead of at the "
+        "offset of the page number.",
+    )
+    skip_count: bool = Field(
+        default=False,
+        description="Skip counting the total number of items. If set, the "
+        "total of the returned page is a lower bound estimate.",
+    )
 
     id: Optional[Union[UUID, str]] = Field(
         default=None, description="Id for this resource"
@@ -770,6 +785,93 @@ class BaseFilter(BaseModel):
         """
         return self.size * (self.page - 1)
 
+    def create_cursor(self, schema: "BaseSchema") -> str:
+        """Creates a cursor pointing after an item.
+
+        The cursor contains the sort column value and the ID of the item,
+        which is the tiebreaker of the sort order.
+
+        Args:
+            schema: The schema of the item.
+
+        Returns:
+            The cursor.
+        """
+        column, _ = self.sorting_params
+        value = getattr(schema, column)
+        value_type = None
+        if isinstance(value, datetime):
+            value, value_type = value.isoformat(), "datetime"
+        elif isinstance(value, UUID):
+            value, value_type = str(value), "uuid"
+        cursor = {
+            "sort_by": self.sort_by,
+            "value": value,
+            "type": value_type,
+            "id": str(schema.id),
+        }
+        return base64.urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+
+    def generate_cursor_filter(
+        self, table: Type["AnySchema"]
+    ) -> Optional["BooleanClauseList[Any]"]:
+        """Generates the filter for items after the cursor of this filter.
+
+        Args:
+            table: The query table.
+
+        Returns:
+            The filter expression for the query or None if no cursor is set.
+
+        Raises:
+            ValueError: If the cursor is invalid or was created for a
+                different sort order.
+        """
+        from sqlalchemy import and_, or_
+
+        if not self.cursor:
+            return None
+
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(self.cursor))
+            value = cursor["value"]
+            if cursor["type"] == "datetime":
+                value = datetime.fromisoformat(value)
+            elif cursor["type"] == "uuid":
+                value = UUID(value)
+            item_id = UUID(cursor["id"])
+            sort_by = cursor["sort_by"]
+        except (ValueError, TypeError, KeyError) as e:
+            raise ValueError(f"Invalid cursor `{self.cursor}`.") from e
+
+        if sort_by != self.sort_by:
+            raise ValueError(
+                f"The cursor was created for sorting by `{sort_by}` and "
+                f"can't be used for sorting by `{self.sort_by}`."
+            )
+
+        # Items are ordered by the sort column and their ID. SQLite and MySQL
+        # order NULL values first in ascending and last in descending order.
+        column, operand = self.sorting_params
+        sort_column = getattr(table, column)
+        after_id = table.id > item_id
+        if value is None:
+            cursor_filter = and_(sort_column.is_(None), after_id)
+            if operand == SorterOps.ASCENDING:
+                cursor_filter = or_(cursor_filter, sort_column.is_not(None))
+        else:
+            if operand == SorterOps.ASCENDING:
+                after_value = sort_column > value
+            else:
+                after_value = sort_column < value
+            cursor_filter = or_(
+                after_value, and_(sort_column == value, after_id)
+            )
+            if operand == SorterOps.DESCENDING:
+                cursor_filter = or_(cursor_filter, sort_column.is_(None))
+
+        return cursor_filter
+
     def generate_filter(
         self, table: Type[SQLModel]
     ) -> Union["BinaryExpression[Any]", "BooleanClauseList[Any]"]:
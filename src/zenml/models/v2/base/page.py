@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 """Page model definitions."""
 
-from typing import Generator, Generic, List, TypeVar
+from typing import Generator, Generic, List, Optional, TypeVar
 
 from pydantic import SecretStr
 from pydantic.generics import GenericModel
@@ -33,6 +33,7 @@ class Page(GenericModel, Generic[B]):
     total_pages: NonNegativeInt
     total: NonNegativeInt
     items: List[B]
+    next_cursor: Optional[str] = None
 
     __params_type__ = BaseFilter
 
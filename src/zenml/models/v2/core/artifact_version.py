@@ -30,6 +30,7 @@ from zenml.config.source import Source, convert_source_validator
 from zenml.constants import STR_FIELD_MAX_LENGTH, TEXT_FIELD_MAX_LENGTH
 from zenml.enums import ArtifactType, GenericFilterOps
 from zenml.logger import get_logger
+from zenml.metadata.metadata_types import MetadataType, MetadataTypeEnum
 from zenml.models.v2.base.filter import StrFilter
 from zenml.models.v2.base.scoped import (
     WorkspaceScopedRequest,
@@ -101,6 +102,72 @@ class ArtifactVersionRequest(WorkspaceScopedRequest):
     _convert_source = convert_source_validator("materializer", "data_type")
 
 
+class ArtifactVersionRegistrationRequest(WorkspaceScopedRequest):
+    """Request model to register an artifact version with a single request.
+
+    Registering an artifact version creates the artifact if it doesn't exist
+    yet, assigns the next version number if no version was specified, stores
+    the artifact version metadata and links the artifact version to the step
+    run that saved it.
+    """
+
+    artifact_name: str = Field(
+        title="Name of the artifact to which this version belongs.",
+        max_length=STR_FIELD_MAX_LENGTH,
+    )
+    version: Optional[Union[str, int]] = Field(
+        title="Version of the artifact.",
+        description="If not set, the next auto-incremented version is used.",
+        max_length=STR_FIELD_MAX_LENGTH,
+        default=None,
+    )
+    has_custom_name: bool = Field(
+        title="Whether the name is custom (True) or auto-generated (False).",
+        default=False,
+    )
+    type: ArtifactType = Field(title="Type of the artifact.")
+    artifact_store_id: Optional[UUID] = Field(
+        title="ID of the artifact store in which this artifact is stored.",
+        default=None,
+    )
+    uri: str = Field(
+        title="URI of the artifact.", max_length=TEXT_FIELD_MAX_LENGTH
+    )
+    materializer: Source = Field(
+        title="Materializer class to use for this artifact.",
+    )
+    data_type: Source = Field(
+        title="Data type of the artifact.",
+    )
+    tags: Optional[List[str]] = Field(
+        title="Tags of the artifact.",
+        description="Should be a list of plain strings, e.g., ['tag1', 'tag2']",
+        default=None,
+    )
+    visualizations: Optional[List["ArtifactVisualizationRequest"]] = Field(
+        default=None, title="Visualizations of the artifact."
+    )
+    metadata_values: Dict[str, MetadataType] = Field(
+        default_factory=dict,
+        title="Metadata of the artifact version.",
+    )
+    metadata_types: Dict[str, MetadataTypeEnum] = Field(
+        default_factory=dict,
+        title="Types of the metadata of the artifact version.",
+    )
+    step_run_id: Optional[UUID] = Field(
+        title="ID of the step run that manually saved the artifact version.",
+        default=None,
+    )
+
+    _convert_source = convert_source_validator("materializer", "data_type")
+
+    class Config:
+        """Pydantic configuration."""
+
+        smart_union = True
+
+
 # ------------------ Update Model ------------------
 
 
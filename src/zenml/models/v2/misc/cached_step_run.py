@@ -0,0 +1,38 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Model definition for cached step runs."""
+
+from typing import Dict
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class CachedStepRun(BaseModel):
+    """Step run which can be used as a cached version of another step run.
+
+    Attributes:
+        id: The ID of the step run.
+        pipeline_run_id: The ID of the pipeline run of the step run.
+        outputs: The IDs of the output artifact versions of the step run.
+    """
+
+    id: UUID = Field(title="The ID of the step run.")
+    pipeline_run_id: UUID = Field(
+        title="The ID of the pipeline run of the step run."
+    )
+    outputs: Dict[str, UUID] = Field(
+        default={},
+        title="The IDs of the output artifact versions of the step run.",
+    )
@@ -0,0 +1,70 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Model definitions for resolving the inputs of a step."""
+
+from typing import Dict, List, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from zenml.models.v2.core.artifact_version import ArtifactVersionResponse
+
+
+class StepInputsQuery(BaseModel):
+    """Query for the inputs of a step in a pipeline run.
+
+    Attributes:
+        upstream_steps: The names of the upstream steps of the step.
+        step_outputs: The (step name, output name) pairs of the outputs of
+            other steps in the same pipeline run that the step consumes.
+        external_artifact_ids: The IDs of the external artifact versions that
+            the step consumes.
+    """
+
+    upstream_steps: List[str] = Field(
+        default=[], title="The names of the upstream steps of the step."
+    )
+    step_outputs: List[Tuple[str, str]] = Field(
+        default=[],
+        title="The (step name, output name) pairs of the step outputs that "
+        "the step consumes.",
+    )
+    external_artifact_ids: List[UUID] = Field(
+        default=[],
+        title="The IDs of the external artifact versions that the step "
+        "consumes.",
+    )
+
+
+class ResolvedStepInputs(BaseModel):
+    """Resolved inputs of a step in a pipeline run.
+
+    Attributes:
+        step_run_ids: The IDs of the queried step runs by step name. Steps
+            that don't exist in the pipeline run are missing.
+        step_outputs: The queried output artifact versions by step and output
+            name. Outputs that don't exist are missing.
+        external_artifacts: The queried external artifact versions by ID.
+    """
+
+    step_run_ids: Dict[str, UUID] = Field(
+        default={}, title="The IDs of the queried step runs by step name."
+    )
+    step_outputs: Dict[str, Dict[str, ArtifactVersionResponse]] = Field(
+        default={},
+        title="The queried output artifact versions by step and output name.",
+    )
+    external_artifacts: Dict[UUID, ArtifactVersionResponse] = Field(
+        default={}, title="The queried external artifact versions by ID."
+    )
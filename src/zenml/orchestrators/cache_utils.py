@@ -17,7 +17,6 @@ import hashlib
 from typing import TYPE_CHECKING, Dict, Optional
 
 from zenml.client import Client
-from zenml.enums import ExecutionStatus, SorterOps
 from zenml.logger import get_logger
 
 if TYPE_CHECKING:
@@ -25,7 +24,7 @@ if TYPE_CHECKING:
 
     from zenml.artifact_stores import BaseArtifactStore
     from zenml.config.step_configurations import Step
-    from zenml.models import StepRunResponse
+    from zenml.models import CachedStepRun
 
 logger = get_logger(__name__)
 
@@ -102,7 +101,7 @@ def generate_cache_key(
     return hash_.hexdigest()
 
 
-def get_cached_step_run(cache_key: str) -> Optional["StepRunResponse"]:
+def get_cached_step_run(cache_key: str) -> Optional["CachedStepRun"]:
     """If a given step can be cached, get the corresponding existing step run.
 
     A step run can be cached if there is an existing step run in the same
@@ -116,14 +115,6 @@ def get_cached_step_run(cache_key: str) -> Optional["StepRunResponse"]:
     """
     client = Client()
 
-    cache_candidates = client.list_run_steps(
-        workspace_id=client.active_workspace.id,
-        cache_key=cache_key,
-        status=ExecutionStatus.COMPLETED,
-        sort_by=f"{SorterOps.DESCENDING}:created",
-        size=1,
-    ).items
-
-    if cache_candidates:
-        return cache_candidates[0]
-    return None
+    return client.zen_store.get_latest_cached_step_run(
+        workspace_id=client.active_workspace.id, cache_key=cache_key
+    )
@@ -15,8 +15,14 @@
 
 import threading
 from collections import defaultdict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from enum import Enum
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 from zenml.logger import get_logger
 
@@ -53,6 +59,48 @@ class NodeStatus(Enum):
     WAITING = "Waiting"
     RUNNING = "Running"
     COMPLETED = "Completed"
+    FAILED = "Failed"
+    SKIPPED = "Skipped"
+
+
+def get_critical_path_lengths(dag: Dict[str, List[str]]) -> Dict[str, int]:
+    """Computes the length of the longest path starting at each node.
+
+    The length of a path is the number of nodes it contains, so a node without
+    any downstream nodes has a critical path length of 1. Nodes that are part
+    of a cycle are not included in the result.
+
+    Args:
+        dag: Adjacency list representation of a DAG.
+
+    Returns:
+        The critical path length of each node.
+    """
+    reversed_dag = reverse_dag(dag)
+    num_pending_downstream_nodes = {
+        node: len(downstream_nodes)
+        for node, downstream_nodes in reversed_dag.items()
+    }
+    path_lengths: Dict[str, int] = {}
+
+    # Walk the DAG in reverse topological order, starting with the nodes that
+    # don't have any downstream nodes.
+    nodes_to_visit = [
+        node
+        for node, count in num_pending_downstream_nodes.items()
+        if not count
+    ]
+    while nodes_to_visit:
+        node = nodes_to_visit.pop()
+        path_lengths[node] = 1 + max(
+            (path_lengths[n] for n in reversed_dag[node]), default=0
+        )
+        for upstream_node in dag.get(node, []):
+            num_pending_downstream_nodes[upstream_node] -= 1
+            if num_pending_downstream_nodes[upstream_node] == 0:
+                nodes_to_visit.append(upstream_node)
+
+    return path_lengths
 
 
 class ThreadedDagRunner:
@@ -62,11 +110,20 @@ class ThreadedDagRunner:
     well as a custom `run_fn` as input, then calls `run_fn(node)` for each
     string node in the DAG.
 
-    Steps that can be executed in parallel will be started in separate threads.
+    Nodes that can be executed in parallel will be run in separate threads of
+    a worker pool. If `run_fn` raises an exception for a node, the node is
+    marked as failed and all its downstream nodes are skipped. If the runner
+    is configured to fail fast, no new nodes are started after the first
+    failure and all remaining waiting nodes are skipped instead.
     """
 
     def __init__(
-        self, dag: Dict[str, List[str]], run_fn: Callable[[str], Any]
+        self,
+        dag: Dict[str, List[str]],
+        run_fn: Callable[[str], Any],
+        max_parallelism: Optional[int] = None,
+        fail_fast: bool = False,
+        prioritize_critical_path: bool = False,
     ) -> None:
         """Define attributes and initialize all nodes in waiting state.
 
@@ -75,12 +132,35 @@ class ThreadedDagRunner:
                 E.g.: [(1->2), (1->3), (2->4), (3->4)] should be represented as
                 `dag={2: [1], 3: [1], 4: [2, 3]}`
             run_fn: A function `run_fn(node)` that runs a single node
+            max_parallelism: The maximum number of nodes to run at the same
+                time. If not set, all nodes that are ready will be run
+                immediately.
+            fail_fast: If `True`, stop starting new nodes as soon as one node
+                failed and skip all nodes that didn't start yet. Nodes that
+                are already running at that point will still finish.
+            prioritize_critical_path: If `True` and more nodes are ready than
+                can be run at the same time, the nodes with the longest chain
+                of downstream nodes will be started first.
+
+        Raises:
+            ValueError: If `max_parallelism` is not a positive integer.
         """
+        if max_parallelism is not None and max_parallelism < 1:
+            raise ValueError(
+                "The maximum parallelism of the DAG runner needs to be a "
+                f"positive integer, got {max_parallelism}."
+            )
+
         self.dag = dag
         self.reversed_dag = reverse_dag(dag)
         self.run_fn = run_fn
         self.nodes = dag.keys()
         self.node_states = {node: NodeStatus.WAITING for node in self.nodes}
+        self.max_parallelism = max_parallelism
+        self.fail_fast = fail_fast
+        self._priorities: Dict[str, int] = (
+            get_critical_path_lengths(dag) if prioritize_critical_path else {}
+        )
         self._lock = threading.Lock()
 
     def _can_run(self, node: str) -> bool:
@@ -106,63 +186,74 @@ class ThreadedDagRunner:
 
         return True
 
-    def _run_node(self, node: str) -> None:
-        """Run a single node.
+    def _get_runnable_nodes(self) -> List[str]:
+        """Get all nodes that are ready to be run, sorted by priority.
 
-        Calls the user-defined run_fn, then calls `self._finish_node`.
-
-        Args:
-            node: The node.
+        Returns:
+            The nodes that are ready to be run.
         """
-        self.run_fn(node)
-        self._finish_node(node)
-
-    def _run_node_in_thread(self, node: str) -> threading.Thread:
-        """Run a single node in a separate thread.
-
-        First updates the node status to running.
-        Then calls self._run_node() in a new thread and returns the thread.
+        runnable_nodes = [node for node in self.nodes if self._can_run(node)]
+        if self._priorities:
+            # `sorted` is stable, so nodes with the same priority keep their
+            # order from the DAG.
+            runnable_nodes = sorted(
+                runnable_nodes,
+                key=lambda node: self._priorities.get(node, 0),
+                reverse=True,
+            )
+        return runnable_nodes
+
+    def _skip_downstream_nodes(self, node: str) -> None:
+        """Mark all waiting nodes downstream of a node as skipped.
 
         Args:
             node: The node.
-
-        Returns:
-            The thread in which the node was run.
         """
-        # Update node status to running.
-        assert self.node_states[node] == NodeStatus.WAITING
-        with self._lock:
-            self.node_states[node] = NodeStatus.RUNNING
+        nodes_to_skip = list(self.reversed_dag[node])
+        while nodes_to_skip:
+            downstream_node = nodes_to_skip.pop()
+            if self.node_states[downstream_node] == NodeStatus.WAITING:
+                logger.info(
+                    "Skipping node `%s` because its upstream node `%s` failed.",
+                    downstream_node,
+                    node,
+                )
+                self.node_states[downstream_node] = NodeStatus.SKIPPED
+                nodes_to_skip.extend(self.reversed_dag[downstream_node])
 
-        # Run node in new thread.
-        thread = threading.Thread(target=self._run_node, args=(node,))
-        thread.start()
-        return thread
+    def _skip_waiting_nodes(self) -> None:
+        """Mark all nodes that are still waiting as skipped."""
+        for node in self.nodes:
+            if self.node_states[node] == NodeStatus.WAITING:
+                logger.info("Skipping node `%s` after a failure.", node)
+                self.node_states[node] = NodeStatus.SKIPPED
 
-    def _finish_node(self, node: str) -> None:
+    def _finish_node(self, node: str, future: "Future[Any]") -> None:
         """Finish a node run.
 
-        First updates the node status to completed.
-        Then starts all other nodes that can now be run and waits for them.
+        Updates the node status to completed or failed depending on the result
+        of the node run and skips all nodes that should not be run anymore.
 
         Args:
             node: The node.
+            future: The future of the node run.
         """
-        # Update node status to completed.
         assert self.node_states[node] == NodeStatus.RUNNING
+        exception = future.exception()
         with self._lock:
-            self.node_states[node] = NodeStatus.COMPLETED
-
-        # Run downstream nodes.
-        threads = []
-        for downstram_node in self.reversed_dag[node]:
-            if self._can_run(downstram_node):
-                thread = self._run_node_in_thread(downstram_node)
-                threads.append(thread)
-
-        # Wait for all downstream nodes to complete.
-        for thread in threads:
-            thread.join()
+            if exception is None:
+                self.node_states[node] = NodeStatus.COMPLETED
+                return
+
+            logger.error(
+                "Failed to run node `%s`.",
+                node,
+                exc_info=(type(exception), exception, exception.__traceback__),
+            )
+            self.node_states[node] = NodeStatus.FAILED
+            self._skip_downstream_nodes(node)
+            if self.fail_fast:
+                self._skip_waiting_nodes()
 
     def run(self) -> None:
         """Call `self.run_fn` on all nodes in `self.dag`.
@@ -170,18 +261,28 @@ class ThreadedDagRunner:
         The order of execution is determined using topological sort.
         Each node is run in a separate thread to enable parallelism.
         """
-        # Run all nodes that can be started immediately.
-        # These will, in turn, start other nodes once all of their respective
-        # upstream nodes have completed.
-        threads = []
-        for node in self.nodes:
-            if self._can_run(node):
-                thread = self._run_node_in_thread(node)
-                threads.append(thread)
-
-        # Wait till all nodes have completed.
-        for thread in threads:
-            thread.join()
+        max_workers = self.max_parallelism or max(len(self.nodes), 1)
+        running: Dict["Future[Any]", str] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="dag_runner"
+        ) as executor:
+            while True:
+                # Start as many runnable nodes as there are free workers.
+                with self._lock:
+                    for node in self._get_runnable_nodes():
+                        if len(running) >= max_workers:
+                            break
+                        self.node_states[node] = NodeStatus.RUNNING
+                        running[executor.submit(self.run_fn, node)] = node
+
+                if not running:
+                    break
+
+                # Wait until at least one of the running nodes finished.
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    self._finish_node(running.pop(future), future)
 
         # Make sure all nodes were run, otherwise print a warning.
         for node in self.nodes:
@@ -191,3 +292,16 @@ class ThreadedDagRunner:
                     f"Node `{node}` was never run, because it was still"
                     f" waiting for the following nodes: `{upstream_nodes}`."
                 )
+
+    @property
+    def failed_nodes(self) -> List[str]:
+        """The nodes that failed during the last run.
+
+        Returns:
+            The failed nodes.
+        """
+        return [
+            node
+            for node, state in self.node_states.items()
+            if state == NodeStatus.FAILED
+        ]
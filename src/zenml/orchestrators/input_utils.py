@@ -13,14 +13,12 @@
 #  permissions and limitations under the License.
 """Utilities for inputs."""
 
-import functools
 from typing import TYPE_CHECKING, Dict, List, Tuple
 from uuid import UUID
 
 from zenml.client import Client
 from zenml.config.step_configurations import Step
 from zenml.exceptions import InputResolutionError
-from zenml.utils import pagination_utils
 
 if TYPE_CHECKING:
     from zenml.models import ArtifactVersionResponse
@@ -46,28 +44,41 @@ def resolve_step_inputs(
         The IDs of the input artifact versions and the IDs of parent steps of
             the current step.
     """
-    from zenml.models import ArtifactVersionResponse, RunMetadataResponse
-
-    list_run_steps = functools.partial(
-        Client().list_run_steps, pipeline_run_id=run_id
+    from zenml.models import (
+        ArtifactVersionResponse,
+        RunMetadataResponse,
+        StepInputsQuery,
     )
 
-    current_run_steps = {
-        run_step.name: run_step
-        for run_step in pagination_utils.depaginate(list_run_steps)
+    external_artifact_ids = {
+        name: external_artifact.get_artifact_version_id()
+        for name, external_artifact in (
+            step.config.external_input_artifacts.items()
+        )
     }
+    resolved_inputs = Client().zen_store.resolve_step_inputs(
+        pipeline_run_id=run_id,
+        query=StepInputsQuery(
+            upstream_steps=step.spec.upstream_steps,
+            step_outputs=[
+                (input_.step_name, input_.output_name)
+                for input_ in step.spec.inputs.values()
+            ],
+            external_artifact_ids=list(external_artifact_ids.values()),
+        ),
+    )
 
     input_artifacts: Dict[str, "ArtifactVersionResponse"] = {}
     for name, input_ in step.spec.inputs.items():
-        try:
-            step_run = current_run_steps[input_.step_name]
-        except KeyError:
+        if input_.step_name not in resolved_inputs.step_run_ids:
             raise InputResolutionError(
                 f"No step `{input_.step_name}` found in current run."
             )
 
         try:
-            artifact = step_run.outputs[input_.output_name]
+            artifact = resolved_inputs.step_outputs[input_.step_name][
+                input_.output_name
+            ]
         except KeyError:
             raise InputResolutionError(
                 f"No output `{input_.output_name}` found for step "
@@ -76,14 +87,10 @@ def resolve_step_inputs(
 
         input_artifacts[name] = artifact
 
-    for (
-        name,
-        external_artifact,
-    ) in step.config.external_input_artifacts.items():
-        artifact_version_id = external_artifact.get_artifact_version_id()
-        input_artifacts[name] = Client().get_artifact_version(
+    for name, artifact_version_id in external_artifact_ids.items():
+        input_artifacts[name] = resolved_inputs.external_artifacts[
             artifact_version_id
-        )
+        ]
 
     for name, config_ in step.config.model_artifacts_or_metadata.items():
         issue_found = False
@@ -134,9 +141,13 @@ def resolve_step_inputs(
         else:
             step.config.parameters[name] = value_
 
-    parent_step_ids = [
-        current_run_steps[upstream_step].id
-        for upstream_step in step.spec.upstream_steps
-    ]
+    parent_step_ids = []
+    for upstream_step in step.spec.upstream_steps:
+        try:
+            parent_step_ids.append(resolved_inputs.step_run_ids[upstream_step])
+        except KeyError:
+            raise InputResolutionError(
+                f"No step `{upstream_step}` found in current run."
+            )
 
     return input_artifacts, parent_step_ids
@@ -13,41 +13,62 @@
 #  permissions and limitations under the License.
 """Implementation of the ZenML local orchestrator."""
 
+import os
+import subprocess
+import sys
 import time
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type, cast
 from uuid import uuid4
 
+from pydantic import PositiveInt
+
+from zenml.config.base_settings import BaseSettings
+from zenml.entrypoints import StepEntrypointConfiguration
 from zenml.logger import get_logger
 from zenml.orchestrators import BaseOrchestrator
 from zenml.orchestrators.base_orchestrator import (
     BaseOrchestratorConfig,
     BaseOrchestratorFlavor,
 )
+from zenml.orchestrators.dag_runner import ThreadedDagRunner
 from zenml.stack import Stack
-from zenml.utils import string_utils
+from zenml.utils import source_utils, string_utils
 
 if TYPE_CHECKING:
     from zenml.models import PipelineDeploymentResponse
 
 logger = get_logger(__name__)
 
+ENV_ZENML_LOCAL_ORCHESTRATOR_RUN_ID = "ZENML_LOCAL_ORCHESTRATOR_RUN_ID"
+
 
 class LocalOrchestrator(BaseOrchestrator):
     """Orchestrator responsible for running pipelines locally.
 
-    This orchestrator does not allow for concurrent execution of steps and also
-    does not support running on a schedule.
+    By default, this orchestrator runs all steps sequentially in the current
+    Python process. If the `parallel` setting is enabled, steps which don't
+    depend on each other are run concurrently in separate Python processes.
+    This orchestrator does not support running on a schedule.
     """
 
     _orchestrator_run_id: Optional[str] = None
 
+    @property
+    def settings_class(self) -> Optional[Type["BaseSettings"]]:
+        """Settings class for the local orchestrator.
+
+        Returns:
+            The settings class.
+        """
+        return LocalOrchestratorSettings
+
     def prepare_or_run_pipeline(
         self,
         deployment: "PipelineDeploymentResponse",
         stack: "Stack",
         environment: Dict[str, str],
     ) -> Any:
-        """Iterates through all steps and executes them sequentially.
+        """Iterates through all steps and executes them.
 
         Args:
             deployment: The pipeline deployment to prepare or run.
@@ -65,7 +86,6 @@ class LocalOrchestrator(BaseOrchestrator):
         self._orchestrator_run_id = str(uuid4())
         start_time = time.time()
 
-        # Run each step
         for step_name, step in deployment.step_configurations.items():
             if self.requires_resources_in_orchestration_environment(step):
                 logger.warning(
@@ -75,16 +95,119 @@ class LocalOrchestrator(BaseOrchestrator):
                     step_name,
                 )
 
-            self.run_step(
-                step=step,
-            )
+        settings = cast(
+            LocalOrchestratorSettings, self.get_settings(deployment)
+        )
+        try:
+            if settings.parallel:
+                self._run_steps_in_parallel(
+                    deployment=deployment,
+                    environment=environment,
+                    max_parallelism=settings.max_parallelism,
+                )
+            else:
+                # Run each step
+                for step in deployment.step_configurations.values():
+                    self.run_step(
+                        step=step,
+                    )
+        finally:
+            self._orchestrator_run_id = None
 
         run_duration = time.time() - start_time
         logger.info(
             "Pipeline run has finished in `%s`.",
             string_utils.get_human_readable_time(run_duration),
         )
-        self._orchestrator_run_id = None
+
+    def _run_steps_in_parallel(
+        self,
+        deployment: "PipelineDeploymentResponse",
+        environment: Dict[str, str],
+        max_parallelism: Optional[int] = None,
+    ) -> None:
+        """Runs all steps of a deployment in concurrent Python processes.
+
+        Each step is started as soon as all of its upstream steps have
+        finished. The step itself is executed by running the step entrypoint
+        in a separate Python process, the same way containerized orchestrators
+        run steps inside their containers.
+
+        Args:
+            deployment: The pipeline deployment to run.
+            environment: Environment variables to set in the step processes.
+            max_parallelism: Maximum number of steps to run at the same time.
+                Defaults to the number of CPUs of the machine.
+
+        Raises:
+            RuntimeError: If one or more steps failed.
+        """
+        assert self._orchestrator_run_id
+
+        max_parallelism = max_parallelism or os.cpu_count() or 1
+        logger.info(
+            "Running steps in parallel using up to %d processes.",
+            max_parallelism,
+        )
+
+        source_root = source_utils.get_source_root()
+        step_environment = os.environ.copy()
+        step_environment.update(environment)
+        step_environment[ENV_ZENML_LOCAL_ORCHESTRATOR_RUN_ID] = (
+            self._orchestrator_run_id
+        )
+        python_path = step_environment.get("PYTHONPATH")
+        step_environment["PYTHONPATH"] = (
+            os.pathsep.join([source_root, python_path])
+            if python_path
+            else source_root
+        )
+
+        command = StepEntrypointConfiguration.get_entrypoint_command()
+        # Make sure the steps run with the same interpreter as the client
+        command[0] = sys.executable
+
+        def _run_step_in_process(step_name: str) -> None:
+            """Runs a single step in a separate Python process.
+
+            Args:
+                step_name: Name of the step to run.
+
+            Raises:
+                RuntimeError: If the step process failed.
+            """
+            arguments = StepEntrypointConfiguration.get_entrypoint_arguments(
+                step_name=step_name, deployment_id=deployment.id
+            )
+            logger.info("Running step `%s` in a new process.", step_name)
+            process = subprocess.run(
+                command + arguments,
+                cwd=source_root,
+                env=step_environment,
+            )
+
+            if process.returncode != 0:
+                raise RuntimeError(
+                    f"Process of step `{step_name}` exited with return code "
+                    f"{process.returncode}."
+                )
+
+        pipeline_dag = {
+            step_name: step.spec.upstream_steps
+            for step_name, step in deployment.step_configurations.items()
+        }
+        dag_runner = ThreadedDagRunner(
+            dag=pipeline_dag,
+            run_fn=_run_step_in_process,
+            max_parallelism=max_parallelism,
+        )
+        dag_runner.run()
+
+        if dag_runner.failed_nodes:
+            raise RuntimeError(
+                "Pipeline run failed because the following steps failed: "
+                f"{', '.join(dag_runner.failed_nodes)}."
+            )
 
     def get_orchestrator_run_id(self) -> str:
         """Returns the active orchestrator run id.
@@ -96,13 +219,38 @@ class LocalOrchestrator(BaseOrchestrator):
         Returns:
             The orchestrator run id.
         """
-        if not self._orchestrator_run_id:
-            raise RuntimeError("No run id set.")
+        if self._orchestrator_run_id:
+            return self._orchestrator_run_id
+
+        # Steps running in a separate process when using the parallel mode
+        # receive the run id of the orchestrator through the environment
+        if ENV_ZENML_LOCAL_ORCHESTRATOR_RUN_ID in os.environ:
+            return os.environ[ENV_ZENML_LOCAL_ORCHESTRATOR_RUN_ID]
+
+        raise RuntimeError("No run id set.")
+
+
+class LocalOrchestratorSettings(BaseSettings):
+    """Local orchestrator settings.
+
+    Attributes:
+        parallel: If `True`, steps that don't depend on each other will be
+            run concurrently, each in a separate Python process. Similar to
+            containerized orchestrators, this requires the module which
+            defines your steps to be importable without side effects, e.g. by
+            guarding the pipeline run with `if __name__ == "__main__":`.
+        max_parallelism: The maximum number of steps to run at the same
+            time when running in parallel. Defaults to the number of CPUs of
+            the machine.
+    """
 
-        return self._orchestrator_run_id
+    parallel: bool = False
+    max_parallelism: Optional[PositiveInt] = None
 
 
-class LocalOrchestratorConfig(BaseOrchestratorConfig):
+class LocalOrchestratorConfig(  # type: ignore[misc] # https://github.com/pydantic/pydantic/issues/4173
+    BaseOrchestratorConfig, LocalOrchestratorSettings
+):
     """Local orchestrator config."""
 
     @property
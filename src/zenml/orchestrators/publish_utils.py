@@ -13,8 +13,9 @@
 #  permissions and limitations under the License.
 """Utilities to publish pipeline and step runs."""
 
+from collections import Counter
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, Dict, List, Mapping
 
 from zenml.client import Client
 from zenml.enums import ExecutionStatus, MetadataResourceTypes
@@ -103,11 +104,28 @@ def get_pipeline_run_status(
     Returns:
         The run status.
     """
-    if ExecutionStatus.FAILED in step_statuses:
+    return get_pipeline_run_status_from_counts(
+        step_status_counts=Counter(step_statuses), num_steps=num_steps
+    )
+
+
+def get_pipeline_run_status_from_counts(
+    step_status_counts: Mapping[ExecutionStatus, int], num_steps: int
+) -> ExecutionStatus:
+    """Gets the pipeline run status for the given step status counts.
+
+    Args:
+        step_status_counts: The number of steps in this run for each status.
+        num_steps: The total amount of steps in this run.
+
+    Returns:
+        The run status.
+    """
+    if step_status_counts.get(ExecutionStatus.FAILED, 0) > 0:
         return ExecutionStatus.FAILED
     if (
-        ExecutionStatus.RUNNING in step_statuses
-        or len(step_statuses) < num_steps
+        step_status_counts.get(ExecutionStatus.RUNNING, 0) > 0
+        or sum(step_status_counts.values()) < num_steps
     ):
         return ExecutionStatus.RUNNING
 
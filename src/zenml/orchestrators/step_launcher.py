@@ -23,9 +23,11 @@ from zenml.config.step_configurations import Step
 from zenml.config.step_run_info import StepRunInfo
 from zenml.constants import (
     ENV_ZENML_DISABLE_STEP_LOGS_STORAGE,
+    ENV_ZENML_INPUT_ARTIFACT_PREFETCH_PARALLELISM,
     STEP_SOURCE_PARAMETER_NAME,
     TEXT_FIELD_MAX_LENGTH,
     handle_bool_env_var,
+    handle_int_env_var,
 )
 from zenml.enums import ExecutionStatus
 from zenml.environment import get_run_environment_dict
@@ -137,6 +139,7 @@ class StepLauncher:
 
         self._stack = Stack.from_model(deployment.stack)
         self._step_name = step.spec.pipeline_parameter_name
+        self._step_runner: Optional[StepRunner] = None
 
     def launch(self) -> None:
         """Launches the step.
@@ -354,12 +357,8 @@ class StepLauncher:
             if cached_step_run:
                 logger.info(f"Using cached version of `{self._step_name}`.")
                 execution_needed = False
-                cached_outputs = cached_step_run.outputs
                 step_run.original_step_run_id = cached_step_run.id
-                step_run.outputs = {
-                    output_name: artifact.id
-                    for output_name, artifact in cached_outputs.items()
-                }
+                step_run.outputs = cached_step_run.outputs
                 self._link_cached_artifacts_to_model(
                     model_from_context=model,
                     step_run=step_run,
@@ -367,6 +366,19 @@ class StepLauncher:
                 step_run.status = ExecutionStatus.CACHED
                 step_run.end_time = step_run.start_time
 
+        if execution_needed and not self._step.config.step_operator:
+            prefetch_parallelism = handle_int_env_var(
+                ENV_ZENML_INPUT_ARTIFACT_PREFETCH_PARALLELISM, default=0
+            )
+            if prefetch_parallelism > 0 and input_artifacts:
+                self._step_runner = StepRunner(
+                    step=self._step, stack=self._stack
+                )
+                self._step_runner.prefetch_input_artifacts(
+                    input_artifacts=input_artifacts,
+                    max_workers=prefetch_parallelism,
+                )
+
         return execution_needed, step_run
 
     def _link_cached_artifacts_to_model(
@@ -513,7 +525,9 @@ class StepLauncher:
             input_artifacts: The input artifact versions of the current step.
             output_artifact_uris: The output artifact URIs of the current step.
         """
-        runner = StepRunner(step=self._step, stack=self._stack)
+        runner = self._step_runner or StepRunner(
+            step=self._step, stack=self._stack
+        )
         runner.run(
             pipeline_run=pipeline_run,
             step_run=step_run,
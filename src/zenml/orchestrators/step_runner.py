@@ -16,6 +16,7 @@
 
 import copy
 import inspect
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import nullcontext
 from typing import (
     TYPE_CHECKING,
@@ -32,13 +33,15 @@ from uuid import UUID
 from pydantic.typing import get_origin, is_union
 
 from zenml.artifacts.unmaterialized_artifact import UnmaterializedArtifact
-from zenml.artifacts.utils import save_artifact
+from zenml.artifacts.utils import _store_artifact_data_and_prepare_request
 from zenml.client import Client
 from zenml.config.step_configurations import StepConfiguration
 from zenml.config.step_run_info import StepRunInfo
 from zenml.constants import (
     ENV_ZENML_DISABLE_STEP_LOGS_STORAGE,
+    ENV_ZENML_OUTPUT_ARTIFACT_SAVE_PARALLELISM,
     handle_bool_env_var,
+    handle_int_env_var,
 )
 from zenml.exceptions import StepContextError, StepInterfaceError
 from zenml.logger import get_logger
@@ -56,12 +59,14 @@ from zenml.orchestrators.utils import is_setting_enabled
 from zenml.steps.step_environment import StepEnvironment
 from zenml.steps.utils import (
     OutputSignature,
+    get_load_config_from_annotation_metadata,
     parse_return_type_annotations,
     resolve_type_annotation,
 )
 from zenml.utils import materializer_utils, source_utils
 
 if TYPE_CHECKING:
+    from zenml.artifacts.artifact_load_config import ArtifactLoadConfig
     from zenml.artifacts.external_artifact_config import (
         ExternalArtifactConfiguration,
     )
@@ -91,6 +96,7 @@ class StepRunner:
         """
         self._step = step
         self._stack = stack
+        self._prefetched_inputs: Dict[str, "Future[Any]"] = {}
 
     @property
     def configuration(self) -> StepConfiguration:
@@ -101,6 +107,44 @@ class StepRunner:
         """
         return self._step.config
 
+    def prefetch_input_artifacts(
+        self,
+        input_artifacts: Dict[str, "ArtifactVersionResponse"],
+        max_workers: int,
+    ) -> None:
+        """Starts loading the input artifacts of the step in the background.
+
+        The loaded values are used once the inputs for the step entrypoint
+        function get parsed. This allows downloading the input artifacts
+        while the stack prepares the step run.
+
+        Args:
+            input_artifacts: The input artifact versions of the step.
+            max_workers: The maximum number of input artifacts to load
+                concurrently.
+        """
+        step_instance = self._load_step()
+        spec = inspect.getfullargspec(inspect.unwrap(step_instance.entrypoint))
+        input_names = [arg for arg in spec.args if arg in input_artifacts]
+        if not input_names:
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(max_workers, len(input_names)),
+            thread_name_prefix="zenml-input-prefetch",
+        )
+        for input_name in input_names:
+            annotation = spec.annotations.get(input_name, None)
+            self._prefetched_inputs[input_name] = executor.submit(
+                self._load_input_artifact,
+                input_artifacts[input_name],
+                resolve_type_annotation(annotation),
+                self._get_input_load_config(input_name, annotation),
+            )
+        # Don't wait for the loading to finish here, the threads of the
+        # executor will shut down once all inputs are loaded.
+        executor.shutdown(wait=False)
+
     def run(
         self,
         pipeline_run: "PipelineRunResponse",
@@ -348,9 +392,15 @@ class StepRunner:
                     "https://docs.zenml.io/user-guide/advanced-guide/pipelining-features/fetch-metadata-within-steps"
                 )
                 function_params[arg] = get_step_context()
+            elif arg in self._prefetched_inputs:
+                function_params[arg] = self._prefetched_inputs.pop(
+                    arg
+                ).result()
             elif arg in input_artifacts:
                 function_params[arg] = self._load_input_artifact(
-                    input_artifacts[arg], arg_type
+                    input_artifacts[arg],
+                    arg_type,
+                    self._get_input_load_config(arg, annotations.get(arg)),
                 )
             elif arg in self.configuration.parameters:
                 function_params[arg] = self.configuration.parameters[arg]
@@ -422,14 +472,41 @@ class StepRunner:
 
         return function_params
 
+    def _get_input_load_config(
+        self, input_name: str, annotation: Any
+    ) -> Optional["ArtifactLoadConfig"]:
+        """Gets the load config of a step input.
+
+        Args:
+            input_name: The name of the input.
+            annotation: The type annotation of the input.
+
+        Returns:
+            The load config from the input annotation or, if not annotated,
+            from the external artifact configuration of the input.
+        """
+        load_config = get_load_config_from_annotation_metadata(annotation)
+        if load_config is None:
+            external_artifact = (
+                self.configuration.external_input_artifacts.get(input_name)
+            )
+            if external_artifact:
+                load_config = external_artifact.load_config
+        return load_config
+
     def _load_input_artifact(
-        self, artifact: "ArtifactVersionResponse", data_type: Type[Any]
+        self,
+        artifact: "ArtifactVersionResponse",
+        data_type: Type[Any],
+        load_config: Optional["ArtifactLoadConfig"] = None,
     ) -> Any:
         """Loads an input artifact.
 
         Args:
             artifact: The artifact to load.
             data_type: The data type of the artifact value.
+            load_config: Optional configuration to load only parts of the
+                artifact.
 
         Returns:
             The artifact value.
@@ -452,6 +529,10 @@ class StepRunner:
         )
         materializer: BaseMaterializer = materializer_class(artifact.uri)
         materializer.validate_type_compatibility(data_type)
+        if load_config:
+            return materializer.load_with_config(
+                data_type=data_type, load_config=load_config
+            )
         return materializer.load(data_type=data_type)
 
     def _validate_outputs(
@@ -545,6 +626,12 @@ class StepRunner:
     ) -> Dict[str, UUID]:
         """Stores the output artifacts of the step.
 
+        If the `ZENML_OUTPUT_ARTIFACT_SAVE_PARALLELISM` environment variable
+        is set to a value larger than 1, up to that many outputs are
+        materialized and uploaded concurrently. Once all outputs were saved
+        successfully, their artifact versions are registered with a single
+        request.
+
         Args:
             output_data: The output data of the step function, mapping output
                 names to return values.
@@ -560,7 +647,7 @@ class StepRunner:
             The IDs of the published output artifacts.
         """
         step_context = get_step_context()
-        output_artifacts: Dict[str, UUID] = {}
+        save_kwargs: Dict[str, Dict[str, Any]] = {}
 
         for output_name, return_value in output_data.items():
             data_type = type(return_value)
@@ -621,7 +708,7 @@ class StepRunner:
             # Get full set of tags
             tags = step_context.get_output_tags(output_name)
 
-            artifact = save_artifact(
+            save_kwargs[output_name] = dict(
                 name=artifact_name,
                 data=return_value,
                 materializer=materializer_class,
@@ -634,9 +721,50 @@ class StepRunner:
                 user_metadata=user_metadata,
                 manual_save=False,
             )
-            output_artifacts[output_name] = artifact.id
 
-        return output_artifacts
+        parallelism = handle_int_env_var(
+            ENV_ZENML_OUTPUT_ARTIFACT_SAVE_PARALLELISM, default=1
+        )
+        if parallelism <= 1 or len(save_kwargs) <= 1:
+            requests = {
+                output_name: _store_artifact_data_and_prepare_request(**kwargs)
+                for output_name, kwargs in save_kwargs.items()
+            }
+        else:
+            logger.debug(
+                "Saving %d output artifacts with parallelism %d.",
+                len(save_kwargs),
+                parallelism,
+            )
+            with ThreadPoolExecutor(
+                max_workers=min(parallelism, len(save_kwargs)),
+                thread_name_prefix="zenml-artifact-save",
+            ) as executor:
+                futures = {
+                    output_name: executor.submit(
+                        _store_artifact_data_and_prepare_request, **kwargs
+                    )
+                    for output_name, kwargs in save_kwargs.items()
+                }
+
+            # All outputs are saved at this point, which means any exception
+            # raised here doesn't leave uploads running in the background.
+            requests = {
+                output_name: future.result()
+                for output_name, future in futures.items()
+            }
+
+        if not requests:
+            return {}
+
+        # Register all output artifact versions with a single request
+        responses = Client().zen_store.register_artifact_versions(
+            list(requests.values())
+        )
+        return {
+            output_name: response.id
+            for output_name, response in zip(requests, responses)
+        }
 
     def _prepare_model_context_for_step(self) -> None:
         try:
@@ -35,6 +35,7 @@ from zenml.client import Client
 from zenml.config.build_configuration import BuildConfiguration
 from zenml.config.global_config import GlobalConfiguration
 from zenml.constants import (
+    DEPAGINATION_MAX_WORKERS,
     ENV_ZENML_SECRET_VALIDATION_LEVEL,
     ENV_ZENML_SKIP_IMAGE_BUILDER_DEFAULT,
     handle_bool_env_var,
@@ -158,7 +159,8 @@ class Stack:
                 Client().list_stack_components,
                 stack_id=stack_model.id,
                 hydrate=True,
-            )
+            ),
+            max_workers=DEPAGINATION_MAX_WORKERS,
         )
 
         stack_components = {
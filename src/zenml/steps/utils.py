@@ -26,6 +26,7 @@ from pydantic import BaseModel
 from typing_extensions import Annotated
 
 from zenml.artifacts.artifact_config import ArtifactConfig
+from zenml.artifacts.artifact_load_config import ArtifactLoadConfig
 from zenml.client import Client
 from zenml.enums import MetadataResourceTypes
 from zenml.logger import get_logger
@@ -260,6 +261,43 @@ def get_artifact_config_from_annotation_metadata(
     return artifact_config
 
 
+def get_load_config_from_annotation_metadata(
+    annotation: Any,
+) -> Optional[ArtifactLoadConfig]:
+    """Get the load config from the annotation metadata of a step input.
+
+    Example:
+    ```python
+    get_load_config_from_annotation_metadata(pd.DataFrame)  # None
+    get_load_config_from_annotation_metadata(Annotated[pd.DataFrame, ArtifactLoadConfig(columns=["a"])])  # ArtifactLoadConfig(columns=["a"])
+    ```
+
+    Args:
+        annotation: The type annotation.
+
+    Raises:
+        ValueError: If the annotation contains multiple load configs.
+
+    Returns:
+        The load config.
+    """
+    if (pydantic_typing.get_origin(annotation) or annotation) is not Annotated:
+        return None
+
+    _, *metadata = pydantic_typing.get_args(annotation)
+    load_configs = [
+        metadata_instance
+        for metadata_instance in metadata
+        if isinstance(metadata_instance, ArtifactLoadConfig)
+    ]
+    if len(load_configs) > 1:
+        raise ValueError(
+            "Input annotations can only contain a single `ArtifactLoadConfig`."
+        )
+
+    return load_configs[0] if load_configs else None
+
+
 class ReturnVisitor(ast.NodeVisitor):
     """AST visitor class that can be subclassed to visit function returns."""
 
@@ -0,0 +1,261 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utilities for downloading and caching code."""
+
+import hashlib
+import os
+import shutil
+import tarfile
+import tempfile
+from typing import IO, TYPE_CHECKING, Optional
+from uuid import uuid4
+
+from zenml.io import fileio
+from zenml.logger import get_logger
+from zenml.utils import io_utils
+
+if TYPE_CHECKING:
+    from zenml.artifact_stores import BaseArtifactStore
+    from zenml.code_repositories import BaseCodeRepository
+
+logger = get_logger(__name__)
+
+CODE_DOWNLOAD_CACHE_DIRECTORY_NAME = "code_download_cache"
+
+
+def extract_archive(
+    fileobj: IO[bytes],
+    directory: str,
+    strip_components: int = 0,
+    sub_directory: Optional[str] = None,
+) -> None:
+    """Extracts a tar archive to a local directory.
+
+    Only regular files and directories are extracted. Members whose path
+    would end up outside of the target directory are skipped.
+
+    Args:
+        fileobj: File object of the (optionally compressed) tar archive.
+        directory: The directory to extract the archive to.
+        strip_components: Number of leading path components to remove from
+            the archive members before extracting them.
+        sub_directory: If given, only members inside this directory of the
+            archive (after stripping leading components) will be extracted,
+            relative to the subdirectory.
+    """
+    prefix = sub_directory.strip("/") + "/" if sub_directory else ""
+    target_root = os.path.realpath(directory)
+    os.makedirs(target_root, exist_ok=True)
+
+    with tarfile.open(fileobj=fileobj, mode="r:*") as tar:
+        for member in tar:
+            if not (member.isfile() or member.isdir()):
+                continue
+
+            parts = member.name.split("/")[strip_components:]
+            path = "/".join(part for part in parts if part and part != ".")
+            if prefix:
+                if not path.startswith(prefix):
+                    continue
+                path = path[len(prefix) :]
+            if not path:
+                continue
+
+            target_path = os.path.realpath(os.path.join(target_root, path))
+            if os.path.commonpath([target_root, target_path]) != target_root:
+                logger.warning("Skipping invalid archive member %s.", path)
+                continue
+
+            if member.isdir():
+                os.makedirs(target_path, exist_ok=True)
+                continue
+
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            source = tar.extractfile(member)
+            if source is None:
+                continue
+            with source, open(target_path, "wb") as target:
+                shutil.copyfileobj(source, target)
+            os.chmod(target_path, member.mode & 0o755 | 0o644)
+
+
+def _get_cache_key(
+    code_repository: "BaseCodeRepository",
+    commit: str,
+    sub_directory: Optional[str],
+) -> str:
+    """Computes the cache key for downloaded code.
+
+    Args:
+        code_repository: The code repository.
+        commit: The commit of the code.
+        sub_directory: The subdirectory of the repository.
+
+    Returns:
+        The cache key.
+    """
+    key = f"{code_repository.id}:{commit}:{(sub_directory or '').strip('/')}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _get_artifact_store_archive_path(
+    artifact_store: "BaseArtifactStore", cache_key: str
+) -> str:
+    """Gets the path of a cached code archive in the artifact store.
+
+    Args:
+        artifact_store: The artifact store.
+        cache_key: The cache key of the code.
+
+    Returns:
+        The archive path.
+    """
+    return os.path.join(
+        artifact_store.path,
+        CODE_DOWNLOAD_CACHE_DIRECTORY_NAME,
+        f"{cache_key}.tar.gz",
+    )
+
+
+def _populate_local_cache(directory: str, cache_directory: str) -> None:
+    """Stores downloaded code in the local cache.
+
+    The code gets copied to a temporary directory first which is then
+    renamed, so other processes never see a partially written cache entry.
+
+    Args:
+        directory: The directory containing the downloaded code.
+        cache_directory: The local cache directory for the code.
+    """
+    temporary_directory = f"{cache_directory}.{uuid4().hex}.tmp"
+    try:
+        shutil.copytree(directory, temporary_directory)
+        os.rename(temporary_directory, cache_directory)
+    except OSError as e:
+        # Another process might have populated the cache in the meantime
+        logger.debug("Failed to populate local code cache: %s", e)
+    finally:
+        shutil.rmtree(temporary_directory, ignore_errors=True)
+
+
+def _download_from_artifact_store(archive_path: str, directory: str) -> bool:
+    """Downloads cached code from the artifact store.
+
+    Args:
+        archive_path: Path of the code archive in the artifact store.
+        directory: The directory to extract the code to.
+
+    Returns:
+        Whether the code was downloaded.
+    """
+    if not fileio.exists(archive_path):
+        return False
+
+    with tempfile.TemporaryFile() as f:
+        with fileio.open(archive_path, "rb") as remote_file:
+            shutil.copyfileobj(remote_file, f)
+        f.seek(0)
+        extract_archive(fileobj=f, directory=directory)
+
+    return True
+
+
+def _upload_to_artifact_store(directory: str, archive_path: str) -> None:
+    """Uploads downloaded code to the artifact store.
+
+    Args:
+        directory: The directory containing the downloaded code.
+        archive_path: Path of the code archive in the artifact store.
+    """
+    temporary_path = f"{archive_path}.{uuid4().hex}.tmp"
+    with tempfile.NamedTemporaryFile(suffix=".tar.gz") as f:
+        with tarfile.open(fileobj=f, mode="w:gz") as tar:
+            tar.add(directory, arcname=".")
+        f.flush()
+
+        fileio.makedirs(os.path.dirname(archive_path))
+        fileio.copy(f.name, temporary_path, overwrite=True)
+    fileio.rename(temporary_path, archive_path, overwrite=True)
+
+
+def download_code(
+    code_repository: "BaseCodeRepository",
+    commit: str,
+    sub_directory: Optional[str],
+    directory: str,
+) -> None:
+    """Downloads code from a code repository.
+
+    Downloaded code is cached by repository, commit and subdirectory, both
+    in a local directory and in the artifact store of the active stack. This
+    way, the code only gets downloaded from the code repository once even if
+    a pipeline run consists of many steps running in separate environments.
+
+    Args:
+        code_repository: The code repository to download the code from.
+        commit: The commit to download.
+        sub_directory: The subdirectory of the repository to download.
+        directory: The directory to download the code to.
+    """
+    from zenml.client import Client
+
+    cache_key = _get_cache_key(
+        code_repository=code_repository,
+        commit=commit,
+        sub_directory=sub_directory,
+    )
+    local_cache_directory = os.path.join(
+        io_utils.get_global_config_directory(),
+        CODE_DOWNLOAD_CACHE_DIRECTORY_NAME,
+        cache_key,
+    )
+
+    if os.path.isdir(local_cache_directory):
+        logger.debug("Using locally cached code.")
+        shutil.copytree(local_cache_directory, directory, dirs_exist_ok=True)
+        return
+
+    os.makedirs(os.path.dirname(local_cache_directory), exist_ok=True)
+
+    archive_path = None
+    try:
+        artifact_store = Client().active_stack.artifact_store
+        archive_path = _get_artifact_store_archive_path(
+            artifact_store=artifact_store, cache_key=cache_key
+        )
+        if _download_from_artifact_store(
+            archive_path=archive_path, directory=directory
+        ):
+            logger.debug("Using code cached in the artifact store.")
+            _populate_local_cache(
+                directory=directory, cache_directory=local_cache_directory
+            )
+            return
+    except Exception as e:
+        logger.debug("Failed to load code from the artifact store: %s", e)
+
+    code_repository.download_code(
+        commit=commit, directory=directory, repo_sub_directory=sub_directory
+    )
+    _populate_local_cache(
+        directory=directory, cache_directory=local_cache_directory
+    )
+
+    if archive_path:
+        try:
+            _upload_to_artifact_store(
+                directory=directory, archive_path=archive_path
+            )
+        except Exception as e:
+            logger.debug("Failed to cache code in the artifact store: %s", e)
@@ -0,0 +1,267 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utility functions for HTTP payloads of the ZenML client and server."""
+
+import json
+import zlib
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, List, Optional
+
+GZIP_ENCODING = "gzip"
+ZSTD_ENCODING = "zstd"
+
+# Fast compression levels, the payloads are mostly repetitive JSON which
+# compresses well even at low levels.
+GZIP_COMPRESSION_LEVEL = 6
+ZSTD_COMPRESSION_LEVEL = 3
+
+# Payloads smaller than this are not compressed as the savings don't outweigh
+# the compression overhead.
+MINIMUM_COMPRESSION_SIZE = 1024
+
+# The zstd decompressor can't limit the size of its output, so compressed data
+# is passed to it in slices of this size. At the maximum zstd compression
+# ratio, a slice decompresses to at most 8MiB.
+ZSTD_DECOMPRESSION_SLICE_SIZE = 256
+
+
+@lru_cache
+def _import_optional(module_name: str) -> Optional[ModuleType]:
+    """Imports an optional dependency.
+
+    Args:
+        module_name: The name of the module to import.
+
+    Returns:
+        The module or None if it is not installed.
+    """
+    try:
+        return __import__(module_name)
+    except ImportError:
+        return None
+
+
+def supported_encodings() -> List[str]:
+    """Gets the supported content encodings.
+
+    Returns:
+        The supported content encodings in order of preference.
+    """
+    if _import_optional("zstandard"):
+        return [ZSTD_ENCODING, GZIP_ENCODING]
+    return [GZIP_ENCODING]
+
+
+def select_encoding(accept_encoding: str) -> Optional[str]:
+    """Selects the preferred supported encoding out of accepted encodings.
+
+    Args:
+        accept_encoding: The value of an `Accept-Encoding` header, e.g.
+            `gzip, deflate, zstd;q=0.5`.
+
+    Returns:
+        The preferred supported content encoding or None if none of the
+        supported encodings is accepted.
+    """
+    accepted = set()
+    for coding in accept_encoding.split(","):
+        name, _, parameters = coding.partition(";")
+        quality = 1.0
+        for parameter in parameters.split(";"):
+            key, _, value = parameter.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(name.strip().lower())
+
+    for encoding in supported_encodings():
+        if encoding in accepted or "*" in accepted:
+            return encoding
+    return None
+
+
+def get_compressor(encoding: str) -> Any:
+    """Gets a streaming compressor for a content encoding.
+
+    Args:
+        encoding: The content encoding.
+
+    Returns:
+        A compressor with `compress(data)` and `flush()` methods.
+
+    Raises:
+        ValueError: If the encoding is not supported.
+    """
+    if encoding == ZSTD_ENCODING:
+        import zstandard
+
+        return zstandard.ZstdCompressor(
+            level=ZSTD_COMPRESSION_LEVEL
+        ).compressobj()
+    if encoding == GZIP_ENCODING:
+        return zlib.compressobj(
+            GZIP_COMPRESSION_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+        )
+    raise ValueError(f"Unsupported content encoding `{encoding}`.")
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compresses data.
+
+    Args:
+        data: The data to compress.
+        encoding: The content encoding.
+
+    Returns:
+        The compressed data.
+    """
+    compressor = get_compressor(encoding)
+    return compressor.compress(data) + compressor.flush()  # type: ignore[no-any-return]
+
+
+class StreamingDecompressor:
+    """Decompresses data that arrives in chunks, up to a maximum size."""
+
+    def __init__(self, encoding: str, max_size: Optional[int] = None) -> None:
+        """Initializes the decompressor.
+
+        Args:
+            encoding: The content encoding.
+            max_size: The maximum size of the decompressed data.
+
+        Raises:
+            ValueError: If the encoding is not supported.
+        """
+        self._encoding = encoding
+        self._max_size = max_size
+        self._size = 0
+        self._decompressor: Any
+        if encoding == ZSTD_ENCODING:
+            import zstandard
+
+            self._decompressor = zstandard.ZstdDecompressor().decompressobj()
+        elif encoding == GZIP_ENCODING:
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        else:
+            raise ValueError(f"Unsupported content encoding `{encoding}`.")
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompresses the next chunk of data.
+
+        Args:
+            data: The next chunk of compressed data.
+
+        Returns:
+            The decompressed data of the chunk.
+
+        Raises:
+            ValueError: If the data is invalid or the decompressed data
+                exceeds the maximum size.
+        """
+        if self._encoding == ZSTD_ENCODING:
+            import zstandard
+
+            chunks = []
+            try:
+                for start in range(
+                    0, len(data), ZSTD_DECOMPRESSION_SLICE_SIZE
+                ):
+                    if self._decompressor.eof:
+                        break
+                    chunk = self._decompressor.decompress(
+                        data[start : start + ZSTD_DECOMPRESSION_SLICE_SIZE]
+                    )
+                    self._add_size(len(chunk))
+                    chunks.append(chunk)
+            except zstandard.ZstdError as e:
+                raise ValueError(
+                    f"Invalid `{self._encoding}` data: {e}"
+                ) from e
+            return b"".join(chunks)
+
+        limit = 0
+        if self._max_size is not None:
+            limit = self._max_size - self._size + 1
+        try:
+            decompressed: bytes = self._decompressor.decompress(data, limit)
+        except zlib.error as e:
+            raise ValueError(f"Invalid `{self._encoding}` data: {e}") from e
+        self._add_size(len(decompressed))
+        return decompressed
+
+    def finish(self) -> None:
+        """Checks that the compressed data was complete.
+
+        Raises:
+            ValueError: If the compressed data ended prematurely.
+        """
+        if not self._decompressor.eof:
+            raise ValueError(
+                f"Invalid `{self._encoding}` data: The compressed data ended "
+                "prematurely."
+            )
+
+    def _add_size(self, size: int) -> None:
+        """Adds to the size of the decompressed data.
+
+        Args:
+            size: The size of newly decompressed data.
+
+        Raises:
+            ValueError: If the decompressed data exceeds the maximum size.
+        """
+        self._size += size
+        if self._max_size is not None and self._size > self._max_size:
+            raise ValueError(
+                "Decompressed data exceeds the maximum size of "
+                f"{self._max_size} bytes."
+            )
+
+
+def decompress(
+    data: bytes, encoding: str, max_size: Optional[int] = None
+) -> bytes:
+    """Decompresses data.
+
+    Args:
+        data: The compressed data.
+        encoding: The content encoding.
+        max_size: The maximum size of the decompressed data.
+
+    Returns:
+        The decompressed data.
+    """
+    decompressor = StreamingDecompressor(encoding, max_size=max_size)
+    decompressed = decompressor.decompress(data)
+    decompressor.finish()
+    return decompressed
+
+
+def json_loads(data: bytes) -> Any:
+    """Deserializes JSON, using `orjson` if it is installed.
+
+    Args:
+        data: The JSON data.
+
+    Returns:
+        The deserialized data.
+    """
+    orjson = _import_optional("orjson")
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -15,8 +15,9 @@
 
 import fnmatch
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
 
 import click
 
@@ -35,8 +36,14 @@ from zenml.io.fileio import (
 )
 
 if TYPE_CHECKING:
+    from fsspec import AbstractFileSystem
+
     from zenml.io.filesystem import PathType
 
+# Maximum number of files that are transferred concurrently when copying
+# directories.
+DEFAULT_COPY_DIR_MAX_WORKERS = 16
+
 
 def is_root(path: str) -> bool:
     """Returns true if path has no parent in local filesystem.
@@ -96,16 +103,26 @@ def read_file_contents_as_string(file_path: str) -> str:
         return f.read()  # type: ignore[no-any-return]
 
 
-def copy_dir(
+def list_dir_copy_paths(
     source_dir: str, destination_dir: str, overwrite: bool = False
-) -> None:
-    """Copies dir from source to destination.
+) -> List[Tuple[str, str]]:
+    """Lists the files of a dir and the paths they should be copied to.
 
     Args:
         source_dir: Path to copy from.
         destination_dir: Path to copy to.
-        overwrite: Boolean. If false, function throws an error before overwrite.
+        overwrite: Boolean. If false, function throws an error if any of the
+            destination files already exists.
+
+    Returns:
+        Tuples of source and destination path for each file in the source
+        dir.
+
+    Raises:
+        FileExistsError: If a destination file already exists and
+            `overwrite` is false.
     """
+    copy_paths = []
     for source_file in listdir(source_dir):
         source_path = os.path.join(source_dir, convert_to_str(source_file))
         destination_path = os.path.join(
@@ -116,12 +133,129 @@ def copy_dir(
                 # if the destination is a subdirectory of the source, we skip
                 # copying it to avoid an infinite loop.
                 continue
-            copy_dir(source_path, destination_path, overwrite)
+            copy_paths.extend(
+                list_dir_copy_paths(source_path, destination_path, True)
+            )
         else:
-            create_dir_recursive_if_not_exists(
-                os.path.dirname(destination_path)
+            copy_paths.append((source_path, destination_path))
+
+    if not overwrite and copy_paths and exists(destination_dir):
+        # List the destination once instead of checking each file separately
+        existing_files = {
+            os.path.relpath(
+                os.path.join(convert_to_str(root), convert_to_str(file)),
+                destination_dir,
             )
-            copy(str(source_path), str(destination_path), overwrite)
+            for root, _, files in walk(destination_dir)
+            for file in files
+        }
+        for _, destination_path in copy_paths:
+            if os.path.relpath(destination_path, destination_dir) in (
+                existing_files
+            ):
+                raise FileExistsError(
+                    f"Destination file '{destination_path}' already exists "
+                    f"and `overwrite` is false."
+                )
+    return copy_paths
+
+
+def copy_dir(
+    source_dir: str,
+    destination_dir: str,
+    overwrite: bool = False,
+    max_workers: Optional[int] = None,
+) -> None:
+    """Copies dir from source to destination.
+
+    Files are copied concurrently, which speeds up transfers from and to
+    remote filesystems with a high latency per file.
+
+    Args:
+        source_dir: Path to copy from.
+        destination_dir: Path to copy to.
+        overwrite: Boolean. If false, function throws an error before overwrite.
+        max_workers: Maximum number of files to copy concurrently. Defaults
+            to `DEFAULT_COPY_DIR_MAX_WORKERS`.
+    """
+    copy_paths = list_dir_copy_paths(
+        source_dir, destination_dir, overwrite=overwrite
+    )
+    for directory in sorted(
+        {os.path.dirname(destination) for _, destination in copy_paths}
+    ):
+        create_dir_recursive_if_not_exists(directory)
+
+    def _copy(paths: Tuple[str, str]) -> None:
+        # Conflicts were already checked when listing the files
+        copy(paths[0], paths[1], overwrite=True)
+
+    if len(copy_paths) <= 1:
+        for paths in copy_paths:
+            _copy(paths)
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(
+            max_workers or DEFAULT_COPY_DIR_MAX_WORKERS, len(copy_paths)
+        )
+    ) as executor:
+        # Consume the results to raise any errors
+        list(executor.map(_copy, copy_paths))
+
+
+def fsspec_put_dir(
+    filesystem: "AbstractFileSystem",
+    source_dir: str,
+    destination_dir: str,
+    overwrite: bool = False,
+) -> None:
+    """Uploads a local directory with an fsspec filesystem in batches.
+
+    Args:
+        filesystem: The fsspec filesystem to upload to.
+        source_dir: The local directory to upload.
+        destination_dir: The destination path on the filesystem.
+        overwrite: Whether to overwrite existing destination files.
+    """
+    copy_paths = list_dir_copy_paths(
+        source_dir, destination_dir, overwrite=overwrite
+    )
+    if copy_paths:
+        source_paths, destination_paths = zip(*copy_paths)
+        filesystem.put(
+            list(source_paths),
+            list(destination_paths),
+            batch_size=DEFAULT_COPY_DIR_MAX_WORKERS,
+        )
+
+
+def fsspec_get_dir(
+    filesystem: "AbstractFileSystem",
+    source_dir: str,
+    destination_dir: str,
+    overwrite: bool = False,
+) -> None:
+    """Downloads a directory of an fsspec filesystem in batches.
+
+    Args:
+        filesystem: The fsspec filesystem to download from.
+        source_dir: The directory on the filesystem to download.
+        destination_dir: The local destination directory.
+        overwrite: Whether to overwrite existing destination files.
+    """
+    copy_paths = list_dir_copy_paths(
+        source_dir, destination_dir, overwrite=overwrite
+    )
+    if copy_paths:
+        source_paths, destination_paths = zip(*copy_paths)
+        for directory in set(map(os.path.dirname, destination_paths)):
+            os.makedirs(directory, exist_ok=True)
+        filesystem.get(
+            list(source_paths),
+            list(destination_paths),
+            batch_size=DEFAULT_COPY_DIR_MAX_WORKERS,
+        )
 
 
 def find_files(dir_path: "PathType", pattern: str) -> Iterable[str]:
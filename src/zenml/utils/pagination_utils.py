@@ -13,7 +13,8 @@
 #  permissions and limitations under the License.
 """Pagination utilities."""
 
-from typing import Callable, List, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, TypeVar
 
 from zenml.models import BaseIdentifiedResponse, Page
 
@@ -22,19 +23,72 @@ AnyResponse = TypeVar("AnyResponse", bound=BaseIdentifiedResponse)  # type: igno
 
 def depaginate(
     list_method: Callable[..., Page[AnyResponse]],
+    max_workers: int = 1,
+    use_cursor: bool = False,
 ) -> List[AnyResponse]:
     """Depaginate the results from a client or store method that returns pages.
 
     Args:
         list_method: The list method to wrap around.
+        max_workers: The maximum number of pages to fetch concurrently. If
+            larger than 1, all pages after the first one are fetched
+            concurrently once the total number of pages is known.
+        use_cursor: If set, the pages after the first one are fetched
+            sequentially using the cursor of the previous page instead of
+            the page number. The list method needs to accept a `cursor`
+            argument.
 
     Returns:
         A list of the corresponding Response Models.
     """
+    if use_cursor:
+        return list(lazy_depaginate(list_method, use_cursor=True))
+
     page = list_method()
     items = list(page.items)
+    remaining_pages = range(page.index + 1, page.total_pages + 1)
+
+    if max_workers > 1 and len(remaining_pages) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(remaining_pages))
+        ) as executor:
+            for page in executor.map(
+                lambda index: list_method(page=index), remaining_pages
+            ):
+                items += list(page.items)
+        return items
+
     while page.index < page.total_pages:
         page = list_method(page=page.index + 1)
         items += list(page.items)
 
     return items
+
+
+def lazy_depaginate(
+    list_method: Callable[..., Page[AnyResponse]],
+    use_cursor: bool = False,
+) -> Iterator[AnyResponse]:
+    """Iterate over the results from a method that returns pages.
+
+    Pages are only fetched once the items of the previous page have been
+    consumed, so only a single page is held in memory at a time.
+
+    Args:
+        list_method: The list method to wrap around.
+        use_cursor: If set, the pages after the first one are fetched using
+            the cursor of the previous page instead of the page number if
+            the previous page contains a cursor. The list method needs to
+            accept a `cursor` argument.
+
+    Yields:
+        The corresponding Response Models.
+    """
+    page = list_method()
+    yield from page.items
+    while page.index < page.total_pages:
+        if use_cursor and page.next_cursor:
+            page = list_method(page=page.index + 1, cursor=page.next_cursor)
+        else:
+            page = list_method(page=page.index + 1)
+        yield from page.items
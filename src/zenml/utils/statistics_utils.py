@@ -0,0 +1,192 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utility functions to compute statistics of numeric data."""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+# Number of elements that are processed at once. Only temporary arrays of
+# this size are allocated while computing statistics.
+DEFAULT_CHUNK_SIZE = 2**20
+
+
+class RunningStatistics:
+    """Count, mean, variance, min and max of a stream of numeric values.
+
+    Chunks of values are merged with the parallel variant of Welford's
+    algorithm, which is numerically stable and only needs a single pass over
+    the data.
+    """
+
+    def __init__(self, skipna: bool = False) -> None:
+        """Initializes the statistics.
+
+        Args:
+            skipna: If True, NaN values are ignored. Otherwise, the mean,
+                variance, min and max become NaN once a NaN value is added.
+        """
+        self.skipna = skipna
+        self.count = 0
+        self.mean: Any = 0.0
+        self._m2 = 0.0
+        self.min: Any = None
+        self.max: Any = None
+
+    def update(self, values: "NDArray[Any]") -> None:
+        """Adds a chunk of values to the statistics.
+
+        Args:
+            values: The values to add.
+        """
+        values = values.reshape(-1)
+        if self.skipna and values.dtype.kind in "fc":
+            values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+
+        chunk_min, chunk_max = values.min(), values.max()
+        self.min = (
+            chunk_min if self.min is None else np.minimum(self.min, chunk_min)
+        )
+        self.max = (
+            chunk_max if self.max is None else np.maximum(self.max, chunk_max)
+        )
+
+        dtype = np.complex128 if values.dtype.kind == "c" else np.float64
+        chunk_count = values.size
+        chunk_mean = values.mean(dtype=dtype)
+        deviations = values.astype(dtype, copy=False) - chunk_mean
+        chunk_m2 = np.vdot(deviations, deviations).real
+
+        count = self.count + chunk_count
+        delta = chunk_mean - self.mean
+        self.mean = self.mean + delta * chunk_count / count
+        self._m2 = (
+            self._m2
+            + chunk_m2
+            + abs(delta) ** 2 * self.count * chunk_count / count
+        )
+        self.count = count
+
+    def variance(self, ddof: int = 0) -> float:
+        """Computes the variance of the values.
+
+        Args:
+            ddof: Delta degrees of freedom. The divisor used in the
+                calculation is `count - ddof`.
+
+        Returns:
+            The variance, or NaN if there are not enough values.
+        """
+        if self.count - ddof <= 0:
+            return float("nan")
+        return float(self._m2 / (self.count - ddof))
+
+    def std(self, ddof: int = 0) -> float:
+        """Computes the standard deviation of the values.
+
+        Args:
+            ddof: Delta degrees of freedom. The divisor used in the
+                calculation is `count - ddof`.
+
+        Returns:
+            The standard deviation, or NaN if there are not enough values.
+        """
+        return float(np.sqrt(self.variance(ddof=ddof)))
+
+    def to_dict(self, ddof: int = 0) -> Dict[str, Any]:
+        """Returns the mean, standard deviation, min and max.
+
+        Args:
+            ddof: Delta degrees of freedom used to compute the standard
+                deviation.
+
+        Returns:
+            The statistics as Python scalars. All statistics are NaN if no
+            values were added.
+        """
+        if self.count == 0:
+            nan = float("nan")
+            return {"mean": nan, "std": nan, "min": nan, "max": nan}
+
+        return {
+            "mean": _to_python_scalar(self.mean),
+            "std": self.std(ddof=ddof),
+            "min": _to_python_scalar(self.min),
+            "max": _to_python_scalar(self.max),
+        }
+
+
+def _to_python_scalar(value: Any) -> Any:
+    """Converts a numpy scalar to the corresponding Python scalar.
+
+    Args:
+        value: The value to convert.
+
+    Returns:
+        The converted value.
+    """
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def iterate_chunks(
+    arr: "NDArray[Any]", chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator["NDArray[Any]"]:
+    """Iterates over the elements of an array in flat chunks.
+
+    Contiguous arrays, including memory-mapped arrays, are split into views
+    without copying any data.
+
+    Args:
+        arr: The array to iterate over.
+        chunk_size: The maximum number of elements per chunk.
+
+    Yields:
+        The chunks of the array.
+    """
+    if arr.ndim <= 1 or arr.flags.c_contiguous or arr.flags.f_contiguous:
+        flat = arr.reshape(-1, order="A")
+        for start in range(0, flat.size, chunk_size):
+            yield flat[start : start + chunk_size]
+    else:
+        for sub_array in arr:
+            yield from iterate_chunks(sub_array, chunk_size=chunk_size)
+
+
+def compute_statistics(
+    arr: "NDArray[Any]",
+    skipna: bool = False,
+    chunk_size: Optional[int] = None,
+) -> RunningStatistics:
+    """Computes statistics of a numeric array in a single pass.
+
+    Args:
+        arr: The array for which to compute the statistics.
+        skipna: If True, NaN values are ignored.
+        chunk_size: The maximum number of elements that are processed at
+            once. Defaults to `DEFAULT_CHUNK_SIZE`.
+
+    Returns:
+        The statistics of the array.
+    """
+    statistics = RunningStatistics(skipna=skipna)
+    for chunk in iterate_chunks(
+        arr, chunk_size=chunk_size or DEFAULT_CHUNK_SIZE
+    ):
+        statistics.update(chunk)
+    return statistics
@@ -52,6 +52,7 @@ from zenml.models import (
     UserResponse,
     UserUpdate,
 )
+from zenml.zen_server.auth_cache import auth_context_cache
 from zenml.zen_server.jwt import JWTToken
 from zenml.zen_server.utils import server_config, zen_store
 
@@ -234,6 +235,12 @@ def authenticate_credentials(
             raise AuthorizationException(error)
 
     elif access_token is not None:
+        # Resolving an access token requires several database queries, so
+        # the resulting authentication context is cached for a short time.
+        cached_auth_context = auth_context_cache().get(access_token)
+        if cached_auth_context:
+            return cached_auth_context
+
         try:
             decoded_token = JWTToken.decode_token(
                 token=access_token,
@@ -331,6 +338,7 @@ def authenticate_credentials(
             device=device_model,
             api_key=api_key_model,
         )
+        auth_context_cache().set(access_token, auth_context)
 
     else:
         # IMPORTANT: the ONLY way we allow the authentication process to
@@ -0,0 +1,216 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Cache for authentication contexts of the ZenML Server."""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+from uuid import UUID
+
+from zenml.logger import get_logger
+from zenml.zen_server.utils import register_cache_stats, server_config
+
+if TYPE_CHECKING:
+    from zenml.zen_server.auth import AuthContext
+
+logger = get_logger(__name__)
+
+
+class AuthContextCache:
+    """Size-bounded in-memory cache of authentication contexts.
+
+    Authentication contexts are cached by the access token for which they
+    were created. Cache entries expire after a fixed time and never outlive
+    the access token or device for which they were created.
+
+    Attributes:
+        hits: The number of cache hits.
+        misses: The number of cache misses.
+        evictions: The number of entries that were removed because the cache
+            was full.
+    """
+
+    def __init__(self, ttl_seconds: int, max_size: int) -> None:
+        """Initializes the cache.
+
+        Args:
+            ttl_seconds: The time in seconds after which cache entries
+                expire. If 0, the cache is disabled.
+            max_size: The maximum number of cache entries.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[float, AuthContext]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is enabled.
+
+        Returns:
+            Whether the cache is enabled.
+        """
+        return self.ttl_seconds > 0 and self.max_size > 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Statistics of the cache.
+
+        Returns:
+            The number of hits, misses, evictions and cached entries.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+    @staticmethod
+    def _get_key(access_token: str) -> str:
+        """Gets the cache key for an access token.
+
+        Args:
+            access_token: The encoded access token.
+
+        Returns:
+            The cache key.
+        """
+        return hashlib.sha256(access_token.encode()).hexdigest()
+
+    def get(self, access_token: str) -> Optional["AuthContext"]:
+        """Gets the cached authentication context for an access token.
+
+        Args:
+            access_token: The encoded access token.
+
+        Returns:
+            The cached authentication context or None if no valid entry
+            exists for the access token.
+        """
+        if not self.enabled:
+            return None
+
+        key = self._get_key(access_token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+            if entry:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, access_token: str, auth_context: "AuthContext") -> None:
+        """Caches the authentication context for an access token.
+
+        Args:
+            access_token: The encoded access token.
+            auth_context: The authentication context.
+        """
+        if not self.enabled:
+            return
+
+        ttl: float = self.ttl_seconds
+        if auth_context.access_token:
+            token_expires = auth_context.access_token.claims.get("exp")
+            if token_expires:
+                ttl = min(ttl, float(token_expires) - time.time())
+        if auth_context.device and auth_context.device.expires:
+            ttl = min(
+                ttl,
+                (
+                    auth_context.device.expires - datetime.utcnow()
+                ).total_seconds(),
+            )
+        if ttl <= 0:
+            return
+
+        key = self._get_key(access_token)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, auth_context)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(
+        self,
+        user_id: Optional[UUID] = None,
+        device_id: Optional[UUID] = None,
+        api_key_id: Optional[UUID] = None,
+    ) -> None:
+        """Removes cached authentication contexts.
+
+        Args:
+            user_id: Remove all entries of this user or service account.
+            device_id: Remove all entries of this device.
+            api_key_id: Remove all entries of this API key.
+        """
+        with self._lock:
+            for key, (_, auth_context) in list(self._entries.items()):
+                if (
+                    (user_id and auth_context.user.id == user_id)
+                    or (
+                        device_id
+                        and auth_context.device
+                        and auth_context.device.id == device_id
+                    )
+                    or (
+                        api_key_id
+                        and auth_context.api_key
+                        and auth_context.api_key.id == api_key_id
+                    )
+                ):
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        """Removes all cached authentication contexts."""
+        with self._lock:
+            self._entries.clear()
+
+
+_auth_context_cache: Optional[AuthContextCache] = None
+
+
+def auth_context_cache() -> AuthContextCache:
+    """Returns the authentication context cache of the server.
+
+    Returns:
+        The authentication context cache.
+    """
+    global _auth_context_cache
+    if _auth_context_cache is None:
+        config = server_config()
+        _auth_context_cache = AuthContextCache(
+            ttl_seconds=config.auth_cache_ttl_seconds,
+            max_size=config.auth_cache_size,
+        )
+        if _auth_context_cache.enabled:
+            register_cache_stats(
+                "authentication context", lambda: auth_context_cache().stats
+            )
+    return _auth_context_cache
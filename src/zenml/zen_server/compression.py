@@ -0,0 +1,230 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Compression of HTTP request and response bodies of the ZenML server."""
+
+from typing import Any, Optional
+
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from zenml.constants import (
+    DEFAULT_ZENML_SERVER_MAX_DECOMPRESSED_REQUEST_SIZE,
+)
+from zenml.utils import http_utils
+from zenml.zen_server.exceptions import error_detail
+
+
+class CompressionMiddleware:
+    """Middleware that compresses responses and decompresses requests.
+
+    Responses are compressed with the preferred supported encoding that the
+    client accepts. Request bodies that are compressed with a supported
+    encoding are decompressed before they are passed on. The supported
+    request encodings are announced in the `Accept-Encoding` header of each
+    response, so clients know which encodings they can use for requests.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = http_utils.MINIMUM_COMPRESSION_SIZE,
+        max_decompressed_request_size: int = (
+            DEFAULT_ZENML_SERVER_MAX_DECOMPRESSED_REQUEST_SIZE
+        ),
+    ) -> None:
+        """Initializes the middleware.
+
+        Args:
+            app: The ASGI app.
+            minimum_size: Responses smaller than this are not compressed.
+            max_decompressed_request_size: Compressed request bodies which
+                decompress to more than this are rejected.
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.max_decompressed_request_size = max_decompressed_request_size
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Handles an ASGI request.
+
+        Args:
+            scope: The ASGI scope.
+            receive: The ASGI receive function.
+            send: The ASGI send function.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        request_encoding = headers.get("content-encoding", "").strip().lower()
+        if request_encoding and request_encoding != "identity":
+            try:
+                scope, receive = await self._decompress_request(
+                    scope, receive, request_encoding
+                )
+            except ValueError as e:
+                status_code = (
+                    400
+                    if request_encoding in http_utils.supported_encodings()
+                    else 415
+                )
+                response = ORJSONResponse(
+                    {"detail": error_detail(e, ValueError)},
+                    status_code=status_code,
+                )
+                await response(scope, receive, send)
+                return
+
+        responder = _CompressionResponder(
+            app=self.app,
+            encoding=http_utils.select_encoding(
+                headers.get("accept-encoding", "")
+            ),
+            minimum_size=self.minimum_size,
+        )
+        await responder(scope, receive, send)
+
+    async def _decompress_request(
+        self, scope: Scope, receive: Receive, encoding: str
+    ) -> Any:
+        """Decompresses the body of a request.
+
+        The body is decompressed chunk by chunk while it is received, so the
+        compressed body is never buffered as a whole.
+
+        Args:
+            scope: The ASGI scope.
+            receive: The ASGI receive function.
+            encoding: The content encoding of the request body.
+
+        Returns:
+            The ASGI scope and receive function of the decompressed request.
+        """
+        decompressor = http_utils.StreamingDecompressor(
+            encoding, max_size=self.max_decompressed_request_size
+        )
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunks.append(decompressor.decompress(message.get("body", b"")))
+            more_body = message.get("more_body", False)
+        decompressor.finish()
+        body = b"".join(chunks)
+
+        scope = dict(scope)
+        scope["headers"] = [
+            (key, value)
+            for key, value in scope["headers"]
+            if key not in (b"content-encoding", b"content-length")
+        ] + [(b"content-length", str(len(body)).encode())]
+
+        body_received = False
+
+        async def receive_decompressed() -> Message:
+            nonlocal body_received
+            if body_received:
+                return await receive()
+            body_received = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        return scope, receive_decompressed
+
+
+class _CompressionResponder:
+    """Compresses the body of a single response."""
+
+    def __init__(
+        self, app: ASGIApp, encoding: Optional[str], minimum_size: int
+    ) -> None:
+        """Initializes the responder.
+
+        Args:
+            app: The ASGI app.
+            encoding: The encoding with which to compress the response or
+                None if the response should not be compressed.
+            minimum_size: Responses smaller than this are not compressed.
+        """
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send: Send
+        self.initial_message: Message = {}
+        self.started = False
+        self.compressor: Any = None
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Calls the app with a send function that compresses the response.
+
+        Args:
+            scope: The ASGI scope.
+            receive: The ASGI receive function.
+            send: The ASGI send function.
+        """
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        """Sends an ASGI message, compressing the response body.
+
+        Args:
+            message: The ASGI message.
+        """
+        if message["type"] == "http.response.start":
+            headers = MutableHeaders(raw=message["headers"])
+            headers["Accept-Encoding"] = ", ".join(
+                http_utils.supported_encodings()
+            )
+            if "content-encoding" in headers:
+                self.encoding = None
+            # Don't send the initial message until we know whether the body
+            # gets compressed.
+            self.initial_message = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not self.started:
+            self.started = True
+            if self.encoding and (more_body or len(body) >= self.minimum_size):
+                self.compressor = http_utils.get_compressor(self.encoding)
+                headers = MutableHeaders(raw=self.initial_message["headers"])
+                headers["Content-Encoding"] = self.encoding
+                headers.add_vary_header("Accept-Encoding")
+                if more_body:
+                    del headers["Content-Length"]
+                else:
+                    body = self.compressor.compress(body)
+                    body += self.compressor.flush()
+                    headers["Content-Length"] = str(len(body))
+                    message["body"] = body
+                    self.compressor = None
+            await self.send(self.initial_message)
+        elif self.compressor:
+            body = self.compressor.compress(body)
+            if not more_body:
+                body += self.compressor.flush()
+            message["body"] = body
+
+        await self.send(message)
@@ -0,0 +1,347 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Cache for RBAC permission decisions."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from zenml.zen_server.rbac.models import Action, Resource
+from zenml.zen_server.rbac.rbac_interface import RBACInterface
+
+if TYPE_CHECKING:
+    from zenml.models import UserResponse
+
+# Cache keys are tuples of (user ID, action, resource). Permission decisions
+# are cached for resources and allowed resource IDs for resource types, which
+# are represented by a resource without an ID.
+CacheKey = Tuple[UUID, str, Resource]
+
+
+class RBACCache:
+    """Size-bounded in-memory cache of RBAC permission decisions.
+
+    The cache stores the permission decisions for single resources and the
+    allowed resource IDs for resource types per user. Cache entries expire
+    after a fixed time.
+
+    Attributes:
+        hits: The number of cache hits.
+        misses: The number of cache misses.
+        evictions: The number of entries that were removed because the cache
+            was full.
+    """
+
+    def __init__(self, ttl_seconds: int, max_size: int) -> None:
+        """Initializes the cache.
+
+        Args:
+            ttl_seconds: The time in seconds after which cache entries
+                expire. If 0, the cache is disabled.
+            max_size: The maximum number of cache entries.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is enabled.
+
+        Returns:
+            Whether the cache is enabled.
+        """
+        return self.ttl_seconds > 0 and self.max_size > 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Statistics of the cache.
+
+        Returns:
+            The number of hits, misses, evictions and cached entries.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+    def _get(self, key: CacheKey) -> Optional[Any]:
+        """Gets a cache entry without updating the statistics.
+
+        Must be called while holding the lock.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached value or None if no valid entry exists.
+        """
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        if entry:
+            del self._entries[key]
+        return None
+
+    def _set(self, key: CacheKey, value: Any) -> None:
+        """Sets a cache entry.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_permission(
+        self, user_id: UUID, resource: Resource, action: Action
+    ) -> Optional[bool]:
+        """Gets a cached permission decision.
+
+        If no decision is cached for the resource itself, the decision is
+        derived from the cached allowed resource IDs of its resource type.
+
+        Args:
+            user_id: The ID of the user.
+            resource: The resource.
+            action: The action.
+
+        Returns:
+            Whether the user is allowed to perform the action on the resource
+            or None if no decision is cached.
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            allowed = self._get((user_id, str(action), resource))
+            if allowed is None and resource.id:
+                allowed_ids = self._get(
+                    (user_id, str(action), Resource(type=resource.type))
+                )
+                if allowed_ids is not None:
+                    full_resource_access, resource_ids = allowed_ids
+                    allowed = full_resource_access or (
+                        str(resource.id) in resource_ids
+                    )
+
+            if allowed is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return allowed
+
+    def set_permission(
+        self, user_id: UUID, resource: Resource, action: Action, allowed: bool
+    ) -> None:
+        """Caches a permission decision.
+
+        Args:
+            user_id: The ID of the user.
+            resource: The resource.
+            action: The action.
+            allowed: Whether the user is allowed to perform the action on the
+                resource.
+        """
+        self._set((user_id, str(action), resource), allowed)
+
+    def get_allowed_resource_ids(
+        self, user_id: UUID, resource: Resource, action: Action
+    ) -> Optional[Tuple[bool, List[str]]]:
+        """Gets the cached allowed resource IDs of a resource type.
+
+        Args:
+            user_id: The ID of the user.
+            resource: The resource type.
+            action: The action.
+
+        Returns:
+            The cached tuple (full_resource_access, resource_ids) or None if
+            nothing is cached.
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            allowed_ids = self._get((user_id, str(action), resource))
+            if allowed_ids is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return allowed_ids
+
+    def set_allowed_resource_ids(
+        self,
+        user_id: UUID,
+        resource: Resource,
+        action: Action,
+        allowed_ids: Tuple[bool, List[str]],
+    ) -> None:
+        """Caches the allowed resource IDs of a resource type.
+
+        Args:
+            user_id: The ID of the user.
+            resource: The resource type.
+            action: The action.
+            allowed_ids: The tuple (full_resource_access, resource_ids).
+        """
+        self._set((user_id, str(action), resource), allowed_ids)
+
+    def invalidate(
+        self, user_id: UUID, resource: Optional[Resource] = None
+    ) -> None:
+        """Removes cached permission decisions of a user.
+
+        Args:
+            user_id: The ID of the user.
+            resource: If given, only remove the decisions for this resource
+                and the allowed resource IDs of its resource type.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                entry_user_id, _, entry_resource = key
+                if entry_user_id != user_id:
+                    continue
+                if (
+                    resource is None
+                    or entry_resource == resource
+                    or entry_resource == Resource(type=resource.type)
+                ):
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        """Removes all cached permission decisions."""
+        with self._lock:
+            self._entries.clear()
+
+
+class CachedRBAC(RBACInterface):
+    """RBAC implementation that caches the decisions of another one.
+
+    Permission checks are answered from the cache where possible and only the
+    remaining resources are checked by the wrapped implementation. Cached
+    decisions of a user are invalidated when the user's resource membership
+    is updated through this class.
+    """
+
+    def __init__(self, rbac: RBACInterface, cache: RBACCache) -> None:
+        """Initializes the cached RBAC implementation.
+
+        Args:
+            rbac: The RBAC implementation to cache.
+            cache: The cache for the permission decisions.
+        """
+        self.rbac = rbac
+        self.cache = cache
+
+    def check_permissions(
+        self, user: "UserResponse", resources: Set[Resource], action: Action
+    ) -> Dict[Resource, bool]:
+        """Checks if a user has permissions to perform an action on resources.
+
+        Args:
+            user: User which wants to access a resource.
+            resources: The resources the user wants to access.
+            action: The action that the user wants to perform on the resources.
+
+        Returns:
+            A dictionary mapping resources to a boolean which indicates whether
+            the user has permissions to perform the action on that resource.
+        """
+        result: Dict[Resource, bool] = {}
+        uncached_resources: Set[Resource] = set()
+        for resource in resources:
+            allowed = self.cache.get_permission(user.id, resource, action)
+            if allowed is None:
+                uncached_resources.add(resource)
+            else:
+                result[resource] = allowed
+
+        if uncached_resources:
+            checked = self.rbac.check_permissions(
+                user=user, resources=uncached_resources, action=action
+            )
+            for resource, allowed in checked.items():
+                self.cache.set_permission(user.id, resource, action, allowed)
+            result.update(checked)
+
+        return result
+
+    def list_allowed_resource_ids(
+        self, user: "UserResponse", resource: Resource, action: Action
+    ) -> Tuple[bool, List[str]]:
+        """Lists all resource IDs of a resource type that a user can access.
+
+        Args:
+            user: User which wants to access a resource.
+            resource: The resource the user wants to access.
+            action: The action that the user wants to perform on the resource.
+
+        Returns:
+            A tuple (full_resource_access, resource_ids).
+            `full_resource_access` will be `True` if the user can perform the
+            given action on any instance of the given resource type, `False`
+            otherwise. If `full_resource_access` is `False`, `resource_ids`
+            will contain the list of instance IDs that the user can perform
+            the action on.
+        """
+        allowed_ids = self.cache.get_allowed_resource_ids(
+            user.id, resource, action
+        )
+        if allowed_ids is None:
+            allowed_ids = self.rbac.list_allowed_resource_ids(
+                user=user, resource=resource, action=action
+            )
+            self.cache.set_allowed_resource_ids(
+                user.id, resource, action, allowed_ids
+            )
+        return allowed_ids
+
+    def update_resource_membership(
+        self, user: "UserResponse", resource: Resource, actions: List[Action]
+    ) -> None:
+        """Update the resource membership of a user.
+
+        Args:
+            user: User for which the resource membership should be updated.
+            resource: The resource.
+            actions: The actions that the user should be able to perform on the
+                resource.
+        """
+        try:
+            self.rbac.update_resource_membership(
+                user=user, resource=resource, actions=actions
+            )
+        finally:
+            self.cache.invalidate(user.id, resource=resource)
@@ -13,14 +13,24 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for artifact versions."""
 
+from typing import List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Security
 
 from zenml.artifacts.utils import load_artifact_visualization
-from zenml.constants import API, ARTIFACT_VERSIONS, VERSION_1, VISUALIZE
+from zenml.constants import (
+    API,
+    ARTIFACT_VERSIONS,
+    REGISTER,
+    VERSION_1,
+    VISUALIZE,
+)
+from zenml.exceptions import IllegalOperationError
 from zenml.models import (
+    ArtifactFilter,
     ArtifactVersionFilter,
+    ArtifactVersionRegistrationRequest,
     ArtifactVersionRequest,
     ArtifactVersionResponse,
     ArtifactVersionUpdate,
@@ -36,10 +46,12 @@ from zenml.zen_server.rbac.endpoint_utils import (
     verify_permissions_and_prune_entities,
     verify_permissions_and_update_entity,
 )
-from zenml.zen_server.rbac.models import ResourceType
+from zenml.zen_server.rbac.models import Action, ResourceType
 from zenml.zen_server.rbac.utils import (
     dehydrate_page,
     get_allowed_resource_ids,
+    verify_permission,
+    verify_permission_for_model,
 )
 from zenml.zen_server.utils import (
     handle_exceptions,
@@ -118,6 +130,74 @@ def create_artifact_version(
     )
 
 
+@artifact_version_router.post(
+    REGISTER,
+    response_model=List[ArtifactVersionResponse],
+    responses={401: error_response, 409: error_response, 422: error_response},
+)
+@handle_exceptions
+def register_artifact_versions(
+    artifact_versions: List[ArtifactVersionRegistrationRequest],
+    auth_context: AuthContext = Security(authorize),
+) -> List[ArtifactVersionResponse]:
+    """Register a batch of artifact versions.
+
+    Args:
+        artifact_versions: The artifact versions to register.
+        auth_context: The authentication context.
+
+    Returns:
+        The registered artifact versions.
+
+    Raises:
+        IllegalOperationError: If any of the artifact versions has a different
+            owner than the currently authenticated user.
+    """
+    for artifact_version in artifact_versions:
+        if artifact_version.user != auth_context.user.id:
+            raise IllegalOperationError(
+                "Not allowed to create resource "
+                f"'{ResourceType.ARTIFACT_VERSION}' for a different user."
+            )
+
+    verify_permission(
+        resource_type=ResourceType.ARTIFACT, action=Action.CREATE
+    )
+    verify_permission(
+        resource_type=ResourceType.ARTIFACT_VERSION, action=Action.CREATE
+    )
+
+    # Registering an artifact version updates the `has_custom_name` attribute
+    # of an existing artifact if it changed.
+    has_custom_name = {
+        artifact_version.artifact_name: artifact_version.has_custom_name
+        for artifact_version in artifact_versions
+    }
+    for artifact_name, custom_name in has_custom_name.items():
+        for artifact in zen_store().list_artifacts(
+            ArtifactFilter(name=artifact_name)
+        ):
+            if artifact.has_custom_name != custom_name:
+                verify_permission_for_model(artifact, action=Action.UPDATE)
+
+    # Linking an artifact version to a step run updates its pipeline run.
+    step_run_ids = {
+        artifact_version.step_run_id
+        for artifact_version in artifact_versions
+        if artifact_version.step_run_id
+    }
+    for step_run_id in step_run_ids:
+        step = zen_store().get_run_step(step_run_id, hydrate=True)
+        pipeline_run = zen_store().get_run(
+            step.pipeline_run_id, hydrate=False
+        )
+        verify_permission_for_model(pipeline_run, action=Action.UPDATE)
+
+    return zen_store().register_artifact_versions(
+        artifact_versions=artifact_versions
+    )
+
+
 @artifact_version_router.get(
     "/{artifact_version_id}",
     response_model=ArtifactVersionResponse,
@@ -37,6 +37,7 @@ from zenml.models import (
     Page,
 )
 from zenml.zen_server.auth import AuthContext, authorize
+from zenml.zen_server.auth_cache import auth_context_cache
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
     handle_exceptions,
@@ -166,9 +167,11 @@ def update_authorized_device(
             "this ID found."
         )
 
-    return zen_store().update_authorized_device(
+    device = zen_store().update_authorized_device(
         device_id=device_id, update=update
     )
+    auth_context_cache().invalidate(device_id=device_id)
+    return device
 
 
 @router.put(
@@ -300,3 +303,4 @@ def delete_authorized_device(
         )
 
     zen_store().delete_authorized_device(device_id=device_id)
+    auth_context_cache().invalidate(device_id=device_id)
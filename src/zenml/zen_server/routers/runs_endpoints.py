@@ -24,6 +24,7 @@ from zenml.constants import (
     PIPELINE_CONFIGURATION,
     RUNS,
     STATUS,
+    STEP_INPUTS,
     STEPS,
     VERSION_1,
 )
@@ -34,6 +35,8 @@ from zenml.models import (
     PipelineRunFilter,
     PipelineRunResponse,
     PipelineRunUpdate,
+    ResolvedStepInputs,
+    StepInputsQuery,
     StepRunFilter,
     StepRunResponse,
 )
@@ -45,7 +48,11 @@ from zenml.zen_server.rbac.endpoint_utils import (
     verify_permissions_and_list_entities,
     verify_permissions_and_update_entity,
 )
-from zenml.zen_server.rbac.models import ResourceType
+from zenml.zen_server.rbac.models import Action, ResourceType
+from zenml.zen_server.rbac.utils import (
+    batch_verify_permissions_for_models,
+    dehydrate_response_model,
+)
 from zenml.zen_server.utils import (
     handle_exceptions,
     make_dependable,
@@ -221,6 +228,50 @@ def get_run_steps(
     return zen_store().list_run_steps(step_run_filter_model)
 
 
+@router.post(
+    "/{run_id}" + STEP_INPUTS,
+    response_model=ResolvedStepInputs,
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def resolve_step_inputs(
+    run_id: UUID,
+    query: StepInputsQuery,
+    _: AuthContext = Security(authorize),
+) -> ResolvedStepInputs:
+    """Resolve the inputs of a step in a pipeline run.
+
+    Args:
+        run_id: ID of the pipeline run of the step.
+        query: The step outputs, upstream steps and external artifact versions
+            to resolve.
+
+    Returns:
+        The resolved inputs.
+    """
+    verify_permissions_and_get_entity(
+        id=run_id, get_method=zen_store().get_run, hydrate=False
+    )
+    inputs = zen_store().resolve_step_inputs(
+        pipeline_run_id=run_id, query=query
+    )
+    external_artifacts = list(inputs.external_artifacts.values())
+    batch_verify_permissions_for_models(external_artifacts, action=Action.READ)
+
+    inputs.external_artifacts = {
+        artifact_version.id: dehydrate_response_model(artifact_version)
+        for artifact_version in external_artifacts
+    }
+    inputs.step_outputs = {
+        step_name: {
+            output_name: dehydrate_response_model(artifact_version)
+            for output_name, artifact_version in outputs.items()
+        }
+        for step_name, outputs in inputs.step_outputs.items()
+    }
+    return inputs
+
+
 @router.get(
     "/{run_id}" + PIPELINE_CONFIGURATION,
     response_model=Dict[str, Any],
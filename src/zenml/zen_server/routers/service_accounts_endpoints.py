@@ -38,6 +38,7 @@ from zenml.models import (
     ServiceAccountUpdate,
 )
 from zenml.zen_server.auth import AuthContext, authorize
+from zenml.zen_server.auth_cache import auth_context_cache
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.rbac.endpoint_utils import (
     verify_permissions_and_create_entity,
@@ -178,12 +179,14 @@ def update_service_account(
     Returns:
         The updated service account.
     """
-    return verify_permissions_and_update_entity(
+    service_account = verify_permissions_and_update_entity(
         id=service_account_name_or_id,
         update_model=service_account_update,
         get_method=zen_store().get_service_account,
         update_method=zen_store().update_service_account,
     )
+    auth_context_cache().invalidate(user_id=service_account.id)
+    return service_account
 
 
 @router.delete(
@@ -200,11 +203,15 @@ def delete_service_account(
     Args:
         service_account_name_or_id: Name or ID of the service account.
     """
+    service_account = zen_store().get_service_account(
+        service_account_name_or_id
+    )
     verify_permissions_and_delete_entity(
-        id=service_account_name_or_id,
+        id=service_account.id,
         get_method=zen_store().get_service_account,
         delete_method=zen_store().delete_service_account,
     )
+    auth_context_cache().invalidate(user_id=service_account.id)
 
 
 # --------
@@ -336,11 +343,13 @@ def update_api_key(
     """
     service_account = zen_store().get_service_account(service_account_id)
     verify_permission_for_model(service_account, action=Action.UPDATE)
-    return zen_store().update_api_key(
+    api_key = zen_store().update_api_key(
         service_account_id=service_account_id,
         api_key_name_or_id=api_key_name_or_id,
         api_key_update=api_key_update,
     )
+    auth_context_cache().invalidate(api_key_id=api_key.id)
+    return api_key
 
 
 @router.put(
@@ -371,11 +380,13 @@ def rotate_api_key(
     """
     service_account = zen_store().get_service_account(service_account_id)
     verify_permission_for_model(service_account, action=Action.UPDATE)
-    return zen_store().rotate_api_key(
+    api_key = zen_store().rotate_api_key(
         service_account_id=service_account_id,
         api_key_name_or_id=api_key_name_or_id,
         rotate_request=rotate_request,
     )
+    auth_context_cache().invalidate(api_key_id=api_key.id)
+    return api_key
 
 
 @router.delete(
@@ -401,3 +412,6 @@ def delete_api_key(
         service_account_id=service_account_id,
         api_key_name_or_id=api_key_name_or_id,
     )
+    # The API key can't be fetched anymore once it is deleted, so all cached
+    # authentication contexts of the service account are removed
+    auth_context_cache().invalidate(user_id=service_account_id)
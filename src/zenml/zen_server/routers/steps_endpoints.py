@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for steps (and artifacts) of pipeline runs."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Security
@@ -24,6 +24,7 @@ from zenml.artifacts.utils import (
 )
 from zenml.constants import (
     API,
+    CACHED_STEP_RUN,
     LOGS,
     STATUS,
     STEP_CONFIGURATION,
@@ -32,6 +33,7 @@ from zenml.constants import (
 )
 from zenml.enums import ExecutionStatus
 from zenml.models import (
+    CachedStepRun,
     Page,
     StepRunFilter,
     StepRunRequest,
@@ -123,6 +125,40 @@ def create_run_step(
     return zen_store().create_run_step(step_run=step)
 
 
+@router.get(
+    CACHED_STEP_RUN,
+    response_model=Optional[CachedStepRun],
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def get_latest_cached_step_run(
+    workspace_id: UUID,
+    cache_key: str,
+    auth_context: AuthContext = Security(authorize),
+) -> Optional[CachedStepRun]:
+    """Get the latest completed step run with a given cache key.
+
+    Only step runs of pipeline runs that the user is allowed to read are
+    considered.
+
+    Args:
+        workspace_id: The ID of the workspace in which to search.
+        cache_key: The cache key of the step run.
+        auth_context: Authentication context.
+
+    Returns:
+        The latest step run with the cache key if one exists.
+    """
+    return zen_store().get_latest_cached_step_run(
+        workspace_id=workspace_id,
+        cache_key=cache_key,
+        allowed_pipeline_run_ids=get_allowed_resource_ids(
+            resource_type=ResourceType.PIPELINE_RUN
+        ),
+        authenticated_user_id=auth_context.user.id,
+    )
+
+
 @router.get(
     "/{step_id}",
     response_model=StepRunResponse,
@@ -15,10 +15,13 @@
 
 import inspect
 import os
+import threading
+import time
 from functools import wraps
 from typing import (
     Any,
     Callable,
+    Dict,
     Optional,
     Tuple,
     Type,
@@ -50,6 +53,7 @@ from zenml.zen_server.feature_gate.feature_gate_interface import (
 from zenml.zen_server.pipeline_deployment.workload_manager_interface import (
     WorkloadManagerInterface,
 )
+from zenml.zen_server.rbac.rbac_cache import CachedRBAC, RBACCache
 from zenml.zen_server.rbac.rbac_interface import RBACInterface
 from zenml.zen_stores.sql_zen_store import SqlZenStore
 
@@ -61,6 +65,8 @@ _feature_gate: Optional[FeatureGateInterface] = None
 _workload_manager: Optional[WorkloadManagerInterface] = None
 _plugin_flavor_registry: Optional[PluginFlavorRegistry] = None
 _secure_headers: Optional[secure.Secure] = None
+_cache_stats: Dict[str, Callable[[], Dict[str, int]]] = {}
+_cache_stats_thread: Optional[threading.Thread] = None
 
 
 def zen_store() -> "SqlZenStore":
@@ -116,7 +122,67 @@ def initialize_rbac() -> None:
         implementation_class = source_utils.load_and_validate_class(
             rbac_source, expected_class=RBACInterface
         )
-        _rbac = implementation_class()
+        implementation = implementation_class()
+
+        config = server_config()
+        cache = RBACCache(
+            ttl_seconds=config.rbac_cache_ttl_seconds,
+            max_size=config.rbac_cache_size,
+        )
+        if cache.enabled:
+            implementation = CachedRBAC(rbac=implementation, cache=cache)
+            register_cache_stats("RBAC", lambda: cache.stats)
+        _rbac = implementation
+
+
+def register_cache_stats(
+    name: str, get_stats: Callable[[], Dict[str, int]]
+) -> None:
+    """Register a server cache whose statistics should be reported.
+
+    Args:
+        name: The name of the cache.
+        get_stats: Function that returns the current statistics of the cache.
+    """
+    _cache_stats[name] = get_stats
+
+
+def get_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Get the statistics of all registered server caches.
+
+    Returns:
+        The statistics of the registered caches by cache name.
+    """
+    return {name: get_stats() for name, get_stats in _cache_stats.items()}
+
+
+def log_cache_stats() -> None:
+    """Log the statistics of all registered server caches."""
+    for name, stats in get_cache_stats().items():
+        logger.debug(
+            "Statistics of the %s cache: %s",
+            name,
+            ", ".join(f"{key}={value}" for key, value in stats.items()),
+        )
+
+
+def initialize_cache_stats_logging() -> None:
+    """Start logging the statistics of the server caches periodically."""
+    global _cache_stats_thread
+
+    interval = server_config().cache_stats_log_interval_seconds
+    if interval <= 0 or _cache_stats_thread is not None:
+        return
+
+    def _log_periodically() -> None:
+        while True:
+            time.sleep(interval)
+            log_cache_stats()
+
+    _cache_stats_thread = threading.Thread(
+        target=_log_periodically, name="cache_stats_logger", daemon=True
+    )
+    _cache_stats_thread.start()
 
 
 def feature_gate() -> FeatureGateInterface:
@@ -30,6 +30,7 @@ import zenml
 from zenml.analytics import source_context
 from zenml.constants import API, HEALTH
 from zenml.enums import AuthScheme, SourceContextTypes
+from zenml.zen_server.compression import CompressionMiddleware
 from zenml.zen_server.exceptions import error_detail
 from zenml.zen_server.routers import (
     artifact_endpoint,
@@ -63,6 +64,7 @@ from zenml.zen_server.routers import (
     workspaces_endpoints,
 )
 from zenml.zen_server.utils import (
+    initialize_cache_stats_logging,
     initialize_feature_gate,
     initialize_plugins,
     initialize_rbac,
@@ -124,6 +126,10 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(
+    CompressionMiddleware,
+    max_decompressed_request_size=server_config().max_decompressed_request_size,
+)
 
 
 @app.middleware("http")
@@ -191,6 +197,7 @@ def initialize() -> None:
     initialize_workload_manager()
     initialize_plugins()
     initialize_secure_headers()
+    initialize_cache_stats_logging()
 
 
 if server_config().use_legacy_dashboard:
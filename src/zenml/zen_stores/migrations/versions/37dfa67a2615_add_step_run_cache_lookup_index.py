@@ -0,0 +1,31 @@
+"""Add step run cache lookup index [37dfa67a2615].
+
+Revision ID: 37dfa67a2615
+Revises: cf183aedcd8a
+Create Date: 2024-05-07 09:21:04.381652
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "37dfa67a2615"
+down_revision = "cf183aedcd8a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("step_run", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_step_run_cache_lookup",
+            ["workspace_id", "cache_key", "status", "created"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("step_run", schema=None) as batch_op:
+        batch_op.drop_index("ix_step_run_cache_lookup")
@@ -0,0 +1,233 @@
+"""Atomic version numbering [4d5c5e6e7a8b].
+
+Release notes: Artifact names are now unique. Artifacts which share their
+name with an older artifact are merged into the oldest artifact with that
+name. Colliding versions of merged artifacts are renumbered, and every merge
+and renumbered version is logged during the upgrade.
+
+Revision ID: 4d5c5e6e7a8b
+Revises: 37dfa67a2615
+Create Date: 2024-05-08 14:02:37.120744
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+from zenml.logger import get_logger
+
+logger = get_logger(__name__)
+
+# revision identifiers, used by Alembic.
+revision = "4d5c5e6e7a8b"
+down_revision = "37dfa67a2615"
+branch_labels = None
+depends_on = None
+
+
+def merge_duplicate_artifacts() -> None:
+    """Merge artifacts which share their name with an older artifact.
+
+    In order to add the unique constraint on the artifact name, we first need
+    to make sure all existing artifacts fulfill this constraint. Artifacts
+    with duplicate names could be created by concurrent pipeline runs. The
+    versions and tags of these artifacts are moved to the oldest artifact
+    with the same name, so they can still be found by the artifact name.
+    Versions that collide with an existing version of the oldest artifact
+    get the next free version number if they are numeric, or the ID of the
+    version appended otherwise.
+    """
+    connection = op.get_bind()
+    meta = sa.MetaData(bind=connection)
+    meta.reflect(only=("artifact", "artifact_version", "tag_resource"))
+    artifact_table = sa.Table("artifact", meta)
+    version_table = sa.Table("artifact_version", meta)
+    tag_resource_table = sa.Table("tag_resource", meta)
+    max_version_length = getattr(version_table.c.version.type, "length", None)
+
+    duplicate_names = connection.execute(
+        sa.select(artifact_table.c.name)
+        .group_by(artifact_table.c.name)
+        .having(sa.func.count() > 1)
+    ).fetchall()
+
+    for (name,) in duplicate_names:
+        artifact_ids = [
+            artifact_id
+            for (artifact_id,) in connection.execute(
+                sa.select(artifact_table.c.id)
+                .where(artifact_table.c.name == name)
+                .order_by(artifact_table.c.created, artifact_table.c.id)
+            )
+        ]
+        target_id, duplicate_ids = artifact_ids[0], artifact_ids[1:]
+
+        existing_versions = {
+            version
+            for (version,) in connection.execute(
+                sa.select(version_table.c.version).where(
+                    version_table.c.artifact_id == target_id
+                )
+            )
+        }
+        latest_version_number = (
+            connection.execute(
+                sa.select(sa.func.max(version_table.c.version_number)).where(
+                    version_table.c.artifact_id.in_(artifact_ids)
+                )
+            ).scalar()
+            or 0
+        )
+
+        target_tag_ids = {
+            tag_id
+            for (tag_id,) in connection.execute(
+                sa.select(tag_resource_table.c.tag_id)
+                .where(tag_resource_table.c.resource_id == target_id)
+                .where(tag_resource_table.c.resource_type == "artifact")
+            )
+        }
+
+        for duplicate_id in duplicate_ids:
+            logger.info(
+                "Merging artifact %s into artifact %s with the same name "
+                "`%s`.",
+                duplicate_id,
+                target_id,
+                name,
+            )
+            versions = connection.execute(
+                sa.select(
+                    version_table.c.id,
+                    version_table.c.version,
+                    version_table.c.version_number,
+                )
+                .where(version_table.c.artifact_id == duplicate_id)
+                .order_by(version_table.c.created, version_table.c.id)
+            ).fetchall()
+            for version_id, version, version_number in versions:
+                values = {"artifact_id": target_id}
+                if version in existing_versions:
+                    if version_number is not None:
+                        latest_version_number += 1
+                        version_number = latest_version_number
+                        new_version = str(version_number)
+                    else:
+                        suffix = f"_{version_id}"
+                        prefix = version
+                        if max_version_length:
+                            prefix = version[
+                                : max(max_version_length - len(suffix), 0)
+                            ]
+                        new_version = f"{prefix}{suffix}"
+                    logger.info(
+                        "Renaming version `%s` of artifact `%s` to `%s`.",
+                        version,
+                        name,
+                        new_version,
+                    )
+                    version = new_version
+                    values.update(
+                        version=version, version_number=version_number
+                    )
+                existing_versions.add(version)
+                connection.execute(
+                    sa.update(version_table)
+                    .where(version_table.c.id == version_id)
+                    .values(**values)
+                )
+
+            # Move tags of the duplicate, dropping ones the target already has
+            tag_ids = [
+                tag_id
+                for (tag_id,) in connection.execute(
+                    sa.select(tag_resource_table.c.tag_id)
+                    .where(tag_resource_table.c.resource_id == duplicate_id)
+                    .where(tag_resource_table.c.resource_type == "artifact")
+                )
+            ]
+            for tag_id in tag_ids:
+                tag_filter = sa.and_(
+                    tag_resource_table.c.tag_id == tag_id,
+                    tag_resource_table.c.resource_id == duplicate_id,
+                    tag_resource_table.c.resource_type == "artifact",
+                )
+                if tag_id in target_tag_ids:
+                    connection.execute(
+                        sa.delete(tag_resource_table).where(tag_filter)
+                    )
+                else:
+                    connection.execute(
+                        sa.update(tag_resource_table)
+                        .where(tag_filter)
+                        .values(resource_id=target_id)
+                    )
+                    target_tag_ids.add(tag_id)
+
+            connection.execute(
+                sa.delete(artifact_table).where(
+                    artifact_table.c.id == duplicate_id
+                )
+            )
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    merge_duplicate_artifacts()
+
+    with op.batch_alter_table("artifact", schema=None) as batch_op:
+        batch_op.create_unique_constraint("unique_artifact_name", ["name"])
+
+    for table_name in ["artifact", "model"]:
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.add_column(
+                sa.Column(
+                    "latest_version_number",
+                    sa.Integer(),
+                    nullable=False,
+                    server_default="0",
+                )
+            )
+
+    # Fill in the latest version numbers of all existing artifacts and models
+    connection = op.get_bind()
+    connection.execute(
+        sa.text(
+            """
+            UPDATE artifact
+            SET latest_version_number = COALESCE(
+                (
+                    SELECT MAX(artifact_version.version_number)
+                    FROM artifact_version
+                    WHERE artifact_version.artifact_id = artifact.id
+                ),
+                0
+            )
+            """
+        )
+    )
+    connection.execute(
+        sa.text(
+            """
+            UPDATE model
+            SET latest_version_number = COALESCE(
+                (
+                    SELECT MAX(model_version.number)
+                    FROM model_version
+                    WHERE model_version.model_id = model.id
+                ),
+                0
+            )
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    for table_name in ["artifact", "model"]:
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.drop_column("latest_version_number")
+
+    with op.batch_alter_table("artifact", schema=None) as batch_op:
+        batch_op.drop_constraint("unique_artifact_name", type_="unique")
@@ -0,0 +1,77 @@
+"""Add deployment step count [cf183aedcd8a].
+
+Revision ID: cf183aedcd8a
+Revises: 0.57.0
+Create Date: 2024-05-06 10:12:41.518273
+
+"""
+
+import json
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "cf183aedcd8a"
+down_revision = "0.57.0"
+branch_labels = None
+depends_on = None
+
+# Number of deployments whose step configurations are loaded at once.
+BATCH_SIZE = 100
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("pipeline_deployment", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("step_count", sa.Integer(), nullable=True)
+        )
+
+    # Fill in the step count of all existing deployments. The step
+    # configurations can be large, so they are only fetched for a batch of
+    # deployments at a time.
+    connection = op.get_bind()
+    deployment_ids = [
+        row[0]
+        for row in connection.execute(
+            sa.text("SELECT id FROM pipeline_deployment")
+        )
+    ]
+    select_step_configurations = sa.text(
+        """
+        SELECT id, step_configurations
+        FROM pipeline_deployment
+        WHERE id IN :ids
+        """
+    ).bindparams(sa.bindparam("ids", expanding=True))
+    for start in range(0, len(deployment_ids), BATCH_SIZE):
+        deployments = connection.execute(
+            select_step_configurations,
+            {"ids": deployment_ids[start : start + BATCH_SIZE]},
+        ).fetchall()
+        for deployment_id, step_configurations in deployments:
+            connection.execute(
+                sa.text(
+                    """
+                    UPDATE pipeline_deployment
+                    SET step_count = :step_count
+                    WHERE id = :id
+                    """
+                ),
+                {
+                    "step_count": len(json.loads(step_configurations)),
+                    "id": deployment_id,
+                },
+            )
+
+    with op.batch_alter_table("pipeline_deployment", schema=None) as batch_op:
+        batch_op.alter_column(
+            "step_count", existing_type=sa.Integer(), nullable=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("pipeline_deployment", schema=None) as batch_op:
+        batch_op.drop_column("step_count")
@@ -0,0 +1,35 @@
+"""Add pagination cursor indices [f3fea8eb32c0].
+
+Revision ID: f3fea8eb32c0
+Revises: 4d5c5e6e7a8b
+Create Date: 2024-05-13 10:12:45.285913
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f3fea8eb32c0"
+down_revision = "4d5c5e6e7a8b"
+branch_labels = None
+depends_on = None
+
+CURSOR_INDICES = {
+    "pipeline_run": "ix_pipeline_run_created_id",
+    "step_run": "ix_step_run_created_id",
+    "artifact_version": "ix_artifact_version_created_id",
+}
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    for table_name, index_name in CURSOR_INDICES.items():
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.create_index(index_name, ["created", "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    for table_name, index_name in CURSOR_INDICES.items():
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.drop_index(index_name)
@@ -22,6 +22,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -47,6 +48,7 @@ from zenml.constants import (
     ARTIFACT_VERSIONS,
     ARTIFACT_VISUALIZATIONS,
     ARTIFACTS,
+    CACHED_STEP_RUN,
     CODE_REFERENCES,
     CODE_REPOSITORIES,
     CURRENT_USER,
@@ -68,6 +70,7 @@ from zenml.constants import (
     PIPELINE_BUILDS,
     PIPELINE_DEPLOYMENTS,
     PIPELINES,
+    REGISTER,
     RUN_METADATA,
     RUNS,
     SCHEDULES,
@@ -85,6 +88,7 @@ from zenml.constants import (
     SERVICES,
     STACK_COMPONENTS,
     STACKS,
+    STEP_INPUTS,
     STEPS,
     TAGS,
     TRIGGER_EXECUTIONS,
@@ -113,6 +117,7 @@ from zenml.models import (
     ArtifactResponse,
     ArtifactUpdate,
     ArtifactVersionFilter,
+    ArtifactVersionRegistrationRequest,
     ArtifactVersionRequest,
     ArtifactVersionResponse,
     ArtifactVersionUpdate,
@@ -120,6 +125,7 @@ from zenml.models import (
     BaseFilter,
     BaseIdentifiedResponse,
     BaseRequest,
+    CachedStepRun,
     CodeReferenceResponse,
     CodeRepositoryFilter,
     CodeRepositoryRequest,
@@ -170,6 +176,7 @@ from zenml.models import (
     PipelineRunResponse,
     PipelineRunUpdate,
     PipelineUpdate,
+    ResolvedStepInputs,
     RunMetadataFilter,
     RunMetadataRequest,
     RunMetadataResponse,
@@ -202,6 +209,7 @@ from zenml.models import (
     StackRequest,
     StackResponse,
     StackUpdate,
+    StepInputsQuery,
     StepRunFilter,
     StepRunRequest,
     StepRunResponse,
@@ -229,6 +237,7 @@ from zenml.models import (
 from zenml.service_connectors.service_connector_registry import (
     service_connector_registry,
 )
+from zenml.utils import http_utils
 from zenml.utils.networking_utils import (
     replace_localhost_with_internal_hostname,
 )
@@ -406,6 +415,9 @@ class RestZenStore(BaseZenStore):
     CONFIG_TYPE: ClassVar[Type[StoreConfiguration]] = RestZenStoreConfiguration
     _api_token: Optional[str] = None
     _session: Optional[requests.Session] = None
+    # Encoding with which request bodies are compressed, as announced by
+    # the server in the `Accept-Encoding` header of its responses.
+    _request_encoding: Optional[str] = None
 
     # ====================================
     # ZenML Store interface implementation
@@ -822,6 +834,34 @@ class RestZenStore(BaseZenStore):
             route=ARTIFACT_VERSIONS,
         )
 
+    def register_artifact_versions(
+        self, artifact_versions: List[ArtifactVersionRegistrationRequest]
+    ) -> List[ArtifactVersionResponse]:
+        """Registers a batch of artifact versions.
+
+        Args:
+            artifact_versions: The artifact versions to register.
+
+        Returns:
+            The registered artifact versions, in the order of the requests.
+
+        Raises:
+            ValueError: if the server response is not a list.
+        """
+        response_body = self._request(
+            "POST",
+            self.url + API + VERSION_1 + ARTIFACT_VERSIONS + REGISTER,
+            data="[" + ",".join(a.json() for a in artifact_versions) + "]",
+        )
+        if not isinstance(response_body, list):
+            raise ValueError(
+                f"Bad API Response. Expected list, got {type(response_body)}"
+            )
+        return [
+            ArtifactVersionResponse.parse_obj(artifact_version)
+            for artifact_version in response_body
+        ]
+
     def get_artifact_version(
         self, artifact_version_id: UUID, hydrate: bool = True
     ) -> ArtifactVersionResponse:
@@ -2451,7 +2491,7 @@ class RestZenStore(BaseZenStore):
                 )
             except (ValueError, AuthorizationException) as e:
                 logger.error(
-                    f'Failed to fetch {resource_type or "available"} '
+                    f"Failed to fetch {resource_type or 'available'} "
                     f"resources from service connector {connector.name}/"
                     f"{connector.id}: {e}"
                 )
@@ -2714,6 +2754,53 @@ class RestZenStore(BaseZenStore):
             params={"hydrate": hydrate},
         )
 
+    def get_latest_cached_step_run(
+        self,
+        workspace_id: UUID,
+        cache_key: str,
+        allowed_pipeline_run_ids: Optional[Set[UUID]] = None,
+        authenticated_user_id: Optional[UUID] = None,
+    ) -> Optional[CachedStepRun]:
+        """Get the latest completed step run with a given cache key.
+
+        The server only considers the step runs of pipeline runs that the
+        authenticated user is allowed to read.
+
+        Args:
+            workspace_id: The ID of the workspace in which to search.
+            cache_key: The cache key of the step run.
+            allowed_pipeline_run_ids: Not used, the server determines the
+                allowed pipeline runs of the authenticated user.
+            authenticated_user_id: Not used, the server uses the user of the
+                API token.
+
+        Returns:
+            The latest step run with the cache key if one exists.
+        """
+        body = self.get(
+            f"{STEPS}{CACHED_STEP_RUN}",
+            params={"workspace_id": workspace_id, "cache_key": cache_key},
+        )
+        if body is None:
+            return None
+        return CachedStepRun.parse_obj(body)
+
+    def resolve_step_inputs(
+        self, pipeline_run_id: UUID, query: StepInputsQuery
+    ) -> ResolvedStepInputs:
+        """Resolve the inputs of a step in a pipeline run.
+
+        Args:
+            pipeline_run_id: The ID of the pipeline run of the step.
+            query: The step outputs, upstream steps and external artifact
+                versions to resolve.
+
+        Returns:
+            The resolved inputs.
+        """
+        body = self.post(f"{RUNS}/{pipeline_run_id}{STEP_INPUTS}", body=query)
+        return ResolvedStepInputs.parse_obj(body)
+
     def update_run_step(
         self,
         step_run_id: UUID,
@@ -3762,9 +3849,9 @@ class RestZenStore(BaseZenStore):
         """
         if 200 <= response.status_code < 300:
             try:
-                payload: Json = response.json()
+                payload: Json = http_utils.json_loads(response.content)
                 return payload
-            except requests.exceptions.JSONDecodeError:
+            except ValueError:
                 raise ValueError(
                     "Bad response from API. Expected json, got\n"
                     f"{response.text}"
@@ -3812,16 +3899,23 @@ class RestZenStore(BaseZenStore):
             {source_context.name: source_context.get().value}
         )
 
+        data = kwargs.get("data")
+        if (
+            self._request_encoding
+            and isinstance(data, (str, bytes))
+            and len(data) >= http_utils.MINIMUM_COMPRESSION_SIZE
+        ):
+            if isinstance(data, str):
+                data = data.encode()
+            kwargs["data"] = http_utils.compress(data, self._request_encoding)
+            kwargs["headers"] = {
+                **kwargs.get("headers", {}),
+                "Content-Encoding": self._request_encoding,
+            }
+
         try:
             return self._handle_response(
-                self.session.request(
-                    method,
-                    url,
-                    params=params,
-                    verify=self.config.verify_ssl,
-                    timeout=self.config.http_timeout,
-                    **kwargs,
-                )
+                self._send_request(method, url, params=params, **kwargs)
             )
         except AuthorizationException:
             # The authentication token could have expired; refresh it and try
@@ -3832,14 +3926,7 @@ class RestZenStore(BaseZenStore):
 
         try:
             return self._handle_response(
-                self.session.request(
-                    method,
-                    url,
-                    params=params,
-                    verify=self.config.verify_ssl,
-                    timeout=self.config.http_timeout,
-                    **kwargs,
-                )
+                self._send_request(method, url, params=params, **kwargs)
             )
         except AuthorizationException:
             logger.info(
@@ -3847,6 +3934,42 @@ class RestZenStore(BaseZenStore):
             )
             raise
 
+    def _send_request(
+        self,
+        method: str,
+        url: str,
+        params: Dict[str, str],
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send a request to the REST API.
+
+        Responses are transparently decompressed by `requests`. The request
+        encodings that the server supports are taken from the
+        `Accept-Encoding` header of its responses.
+
+        Args:
+            method: The HTTP method to use.
+            url: The URL to request.
+            params: The query parameters to pass to the endpoint.
+            kwargs: Additional keyword arguments to pass to the request.
+
+        Returns:
+            The response.
+        """
+        response = self.session.request(
+            method,
+            url,
+            params=params,
+            verify=self.config.verify_ssl,
+            timeout=self.config.http_timeout,
+            **kwargs,
+        )
+        if accept_encoding := response.headers.get("Accept-Encoding"):
+            self._request_encoding = http_utils.select_encoding(
+                accept_encoding
+            )
+        return response
+
     def get(
         self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any
     ) -> Json:
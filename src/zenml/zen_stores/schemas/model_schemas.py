@@ -90,6 +90,9 @@ class ModelSchema(NamedSchema, table=True):
     save_models_to_registry: bool = Field(
         sa_column=Column(BOOLEAN, nullable=False)
     )
+    # Highest number assigned to a version of this model, used to atomically
+    # allocate new version numbers.
+    latest_version_number: int = Field(default=0, nullable=False)
     tags: List["TagResourceSchema"] = Relationship(
         back_populates="model",
         sa_relationship_kwargs=dict(
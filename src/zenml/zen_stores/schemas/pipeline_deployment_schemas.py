@@ -14,7 +14,17 @@
 """SQLModel implementation of pipeline deployment tables."""
 
 import json
-from typing import TYPE_CHECKING, Any, List, Optional
+import threading
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+)
 from uuid import UUID
 
 from pydantic.json import pydantic_encoder
@@ -48,6 +58,54 @@ if TYPE_CHECKING:
     from zenml.zen_stores.schemas.step_run_schemas import StepRunSchema
 
 
+# Maximum number of deployments for which the decoded step configurations
+# are kept in memory.
+STEP_CONFIGURATIONS_CACHE_SIZE = 16
+
+_step_configurations_cache: "OrderedDict[UUID, Dict[str, Dict[str, Any]]]" = (
+    OrderedDict()
+)
+_step_configurations_cache_lock = threading.Lock()
+
+
+def _load_step_configurations(
+    deployment_id: UUID, get_step_configurations: Callable[[], str]
+) -> Mapping[str, Dict[str, Any]]:
+    """Decode the step configurations of a deployment.
+
+    Deployments are never updated, so the decoded step configurations can be
+    shared between all step runs of a deployment instead of decoding the full
+    JSON blob again for each one of them. The cache is keyed by the
+    deployment ID only, the JSON blob is only fetched and decoded on a cache
+    miss.
+
+    Args:
+        deployment_id: ID of the deployment.
+        get_step_configurations: Function that returns the JSON encoded step
+            configurations of the deployment.
+
+    Returns:
+        The decoded step configurations. These are the cached entries
+        themselves and must not be modified by the caller.
+    """
+    with _step_configurations_cache_lock:
+        decoded = _step_configurations_cache.get(deployment_id)
+        if decoded is not None:
+            _step_configurations_cache.move_to_end(deployment_id)
+
+    if decoded is None:
+        decoded = json.loads(get_step_configurations())
+        with _step_configurations_cache_lock:
+            _step_configurations_cache[deployment_id] = decoded
+            while (
+                len(_step_configurations_cache)
+                > STEP_CONFIGURATIONS_CACHE_SIZE
+            ):
+                _step_configurations_cache.popitem(last=False)
+
+    return decoded
+
+
 class PipelineDeploymentSchema(BaseSchema, table=True):
     """SQL Model for pipeline deployments."""
 
@@ -71,6 +129,7 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
         )
     )
     client_environment: str = Field(sa_column=Column(TEXT, nullable=False))
+    step_count: int = Field(nullable=False)
     run_name_template: str = Field(nullable=False)
     client_version: str = Field(nullable=True)
     server_version: str = Field(nullable=True)
@@ -184,6 +243,7 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
                 sort_keys=False,
                 default=pydantic_encoder,
             ),
+            step_count=len(request.step_configurations),
             client_environment=json.dumps(request.client_environment),
             client_version=request.client_version,
             server_version=request.server_version,
@@ -206,13 +266,6 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
         Returns:
             The created `PipelineDeploymentResponse`.
         """
-        pipeline_configuration = PipelineConfiguration.parse_raw(
-            self.pipeline_configuration
-        )
-        step_configurations = json.loads(self.step_configurations)
-        for s, c in step_configurations.items():
-            step_configurations[s] = Step.parse_obj(c)
-
         body = PipelineDeploymentResponseBody(
             user=self.user.to_model() if self.user else None,
             created=self.created,
@@ -220,6 +273,16 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
         )
         metadata = None
         if include_metadata:
+            pipeline_configuration = PipelineConfiguration.parse_raw(
+                self.pipeline_configuration
+            )
+            step_configurations = {
+                step_name: Step.parse_obj(step_configuration)
+                for step_name, step_configuration in _load_step_configurations(
+                    self.id, lambda: self.step_configurations
+                ).items()
+            }
+
             metadata = PipelineDeploymentResponseMetadata(
                 workspace=self.workspace.to_model(),
                 run_name_template=self.run_name_template,
@@ -241,3 +304,18 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
             body=body,
             metadata=metadata,
         )
+
+    def get_step_configuration(self, step_name: str) -> Step:
+        """Get the configuration of a single step of the deployment.
+
+        Args:
+            step_name: Name of the step.
+
+        Returns:
+            The step configuration.
+        """
+        return Step.parse_obj(
+            _load_step_configurations(
+                self.id, lambda: self.step_configurations
+            )[step_name]
+        )
@@ -15,10 +15,10 @@
 
 import json
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import TEXT, Column, Field, Relationship
 
 from zenml.config.pipeline_configurations import PipelineConfiguration
@@ -63,6 +63,8 @@ class PipelineRunSchema(NamedSchema, table=True):
             "orchestrator_run_id",
             name="unique_orchestrator_run_id_for_deployment_id",
         ),
+        # Speeds up cursor pagination in the default sort order
+        Index("ix_pipeline_run_created_id", "created", "id"),
     )
 
     # Fields
@@ -234,39 +236,47 @@ class PipelineRunSchema(NamedSchema, table=True):
         Raises:
             RuntimeError: if the model creation fails.
         """
-        orchestrator_environment = (
-            json.loads(self.orchestrator_environment)
-            if self.orchestrator_environment
-            else {}
-        )
-
-        run_metadata = {
-            metadata_schema.key: metadata_schema.to_model()
-            for metadata_schema in self.run_metadata
-        }
-
+        config: Optional[PipelineConfiguration] = None
+        client_environment: Dict[str, str] = {}
         if self.deployment is not None:
-            deployment = self.deployment.to_model()
-
-            config = deployment.pipeline_configuration
-            client_environment = deployment.client_environment
-
-            stack = deployment.stack
-            pipeline = deployment.pipeline
-            build = deployment.build
-            schedule = deployment.schedule
-            code_reference = deployment.code_reference
-
-        elif self.pipeline_configuration is not None:
-            config = PipelineConfiguration.parse_raw(
-                self.pipeline_configuration
+            # Only load the stack, pipeline, build, schedule and code reference
+            # of the deployment for the body instead of converting the whole
+            # deployment. The (potentially large) configurations are only
+            # decoded if the response gets hydrated.
+            if include_metadata:
+                config = PipelineConfiguration.parse_raw(
+                    self.deployment.pipeline_configuration
+                )
+                client_environment = json.loads(
+                    self.deployment.client_environment
+                )
+
+            deployment = self.deployment
+            stack = deployment.stack.to_model() if deployment.stack else None
+            pipeline = (
+                deployment.pipeline.to_model() if deployment.pipeline else None
             )
-            client_environment = (
-                json.loads(self.client_environment)
-                if self.client_environment
-                else {}
+            build = deployment.build.to_model() if deployment.build else None
+            schedule = (
+                deployment.schedule.to_model() if deployment.schedule else None
+            )
+            code_reference = (
+                deployment.code_reference.to_model()
+                if deployment.code_reference
+                else None
             )
 
+        elif self.pipeline_configuration is not None:
+            if include_metadata:
+                config = PipelineConfiguration.parse_raw(
+                    self.pipeline_configuration
+                )
+                client_environment = (
+                    json.loads(self.client_environment)
+                    if self.client_environment
+                    else {}
+                )
+
             stack = self.stack.to_model() if self.stack else None
             pipeline = self.pipeline.to_model() if self.pipeline else None
             build = self.build.to_model() if self.build else None
@@ -297,7 +307,17 @@ class PipelineRunSchema(NamedSchema, table=True):
         )
         metadata = None
         if include_metadata:
+            assert config is not None
             steps = {step.name: step.to_model() for step in self.step_runs}
+            run_metadata = {
+                metadata_schema.key: metadata_schema.to_model()
+                for metadata_schema in self.run_metadata
+            }
+            orchestrator_environment = (
+                json.loads(self.orchestrator_environment)
+                if self.orchestrator_environment
+                else {}
+            )
 
             metadata = PipelineRunResponseMetadata(
                 workspace=self.workspace.to_model(),
@@ -13,12 +13,11 @@
 #  permissions and limitations under the License.
 """SQLModel implementation of step run tables."""
 
-import json
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, List, Optional
 from uuid import UUID
 
-from sqlalchemy import TEXT, Column, String
+from sqlalchemy import TEXT, Column, Index, String
 from sqlalchemy.dialects.mysql import MEDIUMTEXT
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -56,6 +55,18 @@ class StepRunSchema(NamedSchema, table=True):
     """SQL Model for steps of pipeline runs."""
 
     __tablename__ = "step_run"
+    __table_args__ = (
+        # Speeds up the lookup of cached step runs
+        Index(
+            "ix_step_run_cache_lookup",
+            "workspace_id",
+            "cache_key",
+            "status",
+            "created",
+        ),
+        # Speeds up cursor pagination in the default sort order
+        Index("ix_step_run_created_id", "created", "id"),
+    )
 
     # Fields
     start_time: Optional[datetime] = Field(nullable=True)
@@ -211,18 +222,6 @@ class StepRunSchema(NamedSchema, table=True):
             for artifact in self.output_artifacts
         }
 
-        if self.deployment is not None:
-            full_step_config = Step.parse_obj(
-                json.loads(self.deployment.step_configurations)[self.name]
-            )
-        elif self.step_configuration is not None:
-            full_step_config = Step.parse_raw(self.step_configuration)
-        else:
-            raise RuntimeError(
-                "Step run model creation has failed. Each step run entry "
-                "should either have a deployment_id or step_configuration."
-            )
-
         body = StepRunResponseBody(
             user=self.user.to_model() if self.user else None,
             status=self.status,
@@ -233,6 +232,18 @@ class StepRunSchema(NamedSchema, table=True):
         )
         metadata = None
         if include_metadata:
+            if self.deployment is not None:
+                full_step_config = self.deployment.get_step_configuration(
+                    self.name
+                )
+            elif self.step_configuration is not None:
+                full_step_config = Step.parse_raw(self.step_configuration)
+            else:
+                raise RuntimeError(
+                    "Step run model creation has failed. Each step run entry "
+                    "should either have a deployment_id or step_configuration."
+                )
+
             metadata = StepRunResponseMetadata(
                 workspace=self.workspace.to_model(),
                 config=full_step_config.config,
@@ -31,6 +31,7 @@ from typing import (
     ForwardRef,
     List,
     Optional,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -42,14 +43,14 @@ from uuid import UUID
 from packaging import version
 from pydantic import Field, SecretStr, root_validator, validator
 from pydantic.json import pydantic_encoder
-from sqlalchemy import asc, desc, func
+from sqlalchemy import asc, case, desc, func, text, update
 from sqlalchemy.engine import URL, Engine, make_url
 from sqlalchemy.exc import (
     ArgumentError,
     IntegrityError,
     NoResultFound,
 )
-from sqlalchemy.orm import noload
+from sqlalchemy.orm import defer, noload, selectinload
 from sqlmodel import (
     Session,
     SQLModel,
@@ -93,6 +94,7 @@ from zenml.enums import (
     DatabaseBackupStrategy,
     ExecutionStatus,
     LoggingLevels,
+    MetadataResourceTypes,
     ModelStages,
     SecretScope,
     SecretsStoreType,
@@ -129,6 +131,7 @@ from zenml.models import (
     ArtifactResponse,
     ArtifactUpdate,
     ArtifactVersionFilter,
+    ArtifactVersionRegistrationRequest,
     ArtifactVersionRequest,
     ArtifactVersionResponse,
     ArtifactVersionUpdate,
@@ -136,6 +139,7 @@ from zenml.models import (
     BaseFilter,
     BaseIdentifiedResponse,
     BaseResponse,
+    CachedStepRun,
     CodeReferenceRequest,
     CodeReferenceResponse,
     CodeRepositoryFilter,
@@ -193,6 +197,7 @@ from zenml.models import (
     PipelineRunResponse,
     PipelineRunUpdate,
     PipelineUpdate,
+    ResolvedStepInputs,
     RunMetadataFilter,
     RunMetadataRequest,
     RunMetadataResponse,
@@ -227,6 +232,7 @@ from zenml.models import (
     StackRequest,
     StackResponse,
     StackUpdate,
+    StepInputsQuery,
     StepRunFilter,
     StepRunRequest,
     StepRunResponse,
@@ -869,17 +875,24 @@ class SqlZenStore(BaseZenStore):
             The Domain Model representation of the DB resource
 
         Raises:
-            ValueError: if the filtered page number is out of bounds.
+            ValueError: if the filtered page number is out of bounds or a
+                cursor is used with a custom fetch.
             RuntimeError: if the schema does not have a `to_model` method.
         """
         query = filter_model.apply_filter(query=query, table=table)
 
+        if custom_fetch and filter_model.cursor:
+            raise ValueError(
+                "Cursor pagination is not supported for this resource."
+            )
+
         # Get the total amount of items in the database for a given query
         custom_fetch_result: Optional[List[Any]] = None
+        total: Optional[int] = None
         if custom_fetch:
             custom_fetch_result = custom_fetch(session, query, filter_model)
             total = len(custom_fetch_result)
-        else:
+        elif not filter_model.skip_count:
             total = session.scalar(
                 select([func.count("*")]).select_from(
                     query.options(noload("*")).subquery()
@@ -899,12 +912,18 @@ class SqlZenStore(BaseZenStore):
         query = query.order_by(sort_clause, asc(table.id))
 
         # Get the total amount of pages in the database for a given query
-        if total == 0:
+        if total is None:
+            total_pages = None
+        elif total == 0:
             total_pages = 1
         else:
             total_pages = math.ceil(total / filter_model.size)
 
-        if filter_model.page > total_pages:
+        if (
+            total_pages is not None
+            and filter_model.page > total_pages
+            and not filter_model.cursor
+        ):
             raise ValueError(
                 f"Invalid page {filter_model.page}. The requested page size is "
                 f"{filter_model.size} and there are a total of {total} items "
@@ -921,14 +940,40 @@ class SqlZenStore(BaseZenStore):
             item_schemas = item_schemas[
                 filter_model.offset : filter_model.offset + filter_model.size
             ]
+            has_more = filter_model.page < (total_pages or 0)
         else:
+            # Instead of skipping the items of previous pages, the items
+            # after the cursor are selected if a cursor is given. This allows
+            # the database to seek to the first item using an index.
+            cursor_filter = filter_model.generate_cursor_filter(table=table)
+            if cursor_filter is not None:
+                query = query.where(cursor_filter)
+            else:
+                query = query.offset(filter_model.offset)
+
+            # Fetch one additional item to find out whether there are more
+            # items after this page.
             item_schemas = (
-                session.exec(
-                    query.limit(filter_model.size).offset(filter_model.offset)
-                )
-                .unique()
-                .all()
+                session.exec(query.limit(filter_model.size + 1)).unique().all()
             )
+            has_more = len(item_schemas) > filter_model.size
+            item_schemas = item_schemas[: filter_model.size]
+
+        if total is None or total_pages is None:
+            # Without counting, the totals are estimated from the items up to
+            # this page and whether more items exist.
+            if not item_schemas and filter_model.page > 1:
+                raise ValueError(
+                    f"Invalid page {filter_model.page}. There are no items "
+                    f"on this page for the requested page size "
+                    f"{filter_model.size}."
+                )
+            total = filter_model.offset + len(item_schemas) + int(has_more)
+            total_pages = filter_model.page + int(has_more)
+
+        next_cursor = None
+        if has_more and not custom_fetch:
+            next_cursor = filter_model.create_cursor(item_schemas[-1])
 
         # Convert this page of items from schemas to models.
         items: List[AnyResponse] = []
@@ -954,6 +999,7 @@ class SqlZenStore(BaseZenStore):
             items=items,
             index=filter_model.page,
             max_size=filter_model.size,
+            next_cursor=next_cursor,
         )
 
     # ====================================
@@ -2170,6 +2216,16 @@ class SqlZenStore(BaseZenStore):
 
             # Create the artifact.
             artifact_schema = ArtifactSchema.from_request(artifact)
+            session.add(artifact_schema)
+            try:
+                session.commit()
+            except IntegrityError:
+                # The artifact was created concurrently in the meantime
+                session.rollback()
+                raise EntityExistsError(
+                    f"Unable to create artifact with name '{artifact.name}': "
+                    "An artifact with the same name already exists."
+                )
 
             # Save tags of the artifact.
             if artifact.tags:
@@ -2179,8 +2235,7 @@ class SqlZenStore(BaseZenStore):
                     resource_type=TaggableResourceTypes.ARTIFACT,
                 )
 
-            session.add(artifact_schema)
-            session.commit()
+            session.refresh(artifact_schema)
             return artifact_schema.to_model(include_metadata=True)
 
     def get_artifact(
@@ -2307,43 +2362,20 @@ class SqlZenStore(BaseZenStore):
 
         Returns:
             The created artifact version.
-
-        Raises:
-            EntityExistsError: if an artifact with the same name and version
-                already exists.
         """
         with Session(self.engine) as session:
-            # Check if an artifact with the given name and version exists
-            def _check(tolerance: int = 0) -> None:
-                query = session.exec(
-                    select(ArtifactVersionSchema)
-                    .where(
-                        ArtifactVersionSchema.artifact_id
-                        == artifact_version.artifact_id
-                    )
-                    .where(
-                        ArtifactVersionSchema.version
-                        == artifact_version.version
-                    )
-                )
-                existing_artifact = query.fetchmany(tolerance + 1)
-                if (
-                    existing_artifact is not None
-                    and len(existing_artifact) > tolerance
-                ):
-                    raise EntityExistsError(
-                        f"Unable to create artifact with name "
-                        f"'{existing_artifact[0].artifact.name}' and version "
-                        f"'{artifact_version.version}': An artifact with the same "
-                        "name and version already exists."
-                    )
+            self._reserve_artifact_version(
+                artifact_id=artifact_version.artifact_id,
+                version=artifact_version.version,
+                session=session,
+            )
 
-            _check()
             # Create the artifact version.
             artifact_version_schema = ArtifactVersionSchema.from_request(
                 artifact_version
             )
             session.add(artifact_version_schema)
+            session.flush()
 
             # Save visualizations of the artifact.
             if artifact_version.visualizations:
@@ -2360,16 +2392,302 @@ class SqlZenStore(BaseZenStore):
                     tag_names=artifact_version.tags,
                     resource_id=artifact_version_schema.id,
                     resource_type=TaggableResourceTypes.ARTIFACT_VERSION,
+                    session=session,
                 )
 
+            session.commit()
+            session.refresh(artifact_version_schema)
+            return artifact_version_schema.to_model(include_metadata=True)
+
+    def register_artifact_versions(
+        self, artifact_versions: List[ArtifactVersionRegistrationRequest]
+    ) -> List[ArtifactVersionResponse]:
+        """Registers a batch of artifact versions.
+
+        For each artifact version, this creates the artifact if it doesn't
+        exist yet, assigns the next version number if no version was given,
+        stores the artifact version metadata and links the artifact version
+        to the step run that saved it. The artifacts, their tags and all
+        artifact versions of the batch are registered in a single transaction.
+
+        Args:
+            artifact_versions: The artifact versions to register.
+
+        Returns:
+            The registered artifact versions, in the order of the requests.
+        """
+        artifact_version_schemas: Dict[int, ArtifactVersionSchema] = {}
+        artifact_ids: Dict[str, UUID] = {}
+
+        with Session(self.engine) as session:
+            if self.config.driver == SQLDatabaseDriver.SQLITE:
+                # The SQLite driver only opens a transaction before the first
+                # write, which would turn the savepoints used to create the
+                # artifacts into separately committed transactions.
+                session.execute(text("BEGIN"))
+
+            # Process the requests ordered by artifact name so that concurrent
+            # batches always lock the artifacts in the same order.
+            for index, request in sorted(
+                enumerate(artifact_versions), key=lambda x: x[1].artifact_name
+            ):
+                if request.artifact_name not in artifact_ids:
+                    artifact_ids[request.artifact_name] = (
+                        self._get_or_create_artifact(
+                            name=request.artifact_name,
+                            has_custom_name=request.has_custom_name,
+                            tags=request.tags,
+                            session=session,
+                        )
+                    )
+                artifact_id = artifact_ids[request.artifact_name]
+
+                version = self._reserve_artifact_version(
+                    artifact_id=artifact_id,
+                    version=request.version,
+                    session=session,
+                )
+
+                # Create the artifact version.
+                artifact_version_schema = ArtifactVersionSchema.from_request(
+                    ArtifactVersionRequest(
+                        user=request.user,
+                        workspace=request.workspace,
+                        artifact_id=artifact_id,
+                        version=version,
+                        has_custom_name=request.has_custom_name,
+                        type=request.type,
+                        artifact_store_id=request.artifact_store_id,
+                        uri=request.uri,
+                        materializer=request.materializer,
+                        data_type=request.data_type,
+                    )
+                )
+                session.add(artifact_version_schema)
+                session.flush()
+                artifact_version_schemas[index] = artifact_version_schema
+
+                # Save tags of the artifact version.
+                if request.tags:
+                    self._attach_tags_to_resource(
+                        tag_names=request.tags,
+                        resource_id=artifact_version_schema.id,
+                        resource_type=TaggableResourceTypes.ARTIFACT_VERSION,
+                        session=session,
+                    )
+
+                # Save visualizations of the artifact version.
+                for vis in request.visualizations or []:
+                    session.add(
+                        ArtifactVisualizationSchema.from_model(
+                            artifact_visualization_request=vis,
+                            artifact_version_id=artifact_version_schema.id,
+                        )
+                    )
+
+                # Save metadata of the artifact version.
+                for key, value in request.metadata_values.items():
+                    session.add(
+                        RunMetadataSchema(
+                            workspace_id=request.workspace,
+                            user_id=request.user,
+                            resource_id=artifact_version_schema.id,
+                            resource_type=(
+                                MetadataResourceTypes.ARTIFACT_VERSION.value
+                            ),
+                            key=key,
+                            value=json.dumps(value),
+                            type=request.metadata_types[key],
+                        )
+                    )
+
+                # Link the artifact version to the step run that saved it.
+                if request.step_run_id:
+                    self._set_run_step_output_artifact(
+                        step_run_id=request.step_run_id,
+                        artifact_version_id=artifact_version_schema.id,
+                        name=request.artifact_name,
+                        output_type=StepRunOutputArtifactType.MANUAL,
+                        session=session,
+                    )
+
+            session.commit()
+
+            responses = []
+            for index in range(len(artifact_versions)):
+                artifact_version_schema = artifact_version_schemas[index]
+                session.refresh(artifact_version_schema)
+                responses.append(
+                    artifact_version_schema.to_model(include_metadata=True)
+                )
+            return responses
+
+    def _reserve_artifact_version(
+        self,
+        artifact_id: UUID,
+        version: Optional[Union[str, int]],
+        session: Session,
+    ) -> Union[str, int]:
+        """Reserves a version of an artifact.
+
+        If no version is given, the next version number is allocated.
+        Explicit numeric versions raise the version counter of the artifact so
+        that later auto-assigned version numbers don't collide with them.
+        Either way, the artifact is locked until the transaction ends, which
+        makes the existence check safe against concurrent registrations.
+
+        Args:
+            artifact_id: The ID of the artifact.
+            version: The requested version, or None to use the next version
+                number.
+            session: The session in which to reserve the version.
+
+        Returns:
+            The reserved version.
+
+        Raises:
+            EntityExistsError: if the artifact already has a version with the
+                same name.
+        """
+        if version is None:
+            version = self._allocate_version_number(
+                schema=ArtifactSchema, resource_id=artifact_id, session=session
+            )
+        else:
             try:
-                _check(1)
-                session.commit()
-            except EntityExistsError as e:
-                session.rollback()
-                raise e
+                version_number = int(version)
+            except ValueError:
+                version_number = 0
+            self._allocate_version_number(
+                schema=ArtifactSchema,
+                resource_id=artifact_id,
+                session=session,
+                version_number=version_number,
+            )
 
-            return artifact_version_schema.to_model(include_metadata=True)
+        existing_version = session.exec(
+            select(ArtifactVersionSchema)
+            .where(ArtifactVersionSchema.artifact_id == artifact_id)
+            .where(ArtifactVersionSchema.version == str(version))
+            .with_for_update()
+        ).first()
+        if existing_version is not None:
+            raise EntityExistsError(
+                f"Unable to create artifact with name "
+                f"'{existing_version.artifact.name}' and version "
+                f"'{version}': An artifact with the same name and version "
+                "already exists."
+            )
+        return version
+
+    def _get_or_create_artifact(
+        self,
+        name: str,
+        has_custom_name: bool,
+        tags: Optional[List[str]],
+        session: Session,
+    ) -> UUID:
+        """Gets or creates an artifact inside an ongoing transaction.
+
+        The artifact is inserted in a savepoint. If the insert violates the
+        unique artifact name constraint because the artifact was created
+        concurrently, only the savepoint is rolled back and the artifact
+        created by the other transaction is used instead.
+
+        Args:
+            name: The name of the artifact.
+            has_custom_name: Whether the artifact name is custom.
+            tags: Tags to attach to the artifact if it gets created.
+            session: The session in which to get or create the artifact.
+
+        Returns:
+            The ID of the artifact.
+        """
+        artifact = session.exec(
+            select(ArtifactSchema).where(ArtifactSchema.name == name)
+        ).first()
+
+        if artifact is None:
+            artifact_request = ArtifactRequest(
+                name=name, has_custom_name=has_custom_name, tags=tags
+            )
+            validate_name(artifact_request)
+            new_artifact = ArtifactSchema.from_request(artifact_request)
+            try:
+                with session.begin_nested():
+                    session.add(new_artifact)
+            except IntegrityError:
+                # The artifact was created concurrently in the meantime. The
+                # locking read makes sure we see the committed row even if
+                # the isolation level uses a snapshot taken earlier.
+                artifact = session.exec(
+                    select(ArtifactSchema)
+                    .where(ArtifactSchema.name == name)
+                    .with_for_update()
+                ).one()
+            else:
+                if tags:
+                    self._attach_tags_to_resource(
+                        tag_names=tags,
+                        resource_id=new_artifact.id,
+                        resource_type=TaggableResourceTypes.ARTIFACT,
+                        session=session,
+                    )
+                return new_artifact.id
+
+        if artifact.has_custom_name != has_custom_name:
+            artifact.update(ArtifactUpdate(has_custom_name=has_custom_name))
+            session.add(artifact)
+        return artifact.id
+
+    @staticmethod
+    def _allocate_version_number(
+        schema: Union[Type[ArtifactSchema], Type[ModelSchema]],
+        resource_id: UUID,
+        session: Session,
+        version_number: Optional[int] = None,
+    ) -> int:
+        """Atomically allocates a version number of an artifact or model.
+
+        The version counter is updated in the row of the artifact or model,
+        which locks this row until the transaction ends. Concurrent
+        allocations for the same artifact or model therefore wait for each
+        other instead of assigning the same version number.
+
+        Args:
+            schema: The schema of the artifact or model.
+            resource_id: The ID of the artifact or model.
+            session: The session in which to allocate the version number.
+            version_number: An explicitly requested version number. If given,
+                the counter is only raised to this number if it is larger
+                than all previously assigned numbers.
+
+        Returns:
+            The allocated version number.
+        """
+        counter = schema.latest_version_number
+        new_value: Any
+        if version_number is None:
+            new_value = counter + 1
+        else:
+            new_value = case(
+                (counter < version_number, version_number), else_=counter
+            )
+
+        session.execute(
+            update(schema)
+            .where(schema.id == resource_id)
+            .values(latest_version_number=new_value)
+            .execution_options(synchronize_session=False)
+        )
+        if version_number is not None:
+            return version_number
+
+        return session.exec(
+            select(schema.latest_version_number).where(
+                schema.id == resource_id
+            )
+        ).one()
 
     def get_artifact_version(
         self, artifact_version_id: UUID, hydrate: bool = True
@@ -4471,6 +4789,17 @@ class SqlZenStore(BaseZenStore):
         """
         with Session(self.engine) as session:
             query = select(PipelineRunSchema)
+            if not hydrate:
+                # Unhydrated runs only need the relationships of their
+                # deployment, so we skip loading the potentially large
+                # configuration columns.
+                query = query.options(
+                    selectinload(PipelineRunSchema.deployment).options(
+                        defer(PipelineDeploymentSchema.pipeline_configuration),
+                        defer(PipelineDeploymentSchema.step_configurations),
+                        defer(PipelineDeploymentSchema.client_environment),
+                    )
+                )
             return self.filter_and_paginate(
                 session=session,
                 query=query,
@@ -6982,6 +7311,195 @@ class SqlZenStore(BaseZenStore):
                 hydrate=hydrate,
             )
 
+    def get_latest_cached_step_run(
+        self,
+        workspace_id: UUID,
+        cache_key: str,
+        allowed_pipeline_run_ids: Optional[Set[UUID]] = None,
+        authenticated_user_id: Optional[UUID] = None,
+    ) -> Optional[CachedStepRun]:
+        """Get the latest completed step run with a given cache key.
+
+        Args:
+            workspace_id: The ID of the workspace in which to search.
+            cache_key: The cache key of the step run.
+            allowed_pipeline_run_ids: If given, only step runs of these
+                pipeline runs, step runs owned by the authenticated user and
+                server-owned step runs are considered.
+            authenticated_user_id: ID of the authenticated user.
+
+        Returns:
+            The latest step run with the cache key if one exists.
+        """
+        with Session(self.engine) as session:
+            query = (
+                select(StepRunSchema.id, StepRunSchema.pipeline_run_id)
+                .where(StepRunSchema.workspace_id == workspace_id)
+                .where(StepRunSchema.cache_key == cache_key)
+                .where(StepRunSchema.status == ExecutionStatus.COMPLETED)
+            )
+            if allowed_pipeline_run_ids is not None:
+                query = query.where(
+                    or_(
+                        col(StepRunSchema.pipeline_run_id).in_(
+                            allowed_pipeline_run_ids
+                        ),
+                        col(StepRunSchema.user_id).is_(None),
+                        StepRunSchema.user_id == authenticated_user_id,
+                    )
+                )
+            step_run = session.exec(
+                query.order_by(desc(StepRunSchema.created)).limit(1)
+            ).first()
+            if step_run is None:
+                return None
+
+            step_run_id, pipeline_run_id = step_run
+            outputs = session.exec(
+                select(
+                    StepRunOutputArtifactSchema.name,
+                    StepRunOutputArtifactSchema.artifact_id,
+                ).where(StepRunOutputArtifactSchema.step_id == step_run_id)
+            ).all()
+
+            return CachedStepRun(
+                id=step_run_id,
+                pipeline_run_id=pipeline_run_id,
+                outputs={name: artifact_id for name, artifact_id in outputs},
+            )
+
+    def resolve_step_inputs(
+        self, pipeline_run_id: UUID, query: StepInputsQuery
+    ) -> ResolvedStepInputs:
+        """Resolve the inputs of a step in a pipeline run.
+
+        Args:
+            pipeline_run_id: The ID of the pipeline run of the step.
+            query: The step outputs, upstream steps and external artifact
+                versions to resolve.
+
+        Returns:
+            The resolved inputs.
+
+        Raises:
+            KeyError: If the pipeline run or one of the external artifact
+                versions doesn't exist.
+        """
+        step_names = set(query.upstream_steps)
+        step_names.update(step_name for step_name, _ in query.step_outputs)
+
+        with Session(self.engine) as session:
+            if not session.exec(
+                select(PipelineRunSchema.id).where(
+                    PipelineRunSchema.id == pipeline_run_id
+                )
+            ).first():
+                raise KeyError(
+                    f"Unable to get pipeline run with ID {pipeline_run_id}: "
+                    f"No pipeline run with this ID found."
+                )
+
+            step_run_ids: Dict[str, UUID] = {}
+            if step_names:
+                step_run_ids = dict(
+                    session.exec(
+                        select(StepRunSchema.name, StepRunSchema.id)
+                        .where(
+                            StepRunSchema.pipeline_run_id == pipeline_run_id
+                        )
+                        .where(col(StepRunSchema.name).in_(step_names))
+                    ).all()
+                )
+
+            # Load the relationships needed to convert the artifact versions
+            # to models with one query per relationship instead of lazily
+            # loading them for each artifact version.
+            artifact_version_options = [
+                selectinload(ArtifactVersionSchema.artifact).selectinload(
+                    ArtifactSchema.versions
+                ),
+                selectinload(ArtifactVersionSchema.user),
+                selectinload(ArtifactVersionSchema.tags).selectinload(
+                    TagResourceSchema.tag
+                ),
+                selectinload(
+                    ArtifactVersionSchema.output_of_step_runs
+                ).selectinload(StepRunOutputArtifactSchema.step_run),
+            ]
+
+            step_outputs: Dict[str, Dict[str, ArtifactVersionResponse]] = {}
+            if step_run_ids and query.step_outputs:
+                step_names_by_id = {
+                    step_run_id: step_name
+                    for step_name, step_run_id in step_run_ids.items()
+                }
+                requested_outputs = set(query.step_outputs)
+                output_schemas = session.exec(
+                    select(StepRunOutputArtifactSchema)
+                    .options(
+                        selectinload(
+                            StepRunOutputArtifactSchema.artifact_version
+                        ).options(*artifact_version_options)
+                    )
+                    .where(
+                        col(StepRunOutputArtifactSchema.step_id).in_(
+                            step_names_by_id
+                        )
+                    )
+                    .where(
+                        col(StepRunOutputArtifactSchema.name).in_(
+                            {
+                                output_name
+                                for _, output_name in requested_outputs
+                            }
+                        )
+                    )
+                ).all()
+                for output_schema in output_schemas:
+                    step_name = step_names_by_id[output_schema.step_id]
+                    if (step_name, output_schema.name) in requested_outputs:
+                        step_outputs.setdefault(step_name, {})[
+                            output_schema.name
+                        ] = output_schema.artifact_version.to_model()
+
+            external_artifacts: Dict[UUID, ArtifactVersionResponse] = {}
+            if query.external_artifact_ids:
+                artifact_versions = session.exec(
+                    select(ArtifactVersionSchema)
+                    .options(
+                        *artifact_version_options,
+                        selectinload(ArtifactVersionSchema.workspace),
+                        selectinload(ArtifactVersionSchema.visualizations),
+                        selectinload(ArtifactVersionSchema.run_metadata),
+                    )
+                    .where(
+                        col(ArtifactVersionSchema.id).in_(
+                            query.external_artifact_ids
+                        )
+                    )
+                ).all()
+                external_artifacts = {
+                    artifact_version.id: artifact_version.to_model(
+                        include_metadata=True
+                    )
+                    for artifact_version in artifact_versions
+                }
+                missing_ids = set(query.external_artifact_ids).difference(
+                    external_artifacts
+                )
+                if missing_ids:
+                    raise KeyError(
+                        f"Unable to get artifact versions with IDs "
+                        f"{sorted(str(id_) for id_ in missing_ids)}: No "
+                        f"artifact versions with these IDs found."
+                    )
+
+            return ResolvedStepInputs(
+                step_run_ids=step_run_ids,
+                step_outputs=step_outputs,
+                external_artifacts=external_artifacts,
+            )
+
     def update_run_step(
         self,
         step_run_id: UUID,
@@ -7246,24 +7764,35 @@ class SqlZenStore(BaseZenStore):
             pipeline_run_id: The ID of the pipeline run to update.
             session: The database session to use.
         """
-        from zenml.orchestrators.publish_utils import get_pipeline_run_status
+        from zenml.orchestrators.publish_utils import (
+            get_pipeline_run_status_from_counts,
+        )
 
         pipeline_run = session.exec(
             select(PipelineRunSchema).where(
                 PipelineRunSchema.id == pipeline_run_id
             )
         ).one()
-        step_runs = session.exec(
-            select(StepRunSchema).where(
-                StepRunSchema.pipeline_run_id == pipeline_run_id
+        step_status_counts = session.exec(
+            select(  # type: ignore[call-overload]
+                StepRunSchema.status, func.count(StepRunSchema.id)
             )
+            .where(StepRunSchema.pipeline_run_id == pipeline_run_id)
+            .group_by(StepRunSchema.status)
         ).all()
 
         # Deployment always exists for pipeline runs of newer versions
-        assert pipeline_run.deployment
-        num_steps = len(pipeline_run.deployment.to_model().step_configurations)
-        new_status = get_pipeline_run_status(
-            step_statuses=[step_run.status for step_run in step_runs],
+        assert pipeline_run.deployment_id
+        num_steps = session.exec(
+            select(PipelineDeploymentSchema.step_count).where(
+                PipelineDeploymentSchema.id == pipeline_run.deployment_id
+            )
+        ).one()
+        new_status = get_pipeline_run_status_from_counts(
+            step_status_counts={
+                ExecutionStatus(status): count
+                for status, count in step_status_counts
+            },
             num_steps=num_steps,
         )
 
@@ -7288,6 +7817,7 @@ class SqlZenStore(BaseZenStore):
                     start_time_str = None
                     duration_seconds = None
 
+                assert pipeline_run.deployment
                 stack = pipeline_run.deployment.stack
                 assert stack
                 stack_metadata = {
@@ -8866,31 +9396,11 @@ class SqlZenStore(BaseZenStore):
             model_version_ = model_version.copy()
             model = self.get_model(model_version_.model)
 
-            def _check(tolerance: int = 0) -> None:
-                query = session.exec(
-                    select(ModelVersionSchema)
-                    .where(ModelVersionSchema.model_id == model.id)
-                    .where(ModelVersionSchema.name == model_version_.name)
-                )
-                existing_model_version = query.fetchmany(tolerance + 1)
-                if (
-                    existing_model_version is not None
-                    and len(existing_model_version) > tolerance
-                ):
-                    raise EntityExistsError(
-                        f"Unable to create model version {model_version_.name}: "
-                        f"A model version with this name already exists in {model.name} model."
-                    )
-
-            _check()
-            all_versions = session.exec(
-                select(ModelVersionSchema)
-                .where(ModelVersionSchema.model_id == model.id)
-                .order_by(ModelVersionSchema.number.desc())  # type: ignore[attr-defined]
-            ).first()
-
-            model_version_.number = (
-                all_versions.number + 1 if all_versions else 1
+            # Allocating the version number locks the model until the
+            # transaction ends, which also makes the existence check below
+            # safe against concurrent model version creations.
+            model_version_.number = self._allocate_version_number(
+                schema=ModelSchema, resource_id=model.id, session=session
             )
 
             if model_version_.name is None:
@@ -8898,10 +9408,24 @@ class SqlZenStore(BaseZenStore):
             else:
                 validate_name(model_version_)
 
+            existing_model_version = session.exec(
+                select(ModelVersionSchema.id)
+                .where(ModelVersionSchema.model_id == model.id)
+                .where(ModelVersionSchema.name == model_version_.name)
+                .with_for_update()
+            ).first()
+            if existing_model_version is not None:
+                raise EntityExistsError(
+                    f"Unable to create model version {model_version_.name}: "
+                    f"A model version with this name already exists in "
+                    f"{model.name} model."
+                )
+
             model_version_schema = ModelVersionSchema.from_request(
                 model_version_
             )
             session.add(model_version_schema)
+            session.commit()
 
             if model_version_.tags:
                 self._attach_tags_to_resource(
@@ -8909,13 +9433,8 @@ class SqlZenStore(BaseZenStore):
                     resource_id=model_version_schema.id,
                     resource_type=TaggableResourceTypes.MODEL_VERSION,
                 )
-            try:
-                _check(1)
-                session.commit()
-            except EntityExistsError as e:
-                session.rollback()
-                raise e
 
+            session.refresh(model_version_schema)
             return model_version_schema.to_model(include_metadata=True)
 
     def get_model_version(
@@ -9390,6 +9909,7 @@ class SqlZenStore(BaseZenStore):
         tag_names: List[str],
         resource_id: UUID,
         resource_type: TaggableResourceTypes,
+        session: Optional[Session] = None,
     ) -> None:
         """Creates a tag<>resource link if not present.
 
@@ -9397,7 +9917,53 @@ class SqlZenStore(BaseZenStore):
             tag_names: The list of names of the tags.
             resource_id: The id of the resource.
             resource_type: The type of the resource to create link with.
-        """
+            session: If given, missing tags and links are added to this
+                session without committing, so that they become part of its
+                transaction. Missing tags are created in a savepoint, so that
+                a tag created concurrently doesn't roll back the transaction.
+        """
+        if session is not None:
+            for tag_name in tag_names:
+                tag_schema = session.exec(
+                    select(TagSchema).where(TagSchema.name == tag_name)
+                ).first()
+                if tag_schema is None:
+                    tag_request = TagRequest(name=tag_name)
+                    validate_name(tag_request)
+                    new_tag = TagSchema.from_request(tag_request)
+                    try:
+                        with session.begin_nested():
+                            session.add(new_tag)
+                        tag_schema = new_tag
+                    except IntegrityError:
+                        # The tag was created concurrently in the meantime.
+                        # Only the savepoint is rolled back, the rest of the
+                        # transaction is unaffected.
+                        tag_schema = session.exec(
+                            select(TagSchema)
+                            .where(TagSchema.name == tag_name)
+                            .with_for_update()
+                        ).one()
+
+                existing_tag_resource = session.exec(
+                    select(TagResourceSchema).where(
+                        TagResourceSchema.tag_id == tag_schema.id,
+                        TagResourceSchema.resource_id == resource_id,
+                        TagResourceSchema.resource_type == resource_type.value,
+                    )
+                ).first()
+                if existing_tag_resource is None:
+                    session.add(
+                        TagResourceSchema.from_request(
+                            TagResourceRequest(
+                                tag_id=tag_schema.id,
+                                resource_id=resource_id,
+                                resource_type=resource_type,
+                            )
+                        )
+                    )
+            return
+
         for tag_name in tag_names:
             try:
                 tag = self.get_tag(tag_name)
@@ -14,7 +14,7 @@
 """ZenML Store interface."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple, Union
+from typing import List, Optional, Set, Tuple, Union
 from uuid import UUID
 
 from zenml.models import (
@@ -28,10 +28,12 @@ from zenml.models import (
     ArtifactResponse,
     ArtifactUpdate,
     ArtifactVersionFilter,
+    ArtifactVersionRegistrationRequest,
     ArtifactVersionRequest,
     ArtifactVersionResponse,
     ArtifactVersionUpdate,
     ArtifactVisualizationResponse,
+    CachedStepRun,
     CodeReferenceResponse,
     CodeRepositoryFilter,
     CodeRepositoryRequest,
@@ -82,6 +84,7 @@ from zenml.models import (
     PipelineRunResponse,
     PipelineRunUpdate,
     PipelineUpdate,
+    ResolvedStepInputs,
     RunMetadataFilter,
     RunMetadataRequest,
     RunMetadataResponse,
@@ -114,6 +117,7 @@ from zenml.models import (
     StackRequest,
     StackResponse,
     StackUpdate,
+    StepInputsQuery,
     StepRunFilter,
     StepRunRequest,
     StepRunResponse,
@@ -568,6 +572,24 @@ class ZenStoreInterface(ABC):
             The created artifact version.
         """
 
+    @abstractmethod
+    def register_artifact_versions(
+        self, artifact_versions: List[ArtifactVersionRegistrationRequest]
+    ) -> List[ArtifactVersionResponse]:
+        """Registers a batch of artifact versions.
+
+        For each artifact version, this creates the artifact if it doesn't
+        exist yet, assigns the next version number if no version was given,
+        stores the artifact version metadata and links the artifact version
+        to the step run that saved it.
+
+        Args:
+            artifact_versions: The artifact versions to register.
+
+        Returns:
+            The registered artifact versions, in the order of the requests.
+        """
+
     @abstractmethod
     def get_artifact_version(
         self, artifact_version_id: UUID, hydrate: bool = True
@@ -2163,6 +2185,47 @@ class ZenStoreInterface(ABC):
             A list of all step runs matching the filter criteria.
         """
 
+    @abstractmethod
+    def get_latest_cached_step_run(
+        self,
+        workspace_id: UUID,
+        cache_key: str,
+        allowed_pipeline_run_ids: Optional[Set[UUID]] = None,
+        authenticated_user_id: Optional[UUID] = None,
+    ) -> Optional[CachedStepRun]:
+        """Get the latest completed step run with a given cache key.
+
+        Args:
+            workspace_id: The ID of the workspace in which to search.
+            cache_key: The cache key of the step run.
+            allowed_pipeline_run_ids: If given, only step runs of these
+                pipeline runs, step runs owned by the authenticated user and
+                server-owned step runs are considered.
+            authenticated_user_id: ID of the authenticated user.
+
+        Returns:
+            The latest step run with the cache key if one exists.
+        """
+
+    @abstractmethod
+    def resolve_step_inputs(
+        self, pipeline_run_id: UUID, query: StepInputsQuery
+    ) -> ResolvedStepInputs:
+        """Resolve the inputs of a step in a pipeline run.
+
+        Args:
+            pipeline_run_id: The ID of the pipeline run of the step.
+            query: The step outputs, upstream steps and external artifact
+                versions to resolve.
+
+        Returns:
+            The resolved inputs.
+
+        Raises:
+            KeyError: If the pipeline run or one of the external artifact
+                versions doesn't exist.
+        """
+
     @abstractmethod
     def update_run_step(
         self,
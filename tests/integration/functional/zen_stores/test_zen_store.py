@@ -86,7 +86,9 @@ from zenml.models import (
     APIKeyRequest,
     APIKeyRotateRequest,
     APIKeyUpdate,
+    ArtifactFilter,
     ArtifactVersionFilter,
+    ArtifactVersionRegistrationRequest,
     ArtifactVersionRequest,
     ArtifactVersionResponse,
     ComponentFilter,
@@ -108,6 +110,7 @@ from zenml.models import (
     StackFilter,
     StackRequest,
     StackUpdate,
+    StepInputsQuery,
     StepRunFilter,
     StepRunUpdate,
     TagFilter,
@@ -118,6 +121,7 @@ from zenml.models import (
     UserResponse,
     UserUpdate,
     WorkspaceFilter,
+    WorkspaceRequest,
     WorkspaceUpdate,
 )
 from zenml.models.v2.core.artifact import ArtifactRequest
@@ -376,6 +380,60 @@ def test_deleting_default_workspace_fails():
         client.zen_store.delete_workspace(DEFAULT_NAME)
 
 
+@pytest.mark.parametrize("sort_by", ["asc:name", "desc:name", "desc:created"])
+def test_cursor_pagination(clean_client: "Client", sort_by: str):
+    """Tests that cursor pagination returns the same items as page numbers."""
+    zen_store = clean_client.zen_store
+    for i in range(7):
+        zen_store.create_workspace(WorkspaceRequest(name=f"workspace_{i}"))
+
+    expected = [
+        workspace.id
+        for workspace in zen_store.list_workspaces(
+            WorkspaceFilter(sort_by=sort_by, size=100)
+        ).items
+    ]
+
+    page = zen_store.list_workspaces(WorkspaceFilter(sort_by=sort_by, size=3))
+    first_cursor = page.next_cursor
+    items = [workspace.id for workspace in page.items]
+    while page.next_cursor:
+        page = zen_store.list_workspaces(
+            WorkspaceFilter(
+                sort_by=sort_by,
+                size=3,
+                page=page.index + 1,
+                cursor=page.next_cursor,
+            )
+        )
+        assert page.total == len(expected)
+        items += [workspace.id for workspace in page.items]
+
+    assert items == expected
+    assert page.index == page.total_pages == 3
+
+    with pytest.raises(ValueError):
+        zen_store.list_workspaces(
+            WorkspaceFilter(sort_by="asc:updated", cursor=first_cursor)
+        )
+
+
+def test_pagination_without_count(clean_client: "Client"):
+    """Tests that the total is estimated if counting is skipped."""
+    zen_store = clean_client.zen_store
+    for i in range(4):
+        zen_store.create_workspace(WorkspaceRequest(name=f"workspace_{i}"))
+
+    page = zen_store.list_workspaces(WorkspaceFilter(size=2, skip_count=True))
+    assert (page.total, page.total_pages) == (3, 2)
+
+    page = zen_store.list_workspaces(
+        WorkspaceFilter(size=2, page=3, skip_count=True)
+    )
+    assert (page.total, page.total_pages) == (5, 3)
+    assert page.next_cursor is None
+
+
 #  .------.
 # | USERS |
 # '-------'
@@ -2922,6 +2980,38 @@ def test_get_run_step_outputs_succeeds():
             assert len(run_step_outputs) == 1
 
 
+def test_get_latest_cached_step_run_filters_allowed_runs(clean_client):
+    """Tests that the cached step run lookup respects the allowed runs."""
+    store = clean_client.zen_store
+
+    with PipelineRunContext(1) as runs:
+        step = store.list_run_steps(
+            StepRunFilter(pipeline_run_id=runs[0].id, name="step_2")
+        ).items[0]
+        step = store.get_run_step(step.id)
+
+        def _get(**kwargs):
+            return store.get_latest_cached_step_run(
+                workspace_id=step.workspace.id,
+                cache_key=step.cache_key,
+                **kwargs,
+            )
+
+        assert _get().id == step.id
+        assert _get(allowed_pipeline_run_ids={runs[0].id}).id == step.id
+        assert (
+            _get(
+                allowed_pipeline_run_ids=set(),
+                authenticated_user_id=step.user.id,
+            ).id
+            == step.id
+        )
+        assert (
+            _get(allowed_pipeline_run_ids=set(), authenticated_user_id=uuid4())
+            is None
+        )
+
+
 def test_get_run_step_inputs_succeeds():
     """Tests getting run step inputs."""
     client = Client()
@@ -2934,6 +3024,56 @@ def test_get_run_step_inputs_succeeds():
             assert len(run_step_inputs) == 1
 
 
+def test_resolve_step_inputs_succeeds():
+    """Tests resolving step inputs returns only the queried entities."""
+    client = Client()
+    store = client.zen_store
+
+    with PipelineRunContext(2) as runs:
+        run = runs[0]
+        steps = {
+            step.name: step
+            for step in store.list_run_steps(
+                StepRunFilter(pipeline_run_id=run.id)
+            ).items
+        }
+        output_name, output = next(iter(steps["step_1"].outputs.items()))
+        external_artifact = store.get_run_step(
+            store.list_run_steps(
+                StepRunFilter(pipeline_run_id=runs[1].id, name="step_1")
+            )[0].id
+        ).outputs[output_name]
+
+        inputs = store.resolve_step_inputs(
+            pipeline_run_id=run.id,
+            query=StepInputsQuery(
+                upstream_steps=["step_1"],
+                step_outputs=[
+                    ("step_1", output_name),
+                    ("step_1", "non_existent"),
+                    ("non_existent", output_name),
+                ],
+                external_artifact_ids=[external_artifact.id],
+            ),
+        )
+
+        assert inputs.step_run_ids == {"step_1": steps["step_1"].id}
+        assert list(inputs.step_outputs) == ["step_1"]
+        assert inputs.step_outputs["step_1"][output_name].id == output.id
+        assert list(inputs.external_artifacts) == [external_artifact.id]
+
+        with pytest.raises(KeyError):
+            store.resolve_step_inputs(
+                pipeline_run_id=run.id,
+                query=StepInputsQuery(external_artifact_ids=[uuid.uuid4()]),
+            )
+
+        with pytest.raises(KeyError):
+            store.resolve_step_inputs(
+                pipeline_run_id=uuid.uuid4(), query=StepInputsQuery()
+            )
+
+
 # .-----------.
 # | Artifacts |
 # '-----------'
@@ -2987,6 +3127,58 @@ def test_artifacts_are_not_deleted_with_run(clean_client: "Client"):
         assert artifacts.total == num_artifact_versions_before + num_runs * 2
 
 
+def test_register_artifact_versions_is_atomic(clean_client: "Client"):
+    """Tests that a failed batch registration doesn't leave anything behind."""
+    store = clean_client.zen_store
+
+    def _request(version, tags, artifact_name="batch_artifact"):
+        return ArtifactVersionRegistrationRequest(
+            artifact_name=artifact_name,
+            version=version,
+            tags=tags,
+            type=ArtifactType.DATA,
+            uri=sample_name("batch_artifact"),
+            materializer=Source(module="acme.foo", type=SourceType.INTERNAL),
+            data_type=Source(module="acme.foo", type=SourceType.INTERNAL),
+            user=clean_client.active_user.id,
+            workspace=clean_client.active_workspace.id,
+        )
+
+    (first,) = store.register_artifact_versions([_request("1", None)])
+
+    with pytest.raises(EntityExistsError):
+        store.register_artifact_versions(
+            [_request(None, ["batch_tag"]), _request("1", None)]
+        )
+
+    assert (
+        store.list_artifact_versions(
+            ArtifactVersionFilter(artifact_id=first.artifact.id)
+        ).total
+        == 1
+    )
+    with pytest.raises(KeyError):
+        store.get_tag("batch_tag")
+
+    # New artifacts of a failed batch are not created either
+    with pytest.raises(EntityExistsError):
+        store.register_artifact_versions(
+            [
+                _request(None, ["batch_tag"], artifact_name="aa_artifact"),
+                _request("1", None),
+            ]
+        )
+    assert store.list_artifacts(ArtifactFilter(name="aa_artifact")).total == 0
+    with pytest.raises(KeyError):
+        store.get_tag("batch_tag")
+
+    (second,) = store.register_artifact_versions(
+        [_request(None, ["batch_tag"])]
+    )
+    assert second.version == "2"
+    assert [tag.name for tag in second.tags] == ["batch_tag"]
+
+
 def test_artifact_create_fails_with_invalid_name(clean_client: "Client"):
     """Tests that artifact creation fails with an invalid name."""
     store = clean_client.zen_store
@@ -0,0 +1,149 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Unit tests for kube_utils.py."""
+
+import datetime
+from unittest.mock import MagicMock
+
+from zenml.integrations.kubernetes.orchestrators import kube_utils
+
+
+def _log_response(chunks):
+    """Creates a mock response of a streaming pod log request."""
+    response = MagicMock()
+    response.stream.return_value = iter(chunks)
+    return response
+
+
+def _pod(phase: str):
+    pod = MagicMock()
+    pod.status.phase = phase
+    return pod
+
+
+def test_parse_log_line():
+    """Tests parsing log lines that are prefixed with timestamps."""
+    assert kube_utils._parse_log_line(
+        "2024-05-06T10:12:41.518273123Z some message"
+    ) == (datetime.datetime(2024, 5, 6, 10, 12, 41, 518273), "some message")
+    assert kube_utils._parse_log_line("2024-05-06T10:12:41Z message") == (
+        datetime.datetime(2024, 5, 6, 10, 12, 41),
+        "message",
+    )
+    assert kube_utils._parse_log_line("no timestamp") == (
+        None,
+        "no timestamp",
+    )
+
+
+def test_stream_pod_logs_logs_each_line_once(mocker):
+    """Tests that logs are streamed with a single request and lines that are
+    split across chunks are logged once."""
+    core_api = MagicMock()
+    core_api.read_namespaced_pod_log.return_value = _log_response(
+        [
+            b"2024-05-06T10:00:00.1Z first\n2024-05-06T10:00:00.2Z sec",
+            b"ond\n2024-05-06T10:00:00.3Z third\n",
+        ]
+    )
+    mocker.patch.object(kube_utils, "get_pod", return_value=_pod("Succeeded"))
+    mock_logger = mocker.patch.object(kube_utils, "logger")
+
+    kube_utils.stream_pod_logs(
+        core_api_fn=lambda: core_api, pod_name="pod", namespace="ns"
+    )
+
+    core_api.read_namespaced_pod_log.assert_called_once()
+    assert core_api.read_namespaced_pod_log.call_args.kwargs["follow"]
+    assert [c.args[0] for c in mock_logger.info.call_args_list] == [
+        "first",
+        "second",
+        "third",
+    ]
+
+
+def test_stream_pod_logs_resumes_interrupted_stream(mocker):
+    """Tests that an interrupted log stream is resumed without logging lines
+    twice."""
+    core_api = MagicMock()
+    core_api.read_namespaced_pod_log.side_effect = [
+        _log_response(
+            [b"2024-05-06T10:00:00.1Z first\n2024-05-06T10:00:00.2Z second\n"]
+        ),
+        _log_response(
+            [
+                b"2024-05-06T10:00:00.1Z first\n2024-05-06T10:00:00.2Z second\n"
+                b"2024-05-06T10:00:00.3Z third\n"
+            ]
+        ),
+    ]
+    mocker.patch.object(
+        kube_utils,
+        "get_pod",
+        side_effect=[_pod("Running"), _pod("Succeeded")],
+    )
+    mocker.patch.object(kube_utils.time, "sleep")
+    mock_logger = mocker.patch.object(kube_utils, "logger")
+
+    kube_utils.stream_pod_logs(
+        core_api_fn=lambda: core_api, pod_name="pod", namespace="ns"
+    )
+
+    assert core_api.read_namespaced_pod_log.call_count == 2
+    assert core_api.read_namespaced_pod_log.call_args.kwargs["since_seconds"]
+    assert [c.args[0] for c in mock_logger.info.call_args_list] == [
+        "first",
+        "second",
+        "third",
+    ]
+
+
+def test_stream_pod_logs_resumes_lines_with_same_timestamp(mocker):
+    """Tests that resuming a log stream only skips as many lines with the
+    last timestamp as were logged before."""
+    core_api = MagicMock()
+    core_api.read_namespaced_pod_log.side_effect = [
+        _log_response(
+            [
+                b"2024-05-06T10:00:00.1Z first\n"
+                b"2024-05-06T10:00:00.2000001Z second\n"
+            ]
+        ),
+        _log_response(
+            [
+                b"2024-05-06T10:00:00.1Z first\n"
+                b"2024-05-06T10:00:00.2000001Z second\n"
+                b"2024-05-06T10:00:00.2000002Z third\n"
+                b"2024-05-06T10:00:00.3Z fourth\n"
+            ]
+        ),
+    ]
+    mocker.patch.object(
+        kube_utils,
+        "get_pod",
+        side_effect=[_pod("Running"), _pod("Succeeded")],
+    )
+    mocker.patch.object(kube_utils.time, "sleep")
+    mock_logger = mocker.patch.object(kube_utils, "logger")
+
+    kube_utils.stream_pod_logs(
+        core_api_fn=lambda: core_api, pod_name="pod", namespace="ns"
+    )
+
+    assert [c.args[0] for c in mock_logger.info.call_args_list] == [
+        "first",
+        "second",
+        "third",
+        "fourth",
+    ]
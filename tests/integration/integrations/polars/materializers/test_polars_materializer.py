@@ -12,11 +12,14 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import os
 
 import polars
+import pytest
 from polars import testing as polars_testing
 
 from tests.unit.test_general import _test_materializer
+from zenml.artifacts.artifact_load_config import ArtifactLoadConfig
 from zenml.integrations.polars.materializers.dataframe_materializer import (
     PolarsMaterializer,
 )
@@ -44,3 +47,64 @@ def test_polars_materializer():
             polars_testing.assert_frame_equal(example, result)
         else:
             polars_testing.assert_series_equal(example, result)
+
+
+def test_polars_materializer_metadata():
+    """Test the metadata extraction of the polars materializer."""
+    dataframe = polars.DataFrame(
+        {"numbers": [1, 2, None, 4], "text": ["a", "b", "c", "d"]}
+    )
+
+    metadata = PolarsMaterializer(uri="").extract_metadata(dataframe)
+
+    assert metadata["shape"] == (4, 2)
+    assert metadata["dtype"] == {"numbers": "Int64", "text": "String"}
+    assert metadata["mean"] == {"numbers": dataframe["numbers"].mean()}
+    assert metadata["std"]["numbers"] == pytest.approx(
+        dataframe["numbers"].std()
+    )
+    assert metadata["min"] == {"numbers": 1.0}
+    assert metadata["max"] == {"numbers": 4.0}
+
+
+def test_polars_materializer_metadata_is_computed_in_chunks(mocker):
+    """Tests that chunked column statistics match the polars statistics."""
+    mocker.patch(
+        "zenml.integrations.polars.materializers.dataframe_materializer."
+        "DEFAULT_CHUNK_SIZE",
+        3,
+    )
+    dataframe = polars.DataFrame({"numbers": [1, None, 5, 7, 2, 9, None, 4]})
+
+    metadata = PolarsMaterializer(uri="").extract_metadata(dataframe)
+
+    assert metadata["mean"]["numbers"] == pytest.approx(
+        dataframe["numbers"].mean()
+    )
+    assert metadata["std"]["numbers"] == pytest.approx(
+        dataframe["numbers"].std()
+    )
+    assert metadata["min"] == {"numbers": 1.0}
+    assert metadata["max"] == {"numbers": 9.0}
+
+
+def test_polars_materializer_load_config(clean_client):
+    """Test loading only parts of polars data."""
+    artifact_store = clean_client.active_stack.artifact_store
+    uri = os.path.join(artifact_store.path, "polars_load_config_test")
+    artifact_store.makedirs(uri)
+    dataframe = polars.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    materializer = PolarsMaterializer(uri=uri)
+    materializer.save(dataframe)
+
+    result = materializer.load_with_config(
+        polars.DataFrame,
+        ArtifactLoadConfig(columns=["b"], filters=[("a", "in", [1, 3])]),
+    )
+    polars_testing.assert_frame_equal(
+        result, polars.DataFrame({"b": ["x", "z"]})
+    )
+
+    lazy_frame = materializer.load(polars.LazyFrame)
+    assert isinstance(lazy_frame, polars.LazyFrame)
+    polars_testing.assert_frame_equal(lazy_frame.collect(), dataframe)
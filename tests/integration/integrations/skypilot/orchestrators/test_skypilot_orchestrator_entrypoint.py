@@ -0,0 +1,72 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from uuid import uuid4
+
+import pytest
+
+from zenml.enums import ExecutionStatus
+
+
+def test_skypilot_entrypoint_fails_on_failed_step(mocker):
+    """Tests that a failed step fails the orchestration, skips downstream
+    steps and deprovisions its cluster."""
+    from zenml.integrations.skypilot.flavors.skypilot_orchestrator_base_vm_config import (
+        SkypilotBaseOrchestratorSettings,
+    )
+    from zenml.integrations.skypilot.orchestrators import (
+        skypilot_orchestrator_entrypoint as entrypoint,
+    )
+    from zenml.integrations.skypilot.orchestrators.skypilot_base_vm_orchestrator import (
+        SkypilotBaseOrchestrator,
+    )
+
+    deployment = mocker.MagicMock(id=uuid4())
+    deployment.step_configurations = {
+        "step_1": mocker.MagicMock(spec=["spec"]),
+        "step_2": mocker.MagicMock(spec=["spec"]),
+    }
+    deployment.step_configurations["step_1"].spec.upstream_steps = []
+    deployment.step_configurations["step_2"].spec.upstream_steps = ["step_1"]
+
+    orchestrator = mocker.MagicMock(spec=SkypilotBaseOrchestrator)
+    orchestrator.get_settings.return_value = SkypilotBaseOrchestratorSettings()
+    orchestrator.sanitize_cluster_name.side_effect = lambda name: name
+
+    run = mocker.MagicMock(id=uuid4())
+    run.steps = {"step_1": mocker.MagicMock(status=ExecutionStatus.FAILED)}
+
+    client = mocker.MagicMock()
+    client.get_deployment.return_value = deployment
+    client.active_stack.orchestrator = orchestrator
+    client.active_stack.container_registry.credentials = None
+    client.list_pipeline_runs.return_value = [run]
+    client.get_pipeline_run.return_value = run
+
+    mocker.patch.object(entrypoint, "Client", return_value=client)
+    mocker.patch.object(
+        entrypoint,
+        "parse_args",
+        return_value=mocker.MagicMock(deployment_id=deployment.id),
+    )
+    mocker.patch.object(entrypoint, "get_config_environment_vars", dict)
+    mocker.patch.object(SkypilotBaseOrchestrator, "get_image")
+    mocker.patch.object(entrypoint.time, "sleep")
+    sky = mocker.patch.object(entrypoint, "sky")
+
+    with pytest.raises(RuntimeError, match="step_1"):
+        entrypoint.main()
+
+    # Only the failed step was launched, its downstream step was skipped
+    assert sky.launch.call_count == 1
+    assert sky.down.called
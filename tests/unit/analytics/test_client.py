@@ -0,0 +1,164 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from uuid import uuid4
+
+import pytest
+
+from zenml.analytics import source_context
+from zenml.analytics.client import Client
+from zenml.analytics.enums import AnalyticsEvent
+from zenml.enums import SourceContextTypes
+
+
+class _StubAnalyticsServer(HTTPServer):
+    """Local HTTP server that records the batches it receives."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.batches = []
+        self.delay = delay
+        super().__init__(("127.0.0.1", 0), _StubAnalyticsHandler)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _StubAnalyticsHandler(BaseHTTPRequestHandler):
+    def do_POST(self) -> None:
+        time.sleep(self.server.delay)
+        length = int(self.headers["content-length"])
+        self.server.batches.append(
+            (
+                self.path,
+                self.headers[source_context.name],
+                json.loads(self.rfile.read(length)),
+            )
+        )
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """Runs a stub analytics server in a background thread."""
+    server = _StubAnalyticsServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _track(client: Client) -> None:
+    client.track(
+        user_id=uuid4(),
+        event=AnalyticsEvent.RUN_PIPELINE,
+        properties={"key": "value"},
+    )
+
+
+def test_client_sends_events_in_batches(stub_server):
+    """Tests that queued events are sent in batches by the consumer."""
+    client = Client(host=stub_server.url, upload_interval=0.2)
+
+    for _ in range(5):
+        _track(client)
+    client.flush()
+
+    assert sum(len(batch) for _, _, batch in stub_server.batches) == 5
+    assert len(stub_server.batches) < 5
+    assert all(path == "/batch" for path, _, _ in stub_server.batches)
+    client.join()
+    assert not client.consumer.is_alive()
+
+
+def test_client_sends_source_context_of_calling_thread(stub_server):
+    """Tests that each batch is sent with the source context of the thread
+    that tracked the events."""
+    client = Client(host=stub_server.url, upload_interval=0.2)
+
+    token = source_context.set(SourceContextTypes.API)
+    try:
+        _track(client)
+    finally:
+        source_context.reset(token)
+    _track(client)
+    client.flush()
+
+    sources = sorted(source for _, source, _ in stub_server.batches)
+    assert sources == sorted(
+        [SourceContextTypes.API.value, SourceContextTypes.PYTHON.value]
+    )
+    client.join()
+
+
+def test_client_does_not_block_on_slow_server(stub_server):
+    """Tests that tracking an event returns without waiting for the server."""
+    stub_server.delay = 1.0
+    client = Client(host=stub_server.url, upload_interval=0.01)
+
+    start_time = time.monotonic()
+    success, _ = client.track(
+        user_id=uuid4(), event=AnalyticsEvent.RUN_PIPELINE, properties={}
+    )
+    assert success
+    assert time.monotonic() - start_time < 0.5
+    client.flush()
+    assert len(stub_server.batches) == 1
+    client.join()
+
+
+def test_client_drops_events_if_queue_is_full(stub_server):
+    """Tests that events are dropped instead of blocking if the queue is
+    full."""
+    stub_server.delay = 0.5
+    client = Client(
+        host=stub_server.url,
+        max_queue_size=1,
+        upload_size=1,
+        upload_interval=0.01,
+    )
+
+    results = []
+    for _ in range(5):
+        success, _ = client.track(
+            user_id=uuid4(), event=AnalyticsEvent.RUN_PIPELINE, properties={}
+        )
+        results.append(success)
+
+    assert not all(results)
+    client.flush()
+    assert len(stub_server.batches) == sum(results)
+    client.join()
+
+
+def test_client_does_not_send_if_disabled(stub_server):
+    """Tests that no events are sent if sending is disabled."""
+    client = Client(send=False, host=stub_server.url)
+
+    success, _ = client.track(
+        user_id=uuid4(), event=AnalyticsEvent.RUN_PIPELINE, properties={}
+    )
+
+    assert success
+    assert client.consumer is None
+    assert stub_server.batches == []
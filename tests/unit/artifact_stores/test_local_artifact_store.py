@@ -94,3 +94,38 @@ def test_local_artifact_store_only_supports_local_paths():
         updated=datetime.now(),
     )
     assert artifact_store.path == os.getcwd()
+
+
+def test_local_artifact_store_directory_transfers(tmp_path):
+    """Tests uploading and downloading directories."""
+    artifact_store = LocalArtifactStore(
+        name="",
+        id=uuid4(),
+        config=LocalArtifactStoreConfig(path=str(tmp_path / "store")),
+        flavor="default",
+        type=StackComponentType.ARTIFACT_STORE,
+        user=uuid4(),
+        workspace=uuid4(),
+        created=datetime.now(),
+        updated=datetime.now(),
+    )
+    source_dir = tmp_path / "source"
+    (source_dir / "shards").mkdir(parents=True)
+    for i in range(20):
+        (source_dir / "shards" / f"{i}.txt").write_text(str(i))
+    (source_dir / "info.json").write_text("{}")
+
+    remote_dir = os.path.join(artifact_store.path, "dataset")
+    artifact_store.put_dir(str(source_dir), remote_dir)
+    with pytest.raises(FileExistsError):
+        artifact_store.put_dir(str(source_dir), remote_dir)
+
+    download_dir = tmp_path / "download"
+    artifact_store.get_dir(remote_dir, str(download_dir))
+    assert (download_dir / "info.json").read_text() == "{}"
+    assert sorted(os.listdir(download_dir / "shards")) == sorted(
+        f"{i}.txt" for i in range(20)
+    )
+
+    with pytest.raises(FileNotFoundError):
+        artifact_store.put_dir(str(source_dir), str(tmp_path / "outside"))
@@ -20,16 +20,18 @@ import numpy as np
 import pytest
 
 from zenml.artifacts.utils import (
-    _get_new_artifact_version,
     _load_artifact_from_uri,
     load_artifact_from_response,
     load_model_from_metadata,
+    save_artifact,
     save_model_metadata,
 )
 from zenml.client import Client
 from zenml.constants import MODEL_METADATA_YAML_FILE_NAME
+from zenml.exceptions import EntityExistsError
 from zenml.materializers.numpy_materializer import NUMPY_FILENAME
-from zenml.models import ArtifactVersionResponse, Page
+from zenml.models import ArtifactVersionRequest, ArtifactVersionResponse
+from zenml.new.steps.step_context import StepContext
 
 
 @pytest.fixture
@@ -176,33 +178,66 @@ def test__load_artifact(numpy_file_uri):
     assert isinstance(artifact, np.ndarray)
 
 
-def test__get_new_artifact_version(mocker, sample_artifact_version_model):
-    """Unit test for the `_get_new_artifact_version` function."""
-    # If no artifact exists, "1" should be returned
-    mocker.patch(
-        "zenml.client.Client.list_artifact_versions",
-        return_value=Page(
-            index=1,
-            max_size=1,
-            total_pages=1,
-            total=0,
-            items=[],
-        ),
-    )
-    assert _get_new_artifact_version(sample_artifact_version_model.name) == 1
-
-    # If an artifact exists, the next version should be returned
-    mocker.patch(
-        "zenml.client.Client.list_artifact_versions",
-        return_value=Page(
-            index=1,
-            max_size=1,
-            total_pages=1,
-            total=1,
-            items=[sample_artifact_version_model],
-        ),
-    )
-    assert (
-        _get_new_artifact_version(sample_artifact_version_model.name)
-        == int(sample_artifact_version_model.version) + 1
+def test_save_artifact_assigns_versions(clean_client):
+    """Tests that saved artifacts get auto-incremented versions and that
+    existing versions can't be saved again."""
+    StepContext._clear()
+
+    first = save_artifact(1, name="versioned_artifact")
+    second = save_artifact(2, name="versioned_artifact")
+    assert first.version == "1"
+    assert second.version == "2"
+    assert second.artifact.id == first.artifact.id
+
+    custom = save_artifact(3, name="versioned_artifact", version="custom")
+    assert custom.version == "custom"
+    assert save_artifact(4, name="versioned_artifact").version == "3"
+
+    with pytest.raises(EntityExistsError):
+        save_artifact(5, name="versioned_artifact", version="custom")
+
+
+def test_save_artifact_after_creating_artifact_version(clean_client):
+    """Tests that explicitly created artifact versions raise the version
+    counter used for saved artifacts."""
+    StepContext._clear()
+
+    first = save_artifact(1, name="mixed_artifact")
+    clean_client.zen_store.create_artifact_version(
+        ArtifactVersionRequest(
+            artifact_id=first.artifact.id,
+            user=clean_client.active_user.id,
+            workspace=clean_client.active_workspace.id,
+            version="2",
+            type=first.type,
+            uri=f"{first.uri}_2",
+            materializer=first.materializer,
+            data_type=first.data_type,
+        )
     )
+    assert save_artifact(3, name="mixed_artifact").version == "3"
+
+    with pytest.raises(EntityExistsError):
+        clean_client.zen_store.create_artifact_version(
+            ArtifactVersionRequest(
+                artifact_id=first.artifact.id,
+                user=clean_client.active_user.id,
+                workspace=clean_client.active_workspace.id,
+                version="3",
+                type=first.type,
+                uri=f"{first.uri}_3",
+                materializer=first.materializer,
+                data_type=first.data_type,
+            )
+        )
+
+
+def test_save_artifact_with_stale_step_context(
+    clean_client, step_context_with_no_output
+):
+    """Tests that saving an artifact doesn't fail if the step context refers
+    to a step run that doesn't exist."""
+    artifact_version = save_artifact(1, name="stale_context_artifact")
+    assert artifact_version.version == "1"
+    assert artifact_version.producer_step_run_id is None
+    StepContext._clear()
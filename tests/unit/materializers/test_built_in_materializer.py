@@ -15,6 +15,8 @@ import os
 from tempfile import TemporaryDirectory
 from typing import Optional, Type
 
+import pytest
+
 from tests.unit.test_general import _test_materializer
 from zenml.client import Client
 from zenml.materializers.base_materializer import BaseMaterializer
@@ -230,3 +232,126 @@ def test_container_materializer_for_custom_types(
         assert result[0].myname == "aria"
         assert result[1].myname == "axl"
         assert result == example
+
+
+class UnregisteredType:
+    """Type without a materializer that gets pickled."""
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+
+class PackedContainerMaterializer(BuiltInContainerMaterializer):
+    SKIP_REGISTRATION = True
+    PACK_ELEMENTS = True
+
+
+def test_container_materializer_packs_elements(clean_client: "Client"):
+    """Tests that numpy arrays and pickled objects are packed into files if
+    enabled."""
+    import numpy as np
+
+    example = [np.arange(i) for i in range(20)]
+    example += [UnregisteredType(i) for i in range(20)]
+    example.append(CustomType())
+    with TemporaryDirectory(
+        dir=clean_client.active_stack.artifact_store.path
+    ) as artifact_uri:
+        materializer = PackedContainerMaterializer(uri=artifact_uri)
+        materializer.save(example)
+
+        assert sorted(os.listdir(artifact_uri)) == [
+            "40",
+            "elements.npy",
+            "elements.pkl",
+            "metadata.json",
+        ]
+
+        result = materializer.load(list)
+
+    assert len(result) == len(example)
+    for i in range(20):
+        np.testing.assert_array_equal(result[i], example[i])
+        assert isinstance(result[20 + i], UnregisteredType)
+        assert result[20 + i].value == i
+    assert result[-1] == example[-1]
+
+
+def test_container_materializer_without_packing(clean_client: "Client"):
+    """Tests that elements are saved in separate directories by default."""
+    import numpy as np
+
+    example = (np.arange(3), UnregisteredType(1))
+    with TemporaryDirectory(
+        dir=clean_client.active_stack.artifact_store.path
+    ) as artifact_uri:
+        materializer = BuiltInContainerMaterializer(uri=artifact_uri)
+        materializer.save(example)
+
+        assert sorted(os.listdir(artifact_uri)) == ["0", "1", "metadata.json"]
+
+        result = materializer.load(tuple)
+
+    np.testing.assert_array_equal(result[0], example[0])
+    assert result[1].value == 1
+
+
+def test_container_materializer_lazy_loading(clean_client: "Client", mocker):
+    """Tests that elements are only loaded on access if lazy loading is
+    enabled."""
+    import numpy as np
+
+    from zenml.materializers.built_in_materializer import LazyElementSequence
+
+    class LazyContainerMaterializer(PackedContainerMaterializer):
+        SKIP_REGISTRATION = True
+        LAZY_LOAD = True
+
+    example = [np.arange(i) for i in range(100)] + [CustomType()]
+    with TemporaryDirectory(
+        dir=clean_client.active_stack.artifact_store.path
+    ) as artifact_uri:
+        materializer = LazyContainerMaterializer(uri=artifact_uri)
+        materializer.save(example)
+        load_elements = mocker.spy(materializer, "_load_elements")
+
+        result = materializer.load(list)
+        assert isinstance(result, LazyElementSequence)
+        assert len(result) == len(example)
+        assert load_elements.call_count == 0
+
+        np.testing.assert_array_equal(result[5], example[5])
+        np.testing.assert_array_equal(result[-2], example[-2])
+        assert load_elements.call_count == 2
+        np.testing.assert_array_equal(result[5], example[5])
+        assert load_elements.call_count == 2
+
+        elements = list(result)
+        assert result[-1] == example[-1]
+
+    for element, expected in zip(elements[:-1], example[:-1]):
+        np.testing.assert_array_equal(element, expected)
+    with pytest.raises(IndexError):
+        result[len(example)]
+
+
+def test_lazy_element_sequence_equality():
+    """Tests comparing lazily loaded elements with other sequences."""
+    import numpy as np
+
+    from zenml.materializers.built_in_materializer import LazyElementSequence
+
+    def _sequence(elements):
+        return LazyElementSequence(
+            length=len(elements),
+            load_elements=lambda indices: {i: elements[i] for i in indices},
+        )
+
+    assert _sequence([1, 2, 3]) == [1, 2, 3]
+    assert _sequence([1, 2, 3]) != [1, 2]
+    assert _sequence([1, 2, 3]) != (1, 2, 4)
+
+    # Elements without a single truth value fall back to an identity
+    # comparison instead of raising
+    arrays = [np.arange(3), np.arange(4)]
+    assert not _sequence(arrays) == [array.copy() for array in arrays]
@@ -12,9 +12,18 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import os
+
 import numpy as np
+import pytest
 
 from tests.unit.test_general import _test_materializer
+from zenml.artifacts.artifact_load_config import ArtifactLoadConfig
+from zenml.constants import (
+    ENV_ZENML_ARTIFACT_CACHE_PATH,
+    ENV_ZENML_ARTIFACT_CACHE_SIZE_MB,
+    ENV_ZENML_NUMPY_MMAP_MODE,
+)
 from zenml.materializers.numpy_materializer import NumpyMaterializer
 from zenml.metadata.metadata_types import (
     DType,
@@ -84,3 +93,110 @@ def test_numpy_materializer():
     assert text_metadata["total_words"] == 7
     assert text_metadata["most_common_word"] == "world"
     assert text_metadata["most_common_count"] == 2
+
+
+def test_numpy_materializer_memory_mapped_loading(
+    clean_client, tmp_path, monkeypatch
+):
+    """Test that numpy arrays can be loaded as memory-mapped arrays."""
+    artifact_store = clean_client.active_stack.artifact_store
+    uri = os.path.join(artifact_store.path, "numpy_mmap_test")
+    artifact_store.makedirs(uri)
+    arr = np.arange(12, dtype=np.float32).reshape(3, 4)
+    NumpyMaterializer(uri=uri).save(arr)
+
+    monkeypatch.setenv(ENV_ZENML_NUMPY_MMAP_MODE, "r")
+    monkeypatch.setenv(ENV_ZENML_ARTIFACT_CACHE_PATH, str(tmp_path))
+
+    # Local artifact stores are mapped in place
+    loaded = NumpyMaterializer(uri=uri).load(np.ndarray)
+    assert isinstance(loaded, np.memmap)
+    assert loaded.filename == os.path.abspath(os.path.join(uri, "data.npy"))
+    assert np.array_equal(arr, loaded)
+
+    # Remote artifact stores are mapped from a cached local copy
+    monkeypatch.setattr(
+        "zenml.materializers.base_materializer.io_utils.is_remote",
+        lambda path: True,
+    )
+    materializer = NumpyMaterializer(uri=uri)
+    loaded = materializer.load(np.ndarray)
+    assert isinstance(loaded, np.memmap)
+    assert loaded.filename.startswith(str(tmp_path))
+    assert np.array_equal(arr, loaded)
+    assert materializer.load(np.ndarray).filename == loaded.filename
+
+    # Arrays of Python objects are loaded into memory
+    object_arr = np.array([{"a": 1}, None], dtype=object)
+    NumpyMaterializer(uri=uri).save(object_arr)
+    monkeypatch.undo()
+    monkeypatch.setenv(ENV_ZENML_NUMPY_MMAP_MODE, "c")
+    loaded = NumpyMaterializer(uri=uri).load(np.ndarray)
+    assert not isinstance(loaded, np.memmap)
+    assert loaded[0] == {"a": 1}
+
+
+def test_numpy_materializer_artifact_cache_eviction(
+    clean_client, tmp_path, monkeypatch
+):
+    """Test that the least recently used cached arrays are evicted."""
+    artifact_store = clean_client.active_stack.artifact_store
+    uris = []
+    for i in range(3):
+        uri = os.path.join(artifact_store.path, f"numpy_cache_test_{i}")
+        artifact_store.makedirs(uri)
+        # Each array takes a bit more than 400KB on disk
+        NumpyMaterializer(uri=uri).save(np.zeros(50_000) + i)
+        uris.append(uri)
+
+    monkeypatch.setenv(ENV_ZENML_NUMPY_MMAP_MODE, "r")
+    monkeypatch.setenv(ENV_ZENML_ARTIFACT_CACHE_PATH, str(tmp_path))
+    monkeypatch.setenv(ENV_ZENML_ARTIFACT_CACHE_SIZE_MB, "1")
+    monkeypatch.setattr(
+        "zenml.materializers.base_materializer.io_utils.is_remote",
+        lambda path: True,
+    )
+
+    first = NumpyMaterializer(uri=uris[0]).load(np.ndarray).filename
+    second = NumpyMaterializer(uri=uris[1]).load(np.ndarray).filename
+    # Make sure the first array is the least recently used one
+    os.utime(first, (0, 0))
+    third = NumpyMaterializer(uri=uris[2]).load(np.ndarray).filename
+
+    assert not os.path.exists(first)
+    assert os.path.exists(second)
+    assert os.path.exists(third)
+    assert np.array_equal(
+        NumpyMaterializer(uri=uris[0]).load(np.ndarray), np.zeros(50_000)
+    )
+
+
+def test_numpy_materializer_memory_mapped_loading_with_load_config(
+    clean_client, monkeypatch
+):
+    """Test that the load config sets the memory-map mode per load."""
+    artifact_store = clean_client.active_stack.artifact_store
+    uri = os.path.join(artifact_store.path, "numpy_mmap_config_test")
+    artifact_store.makedirs(uri)
+    arr = np.arange(12, dtype=np.float32).reshape(3, 4)
+    NumpyMaterializer(uri=uri).save(arr)
+    monkeypatch.delenv(ENV_ZENML_NUMPY_MMAP_MODE, raising=False)
+
+    loaded = NumpyMaterializer(uri=uri).load_with_config(
+        np.ndarray, ArtifactLoadConfig(mmap_mode="c")
+    )
+    assert isinstance(loaded, np.memmap)
+    assert loaded.mode == "c"
+    assert np.array_equal(arr, loaded)
+
+    # The environment variable is used if the load config has no mode
+    monkeypatch.setenv(ENV_ZENML_NUMPY_MMAP_MODE, "r")
+    loaded = NumpyMaterializer(uri=uri).load_with_config(
+        np.ndarray, ArtifactLoadConfig()
+    )
+    assert loaded.mode == "r"
+
+    with pytest.raises(ValueError):
+        NumpyMaterializer(uri=uri).load_with_config(
+            np.ndarray, ArtifactLoadConfig(columns=["a"])
+        )
@@ -13,11 +13,17 @@
 #  permissions and limitations under the License.
 
 import datetime
+import os
 
 import pandas
+import pytest
 
 from tests.unit.test_general import _test_materializer
-from zenml.materializers.pandas_materializer import PandasMaterializer
+from zenml.artifacts.artifact_load_config import ArtifactLoadConfig
+from zenml.materializers.pandas_materializer import (
+    PandasMaterializer,
+    _compute_series_statistics,
+)
 
 
 def test_pandas_materializer():
@@ -100,3 +106,104 @@ def test_pandas_materializer_with_index():
         assert_visualization_exists=True,
     )
     assert df_datetime_indexed.equals(result)
+
+
+def test_pandas_materializer_load_config(clean_client):
+    """Test loading only parts of a dataframe with a load config."""
+    pytest.importorskip("pyarrow")
+    import pyarrow.dataset
+
+    artifact_store = clean_client.active_stack.artifact_store
+    uri = os.path.join(artifact_store.path, "pandas_load_config_test")
+    artifact_store.makedirs(uri)
+    dataframe = pandas.DataFrame(
+        {"a": [1, 2, 3], "b": ["x", "y", "z"], "c": [0.1, 0.2, 0.3]},
+        index=pandas.Index([10, 20, 30], name="id"),
+    )
+    materializer = PandasMaterializer(uri=uri)
+    materializer.save(dataframe)
+
+    result = materializer.load_with_config(
+        pandas.DataFrame,
+        ArtifactLoadConfig(columns=["a", "c"], filters=[("a", ">=", 2)]),
+    )
+    assert result.equals(dataframe.loc[[20, 30], ["a", "c"]])
+
+    dataset = materializer.load(pyarrow.dataset.Dataset)
+    assert isinstance(dataset, pyarrow.dataset.Dataset)
+    assert dataset.to_table(columns=["b"]).column("b").to_pylist() == [
+        "x",
+        "y",
+        "z",
+    ]
+
+    with pytest.raises(ValueError):
+        materializer.load_with_config(
+            pyarrow.dataset.Dataset, ArtifactLoadConfig(columns=["a"])
+        )
+
+
+def test_pandas_materializer_parquet_options(clean_client):
+    """Test writing dataframes with custom Parquet options."""
+    pytest.importorskip("pyarrow")
+    import pyarrow.dataset
+    import pyarrow.parquet
+
+    class ZstdPandasMaterializer(PandasMaterializer):
+        SKIP_REGISTRATION = True
+        PARQUET_COMPRESSION = "zstd"
+        PARQUET_ROW_GROUP_SIZE = 2
+        PARQUET_ROWS_PER_FILE = 4
+
+    artifact_store = clean_client.active_stack.artifact_store
+    dataframe = pandas.DataFrame(
+        {"a": range(10), "b": [str(i) for i in range(10)]},
+        index=pandas.RangeIndex(100, 110, name="id"),
+    )
+
+    uri = os.path.join(artifact_store.path, "pandas_dataset_test")
+    artifact_store.makedirs(uri)
+    materializer = ZstdPandasMaterializer(uri=uri)
+    materializer.save(dataframe)
+
+    files = materializer._get_parquet_dataset_files()
+    assert len(files) == 3
+    with artifact_store.open(files[0], "rb") as f:
+        metadata = pyarrow.parquet.ParquetFile(f).metadata
+    assert metadata.num_rows == 4
+    assert metadata.num_row_groups == 2
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+    assert materializer.load(pandas.DataFrame).equals(dataframe)
+    assert materializer.load_with_config(
+        pandas.DataFrame,
+        ArtifactLoadConfig(columns=["b"], filters=[("a", ">=", 7)]),
+    ).equals(dataframe.loc[107:, ["b"]])
+    assert materializer.load(pyarrow.dataset.Dataset).count_rows() == len(
+        dataframe
+    )
+
+    # Small dataframes are still written to a single file
+    uri = os.path.join(artifact_store.path, "pandas_single_file_test")
+    artifact_store.makedirs(uri)
+    materializer = ZstdPandasMaterializer(uri=uri)
+    materializer.save(dataframe.head(3))
+    assert artifact_store.exists(materializer.parquet_path)
+    assert materializer.load(pandas.DataFrame).equals(dataframe.head(3))
+
+
+def test_pandas_materializer_statistics_are_computed_in_chunks(mocker):
+    """Tests that chunked column statistics match the pandas statistics."""
+    mocker.patch(
+        "zenml.materializers.pandas_materializer.DEFAULT_CHUNK_SIZE", 3
+    )
+    for series in [
+        pandas.Series([1.5, None, -2.0, 4.0, 8.25, None, 3.0]),
+        pandas.Series([1, None, 5, 7, 2, 9, None, 4], dtype="Int64"),
+        pandas.Series([True, False, True, True, False]),
+    ]:
+        statistics = _compute_series_statistics(series)
+        assert statistics["mean"] == pytest.approx(float(series.mean()))
+        assert statistics["std"] == pytest.approx(float(series.std()))
+        assert statistics["min"] == float(series.min())
+        assert statistics["max"] == float(series.max())
@@ -245,3 +245,12 @@ def test_string_filter_model():
         filter_class=StrFilter,
         filter_value="a_random_string",
     )
+
+
+@pytest.mark.parametrize("cursor", ["invalid", "bnVsbA==", "e30="])
+def test_filter_model_invalid_cursor_fails(cursor: str):
+    """Test that invalid cursors are rejected when generating the filter."""
+    from zenml.zen_stores.schemas import UserSchema
+
+    with pytest.raises(ValueError):
+        SomeFilterModel(cursor=cursor).generate_cursor_filter(UserSchema)
@@ -12,8 +12,16 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
 from zenml.enums import StackComponentType
 from zenml.orchestrators import LocalOrchestratorFlavor
+from zenml.orchestrators.local.local_orchestrator import (
+    ENV_ZENML_LOCAL_ORCHESTRATOR_RUN_ID,
+)
 
 
 def test_local_orchestrator_flavor_attributes():
@@ -23,3 +31,64 @@ def test_local_orchestrator_flavor_attributes():
     flavor = LocalOrchestratorFlavor()
     assert flavor.type == StackComponentType.ORCHESTRATOR
     assert flavor.name == "local"
+
+
+def _get_deployment(dag):
+    """Creates a mock deployment with steps connected according to a DAG."""
+    deployment = MagicMock()
+    deployment.id = uuid4()
+    deployment.step_configurations = {}
+    for step_name, upstream_steps in dag.items():
+        step = MagicMock()
+        step.spec.upstream_steps = upstream_steps
+        deployment.step_configurations[step_name] = step
+    return deployment
+
+
+def test_local_orchestrator_runs_steps_in_parallel(mocker, local_orchestrator):
+    """Tests that the parallel mode runs each step in a separate process after
+    all its upstream steps have finished."""
+    executed_steps = []
+
+    def _run(command, **kwargs):
+        executed_steps.append(command[command.index("--step_name") + 1])
+        assert kwargs["env"][ENV_ZENML_LOCAL_ORCHESTRATOR_RUN_ID] == "run_id"
+        return MagicMock(returncode=0)
+
+    mocker.patch("subprocess.run", side_effect=_run)
+    deployment = _get_deployment(
+        {"a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"]}
+    )
+
+    local_orchestrator._orchestrator_run_id = "run_id"
+    local_orchestrator._run_steps_in_parallel(
+        deployment=deployment, environment={}, max_parallelism=2
+    )
+
+    assert sorted(executed_steps) == ["a", "b", "c", "d"]
+    assert executed_steps[0] == "a"
+    assert executed_steps[-1] == "d"
+
+
+def test_local_orchestrator_parallel_mode_fails_on_step_failure(
+    mocker, local_orchestrator
+):
+    """Tests that the parallel mode fails if a step process fails and doesn't
+    run the downstream steps."""
+    executed_steps = []
+
+    def _run(command, **kwargs):
+        step_name = command[command.index("--step_name") + 1]
+        executed_steps.append(step_name)
+        return MagicMock(returncode=1 if step_name == "a" else 0)
+
+    mocker.patch("subprocess.run", side_effect=_run)
+    deployment = _get_deployment({"a": [], "b": ["a"]})
+
+    local_orchestrator._orchestrator_run_id = "run_id"
+    with pytest.raises(RuntimeError):
+        local_orchestrator._run_steps_in_parallel(
+            deployment=deployment, environment={}
+        )
+
+    assert executed_steps == ["a"]
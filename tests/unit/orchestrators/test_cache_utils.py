@@ -21,8 +21,7 @@ import pytest
 from zenml.config.compiler import Compiler
 from zenml.config.source import Source
 from zenml.config.step_configurations import Step
-from zenml.enums import ExecutionStatus, SorterOps
-from zenml.models import Page
+from zenml.models import CachedStepRun
 from zenml.new.pipelines.pipeline import Pipeline
 from zenml.orchestrators import cache_utils
 from zenml.steps import Output, step
@@ -169,44 +168,24 @@ def test_generate_cache_key_considers_caching_parameters(
     assert key_1 != key_2
 
 
-def test_fetching_cached_step_run_queries_cache_candidates(
-    mocker, create_step_run
-):
+def test_fetching_cached_step_run_queries_cache_candidates(mocker):
     """Tests fetching a cached step run."""
-    mock_list_run_steps = mocker.patch(
-        "zenml.client.Client.list_run_steps",
-        return_value=Page(
-            index=1,
-            max_size=1,
-            total_pages=1,
-            total=0,
-            items=[],
-        ),
+    mock_get_cached_step_run = mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_latest_cached_step_run",
+        return_value=None,
     )
 
     assert cache_utils.get_cached_step_run(cache_key="cache_key") is None
 
-    cache_candidate = create_step_run()
-
-    mock_list_run_steps = mocker.patch(
-        "zenml.client.Client.list_run_steps",
-        return_value=Page(
-            index=1,
-            max_size=1,
-            total_pages=1,
-            total=1,
-            items=[cache_candidate],
-        ),
+    cache_candidate = CachedStepRun(
+        id=uuid4(), pipeline_run_id=uuid4(), outputs={"output": uuid4()}
     )
+    mock_get_cached_step_run.return_value = cache_candidate
 
     cached_step = cache_utils.get_cached_step_run(cache_key="cache_key")
     assert cached_step == cache_candidate
-    mock_list_run_steps.assert_called_with(
-        workspace_id=ANY,
-        cache_key="cache_key",
-        status=ExecutionStatus.COMPLETED,
-        sort_by=f"{SorterOps.DESCENDING}:created",
-        size=1,
+    mock_get_cached_step_run.assert_called_with(
+        workspace_id=ANY, cache_key="cache_key"
     )
 
 
@@ -268,4 +247,5 @@ def test_fetching_cached_step_run_uses_latest_candidate(
     assert response_2.created > response_1.created
 
     cached_step = cache_utils.get_cached_step_run(cache_key="cache_key")
-    assert cached_step == response_2
+    assert cached_step.id == response_2.id
+    assert cached_step.pipeline_run_id == new_run.id
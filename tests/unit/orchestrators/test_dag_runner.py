@@ -12,10 +12,19 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import threading
+import time
 from contextlib import ExitStack as does_not_raise
 from typing import Dict, List
 
-from zenml.orchestrators.dag_runner import ThreadedDagRunner, reverse_dag
+import pytest
+
+from zenml.orchestrators.dag_runner import (
+    NodeStatus,
+    ThreadedDagRunner,
+    get_critical_path_lengths,
+    reverse_dag,
+)
 
 
 def test_reverse_dag():
@@ -68,3 +77,105 @@ def test_dag_runner_multi_path():  # 3->(2, 5)->1
 def test_dag_runner_cyclic():
     """Test that nothing happens for cyclic graphs, and no error is raised."""
     _test_runner({1: [2], 2: [1]}, correct_results=[0])
+
+
+def test_get_critical_path_lengths():
+    """Test `dag_runner.get_critical_path_lengths()`."""
+    dag = {1: [], 2: [1], 3: [1], 4: [3], 5: [2, 4]}
+    assert get_critical_path_lengths(dag) == {1: 4, 2: 2, 3: 3, 4: 2, 5: 1}
+
+
+def test_dag_runner_respects_max_parallelism():
+    """Test that the runner never runs more nodes than allowed at once."""
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def run_fn(node):
+        with lock:
+            running.append(node)
+            max_running.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(node)
+
+    dag = {node: [] for node in range(10)}
+    runner = ThreadedDagRunner(dag, run_fn, max_parallelism=3)
+    runner.run()
+
+    assert max(max_running) <= 3
+    assert all(
+        state == NodeStatus.COMPLETED for state in runner.node_states.values()
+    )
+
+
+def test_dag_runner_rejects_invalid_max_parallelism():
+    """Test that the max parallelism needs to be positive."""
+    with pytest.raises(ValueError):
+        ThreadedDagRunner({1: []}, lambda node: None, max_parallelism=0)
+
+
+def _failing_run_fn(failing_node, executed_nodes):
+    """Creates a run function that fails for a single node."""
+
+    def run_fn(node):
+        executed_nodes.append(node)
+        if node == failing_node:
+            raise RuntimeError("Node failed.")
+
+    return run_fn
+
+
+def test_dag_runner_skips_downstream_nodes_of_failed_node():
+    """Test that nodes downstream of a failed node are skipped while other
+    nodes still run."""
+    executed_nodes = []
+    dag = {1: [], 2: [1], 3: [2], 4: []}
+    runner = ThreadedDagRunner(
+        dag, _failing_run_fn(1, executed_nodes), max_parallelism=1
+    )
+    runner.run()
+
+    assert sorted(executed_nodes) == [1, 4]
+    assert runner.failed_nodes == [1]
+    assert runner.node_states == {
+        1: NodeStatus.FAILED,
+        2: NodeStatus.SKIPPED,
+        3: NodeStatus.SKIPPED,
+        4: NodeStatus.COMPLETED,
+    }
+
+
+def test_dag_runner_fail_fast():
+    """Test that no new nodes are started after a failure when failing
+    fast."""
+    executed_nodes = []
+    dag = {1: [], 2: [], 3: []}
+    runner = ThreadedDagRunner(
+        dag,
+        _failing_run_fn(1, executed_nodes),
+        max_parallelism=1,
+        fail_fast=True,
+    )
+    runner.run()
+
+    assert executed_nodes == [1]
+    assert runner.node_states == {
+        1: NodeStatus.FAILED,
+        2: NodeStatus.SKIPPED,
+        3: NodeStatus.SKIPPED,
+    }
+
+
+def test_dag_runner_prioritizes_critical_path():
+    """Test that nodes with the longest downstream chain are started first."""
+    executed_nodes = []
+    dag = {1: [], 2: [], 3: [2], 4: [3]}
+    ThreadedDagRunner(
+        dag,
+        executed_nodes.append,
+        max_parallelism=1,
+        prioritize_critical_path=True,
+    ).run()
+
+    assert executed_nodes == [2, 3, 1, 4]
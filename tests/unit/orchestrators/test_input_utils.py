@@ -18,7 +18,7 @@ import pytest
 
 from zenml.config.step_configurations import Step
 from zenml.exceptions import InputResolutionError
-from zenml.models import Page
+from zenml.models import ResolvedStepInputs, StepInputsQuery
 from zenml.orchestrators import input_utils
 
 
@@ -33,9 +33,12 @@ def test_input_resolution(
     )
 
     mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        return_value=Page(
-            index=1, max_size=50, total_pages=1, total=1, items=[step_run]
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.resolve_step_inputs",
+        return_value=ResolvedStepInputs(
+            step_run_ids={"upstream_step": step_run.id},
+            step_outputs={
+                "upstream_step": {"output_name": sample_artifact_version_model}
+            },
         ),
     )
     step = Step.parse_obj(
@@ -64,10 +67,8 @@ def test_input_resolution(
 def test_input_resolution_with_missing_step_run(mocker):
     """Tests that input resolution fails if the upstream step run is missing."""
     mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        return_value=Page(
-            index=1, max_size=50, total_pages=1, total=0, items=[]
-        ),
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.resolve_step_inputs",
+        return_value=ResolvedStepInputs(),
     )
     step = Step.parse_obj(
         {
@@ -97,9 +98,9 @@ def test_input_resolution_with_missing_artifact(mocker, create_step_run):
     )
 
     mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        return_value=Page(
-            index=1, max_size=50, total_pages=1, total=1, items=[step_run]
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.resolve_step_inputs",
+        return_value=ResolvedStepInputs(
+            step_run_ids={"upstream_step": step_run.id}
         ),
     )
     step = Step.parse_obj(
@@ -122,36 +123,33 @@ def test_input_resolution_with_missing_artifact(mocker, create_step_run):
         input_utils.resolve_step_inputs(step=step, run_id=uuid4())
 
 
-def test_input_resolution_fetches_all_run_steps(
-    mocker, sample_artifact_version_model, create_step_run
+def test_input_resolution_queries_store_once(
+    mocker, sample_artifact_version_model
 ):
-    """Tests that input resolution fetches all step runs of the pipeline run."""
-    step_run = create_step_run(
-        step_run_name="upstream_step",
-        output_artifacts={"output_name": sample_artifact_version_model},
-    )
-    second_step_run = create_step_run(
-        step_run_name="other_step",
+    """Tests that input resolution resolves all inputs with a single store
+    call."""
+    external_artifact_id = uuid4()
+    mocker.patch(
+        "zenml.artifacts.external_artifact_config.ExternalArtifactConfiguration.get_artifact_version_id",
+        return_value=external_artifact_id,
     )
-    return_values = [
-        Page(index=1, max_size=1, total_pages=2, total=2, items=[step_run]),
-        Page(
-            index=2,
-            max_size=1,
-            total_pages=2,
-            total=2,
-            items=[second_step_run],
+    mock_resolve_step_inputs = mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.resolve_step_inputs",
+        return_value=ResolvedStepInputs(
+            step_run_ids={"upstream_step": uuid4(), "other_step": uuid4()},
+            step_outputs={
+                "upstream_step": {"output_name": sample_artifact_version_model}
+            },
+            external_artifacts={
+                external_artifact_id: sample_artifact_version_model
+            },
         ),
-    ]
-    mock_list_run_steps = mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        side_effect=return_values,
     )
     step = Step.parse_obj(
         {
             "spec": {
                 "source": "module.step_class",
-                "upstream_steps": ["upstream_step"],
+                "upstream_steps": ["upstream_step", "other_step"],
                 "inputs": {
                     "input_name": {
                         "step_name": "upstream_step",
@@ -159,12 +157,31 @@ def test_input_resolution_fetches_all_run_steps(
                     }
                 },
             },
-            "config": {"name": "step_name", "enable_cache": True},
+            "config": {
+                "name": "step_name",
+                "enable_cache": True,
+                "external_input_artifacts": {
+                    "external_input": {"id": external_artifact_id}
+                },
+            },
         }
     )
+    run_id = uuid4()
 
-    input_utils.resolve_step_inputs(step=step, run_id=uuid4())
+    input_artifacts, parent_ids = input_utils.resolve_step_inputs(
+        step=step, run_id=run_id
+    )
 
-    # `resolve_step_inputs(...)` depaginates the run steps so we fetch all
-    # step runs for the pipeline run
-    assert mock_list_run_steps.call_count == 2
+    mock_resolve_step_inputs.assert_called_once_with(
+        pipeline_run_id=run_id,
+        query=StepInputsQuery(
+            upstream_steps=["upstream_step", "other_step"],
+            step_outputs=[("upstream_step", "output_name")],
+            external_artifact_ids=[external_artifact_id],
+        ),
+    )
+    assert input_artifacts == {
+        "input_name": sample_artifact_version_model,
+        "external_input": sample_artifact_version_model,
+    }
+    assert len(parent_ids) == 2
@@ -12,15 +12,19 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+from typing import Dict, List, Tuple
 from uuid import uuid4
 
 import pytest
+from typing_extensions import Annotated
 
-from zenml import save_artifact
+from zenml import pipeline, save_artifact
+from zenml import step as new_step
 from zenml.artifacts.unmaterialized_artifact import UnmaterializedArtifact
 from zenml.config.pipeline_configurations import PipelineConfiguration
 from zenml.config.step_configurations import Step
 from zenml.config.step_run_info import StepRunInfo
+from zenml.constants import ENV_ZENML_OUTPUT_ARTIFACT_SAVE_PARALLELISM
 from zenml.models import PipelineRunResponse, StepRunResponse
 from zenml.orchestrators.step_launcher import StepRunner
 from zenml.stack import Stack
@@ -37,6 +41,23 @@ def failing_step() -> None:
     raise RuntimeError()
 
 
+@new_step
+def step_with_inputs(a: int, b: str) -> None:
+    pass
+
+
+@new_step
+def multiple_outputs_step() -> (
+    Tuple[
+        Annotated[int, "int_output"],
+        Annotated[str, "str_output"],
+        Annotated[List[int], "list_output"],
+        Annotated[Dict[str, int], "dict_output"],
+    ]
+):
+    return 1, "2", [3], {"4": 4}
+
+
 def test_running_a_successful_step(
     mocker,
     local_stack,
@@ -171,3 +192,63 @@ def test_loading_unmaterialized_input_artifact(local_stack, clean_client):
         artifact=artifact_response, data_type=UnmaterializedArtifact
     )
     assert artifact.dict() == artifact_response.dict()
+
+
+def test_saving_output_artifacts_in_parallel(clean_client, monkeypatch):
+    """Tests that output artifacts are saved correctly when saving them in
+    parallel."""
+    monkeypatch.setenv(ENV_ZENML_OUTPUT_ARTIFACT_SAVE_PARALLELISM, "4")
+
+    @pipeline
+    def test_pipeline():
+        multiple_outputs_step()
+
+    test_pipeline()
+
+    outputs = test_pipeline.model.last_run.steps[
+        "multiple_outputs_step"
+    ].outputs
+    assert {name: artifact.load() for name, artifact in outputs.items()} == {
+        "int_output": 1,
+        "str_output": "2",
+        "list_output": [3],
+        "dict_output": {"4": 4},
+    }
+
+
+def test_prefetching_input_artifacts(mocker, local_stack):
+    """Tests that prefetched input artifacts are used when parsing the step
+    inputs."""
+    step = Step.parse_obj(
+        {
+            "spec": {
+                "source": "tests.unit.orchestrators.test_step_runner.step_with_inputs",
+                "upstream_steps": [],
+            },
+            "config": {
+                "name": "step_name",
+            },
+        }
+    )
+    input_artifacts = {"a": mocker.Mock(), "b": mocker.Mock()}
+    values = {id(input_artifacts["a"]): 1, id(input_artifacts["b"]): "2"}
+    mock_load_input_artifact = mocker.patch.object(
+        StepRunner,
+        "_load_input_artifact",
+        side_effect=lambda artifact, data_type, load_config: values[
+            id(artifact)
+        ],
+    )
+
+    runner = StepRunner(step=step, stack=local_stack)
+    runner.prefetch_input_artifacts(
+        input_artifacts=input_artifacts, max_workers=2
+    )
+    function_params = runner._parse_inputs(
+        args=["a", "b"],
+        annotations={"a": int, "b": str},
+        input_artifacts=input_artifacts,
+    )
+
+    assert function_params == {"a": 1, "b": "2"}
+    assert mock_load_input_artifact.call_count == 2
@@ -18,8 +18,10 @@ from numpy import ndarray
 from typing_extensions import Annotated
 
 from zenml.artifacts.artifact_config import ArtifactConfig
+from zenml.artifacts.artifact_load_config import ArtifactLoadConfig
 from zenml.orchestrators.step_runner import OutputSignature
 from zenml.steps.utils import (
+    get_load_config_from_annotation_metadata,
     parse_return_type_annotations,
     resolve_type_annotation,
 )
@@ -324,3 +326,25 @@ def func_with_duplicate_output_name() -> (
 def test_invalid_step_output_annotations(func, exception):
     with pytest.raises(exception):
         parse_return_type_annotations(func)
+
+
+def test_load_config_from_input_annotation():
+    """Tests that load configs are extracted from input annotations."""
+    load_config = ArtifactLoadConfig(columns=["a"], filters=[("a", ">", 1)])
+
+    assert get_load_config_from_annotation_metadata(int) is None
+    assert (
+        get_load_config_from_annotation_metadata(Annotated[int, "x"]) is None
+    )
+    assert (
+        get_load_config_from_annotation_metadata(Annotated[int, load_config])
+        == load_config
+    )
+
+    with pytest.raises(ValueError):
+        get_load_config_from_annotation_metadata(
+            Annotated[int, load_config, load_config]
+        )
+
+    with pytest.raises(ValueError):
+        ArtifactLoadConfig(filters=[("a", "~", 1)])
@@ -0,0 +1,100 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import io
+import os
+import shutil
+import tarfile
+from uuid import uuid4
+
+from zenml.utils import code_utils, io_utils
+
+
+def _create_archive(files):
+    """Creates an in-memory tar archive containing the given files."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, content in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    buffer.seek(0)
+    return buffer
+
+
+def test_extracting_archive(tmp_path):
+    """Tests extracting an archive with stripped leading components and a
+    subdirectory."""
+    archive = _create_archive(
+        {
+            "repo-abc/README.md": b"readme",
+            "repo-abc/src/main.py": b"main",
+            "repo-abc/src/nested/util.py": b"util",
+            "repo-abc/../outside.py": b"outside",
+        }
+    )
+    code_utils.extract_archive(
+        fileobj=archive,
+        directory=str(tmp_path),
+        strip_components=1,
+        sub_directory="src",
+    )
+
+    assert (tmp_path / "main.py").read_bytes() == b"main"
+    assert (tmp_path / "nested" / "util.py").read_bytes() == b"util"
+    assert not (tmp_path / "README.md").exists()
+    assert not (tmp_path.parent / "outside.py").exists()
+
+
+def test_downloaded_code_gets_cached(clean_client, mocker, tmp_path):
+    """Tests that code only gets downloaded from the code repository once."""
+
+    def _download_code(commit, directory, repo_sub_directory):
+        with open(os.path.join(directory, "main.py"), "w") as f:
+            f.write("print('hello')")
+
+    code_repository = mocker.MagicMock(id=uuid4())
+    code_repository.download_code.side_effect = _download_code
+
+    for i in range(2):
+        directory = tmp_path / str(i)
+        directory.mkdir()
+        code_utils.download_code(
+            code_repository=code_repository,
+            commit="commit",
+            sub_directory=None,
+            directory=str(directory),
+        )
+        assert (directory / "main.py").read_text() == "print('hello')"
+
+    code_repository.download_code.assert_called_once()
+
+    # Remove the local cache to check that the code gets loaded from the
+    # artifact store
+    shutil.rmtree(
+        os.path.join(
+            io_utils.get_global_config_directory(),
+            code_utils.CODE_DOWNLOAD_CACHE_DIRECTORY_NAME,
+        )
+    )
+    directory = tmp_path / "from_artifact_store"
+    directory.mkdir()
+    code_utils.download_code(
+        code_repository=code_repository,
+        commit="commit",
+        sub_directory=None,
+        directory=str(directory),
+    )
+    assert (directory / "main.py").read_text() == "print('hello')"
+    code_repository.download_code.assert_called_once()
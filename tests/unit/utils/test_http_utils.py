@@ -0,0 +1,78 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import pytest
+
+from zenml.utils import http_utils
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected",
+    [
+        ("gzip, deflate", "gzip"),
+        ("br;q=1.0, gzip;q=0.8", "gzip"),
+        ("gzip;q=0", None),
+        ("deflate, br", None),
+        ("", None),
+    ],
+)
+def test_select_encoding(accept_encoding, expected):
+    """Tests selecting the content encoding from accepted encodings."""
+    assert http_utils.select_encoding(accept_encoding) == expected
+
+
+@pytest.mark.parametrize("encoding", http_utils.supported_encodings())
+def test_compression_round_trip(encoding):
+    """Tests compressing and decompressing data."""
+    data = b'{"name": "step", "config": {}}' * 1000
+
+    compressed = http_utils.compress(data, encoding)
+
+    assert len(compressed) < len(data) / 10
+    assert http_utils.decompress(compressed, encoding) == data
+    with pytest.raises(ValueError):
+        http_utils.decompress(compressed, encoding, max_size=len(data) - 1)
+    with pytest.raises(ValueError):
+        http_utils.decompress(b"not compressed", encoding)
+    with pytest.raises(ValueError):
+        http_utils.decompress(compressed[:-10], encoding)
+
+
+@pytest.mark.parametrize("encoding", http_utils.supported_encodings())
+def test_streaming_decompression(encoding):
+    """Tests decompressing data that arrives in chunks."""
+    data = b'{"name": "step", "config": {}}' * 1000
+    compressed = http_utils.compress(data, encoding)
+
+    decompressor = http_utils.StreamingDecompressor(encoding)
+    decompressed = b"".join(
+        decompressor.decompress(compressed[start : start + 100])
+        for start in range(0, len(compressed), 100)
+    )
+    decompressor.finish()
+    assert decompressed == data
+
+
+@pytest.mark.parametrize("encoding", http_utils.supported_encodings())
+def test_streaming_decompression_stops_at_maximum_size(encoding):
+    """Tests that highly compressed data is rejected without inflating it
+    completely."""
+    max_size = 1024 * 1024
+    compressed = http_utils.compress(b"\0" * 100 * max_size, encoding)
+
+    decompressor = http_utils.StreamingDecompressor(
+        encoding, max_size=max_size
+    )
+    with pytest.raises(ValueError):
+        decompressor.decompress(compressed)
+    assert decompressor._size <= max_size + 8 * 1024 * 1024
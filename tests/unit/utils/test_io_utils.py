@@ -311,3 +311,44 @@ def test_get_parent_gets_the_parent_directory(tmp_path) -> None:
     )
     parent = io_utils.get_parent(os.path.join(tmp_path, "new_dir/new_dir2"))
     assert parent == "new_dir"
+
+
+def test_copy_dir_copies_nested_directories(tmp_path):
+    """Tests copying nested directories with concurrent workers."""
+    dir_path = os.path.join(tmp_path, "test")
+    for i in range(10):
+        io_utils.create_file_if_not_exists(
+            os.path.join(dir_path, str(i % 3), f"{i}.txt"), str(i)
+        )
+
+    new_dir_path = os.path.join(tmp_path, "test2")
+    io_utils.copy_dir(dir_path, new_dir_path, max_workers=4)
+
+    for i in range(10):
+        assert io_utils.read_file_contents_as_string(
+            os.path.join(new_dir_path, str(i % 3), f"{i}.txt")
+        ) == str(i)
+
+
+def test_fsspec_dir_transfers_use_a_single_batched_call(mocker, tmp_path):
+    """Tests that directory transfers with fsspec filesystems are batched."""
+    source_dir = tmp_path / "source"
+    (source_dir / "nested").mkdir(parents=True)
+    (source_dir / "a.txt").write_text("a")
+    (source_dir / "nested" / "b.txt").write_text("b")
+    filesystem = mocker.MagicMock()
+
+    io_utils.fsspec_put_dir(filesystem, str(source_dir), "remote")
+    _, destinations = filesystem.put.call_args.args
+    assert sorted(destinations) == [
+        os.path.join("remote", "a.txt"),
+        os.path.join("remote", "nested", "b.txt"),
+    ]
+    assert filesystem.put.call_args.kwargs == {
+        "batch_size": io_utils.DEFAULT_COPY_DIR_MAX_WORKERS
+    }
+
+    destination_dir = tmp_path / "destination"
+    io_utils.fsspec_get_dir(filesystem, str(source_dir), str(destination_dir))
+    filesystem.get.assert_called_once()
+    assert (destination_dir / "nested").is_dir()
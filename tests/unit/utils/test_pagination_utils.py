@@ -0,0 +1,93 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from typing import Optional
+from uuid import uuid4
+
+import pytest
+
+from zenml.models import Page
+from zenml.utils import pagination_utils
+
+
+class FakeListMethod:
+    """List method that returns pages of copies of a response model."""
+
+    def __init__(self, model, total: int, page_size: int) -> None:
+        self.items = [model.copy(update={"id": uuid4()}) for _ in range(total)]
+        self.page_size = page_size
+        self.requested_pages = []
+        self.requested_cursors = []
+
+    def __call__(self, page: int = 1, cursor: Optional[str] = None) -> Page:
+        self.requested_pages.append(page)
+        self.requested_cursors.append(cursor)
+        start = int(cursor) if cursor else (page - 1) * self.page_size
+        end = start + self.page_size
+        return Page(
+            index=page,
+            max_size=self.page_size,
+            total_pages=-(-len(self.items) // self.page_size),
+            total=len(self.items),
+            items=self.items[start:end],
+            next_cursor=str(end) if end < len(self.items) else None,
+        )
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+@pytest.mark.parametrize("total", [0, 3, 10])
+def test_depaginate(sample_code_repo_response_model, max_workers, total):
+    """Tests that depaginating returns all items in order."""
+    list_method = FakeListMethod(
+        sample_code_repo_response_model, total=total, page_size=3
+    )
+
+    items = pagination_utils.depaginate(list_method, max_workers=max_workers)
+
+    assert items == list_method.items
+    assert sorted(list_method.requested_pages) == list(
+        range(1, max(-(-total // 3), 1) + 1)
+    )
+
+
+def test_lazy_depaginate(sample_code_repo_response_model):
+    """Tests that pages are only fetched when their items are consumed."""
+    list_method = FakeListMethod(
+        sample_code_repo_response_model, total=10, page_size=3
+    )
+
+    items = pagination_utils.lazy_depaginate(list_method)
+    assert list_method.requested_pages == []
+
+    assert next(items) == list_method.items[0]
+    assert list_method.requested_pages == [1]
+
+    assert [next(items) for _ in range(3)] == list_method.items[1:4]
+    assert list_method.requested_pages == [1, 2]
+
+    assert list(items) == list_method.items[4:]
+    assert list_method.requested_pages == [1, 2, 3, 4]
+
+
+def test_depaginate_with_cursor(sample_code_repo_response_model):
+    """Tests that cursors of previous pages are passed to the list method."""
+    list_method = FakeListMethod(
+        sample_code_repo_response_model, total=10, page_size=3
+    )
+
+    items = pagination_utils.depaginate(list_method, use_cursor=True)
+
+    assert items == list_method.items
+    assert list_method.requested_pages == [1, 2, 3, 4]
+    assert list_method.requested_cursors == [None, "3", "6", "9"]
@@ -0,0 +1,83 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import math
+
+import numpy as np
+import pytest
+
+from zenml.utils import statistics_utils
+
+
+@pytest.mark.parametrize(
+    "arr",
+    [
+        np.arange(1000, dtype=np.int32),
+        np.random.default_rng(0).normal(1e6, 1.0, size=(37, 11)),
+        np.asfortranarray(np.random.default_rng(1).random((13, 7))),
+        np.random.default_rng(2).random((20, 30))[::3, 1::2],
+        np.array([True, False, True]),
+    ],
+)
+def test_compute_statistics_matches_numpy(arr):
+    """Tests that chunked statistics match the numpy results."""
+    statistics = statistics_utils.compute_statistics(arr, chunk_size=16)
+
+    assert statistics.count == arr.size
+    assert math.isclose(statistics.mean, np.mean(arr), rel_tol=1e-12)
+    assert math.isclose(statistics.std(), np.std(arr), rel_tol=1e-9)
+    assert math.isclose(
+        statistics.std(ddof=1), np.std(arr, ddof=1), rel_tol=1e-9
+    )
+    assert statistics.min == np.min(arr)
+    assert statistics.max == np.max(arr)
+
+
+def test_iterate_chunks_returns_views_of_contiguous_arrays(tmp_path):
+    """Tests that contiguous and memory-mapped arrays are not copied."""
+    path = str(tmp_path / "data.npy")
+    np.save(path, np.arange(100, dtype=np.float64).reshape(10, 10))
+    arr = np.load(path, mmap_mode="r")
+
+    chunks = list(statistics_utils.iterate_chunks(arr, chunk_size=30))
+
+    assert [chunk.size for chunk in chunks] == [30, 30, 30, 10]
+    assert all(np.shares_memory(chunk, arr) for chunk in chunks)
+    assert statistics_utils.compute_statistics(arr).max == 99.0
+
+
+def test_compute_statistics_handles_nan_values():
+    """Tests that NaN values are either propagated or skipped."""
+    arr = np.array([1.0, np.nan, 3.0])
+
+    statistics = statistics_utils.compute_statistics(arr)
+    assert math.isnan(statistics.mean)
+    assert math.isnan(statistics.max)
+
+    statistics = statistics_utils.compute_statistics(arr, skipna=True)
+    assert statistics.to_dict(ddof=1) == {
+        "mean": 2.0,
+        "std": math.sqrt(2.0),
+        "min": 1.0,
+        "max": 3.0,
+    }
+
+
+def test_statistics_without_values_are_nan():
+    """Tests that statistics without any values are NaN."""
+    statistics = statistics_utils.compute_statistics(
+        np.array([np.nan]), skipna=True
+    )
+
+    assert statistics.count == 0
+    assert all(math.isnan(value) for value in statistics.to_dict().values())
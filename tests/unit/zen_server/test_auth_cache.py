@@ -0,0 +1,130 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import uuid
+from datetime import datetime, timedelta
+
+from zenml.zen_server import auth, auth_cache, utils
+from zenml.zen_server.auth import AuthContext
+from zenml.zen_server.auth_cache import AuthContextCache, auth_context_cache
+from zenml.zen_server.jwt import JWTToken
+
+
+def test_auth_context_cache_hits_and_misses(sample_user_model):
+    """Tests getting and setting cached authentication contexts."""
+    cache = AuthContextCache(ttl_seconds=60, max_size=10)
+    auth_context = AuthContext(user=sample_user_model)
+
+    assert cache.get("token") is None
+    cache.set("token", auth_context)
+    assert cache.get("token") is auth_context
+    assert cache.stats == {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
+
+
+def test_auth_context_cache_is_size_bounded(sample_user_model):
+    """Tests that the least recently used entries are evicted."""
+    cache = AuthContextCache(ttl_seconds=60, max_size=2)
+    auth_context = AuthContext(user=sample_user_model)
+
+    cache.set("token_1", auth_context)
+    cache.set("token_2", auth_context)
+    cache.get("token_1")
+    cache.set("token_3", auth_context)
+
+    assert cache.get("token_1")
+    assert cache.get("token_2") is None
+    assert cache.get("token_3")
+    assert cache.stats["evictions"] == 1
+
+
+def test_auth_context_cache_entries_expire(sample_user_model):
+    """Tests that cache entries don't outlive the access token or device."""
+    cache = AuthContextCache(ttl_seconds=60, max_size=10)
+
+    expired_token = JWTToken(
+        user_id=sample_user_model.id,
+        claims={
+            "exp": int((datetime.utcnow() - timedelta(seconds=1)).timestamp())
+        },
+    )
+    cache.set(
+        "token",
+        AuthContext(user=sample_user_model, access_token=expired_token),
+    )
+    assert cache.get("token") is None
+
+    cache = AuthContextCache(ttl_seconds=0, max_size=10)
+    cache.set("token", AuthContext(user=sample_user_model))
+    assert cache.get("token") is None
+
+
+def test_auth_context_cache_invalidation(sample_user_model):
+    """Tests invalidating cached authentication contexts."""
+    cache = AuthContextCache(ttl_seconds=60, max_size=10)
+    cache.set("token", AuthContext(user=sample_user_model))
+
+    cache.invalidate(user_id=uuid.uuid4())
+    assert cache.get("token")
+
+    cache.invalidate(user_id=sample_user_model.id)
+    assert cache.get("token") is None
+
+
+def test_authenticating_access_token_uses_cache(mocker, sample_user_model):
+    """Tests that access tokens are only resolved once while cached."""
+    cache = AuthContextCache(ttl_seconds=60, max_size=10)
+    mocker.patch.object(auth, "auth_context_cache", return_value=cache)
+    mock_store = mocker.MagicMock()
+    mock_store.get_user.return_value = sample_user_model
+    mocker.patch.object(auth, "zen_store", return_value=mock_store)
+    mocker.patch.object(
+        type(sample_user_model),
+        "active",
+        new_callable=mocker.PropertyMock,
+        return_value=True,
+    )
+
+    access_token = JWTToken(user_id=sample_user_model.id).encode()
+    for _ in range(3):
+        auth_context = auth.authenticate_credentials(access_token=access_token)
+        assert auth_context.user.id == sample_user_model.id
+
+    mock_store.get_user.assert_called_once()
+    assert cache.hits == 2
+
+
+def test_auth_context_cache_stats_are_reported(mocker, sample_user_model):
+    """Tests that the statistics of the server cache are reported."""
+    mocker.patch.object(utils, "_cache_stats", {})
+    mocker.patch.object(auth_cache, "_auth_context_cache", None)
+    mock_debug = mocker.patch.object(utils.logger, "debug")
+
+    cache = auth_context_cache()
+    cache.set("token", AuthContext(user=sample_user_model))
+    cache.get("token")
+
+    assert utils.get_cache_stats() == {
+        "authentication context": {
+            "hits": 1,
+            "misses": 0,
+            "evictions": 0,
+            "size": 1,
+        }
+    }
+    utils.log_cache_stats()
+    mock_debug.assert_called_once_with(
+        "Statistics of the %s cache: %s",
+        "authentication context",
+        "hits=1, misses=0, evictions=0, size=1",
+    )
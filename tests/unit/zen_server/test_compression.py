@@ -0,0 +1,131 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import asyncio
+import gzip
+from typing import Any, Dict, List, Tuple
+
+from starlette.datastructures import Headers
+
+from zenml.zen_server.compression import CompressionMiddleware
+
+RESPONSE_BODY = b'{"steps": {}}' * 1000
+
+
+async def _echo_app(scope, receive, send) -> None:
+    """ASGI app that responds with a large body or echoes the request."""
+    message = await receive()
+    body = message.get("body") or RESPONSE_BODY
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-length", str(len(body)).encode())],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+def _call(
+    headers: Dict[str, str], body: bytes = b"", **middleware_kwargs: Any
+) -> Tuple[int, Headers, bytes]:
+    """Calls the compression middleware with a request whose body is received
+    in chunks."""
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "headers": [
+            (key.lower().encode(), value.encode())
+            for key, value in headers.items()
+        ],
+    }
+    messages: List = []
+    chunks = [body[start : start + 100] for start in range(0, len(body), 100)]
+
+    async def receive():
+        chunk = chunks.pop(0) if chunks else b""
+        return {
+            "type": "http.request",
+            "body": chunk,
+            "more_body": bool(chunks),
+        }
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(
+        CompressionMiddleware(_echo_app, **middleware_kwargs)(
+            scope, receive, send
+        )
+    )
+    return (
+        messages[0]["status"],
+        Headers(raw=messages[0]["headers"]),
+        b"".join(message.get("body", b"") for message in messages[1:]),
+    )
+
+
+def test_responses_are_compressed():
+    """Tests that responses are compressed if the client accepts it."""
+    status, headers, body = _call({"Accept-Encoding": "gzip"})
+
+    assert status == 200
+    assert headers["content-encoding"] == "gzip"
+    assert headers["content-length"] == str(len(body))
+    assert "gzip" in headers["accept-encoding"]
+    assert gzip.decompress(body) == RESPONSE_BODY
+
+    _, headers, body = _call({})
+    assert "content-encoding" not in headers
+    assert body == RESPONSE_BODY
+
+    _, headers, body = _call({"Accept-Encoding": "gzip"}, body=b"small")
+    assert "content-encoding" not in headers
+    assert body == b"small"
+
+
+def test_request_bodies_are_decompressed():
+    """Tests that compressed request bodies are decompressed."""
+    request_body = b'{"name": "deployment"}' * 100
+
+    _, _, body = _call(
+        {"Content-Encoding": "gzip"}, body=gzip.compress(request_body)
+    )
+    assert body == request_body
+
+    status, _, _ = _call({"Content-Encoding": "gzip"}, body=b"invalid")
+    assert status == 400
+
+    status, _, _ = _call({"Content-Encoding": "unknown"}, body=b"invalid")
+    assert status == 415
+
+
+def test_large_request_bodies_are_rejected():
+    """Tests that request bodies that decompress to more than the maximum
+    size are rejected."""
+    request_body = b'{"name": "deployment"}' * 100
+
+    status, _, _ = _call(
+        {"Content-Encoding": "gzip"},
+        body=gzip.compress(request_body),
+        max_decompressed_request_size=len(request_body) - 1,
+    )
+    assert status == 400
+
+    _, _, body = _call(
+        {"Content-Encoding": "gzip"},
+        body=gzip.compress(request_body),
+        max_decompressed_request_size=len(request_body),
+    )
+    assert body == request_body
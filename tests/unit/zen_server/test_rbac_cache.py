@@ -0,0 +1,187 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import uuid
+from typing import Dict, List, Set, Tuple
+
+from zenml.config.server_config import ServerConfiguration
+from zenml.zen_server import utils
+from zenml.zen_server.rbac.models import Action, Resource, ResourceType
+from zenml.zen_server.rbac.rbac_cache import CachedRBAC, RBACCache
+from zenml.zen_server.rbac.rbac_interface import RBACInterface
+
+
+class FakeRBAC(RBACInterface):
+    """In-memory RBAC implementation that counts its calls."""
+
+    def __init__(self) -> None:
+        self.memberships: Dict[Tuple[uuid.UUID, Resource], List[Action]] = {}
+        self.calls = 0
+
+    def _is_allowed(self, user, resource, action) -> bool:
+        type_resource = Resource(type=resource.type)
+        return action in self.memberships.get(
+            (user.id, resource), []
+        ) or action in self.memberships.get((user.id, type_resource), [])
+
+    def check_permissions(
+        self, user, resources: Set[Resource], action: Action
+    ) -> Dict[Resource, bool]:
+        self.calls += 1
+        return {
+            resource: self._is_allowed(user, resource, action)
+            for resource in resources
+        }
+
+    def list_allowed_resource_ids(
+        self, user, resource: Resource, action: Action
+    ) -> Tuple[bool, List[str]]:
+        self.calls += 1
+        if self._is_allowed(user, resource, action):
+            return True, []
+        return False, [
+            str(resource_.id)
+            for (user_id, resource_), actions in self.memberships.items()
+            if user_id == user.id
+            and resource_.type == resource.type
+            and resource_.id
+            and action in actions
+        ]
+
+    def update_resource_membership(
+        self, user, resource: Resource, actions: List[Action]
+    ) -> None:
+        self.calls += 1
+        self.memberships[(user.id, resource)] = actions
+
+
+def _resource() -> Resource:
+    return Resource(type=ResourceType.STACK, id=uuid.uuid4())
+
+
+def test_cached_rbac_only_checks_uncached_resources(sample_user_model):
+    """Tests that cached permission decisions are not checked again."""
+    fake_rbac = FakeRBAC()
+    rbac = CachedRBAC(fake_rbac, RBACCache(ttl_seconds=60, max_size=100))
+    allowed, denied, new = _resource(), _resource(), _resource()
+    fake_rbac.memberships[(sample_user_model.id, allowed)] = [Action.READ]
+
+    assert rbac.check_permissions(
+        sample_user_model, {allowed, denied}, Action.READ
+    ) == {allowed: True, denied: False}
+    assert rbac.check_permissions(
+        sample_user_model, {allowed, denied}, Action.READ
+    ) == {allowed: True, denied: False}
+    assert fake_rbac.calls == 1
+
+    rbac.check_permissions(sample_user_model, {allowed, new}, Action.READ)
+    assert fake_rbac.calls == 2
+    assert rbac.cache.stats == {
+        "hits": 3,
+        "misses": 3,
+        "evictions": 0,
+        "size": 3,
+    }
+
+    # Different actions are cached separately
+    assert rbac.check_permissions(
+        sample_user_model, {allowed}, Action.UPDATE
+    ) == {allowed: False}
+    assert fake_rbac.calls == 3
+
+
+def test_cached_rbac_uses_allowed_resource_ids(sample_user_model):
+    """Tests that permissions are derived from cached allowed IDs."""
+    fake_rbac = FakeRBAC()
+    rbac = CachedRBAC(fake_rbac, RBACCache(ttl_seconds=60, max_size=100))
+    allowed, denied = _resource(), _resource()
+    fake_rbac.memberships[(sample_user_model.id, allowed)] = [Action.READ]
+    stack_type = Resource(type=ResourceType.STACK)
+
+    for _ in range(2):
+        assert rbac.list_allowed_resource_ids(
+            sample_user_model, stack_type, Action.READ
+        ) == (False, [str(allowed.id)])
+    assert rbac.check_permissions(
+        sample_user_model, {allowed, denied}, Action.READ
+    ) == {allowed: True, denied: False}
+    assert fake_rbac.calls == 1
+
+
+def test_cached_rbac_invalidates_updated_memberships(sample_user_model):
+    """Tests that membership updates invalidate the cached decisions."""
+    fake_rbac = FakeRBAC()
+    rbac = CachedRBAC(fake_rbac, RBACCache(ttl_seconds=60, max_size=100))
+    resource, other_resource = _resource(), _resource()
+
+    rbac.check_permissions(
+        sample_user_model, {resource, other_resource}, Action.READ
+    )
+    rbac.update_resource_membership(
+        sample_user_model, resource, actions=[Action.READ]
+    )
+
+    assert rbac.check_permissions(
+        sample_user_model, {resource, other_resource}, Action.READ
+    ) == {resource: True, other_resource: False}
+    assert rbac.cache.stats["hits"] == 1
+
+
+def test_rbac_cache_expiration_and_size(sample_user_model):
+    """Tests that cache entries expire and the cache is size-bounded."""
+    user_id = sample_user_model.id
+    resources = [_resource() for _ in range(3)]
+
+    cache = RBACCache(ttl_seconds=0, max_size=100)
+    cache.set_permission(user_id, resources[0], Action.READ, True)
+    assert cache.get_permission(user_id, resources[0], Action.READ) is None
+
+    cache = RBACCache(ttl_seconds=60, max_size=2)
+    for resource in resources:
+        cache.set_permission(user_id, resource, Action.READ, True)
+    assert cache.get_permission(user_id, resources[0], Action.READ) is None
+    assert cache.get_permission(user_id, resources[2], Action.READ) is True
+    assert cache.stats["evictions"] == 1
+
+    cache.invalidate(uuid.uuid4())
+    assert cache.stats["size"] == 2
+    cache.invalidate(user_id)
+    assert cache.stats["size"] == 0
+
+
+def test_rbac_cache_stats_are_reported(mocker, sample_user_model):
+    """Tests that the statistics of the server RBAC cache are reported."""
+    mocker.patch.object(utils, "_cache_stats", {})
+    mocker.patch.object(utils, "_rbac", None)
+    mocker.patch.object(
+        utils,
+        "server_config",
+        return_value=ServerConfiguration(
+            rbac_implementation_source=f"{__name__}.FakeRBAC"
+        ),
+    )
+    utils.initialize_rbac()
+
+    resource = _resource()
+    for _ in range(2):
+        utils.rbac().check_permissions(
+            user=sample_user_model, resources={resource}, action=Action.READ
+        )
+
+    assert utils.get_cache_stats()["RBAC"] == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "size": 1,
+    }